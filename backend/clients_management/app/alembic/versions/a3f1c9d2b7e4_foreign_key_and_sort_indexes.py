@@ -0,0 +1,67 @@
+"""foreign key and sort indexes
+
+Revision ID: a3f1c9d2b7e4
+Revises: 7b9687186016
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c9d2b7e4"
+down_revision: Union[str, None] = "7b9687186016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("client_surname_id_idx", "client", ["surname", "id"], unique=False)
+    op.create_index("comment_client_id_idx", "comment", ["client_id"], unique=False)
+    op.create_index("comment_user_id_idx", "comment", ["user_id"], unique=False)
+    op.create_index("complaint_client_id_idx", "complaint", ["client_id"], unique=False)
+    op.create_index("complaint_user_id_idx", "complaint", ["user_id"], unique=False)
+    op.create_index(
+        "relationship_client_id_idx", "relationship", ["client_id"], unique=False
+    )
+    op.create_index(
+        "relationship_group_id_idx", "relationship", ["group_id"], unique=False
+    )
+    op.create_index(
+        "season_ticket_client_id_expires_at_idx",
+        "season_ticket",
+        ["client_id", sa.text("expires_at DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "transaction_client_id_timestamp_idx",
+        "transaction",
+        ["client_id", "timestamp"],
+        unique=False,
+    )
+    op.create_index("violation_client_id_idx", "violation", ["client_id"], unique=False)
+    op.create_index(
+        "visit_client_id_visit_start_idx",
+        "visit",
+        ["client_id", sa.text("visit_start DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("visit_client_id_visit_start_idx", table_name="visit")
+    op.drop_index("violation_client_id_idx", table_name="violation")
+    op.drop_index("transaction_client_id_timestamp_idx", table_name="transaction")
+    op.drop_index("season_ticket_client_id_expires_at_idx", table_name="season_ticket")
+    op.drop_index("relationship_group_id_idx", table_name="relationship")
+    op.drop_index("relationship_client_id_idx", table_name="relationship")
+    op.drop_index("complaint_user_id_idx", table_name="complaint")
+    op.drop_index("complaint_client_id_idx", table_name="complaint")
+    op.drop_index("comment_user_id_idx", table_name="comment")
+    op.drop_index("comment_client_id_idx", table_name="comment")
+    op.drop_index("client_surname_id_idx", table_name="client")
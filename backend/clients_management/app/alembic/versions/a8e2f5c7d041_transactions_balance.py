@@ -0,0 +1,95 @@
+"""transactions balance
+
+Revision ID: a8e2f5c7d041
+Revises: f6c1d8a3b924
+Create Date: 2026-10-18 19:12:47.530194
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a8e2f5c7d041"
+down_revision: Union[str, None] = "f6c1d8a3b924"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "transaction",
+        "amount",
+        existing_type=sa.Float(),
+        type_=sa.Numeric(precision=12, scale=2),
+        existing_nullable=False,
+        postgresql_using="round(amount::numeric, 2)",
+    )
+
+    # индекс покрывает keyset-пагинацию истории транзакций по (timestamp, id)
+    op.drop_index("transaction_client_id_timestamp_idx", table_name="transaction")
+    op.create_index(
+        "transaction_client_id_timestamp_idx",
+        "transaction",
+        ["client_id", sa.text('"timestamp" DESC'), sa.text("id DESC")],
+        unique=False,
+    )
+
+    op.create_table(
+        "client_balance",
+        sa.Column("client_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "balance",
+            sa.Numeric(precision=12, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column(
+            "snapshot_balance",
+            sa.Numeric(precision=12, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("snapshot_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["client_id"],
+            ["client.id"],
+            name="client_balance_client_id_fk",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("client_id", name="client_balance_pkey"),
+        comment="Баланс клиентов и снимок баланса по старым транзакциям.",
+    )
+
+    # заполнение баланса по уже существующим транзакциям
+    op.execute("""
+        INSERT INTO client_balance (client_id, balance)
+        SELECT client_id, sum(amount)
+        FROM "transaction"
+        GROUP BY client_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("client_balance")
+
+    op.drop_index("transaction_client_id_timestamp_idx", table_name="transaction")
+    op.create_index(
+        "transaction_client_id_timestamp_idx",
+        "transaction",
+        ["client_id", "timestamp"],
+        unique=False,
+    )
+
+    op.alter_column(
+        "transaction",
+        "amount",
+        existing_type=sa.Numeric(precision=12, scale=2),
+        type_=sa.Float(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,59 @@
+"""analytics rollups
+
+Revision ID: b4d9e2f6a158
+Revises: a8e2f5c7d041
+Create Date: 2026-10-18 21:05:13.208417
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d9e2f6a158"
+down_revision: Union[str, None] = "a8e2f5c7d041"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "hourly_visit_rollup",
+        sa.Column("hour", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("box", sa.Integer(), nullable=False),
+        sa.Column("visits", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("hour", "box", name="hourly_visit_rollup_pkey"),
+        comment="Количество начатых посещений по часам (UTC) и ящикам.",
+    )
+    op.create_table(
+        "daily_rollup",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("visits", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "revenue",
+            sa.Numeric(precision=14, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("transactions", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("day", name="daily_rollup_pkey"),
+        comment="Посещения и выручка по дням (в часовом поясе аналитики).",
+    )
+    # агрегаты заполняются по всей истории при первом запуске фоновой задачи
+    op.create_table(
+        "rollup_watermark",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("rolled_up_until", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name", name="rollup_watermark_pkey"),
+        comment="Граница, до которой исходные записи учтены в агрегатах.",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("rollup_watermark")
+    op.drop_table("daily_rollup")
+    op.drop_table("hourly_visit_rollup")
@@ -0,0 +1,40 @@
+"""open visits partial index
+
+Revision ID: b81e5f0c4a92
+Revises: a3f1c9d2b7e4
+Create Date: 2026-10-18 12:04:17.902145
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b81e5f0c4a92"
+down_revision: Union[str, None] = "a3f1c9d2b7e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "visit_open_idx",
+        "visit",
+        ["box"],
+        unique=False,
+        postgresql_where=sa.text("visit_end IS NULL"),
+        sqlite_where=sa.text("visit_end IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "visit_open_idx",
+        table_name="visit",
+        postgresql_where=sa.text("visit_end IS NULL"),
+        sqlite_where=sa.text("visit_end IS NULL"),
+    )
@@ -0,0 +1,153 @@
+"""visit monthly partitions
+
+Revision ID: c5d2a7e9f013
+Revises: b81e5f0c4a92
+Create Date: 2026-10-18 14:21:06.517320
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c5d2a7e9f013"
+down_revision: Union[str, None] = "b81e5f0c4a92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS_AHEAD = 3
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE visit RENAME TO visit_unpartitioned")
+    op.execute(
+        "ALTER TABLE visit_unpartitioned RENAME CONSTRAINT visit_pkey TO visit_unpartitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE visit_unpartitioned RENAME CONSTRAINT visit_client_id_fk TO visit_unpartitioned_client_id_fk"
+    )
+    op.execute(
+        "ALTER INDEX visit_client_id_visit_start_idx RENAME TO visit_unpartitioned_client_id_visit_start_idx"
+    )
+    op.execute("ALTER INDEX visit_open_idx RENAME TO visit_unpartitioned_open_idx")
+
+    op.create_table(
+        "visit",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("client_id", sa.Uuid(), nullable=False),
+        sa.Column("visit_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("visit_end", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("box", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["client_id"],
+            ["client.id"],
+            name="visit_client_id_fk",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", "visit_start", name="visit_pkey"),
+        comment="Таблица с записями о посещениях.",
+        postgresql_partition_by="RANGE (visit_start)",
+    )
+    op.create_index(
+        "visit_client_id_visit_start_idx",
+        "visit",
+        ["client_id", sa.text("visit_start DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "visit_open_idx",
+        "visit",
+        ["box"],
+        unique=False,
+        postgresql_where=sa.text("visit_end IS NULL"),
+    )
+
+    # Строки вне созданных помесячных секций попадают в секцию по умолчанию.
+    op.execute("CREATE TABLE visit_default PARTITION OF visit DEFAULT")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION visit_ensure_partitions(since date, months_ahead integer)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            partition_start date := date_trunc('month', since)::date;
+            last_start date := (date_trunc('month', current_date) + make_interval(months => months_ahead))::date;
+        BEGIN
+            WHILE partition_start <= last_start LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF visit FOR VALUES FROM (%L) TO (%L)',
+                    'visit_' || to_char(partition_start, 'YYYY_MM'),
+                    partition_start::timestamp AT TIME ZONE 'UTC',
+                    (partition_start + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                partition_start := (partition_start + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$
+    """)
+    op.execute(
+        "SELECT visit_ensure_partitions("
+        "(SELECT COALESCE(min(visit_start) AT TIME ZONE 'UTC', current_date)::date FROM visit_unpartitioned), "
+        f"{PARTITIONS_AHEAD})"
+    )
+
+    op.execute(
+        "INSERT INTO visit (id, client_id, visit_start, visit_end, box) SELECT id, client_id, visit_start, visit_end, box FROM visit_unpartitioned"
+    )
+    op.drop_table("visit_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE visit RENAME TO visit_partitioned")
+    op.execute(
+        "ALTER TABLE visit_partitioned RENAME CONSTRAINT visit_pkey TO visit_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE visit_partitioned RENAME CONSTRAINT visit_client_id_fk TO visit_partitioned_client_id_fk"
+    )
+    op.execute(
+        "ALTER INDEX visit_client_id_visit_start_idx RENAME TO visit_partitioned_client_id_visit_start_idx"
+    )
+    op.execute("ALTER INDEX visit_open_idx RENAME TO visit_partitioned_open_idx")
+
+    op.create_table(
+        "visit",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("client_id", sa.Uuid(), nullable=False),
+        sa.Column("visit_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("visit_end", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("box", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["client_id"],
+            ["client.id"],
+            name="visit_client_id_fk",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name="visit_pkey"),
+        comment="Таблица с записями о посещениях.",
+    )
+    op.create_index(
+        "visit_client_id_visit_start_idx",
+        "visit",
+        ["client_id", sa.text("visit_start DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "visit_open_idx",
+        "visit",
+        ["box"],
+        unique=False,
+        postgresql_where=sa.text("visit_end IS NULL"),
+    )
+
+    op.execute(
+        "INSERT INTO visit (id, client_id, visit_start, visit_end, box) SELECT id, client_id, visit_start, visit_end, box FROM visit_partitioned"
+    )
+    op.drop_table("visit_partitioned")
+    op.execute("DROP FUNCTION visit_ensure_partitions(date, integer)")
@@ -0,0 +1,92 @@
+"""client records api
+
+Revision ID: c9e4b2d7f316
+Revises: b4d9e2f6a158
+Create Date: 2026-10-18 22:41:09.115630
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c9e4b2d7f316"
+down_revision: Union[str, None] = "b4d9e2f6a158"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "comment",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "complaint",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+    # индексы покрывают keyset-пагинацию записей клиента по (время, id)
+    op.drop_index("violation_client_id_idx", table_name="violation")
+    op.create_index(
+        "violation_client_id_claimed_at_idx",
+        "violation",
+        ["client_id", sa.text("claimed_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("comment_client_id_idx", table_name="comment")
+    op.create_index(
+        "comment_client_id_created_at_idx",
+        "comment",
+        ["client_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("complaint_client_id_idx", table_name="complaint")
+    op.create_index(
+        "complaint_client_id_created_at_idx",
+        "complaint",
+        ["client_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+    op.add_column(
+        "client_summary",
+        sa.Column("complaint_count", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    # заполнение количества жалоб по уже существующим данным
+    op.execute("""
+        UPDATE client_summary
+        SET complaint_count = (
+            SELECT count(*) FROM complaint
+            WHERE complaint.client_id = client_summary.client_id
+        )
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("client_summary", "complaint_count")
+
+    op.drop_index("complaint_client_id_created_at_idx", table_name="complaint")
+    op.create_index("complaint_client_id_idx", "complaint", ["client_id"], unique=False)
+    op.drop_index("comment_client_id_created_at_idx", table_name="comment")
+    op.create_index("comment_client_id_idx", "comment", ["client_id"], unique=False)
+    op.drop_index("violation_client_id_claimed_at_idx", table_name="violation")
+    op.create_index("violation_client_id_idx", "violation", ["client_id"], unique=False)
+
+    op.drop_column("complaint", "created_at")
+    op.drop_column("comment", "created_at")
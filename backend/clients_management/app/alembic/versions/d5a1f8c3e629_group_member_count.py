@@ -0,0 +1,60 @@
+"""group member count
+
+Revision ID: d5a1f8c3e629
+Revises: c9e4b2d7f316
+Create Date: 2026-10-18 23:17:42.508114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a1f8c3e629"
+down_revision: Union[str, None] = "c9e4b2d7f316"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # клиент может состоять в группе только один раз: повторные связи удаляются
+    op.execute("""
+        DELETE FROM relationship AS duplicate
+        USING relationship AS original
+        WHERE duplicate.group_id = original.group_id
+            AND duplicate.client_id = original.client_id
+            AND duplicate.id > original.id
+        """)
+    op.drop_index("relationship_group_id_idx", table_name="relationship")
+    op.create_unique_constraint(
+        "relationship_group_id_client_id_key", "relationship", ["group_id", "client_id"]
+    )
+
+    op.add_column(
+        "group",
+        sa.Column("member_count", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    # заполнение количества участников по уже существующим данным
+    op.execute("""
+        UPDATE "group"
+        SET member_count = (
+            SELECT count(*) FROM relationship
+            WHERE relationship.group_id = "group".id
+        )
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("group", "member_count")
+
+    op.drop_constraint(
+        "relationship_group_id_client_id_key", "relationship", type_="unique"
+    )
+    op.create_index(
+        "relationship_group_id_idx", "relationship", ["group_id"], unique=False
+    )
@@ -0,0 +1,77 @@
+"""client summary read model
+
+Revision ID: d7a4e1b9c306
+Revises: c5d2a7e9f013
+Create Date: 2026-10-18 16:21:05.418230
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a4e1b9c306"
+down_revision: Union[str, None] = "c5d2a7e9f013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "client_summary",
+        sa.Column("client_id", sa.Uuid(), nullable=False),
+        sa.Column("season_ticket_id", sa.Uuid(), nullable=True),
+        sa.Column("season_ticket_type", sa.String(length=256), nullable=True),
+        sa.Column(
+            "season_ticket_expires_at", sa.DateTime(timezone=True), nullable=True
+        ),
+        sa.Column("violation_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_visit", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["client_id"],
+            ["client.id"],
+            name="client_summary_client_id_fk",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("client_id", name="client_summary_pkey"),
+        comment="Денормализованная сводка по клиентам для списка клиентов.",
+    )
+    op.create_index(
+        "client_summary_season_ticket_id_idx",
+        "client_summary",
+        ["season_ticket_id"],
+        unique=False,
+    )
+
+    # заполнение сводки по уже существующим данным
+    op.execute("""
+        INSERT INTO client_summary (
+            client_id,
+            season_ticket_id,
+            season_ticket_type,
+            season_ticket_expires_at,
+            violation_count,
+            last_visit
+        )
+        SELECT
+            client.id,
+            (SELECT st.id FROM season_ticket st WHERE st.client_id = client.id
+             ORDER BY st.expires_at DESC, st.id DESC LIMIT 1),
+            (SELECT st.type FROM season_ticket st WHERE st.client_id = client.id
+             ORDER BY st.expires_at DESC, st.id DESC LIMIT 1),
+            (SELECT st.expires_at FROM season_ticket st WHERE st.client_id = client.id
+             ORDER BY st.expires_at DESC, st.id DESC LIMIT 1),
+            (SELECT count(*) FROM violation WHERE violation.client_id = client.id),
+            (SELECT max(visit.visit_start) FROM visit WHERE visit.client_id = client.id)
+        FROM client
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("client_summary_season_ticket_id_idx", table_name="client_summary")
+    op.drop_table("client_summary")
@@ -0,0 +1,46 @@
+"""client search trigram indexes
+
+Revision ID: e3b8c6f2a517
+Revises: d7a4e1b9c306
+Create Date: 2026-10-18 17:02:44.106385
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b8c6f2a517"
+down_revision: Union[str, None] = "d7a4e1b9c306"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ("client_surname_trgm_idx", "lower(surname)"),
+    ("client_name_trgm_idx", "lower(name)"),
+    ("client_patronymic_trgm_idx", "lower(patronymic)"),
+    ("client_email_trgm_idx", "lower(email)"),
+    ("client_phone_trgm_idx", r"regexp_replace(phone, '\D', '', 'g')"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for name, expression in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            "client",
+            [sa.text(f"{expression} gin_trgm_ops")],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name="client", postgresql_using="gin")
@@ -0,0 +1,110 @@
+"""visit partitions from default
+
+Revision ID: e9b3f7a2c481
+Revises: d5a1f8c3e629
+Create Date: 2026-10-19 10:42:18.093517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e9b3f7a2c481"
+down_revision: Union[str, None] = "d5a1f8c3e629"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Если посещения за месяц уже попали в секцию по умолчанию, секцию месяца нельзя
+    # создать, пока visit_default подключена: строки переносятся в новую секцию
+    # при отключённой секции по умолчанию. Функцию одновременно вызывают несколько
+    # воркеров, поэтому она выполняется под advisory-блокировкой.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION visit_ensure_partitions(since date, months_ahead integer)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            partition_start date := date_trunc('month', since)::date;
+            last_start date := (date_trunc('month', current_date) + make_interval(months => months_ahead))::date;
+            partition_name text;
+            range_from timestamptz;
+            range_to timestamptz;
+        BEGIN
+            PERFORM pg_advisory_xact_lock(hashtext('visit_ensure_partitions'));
+
+            WHILE partition_start <= last_start LOOP
+                partition_name := 'visit_' || to_char(partition_start, 'YYYY_MM');
+                range_from := partition_start::timestamp AT TIME ZONE 'UTC';
+                range_to := (partition_start + interval '1 month') AT TIME ZONE 'UTC';
+
+                IF to_regclass(partition_name) IS NULL THEN
+                    IF EXISTS (
+                        SELECT 1 FROM visit_default
+                        WHERE visit_start >= range_from AND visit_start < range_to
+                    ) THEN
+                        ALTER TABLE visit DETACH PARTITION visit_default;
+
+                        EXECUTE format(
+                            'CREATE TABLE %I PARTITION OF visit FOR VALUES FROM (%L) TO (%L)',
+                            partition_name, range_from, range_to
+                        );
+                        EXECUTE format(
+                            'INSERT INTO %I (id, client_id, visit_start, visit_end, box) '
+                            'SELECT id, client_id, visit_start, visit_end, box FROM visit_default '
+                            'WHERE visit_start >= %L AND visit_start < %L',
+                            partition_name, range_from, range_to
+                        );
+                        DELETE FROM visit_default
+                        WHERE visit_start >= range_from AND visit_start < range_to;
+
+                        ALTER TABLE visit ATTACH PARTITION visit_default DEFAULT;
+                    ELSE
+                        EXECUTE format(
+                            'CREATE TABLE %I PARTITION OF visit FOR VALUES FROM (%L) TO (%L)',
+                            partition_name, range_from, range_to
+                        );
+                    END IF;
+                END IF;
+
+                partition_start := (partition_start + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$
+    """)
+    # посещения, уже попавшие в секцию по умолчанию, переносятся в помесячные секции
+    op.execute(
+        "SELECT visit_ensure_partitions("
+        "(SELECT COALESCE(min(visit_start) AT TIME ZONE 'UTC', current_date)::date FROM visit_default), "
+        "0)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION visit_ensure_partitions(since date, months_ahead integer)
+        RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            partition_start date := date_trunc('month', since)::date;
+            last_start date := (date_trunc('month', current_date) + make_interval(months => months_ahead))::date;
+        BEGIN
+            WHILE partition_start <= last_start LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF visit FOR VALUES FROM (%L) TO (%L)',
+                    'visit_' || to_char(partition_start, 'YYYY_MM'),
+                    partition_start::timestamp AT TIME ZONE 'UTC',
+                    (partition_start + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                partition_start := (partition_start + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$
+    """)
@@ -0,0 +1,51 @@
+"""season ticket expiry
+
+Revision ID: f6c1d8a3b924
+Revises: e3b8c6f2a517
+Create Date: 2026-10-18 17:48:31.662907
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f6c1d8a3b924"
+down_revision: Union[str, None] = "e3b8c6f2a517"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "season_ticket",
+        sa.Column("expired_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # уже истёкшие абонементы помечаются без оповещения планировщиком
+    op.execute(
+        "UPDATE season_ticket SET expired_at = expires_at WHERE expires_at <= now()"
+    )
+
+    op.create_index(
+        "season_ticket_pending_expiry_idx",
+        "season_ticket",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("expired_at IS NULL"),
+        sqlite_where=sa.text("expired_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "season_ticket_pending_expiry_idx",
+        table_name="season_ticket",
+        postgresql_where=sa.text("expired_at IS NULL"),
+        sqlite_where=sa.text("expired_at IS NULL"),
+    )
+    op.drop_column("season_ticket", "expired_at")
@@ -5,14 +5,30 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.session import get_session
 from app.repositories import (
+    AnalyticsRepository,
+    ClientBalanceRepository,
     ClientRepository,
+    ClientSummaryRepository,
+    CommentRepository,
+    ComplaintRepository,
+    GroupRepository,
     SeasonTicketRepository,
+    TransactionRepository,
     UserRepository,
+    ViolationRepository,
+    VisitRepository,
 )
 from app.services import (
+    AnalyticsService,
     AuthService,
     SeasonTicketService,
     ClientService,
+    CommentService,
+    ComplaintService,
+    GroupService,
+    TransactionService,
+    ViolationService,
+    VisitService,
 )
 
 
@@ -46,10 +62,12 @@ async def get_clients_service(session: Annotated[AsyncSession, Depends(get_sessi
     Returns
     -------
     ClientService
-        Экземпляр сервиса клиентов, инициализированный с репозиторием клиентов.
+        Экземпляр сервиса клиентов, инициализированный с репозиториями клиентов
+        и сводки по клиентам.
     """
     client_repo: ClientRepository = ClientRepository(session)
-    return ClientService(client_repo)
+    client_summary_repo: ClientSummaryRepository = ClientSummaryRepository(session)
+    return ClientService(client_repo, client_summary_repo)
 
 
 async def get_season_ticket_service(
@@ -66,7 +84,155 @@ async def get_season_ticket_service(
     Returns
     -------
     ClientService
-        Экземпляр сервиса абонементов, инициализированный с репозиторием абонементов.
+        Экземпляр сервиса абонементов, инициализированный с репозиториями абонементов
+        и сводки по клиентам.
     """
     season_ticket_repo: SeasonTicketRepository = SeasonTicketRepository(session)
-    return SeasonTicketService(season_ticket_repo)
+    client_summary_repo: ClientSummaryRepository = ClientSummaryRepository(session)
+    return SeasonTicketService(season_ticket_repo, client_summary_repo)
+
+
+async def get_visit_service(session: Annotated[AsyncSession, Depends(get_session)]):
+    """Создает и возвращает сервис для работы с посещениями с внедренным репозиторием посещений.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    VisitService
+        Экземпляр сервиса посещений, инициализированный с репозиториями посещений
+        и сводки по клиентам.
+    """
+    visit_repo: VisitRepository = VisitRepository(session)
+    client_summary_repo: ClientSummaryRepository = ClientSummaryRepository(session)
+    return VisitService(visit_repo, client_summary_repo)
+
+
+async def get_transaction_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Создает и возвращает сервис для работы с транзакциями с внедренным репозиторием транзакций.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    TransactionService
+        Экземпляр сервиса транзакций, инициализированный с репозиториями транзакций
+        и балансов клиентов.
+    """
+    transaction_repo: TransactionRepository = TransactionRepository(session)
+    client_balance_repo: ClientBalanceRepository = ClientBalanceRepository(session)
+    return TransactionService(transaction_repo, client_balance_repo)
+
+
+async def get_analytics_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Создает и возвращает сервис аналитики с внедренным репозиторием аналитики.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    AnalyticsService
+        Экземпляр сервиса аналитики, инициализированный с репозиторием аналитики.
+    """
+    analytics_repo: AnalyticsRepository = AnalyticsRepository(session)
+    return AnalyticsService(analytics_repo)
+
+
+async def get_violation_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Создает и возвращает сервис для работы с нарушениями с внедренным репозиторием нарушений.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    ViolationService
+        Экземпляр сервиса нарушений, инициализированный с репозиториями нарушений
+        и сводки по клиентам.
+    """
+    violation_repo: ViolationRepository = ViolationRepository(session)
+    client_summary_repo: ClientSummaryRepository = ClientSummaryRepository(session)
+    return ViolationService(violation_repo, client_summary_repo)
+
+
+async def get_comment_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Создает и возвращает сервис для работы с комментариями с внедренным репозиторием комментариев.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    CommentService
+        Экземпляр сервиса комментариев, инициализированный с репозиторием комментариев.
+    """
+    comment_repo: CommentRepository = CommentRepository(session)
+    return CommentService(comment_repo)
+
+
+async def get_complaint_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Создает и возвращает сервис для работы с жалобами с внедренным репозиторием жалоб.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    ComplaintService
+        Экземпляр сервиса жалоб, инициализированный с репозиториями жалоб
+        и сводки по клиентам.
+    """
+    complaint_repo: ComplaintRepository = ComplaintRepository(session)
+    client_summary_repo: ClientSummaryRepository = ClientSummaryRepository(session)
+    return ComplaintService(complaint_repo, client_summary_repo)
+
+
+async def get_group_service(
+    session: Annotated[AsyncSession, Depends(get_session)],
+):
+    """Создает и возвращает сервис для работы с группами с внедренным репозиторием групп.
+
+    Parameters
+    ----------
+    session : AsyncSession
+        Асинхронная сессия SQLAlchemy, автоматически внедряемая через Depends.
+        Получается из зависимости get_session.
+
+    Returns
+    -------
+    GroupService
+        Экземпляр сервиса групп, инициализированный с репозиторием групп.
+    """
+    group_repo: GroupRepository = GroupRepository(session)
+    return GroupService(group_repo)
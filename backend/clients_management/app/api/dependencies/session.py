@@ -1,3 +1,5 @@
+from typing import Dict
+
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -6,14 +8,51 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import Settings, get_settings
+from app.core.metrics import request_metrics
+from app.database.pool import InstrumentedAsyncQueuePool
 
 settings: Settings = get_settings()
 
+
+def _connect_args(url: str) -> Dict:
+    """Возвращает параметры подключения драйвера asyncpg.
+
+    Parameters
+    ----------
+    url : str
+        Строка подключения к базе данных.
+
+    Returns
+    -------
+    connect_args : Dict
+        Размер кэша подготовленных выражений и серверный ``statement_timeout``.
+        Для других драйверов возвращается пустой словарь.
+    """
+    if not url.startswith("postgresql+asyncpg"):
+        return {}
+
+    connect_args = {"statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE}
+
+    if settings.DATABASE_STATEMENT_TIMEOUT_MS > 0:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+        }
+
+    return connect_args
+
+
 engine: AsyncEngine = create_async_engine(
     url=settings.DATABASE_URL,
     echo=False,
-    pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    connect_args=_connect_args(settings.DATABASE_URL),
 )
+request_metrics.instrument(engine)
 AsyncSessionMaker: async_sessionmaker = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -31,3 +70,18 @@ async def get_session() -> AsyncSession:
     """
     async with AsyncSessionMaker() as session:
         yield session  # noqa
+
+
+async def get_session_maker() -> async_sessionmaker:
+    """Возвращает фабрику асинхронных сессий.
+
+    Используется маршрутами с потоковыми ответами: зависимость ``get_session()`` закрывает
+    сессию до начала отправки тела ответа, поэтому генератор ответа открывает собственную
+    сессию через эту фабрику.
+
+    Returns
+    -------
+    session_maker : async_sessionmaker
+        Фабрика асинхронных сессий приложения.
+    """
+    return AsyncSessionMaker
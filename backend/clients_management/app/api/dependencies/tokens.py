@@ -1,6 +1,6 @@
 from typing import Annotated, AnyStr
 
-from fastapi import Depends, Security
+from fastapi import Depends, Query, Security
 from fastapi.security import (
     HTTPAuthorizationCredentials,
     HTTPBearer,
@@ -11,12 +11,16 @@ from app.api.dependencies.services import get_auth_service
 from app.core.config import Settings, get_settings
 from app.database.tables.entities import User
 from app.services import AuthService
+from app.services.auth_service import credentials_exception
 
 settings: Settings = get_settings()
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"/{settings.CURRENT_API_URL}/auth/sign_in"
 )
+optional_oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl=f"/{settings.CURRENT_API_URL}/auth/sign_in", auto_error=False
+)
 
 
 async def validate_access_token(
@@ -65,3 +69,40 @@ async def validate_refresh_token(
         Объект пользователя.
     """
     return await auth_service.validate_refresh_token(credentials.credentials)
+
+
+async def validate_events_access(
+    access_token: Annotated[str | None, Depends(optional_oauth2_scheme)],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+    token: Annotated[
+        str | None,
+        Query(description="Токен подписки, полученный через ``POST /events/token``."),
+    ] = None,
+) -> User:
+    """Зависимость авторизации ленты изменений.
+
+    Принимает токен доступа в заголовке ``Authorization`` или, для браузерного
+    ``EventSource``, который не может передать заголовок, токен подписки
+    в параметре запроса ``token``.
+
+    Parameters
+    ----------
+    access_token : str | None
+        JSON Web Token, токен доступа из заголовка.
+    auth_service : AuthService
+        Сервис авторизации.
+    token : str | None
+        Токен подписки на ленту изменений.
+
+    Returns
+    -------
+    user : User
+        Объект пользователя.
+    """
+    if access_token is not None:
+        return await auth_service.validate_access_token(access_token)
+
+    if token is not None:
+        return await auth_service.validate_events_token(token)
+
+    raise credentials_exception
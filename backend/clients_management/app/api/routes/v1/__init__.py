@@ -1,15 +1,31 @@
 from fastapi import APIRouter
 
+from .analytics import router as _analytics_router
 from .auth import router as _auth_router
 from .clients import router as _clients_router
+from .comments import router as _comments_router
+from .complaints import router as _complaints_router
+from .events import router as _events_router
+from .groups import router as _groups_router
+from .metrics import router as _metrics_router
 from .root import router as _root_router
 from .season_tickets import router as _season_tickets_router
+from .transactions import router as _transactions_router
+from .violations import router as _violations_router
 from .visits import router as _visits_router
 
 api_v1_router: APIRouter = APIRouter(prefix="/api/v1")
 
+api_v1_router.include_router(_analytics_router)
 api_v1_router.include_router(_auth_router)
 api_v1_router.include_router(_clients_router)
+api_v1_router.include_router(_comments_router)
+api_v1_router.include_router(_complaints_router)
+api_v1_router.include_router(_events_router)
+api_v1_router.include_router(_groups_router)
+api_v1_router.include_router(_metrics_router)
 api_v1_router.include_router(_root_router)
 api_v1_router.include_router(_season_tickets_router)
+api_v1_router.include_router(_transactions_router)
+api_v1_router.include_router(_violations_router)
 api_v1_router.include_router(_visits_router)
@@ -0,0 +1,145 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Query,
+)
+
+from app.api.dependencies.services import get_analytics_service
+from app.api.dependencies.tokens import validate_access_token
+from app.core.config import Settings, get_settings
+from app.database.tables.entities import User
+from app.schemas.analytics import AnalyticsPeriod
+from app.schemas.v1.responses import (
+    AttendanceResponse,
+    HeatmapResponse,
+    RevenueResponse,
+)
+from app.services import AnalyticsService
+
+settings: Settings = get_settings()
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+)
+
+
+@router.get(
+    "/revenue",
+    response_model=RevenueResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает выручку по дням, неделям или месяцам.",
+)
+async def revenue(
+    start: Annotated[date, Query(description="Первый день отчёта.")],
+    end: Annotated[date, Query(description="Последний день отчёта (включительно).")],
+    _: Annotated[User, Depends(validate_access_token)],
+    analytics_service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+    period: Annotated[AnalyticsPeriod, Query(description="Длина периода.")] = "day",
+):
+    """Возвращает выручку по периодам из дневных агрегатов.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    start : date
+        Первый день отчёта.
+    end : date
+        Последний день отчёта (включительно), не дальше `ANALYTICS_RANGE_MAX_DAYS` от начала.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    analytics_service : AnalyticsService
+        Сервис аналитики.
+    period : AnalyticsPeriod
+        Длина периода: ``day``, ``week`` или ``month``. По умолчанию ``day``.
+
+    Returns
+    -------
+    RevenueResponse
+        Выручка и количество транзакций по периодам.
+    """
+    return await analytics_service.get_revenue(period, start, end)
+
+
+@router.get(
+    "/attendance",
+    response_model=AttendanceResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает посещаемость по дням, неделям или месяцам.",
+)
+async def attendance(
+    start: Annotated[date, Query(description="Первый день отчёта.")],
+    end: Annotated[date, Query(description="Последний день отчёта (включительно).")],
+    _: Annotated[User, Depends(validate_access_token)],
+    analytics_service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+    period: Annotated[AnalyticsPeriod, Query(description="Длина периода.")] = "day",
+):
+    """Возвращает посещаемость по периодам из дневных агрегатов.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    start : date
+        Первый день отчёта.
+    end : date
+        Последний день отчёта (включительно), не дальше `ANALYTICS_RANGE_MAX_DAYS` от начала.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    analytics_service : AnalyticsService
+        Сервис аналитики.
+    period : AnalyticsPeriod
+        Длина периода: ``day``, ``week`` или ``month``. По умолчанию ``day``.
+
+    Returns
+    -------
+    AttendanceResponse
+        Количество начатых посещений по периодам.
+    """
+    return await analytics_service.get_attendance(period, start, end)
+
+
+@router.get(
+    "/heatmap",
+    response_model=HeatmapResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает тепловые карты посещений по ящикам.",
+)
+async def heatmap(
+    start: Annotated[date, Query(description="Первый день отчёта.")],
+    end: Annotated[date, Query(description="Последний день отчёта (включительно).")],
+    _: Annotated[User, Depends(validate_access_token)],
+    analytics_service: Annotated[AnalyticsService, Depends(get_analytics_service)],
+    box: Annotated[
+        int | None,
+        Query(ge=1, le=settings.GYM_BOX_COUNT, description="Номер ящика."),
+    ] = None,
+):
+    """Возвращает тепловые карты «день недели × час» из часовых агрегатов.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    start : date
+        Первый день отчёта.
+    end : date
+        Последний день отчёта (включительно), не дальше `ANALYTICS_RANGE_MAX_DAYS` от начала.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    analytics_service : AnalyticsService
+        Сервис аналитики.
+    box : int | None
+        Номер ящика. По умолчанию — все ящики.
+
+    Returns
+    -------
+    HeatmapResponse
+        Тепловые карты ящиков, в которых были посещения.
+    """
+    return await analytics_service.get_heatmap(start, end, box)
@@ -1,4 +1,5 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
 from fastapi import (
@@ -6,20 +7,58 @@ from fastapi import (
     Depends,
     status,
     Body,
+    HTTPException,
     Path,
+    Query,
+    Request,
 )
-
-from app.api.dependencies.services import get_clients_service
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.dependencies.services import (
+    get_clients_service,
+    get_comment_service,
+    get_complaint_service,
+    get_transaction_service,
+    get_violation_service,
+    get_visit_service,
+)
+from app.api.dependencies.session import get_session_maker
 from app.api.dependencies.tokens import validate_access_token
+from app.core.config import Settings, get_settings
+from app.core.query_budget import query_budget
+from app.core.records import CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, iter_records
+from app.core.response_cache import (
+    CLIENTS_SCOPE,
+    GROUPS_SCOPE,
+    client_scope,
+    response_cache,
+)
 from app.database.tables.entities import User
 from app.schemas.v1.requests import ClientRequest
 from app.schemas.v1.responses import (
+    BalanceResponse,
+    ClientsImportResponse,
     ClientsResponse,
     ClientResponse,
+    CommentsResponse,
+    ComplaintsResponse,
     CreatedResponse,
     StandardResponse,
+    TransactionsResponse,
+    ViolationsResponse,
+    VisitsResponse,
+)
+from app.services import (
+    ClientService,
+    CommentService,
+    ComplaintService,
+    TransactionService,
+    ViolationService,
+    VisitService,
 )
-from app.services import ClientService
+
+settings: Settings = get_settings()
 
 router = APIRouter(
     prefix="/clients",
@@ -31,36 +70,199 @@ router = APIRouter(
     "/all",
     response_model=ClientsResponse,
     status_code=status.HTTP_200_OK,
-    summary="Возвращает информацию обо всех клиентах.",
+    summary="Возвращает страницу списка клиентов.",
 )
+@query_budget(3)
 async def all_clients(
+    request: Request,
     _: Annotated[User, Depends(validate_access_token)],
     client_service: Annotated[ClientService, Depends(get_clients_service)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.CLIENTS_PAGE_SIZE_MAX, description="Размер страницы."),
+    ] = settings.CLIENTS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
 ):
-    """Получение списка всех клиентов из системы.
+    """Получение списка клиентов из системы постранично.
 
-    Endpoint предоставляет полный список клиентов, доступный авторизованному пользователю.
-    Ответ включает стандартные метаданные и массив объектов клиентов.
+    Endpoint предоставляет страницу списка клиентов, доступную авторизованному пользователю.
+    Ответ включает стандартные метаданные, массив объектов клиентов и курсор следующей страницы.
 
     Parameters
     ----------
+    request : Request
+        Текущий запрос, по которому ищется ответ в кэше.
     _ : User
         Авторизованный пользователь, полученный через JWT-токен.
     client_service : ClientService
         Объект сервисного слоя для работы с клиентами.
+    limit : int
+        Размер страницы, не больше `CLIENTS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
 
     Returns
     -------
     response : ClientsResponse
-        Список всех клиентов в БД.
+        Страница списка клиентов в БД.
 
     Notes
     -----
     - Объект пользователя не используется напрямую, но гарантирует проверку авторизации.
-    - Возвращает клиентов в алфавитном порядке.
+    - Возвращает клиентов в алфавитном порядке (по фамилии, затем по UUID).
     - Пустой список означает отсутствие клиентов, а не ошибку.
+    - Если `next_cursor` равен null, страница последняя.
+    - Ответ кэшируется до изменения списка клиентов; с заголовком ``If-None-Match``
+      неизменившаяся страница возвращается как ``304 Not Modified``.
+    """
+    return await response_cache.serve(
+        request,
+        (CLIENTS_SCOPE,),
+        lambda: client_service.get_all_clients(limit, cursor),
+    )
+
+
+@router.get(
+    "/search",
+    response_model=ClientsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Ищет клиентов по части ФИО, почты или номера телефона.",
+)
+@query_budget(3)
+async def search_clients(
+    _: Annotated[User, Depends(validate_access_token)],
+    client_service: Annotated[ClientService, Depends(get_clients_service)],
+    q: Annotated[
+        str,
+        Query(min_length=1, max_length=256, description="Строка поиска."),
+    ],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=settings.CLIENTS_SEARCH_LIMIT_MAX,
+            description="Максимальное количество результатов.",
+        ),
+    ] = settings.CLIENTS_SEARCH_LIMIT,
+):
+    """Поиск клиентов для стойки администратора.
+
+    Находит клиентов, у которых строка поиска встречается в фамилии, имени, отчестве
+    или адресе электронной почты (без учёта регистра), а также клиентов, номер телефона
+    которых содержит цифры запроса (например, последние цифры номера).
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    client_service : ClientService
+        Объект сервисного слоя для работы с клиентами.
+    q : str
+        Строка поиска.
+    limit : int
+        Максимальное количество результатов, не больше `CLIENTS_SEARCH_LIMIT_MAX`.
+
+    Returns
+    -------
+    response : ClientsResponse
+        Найденные клиенты; `next_cursor` всегда равен null.
+
+    Notes
+    -----
+    - Первыми идут клиенты, чья фамилия начинается с запроса или номер телефона
+      оканчивается его цифрами, затем совпадения по началу имени, отчества или почты,
+      затем остальные совпадения; внутри группы — по фамилии.
+    """
+    return await client_service.search_clients(q, limit)
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает всех клиентов потоком NDJSON.",
+)
+async def stream_clients(
+    _: Annotated[User, Depends(validate_access_token)],
+    session_maker: Annotated[async_sessionmaker, Depends(get_session_maker)],
+):
+    """Потоковая выдача списка всех клиентов.
+
+    Каждая строка ответа — отдельный JSON-объект `CompactClientModel` (формат NDJSON).
+    Строки отправляются по мере чтения из серверного курсора, поэтому сервер
+    не держит полный список клиентов в памяти.
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    session_maker : async_sessionmaker
+        Фабрика асинхронных сессий для чтения курсора во время отправки ответа.
+
+    Returns
+    -------
+    response : StreamingResponse
+        Поток клиентов в алфавитном порядке с типом `application/x-ndjson`.
+    """
+    return StreamingResponse(
+        ClientService.stream_all_clients(
+            session_maker, settings.CLIENTS_STREAM_CHUNK_SIZE
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Выгружает всех клиентов для отчётности.",
+)
+async def export_clients(
+    _: Annotated[User, Depends(validate_access_token)],
+    session_maker: Annotated[async_sessionmaker, Depends(get_session_maker)],
+    export_format: Annotated[
+        Literal["csv", "columnar"],
+        Query(alias="format", description="Формат выгрузки."),
+    ] = "csv",
+):
+    """Потоковая выгрузка клиентов с текущим абонементом, последним посещением
+    и количеством нарушений.
+
+    Данные читаются из серверного курсора порциями по `CLIENTS_STREAM_CHUNK_SIZE` строк
+    и отправляются по мере чтения, поэтому расход памяти не зависит от количества клиентов.
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    session_maker : async_sessionmaker
+        Фабрика асинхронных сессий для чтения курсора во время отправки ответа.
+    export_format : Literal["csv", "columnar"]
+        ``csv`` — таблица CSV с заголовком; ``columnar`` — NDJSON, где каждая строка
+        после заголовка содержит порцию данных по столбцам.
+
+    Returns
+    -------
+    response : StreamingResponse
+        Поток выгрузки в алфавитном порядке клиентов.
     """
-    return await client_service.get_all_clients()
+    if export_format == "csv":
+        media_type = "text/csv"
+        filename = "clients.csv"
+    else:
+        media_type = "application/x-ndjson"
+        filename = "clients.ndjson"
+
+    return StreamingResponse(
+        ClientService.export_clients(
+            session_maker, settings.CLIENTS_STREAM_CHUNK_SIZE, export_format
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get(
@@ -69,8 +271,10 @@ async def all_clients(
     status_code=status.HTTP_200_OK,
     summary="Возвращает информацию о клиенте по его id.",
 )
+@query_budget(4)
 async def client_by_id(
     client_id: UUID,
+    request: Request,
     _: Annotated[User, Depends(validate_access_token)],
     client_service: Annotated[ClientService, Depends(get_clients_service)],
 ):
@@ -80,6 +284,8 @@ async def client_by_id(
     ----------
     client_id : UUID
         UUID клиента, по которому запрашивается информация.
+    request : Request
+        Текущий запрос, по которому ищется ответ в кэше.
     _ : User
         Авторизованный пользователь, полученный через JWT-токен.
     client_service : ClientService
@@ -93,8 +299,293 @@ async def client_by_id(
     Notes
     -----
     - Объект пользователя не используется напрямую, но гарантирует проверку авторизации.
+    - Ответ кэшируется до изменения клиента или групп; с заголовком ``If-None-Match``
+      неизменившийся ответ возвращается как ``304 Not Modified``.
+    """
+    return await response_cache.serve(
+        request,
+        (client_scope(client_id), GROUPS_SCOPE),
+        lambda: client_service.get_client_by_id(client_id),
+    )
+
+
+@router.get(
+    "/{client_id}/visits",
+    response_model=VisitsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает страницу истории посещений клиента.",
+)
+@query_budget(4)
+async def client_visits(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    visit_service: Annotated[VisitService, Depends(get_visit_service)],
+    since: Annotated[
+        datetime | None,
+        Query(alias="from", description="Начало периода (включительно)."),
+    ] = None,
+    until: Annotated[
+        datetime | None,
+        Query(alias="to", description="Конец периода (не включительно)."),
+    ] = None,
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.VISITS_PAGE_SIZE_MAX, description="Размер страницы."),
+    ] = settings.VISITS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
+):
+    """Получение истории посещений клиента постранично.
+
+    Посещения возвращаются от новых к старым. Ограничение периода параметрами
+    `from` и `to` позволяет базе данных читать только секции таблицы посещений
+    за нужные месяцы.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    visit_service : VisitService
+        Сервис для работы с посещениями.
+    since : datetime | None
+        Начало периода по времени начала посещения (включительно).
+    until : datetime | None
+        Конец периода по времени начала посещения (не включительно).
+    limit : int
+        Размер страницы, не больше `VISITS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
+
+    Returns
+    -------
+    response : VisitsResponse
+        Страница истории посещений и курсор следующей страницы.
+    """
+    return await visit_service.get_client_visits(client_id, since, until, limit, cursor)
+
+
+@router.get(
+    "/{client_id}/transactions",
+    response_model=TransactionsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает страницу истории транзакций клиента.",
+)
+@query_budget(3)
+async def client_transactions(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    transaction_service: Annotated[
+        TransactionService, Depends(get_transaction_service)
+    ],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1, le=settings.TRANSACTIONS_PAGE_SIZE_MAX, description="Размер страницы."
+        ),
+    ] = settings.TRANSACTIONS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
+):
+    """Получение истории транзакций клиента постранично.
+
+    Транзакции возвращаются от новых к старым. Транзакции, удалённые
+    при уплотнении истории, в ответ не попадают, но учтены в балансе.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    transaction_service : TransactionService
+        Сервис для работы с транзакциями.
+    limit : int
+        Размер страницы, не больше `TRANSACTIONS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
+
+    Returns
+    -------
+    response : TransactionsResponse
+        Страница истории транзакций и курсор следующей страницы.
     """
-    return await client_service.get_client_by_id(client_id)
+    return await transaction_service.get_client_transactions(client_id, limit, cursor)
+
+
+@router.get(
+    "/{client_id}/balance",
+    response_model=BalanceResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает баланс клиента.",
+)
+@query_budget(3)
+async def client_balance(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    transaction_service: Annotated[
+        TransactionService, Depends(get_transaction_service)
+    ],
+):
+    """Получение баланса клиента.
+
+    Баланс поддерживается при проведении каждой транзакции и читается
+    одним запросом по первичному ключу.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    transaction_service : TransactionService
+        Сервис для работы с транзакциями.
+
+    Returns
+    -------
+    response : BalanceResponse
+        Баланс клиента.
+    """
+    return await transaction_service.get_balance(client_id)
+
+
+@router.get(
+    "/{client_id}/violations",
+    response_model=ViolationsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает страницу нарушений клиента.",
+)
+@query_budget(3)
+async def client_violations(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    violation_service: Annotated[ViolationService, Depends(get_violation_service)],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1, le=settings.VIOLATIONS_PAGE_SIZE_MAX, description="Размер страницы."
+        ),
+    ] = settings.VIOLATIONS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
+):
+    """Получение нарушений клиента постранично.
+
+    Нарушения возвращаются от новых к старым.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    violation_service : ViolationService
+        Сервис для работы с нарушениями.
+    limit : int
+        Размер страницы, не больше `VIOLATIONS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
+
+    Returns
+    -------
+    response : ViolationsResponse
+        Страница нарушений и курсор следующей страницы.
+    """
+    return await violation_service.get_client_violations(client_id, limit, cursor)
+
+
+@router.get(
+    "/{client_id}/comments",
+    response_model=CommentsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает страницу комментариев о клиенте.",
+)
+@query_budget(3)
+async def client_comments(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    comment_service: Annotated[CommentService, Depends(get_comment_service)],
+    limit: Annotated[
+        int,
+        Query(ge=1, le=settings.COMMENTS_PAGE_SIZE_MAX, description="Размер страницы."),
+    ] = settings.COMMENTS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
+):
+    """Получение комментариев о клиенте постранично.
+
+    Комментарии возвращаются от новых к старым.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    comment_service : CommentService
+        Сервис для работы с комментариями.
+    limit : int
+        Размер страницы, не больше `COMMENTS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
+
+    Returns
+    -------
+    response : CommentsResponse
+        Страница комментариев и курсор следующей страницы.
+    """
+    return await comment_service.get_client_records(client_id, limit, cursor)
+
+
+@router.get(
+    "/{client_id}/complaints",
+    response_model=ComplaintsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает страницу жалоб на клиента.",
+)
+@query_budget(3)
+async def client_complaints(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1, le=settings.COMPLAINTS_PAGE_SIZE_MAX, description="Размер страницы."
+        ),
+    ] = settings.COMPLAINTS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
+):
+    """Получение жалоб на клиента постранично.
+
+    Жалобы возвращаются от новых к старым.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    complaint_service : ComplaintService
+        Сервис для работы с жалобами.
+    limit : int
+        Размер страницы, не больше `COMPLAINTS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
+
+    Returns
+    -------
+    response : ComplaintsResponse
+        Страница жалоб и курсор следующей страницы.
+    """
+    return await complaint_service.get_client_records(client_id, limit, cursor)
 
 
 @router.post(
@@ -140,6 +631,58 @@ async def add_client(
     return await client_service.add_client(client_data)
 
 
+@router.post(
+    "/bulk",
+    response_model=ClientsImportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Пакетно добавляет клиентов из CSV или NDJSON.",
+)
+@query_budget(allow_repeats=True)
+async def import_clients(
+    request: Request,
+    _: Annotated[User, Depends(validate_access_token)],
+    client_service: Annotated[ClientService, Depends(get_clients_service)],
+):
+    """Пакетный импорт клиентов.
+
+    Тело запроса читается потоком и разбирается построчно, поэтому файл
+    не загружается в память целиком. Формат определяется заголовком `Content-Type`:
+
+    - `text/csv` — первая строка содержит названия полей `ClientRequest`;
+    - `application/x-ndjson` — каждая строка является JSON-объектом `ClientRequest`.
+
+    Parameters
+    ----------
+    request : Request
+        Объект запроса, из которого читается тело.
+    _ : User
+        Авторизованный пользователь, полученный через JWT-токен.
+    client_service : ClientService
+        Объект сервисного слоя для работы с клиентами.
+
+    Returns
+    -------
+    response : ClientsImportResponse
+        Количество добавленных клиентов и отчёт об ошибках по строкам.
+
+    Raises
+    ------
+    HTTPException
+        - 415 Unsupported Media Type: если формат тела не поддерживается.
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip()
+
+    if media_type not in (CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Поддерживаются форматы {CSV_MEDIA_TYPE} и {NDJSON_MEDIA_TYPE}.",
+        )
+
+    return await client_service.import_clients(
+        iter_records(request.stream(), media_type)
+    )
+
+
 @router.put(
     "/{client_id}",
     response_model=StandardResponse,
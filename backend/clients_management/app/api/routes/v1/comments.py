@@ -0,0 +1,172 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Body,
+    Path,
+)
+
+from app.api.dependencies.services import get_comment_service
+from app.api.dependencies.tokens import validate_access_token
+from app.database.tables.entities import User
+from app.schemas.v1.requests import CommentRequest, CommentUpdateRequest
+from app.schemas.v1.responses import (
+    CommentResponse,
+    CreatedResponse,
+    StandardResponse,
+)
+from app.services import CommentService
+
+router = APIRouter(
+    prefix="/comments",
+    tags=["comments"],
+)
+
+
+@router.post(
+    "/",
+    response_model=CreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Добавляет комментарий о клиенте.",
+)
+async def add_comment(
+    comment_data: Annotated[CommentRequest, Body()],
+    user: Annotated[User, Depends(validate_access_token)],
+    comment_service: Annotated[CommentService, Depends(get_comment_service)],
+):
+    """Добавляет новый комментарий о клиенте.
+
+    Автором комментария становится авторизованный пользователь.
+
+    Parameters
+    ----------
+    comment_data : CommentRequest
+        Данные нового комментария.
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    comment_service : CommentService
+        Сервис для работы с комментариями.
+
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешном создании комментария с кодом 201.
+    """
+    return await comment_service.add_record(user, comment_data)
+
+
+@router.get(
+    "/{comment_id}",
+    response_model=CommentResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает комментарий о клиенте.",
+)
+async def get_comment(
+    comment_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    comment_service: Annotated[CommentService, Depends(get_comment_service)],
+):
+    """Возвращает комментарий по UUID.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    comment_id : UUID
+        Уникальный идентификатор комментария.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    comment_service : CommentService
+        Сервис для работы с комментариями.
+
+    Returns
+    -------
+    CommentResponse
+        Комментарий.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если комментарий с данным UUID не найден.
+    """
+    return await comment_service.get_record(comment_id)
+
+
+@router.put(
+    "/{comment_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Обновляет комментарий о клиенте.",
+)
+async def update_comment(
+    comment_id: Annotated[UUID, Path()],
+    comment_data: Annotated[CommentUpdateRequest, Body()],
+    user: Annotated[User, Depends(validate_access_token)],
+    comment_service: Annotated[CommentService, Depends(get_comment_service)],
+):
+    """Обновляет текст комментария по UUID.
+
+    Изменить комментарий может только его автор.
+
+    Parameters
+    ----------
+    comment_id : UUID
+        Уникальный идентификатор комментария.
+    comment_data : CommentUpdateRequest
+        Новые данные комментария.
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    comment_service : CommentService
+        Сервис для работы с комментариями.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном обновлении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если комментарий не найден или оставлен другим пользователем.
+    """
+    return await comment_service.update_record(comment_id, user, comment_data)
+
+
+@router.delete(
+    "/{comment_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Удаляет комментарий о клиенте.",
+)
+async def delete_comment(
+    comment_id: Annotated[UUID, Path()],
+    user: Annotated[User, Depends(validate_access_token)],
+    comment_service: Annotated[CommentService, Depends(get_comment_service)],
+):
+    """Удаляет комментарий по UUID.
+
+    Удалить комментарий может только его автор.
+
+    Parameters
+    ----------
+    comment_id : UUID
+        Уникальный идентификатор комментария.
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    comment_service : CommentService
+        Сервис для работы с комментариями.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном удалении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если комментарий не найден или оставлен другим пользователем.
+    """
+    return await comment_service.delete_record(comment_id, user)
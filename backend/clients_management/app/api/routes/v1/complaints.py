@@ -0,0 +1,172 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Body,
+    Path,
+)
+
+from app.api.dependencies.services import get_complaint_service
+from app.api.dependencies.tokens import validate_access_token
+from app.database.tables.entities import User
+from app.schemas.v1.requests import ComplaintRequest, ComplaintUpdateRequest
+from app.schemas.v1.responses import (
+    ComplaintResponse,
+    CreatedResponse,
+    StandardResponse,
+)
+from app.services import ComplaintService
+
+router = APIRouter(
+    prefix="/complaints",
+    tags=["complaints"],
+)
+
+
+@router.post(
+    "/",
+    response_model=CreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Добавляет жалобу на клиента.",
+)
+async def add_complaint(
+    complaint_data: Annotated[ComplaintRequest, Body()],
+    user: Annotated[User, Depends(validate_access_token)],
+    complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
+):
+    """Добавляет новую жалобу на клиента.
+
+    Автором жалобы становится авторизованный пользователь.
+
+    Parameters
+    ----------
+    complaint_data : ComplaintRequest
+        Данные новой жалобы.
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    complaint_service : ComplaintService
+        Сервис для работы с жалобами.
+
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешном создании жалобы с кодом 201.
+    """
+    return await complaint_service.add_record(user, complaint_data)
+
+
+@router.get(
+    "/{complaint_id}",
+    response_model=ComplaintResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает жалобу на клиента.",
+)
+async def get_complaint(
+    complaint_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
+):
+    """Возвращает жалобу по UUID.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    complaint_id : UUID
+        Уникальный идентификатор жалобы.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    complaint_service : ComplaintService
+        Сервис для работы с жалобами.
+
+    Returns
+    -------
+    ComplaintResponse
+        Жалоба.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если жалоба с данным UUID не найдена.
+    """
+    return await complaint_service.get_record(complaint_id)
+
+
+@router.put(
+    "/{complaint_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Обновляет жалобу на клиента.",
+)
+async def update_complaint(
+    complaint_id: Annotated[UUID, Path()],
+    complaint_data: Annotated[ComplaintUpdateRequest, Body()],
+    user: Annotated[User, Depends(validate_access_token)],
+    complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
+):
+    """Обновляет текст жалобы по UUID.
+
+    Изменить жалобу может только её автор.
+
+    Parameters
+    ----------
+    complaint_id : UUID
+        Уникальный идентификатор жалобы.
+    complaint_data : ComplaintUpdateRequest
+        Новые данные жалобы.
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    complaint_service : ComplaintService
+        Сервис для работы с жалобами.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном обновлении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если жалоба не найдена или подана другим пользователем.
+    """
+    return await complaint_service.update_record(complaint_id, user, complaint_data)
+
+
+@router.delete(
+    "/{complaint_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Удаляет жалобу на клиента.",
+)
+async def delete_complaint(
+    complaint_id: Annotated[UUID, Path()],
+    user: Annotated[User, Depends(validate_access_token)],
+    complaint_service: Annotated[ComplaintService, Depends(get_complaint_service)],
+):
+    """Удаляет жалобу по UUID.
+
+    Удалить жалобу может только её автор.
+
+    Parameters
+    ----------
+    complaint_id : UUID
+        Уникальный идентификатор жалобы.
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    complaint_service : ComplaintService
+        Сервис для работы с жалобами.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном удалении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если жалоба не найдена или подана другим пользователем.
+    """
+    return await complaint_service.delete_record(complaint_id, user)
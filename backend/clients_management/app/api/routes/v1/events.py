@@ -0,0 +1,120 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.dependencies.services import get_auth_service
+from app.api.dependencies.tokens import validate_access_token, validate_events_access
+from app.core.change_feed import change_feed
+from app.core.config import Settings, get_settings
+from app.database.tables.entities import User
+from app.schemas.v1.responses import EventsTokenResponse
+from app.services import AuthService
+
+settings: Settings = get_settings()
+
+router = APIRouter(
+    prefix="/events",
+    tags=["events"],
+)
+
+
+@router.post(
+    "/token",
+    response_model=EventsTokenResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Выдаёт токен подписки на ленту изменений.",
+)
+async def events_token(
+    user: Annotated[User, Depends(validate_access_token)],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+):
+    """Выдаёт короткоживущий токен подписки на ленту изменений.
+
+    Браузерный ``EventSource`` не может передать заголовок ``Authorization``,
+    поэтому перед подключением клиент получает токен подписки и передаёт его
+    в параметре ``token``: ``new EventSource(`/api/v1/events/?token=${token}`)``.
+    Токен действует только для ``/events/`` и проверяется при подключении.
+
+    Parameters
+    ----------
+    user : User
+        Авторизованный пользователь (через validate_access_token).
+    auth_service : AuthService
+        Сервис авторизации.
+
+    Returns
+    -------
+    response : EventsTokenResponse
+        Токен и его время жизни в секундах.
+    """
+    return auth_service.create_events_token(user)
+
+
+@router.get(
+    "/",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Лента изменений посещений, клиентов и абонементов.",
+)
+async def change_events(
+    _: Annotated[User, Depends(validate_events_access)],
+    last_event_id: Annotated[
+        str | None,
+        Header(alias="Last-Event-ID", description="Последнее полученное событие."),
+    ] = None,
+    after: Annotated[
+        str | None,
+        Query(description="Последнее полученное событие, если заголовок не передан."),
+    ] = None,
+):
+    """Поток событий об изменениях в формате Server-Sent Events.
+
+    Заменяет периодический опрос списка клиентов и посещений: после каждого изменения
+    клиент получает компактное событие и перезапрашивает только затронутые данные.
+
+    Типы событий:
+
+    - ``visit.started``, ``visit.ended``, ``visit.deleted`` — посещения,
+      ``visits.started``, ``visits.ended`` — пакеты посещений;
+    - ``client.created``, ``client.updated``, ``client.deleted``, ``clients.imported`` —
+      клиенты;
+    - ``season_ticket.created``, ``season_ticket.updated``, ``season_ticket.deleted``,
+      ``season_tickets.expired`` — абонементы;
+    - ``reset`` — пропущенные события недоступны, данные нужно загрузить заново.
+
+    Требуется авторизация: токен доступа в заголовке ``Authorization`` или токен
+    подписки из ``POST /events/token`` в параметре ``token``.
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь (через validate_events_access).
+    last_event_id : str | None
+        Идентификатор последнего полученного события; браузер передаёт его
+        автоматически при переподключении.
+    after : str | None
+        То же, что ``Last-Event-ID``, для первого подключения после перезагрузки страницы.
+
+    Returns
+    -------
+    response : StreamingResponse
+        Бесконечный поток событий с типом `text/event-stream`.
+
+    Notes
+    -----
+    - Если клиент не успевает читать события, поток завершается; после переподключения
+      с ``Last-Event-ID`` пропущенные события отправляются из истории.
+    - Токен подписки проверяется только при подключении. Если браузер переподключается
+      после истечения токена и получает ошибку, клиент запрашивает новый токен
+      и подключается заново с ``after`` — последним полученным событием.
+    - При отсутствии событий каждые `CHANGE_FEED_KEEPALIVE_SECONDS` отправляется
+      комментарий, чтобы прокси не закрывали соединение.
+    """
+    subscription = change_feed.subscribe(last_event_id or after)
+
+    return StreamingResponse(
+        subscription.stream(settings.CHANGE_FEED_KEEPALIVE_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,312 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Body,
+    Path,
+    Query,
+)
+
+from app.api.dependencies.services import get_clients_service, get_group_service
+from app.api.dependencies.tokens import validate_access_token
+from app.core.config import Settings, get_settings
+from app.core.query_budget import query_budget
+from app.database.tables.entities import User
+from app.schemas.v1.requests import GroupMemberRequest, GroupRequest
+from app.schemas.v1.responses import (
+    CreatedResponse,
+    GroupMembersResponse,
+    GroupResponse,
+    StandardResponse,
+)
+from app.services import ClientService, GroupService
+
+settings: Settings = get_settings()
+
+router = APIRouter(
+    prefix="/groups",
+    tags=["groups"],
+)
+
+
+@router.post(
+    "/",
+    response_model=CreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Добавляет запись о новой группе.",
+)
+async def add_group(
+    group_data: Annotated[GroupRequest, Body()],
+    _: Annotated[User, Depends(validate_access_token)],
+    group_service: Annotated[GroupService, Depends(get_group_service)],
+):
+    """Добавляет новую группу клиентов.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    group_data : GroupRequest
+        Данные новой группы.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    group_service : GroupService
+        Сервис для работы с группами.
+
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешном создании группы с кодом 201.
+    """
+    return await group_service.add_group(group_data)
+
+
+@router.get(
+    "/{group_id}",
+    response_model=GroupResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает запись о группе.",
+)
+@query_budget(2)
+async def get_group(
+    group_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    group_service: Annotated[GroupService, Depends(get_group_service)],
+):
+    """Возвращает группу по UUID вместе с количеством участников.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    group_id : UUID
+        Уникальный идентификатор группы.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    group_service : GroupService
+        Сервис для работы с группами.
+
+    Returns
+    -------
+    GroupResponse
+        Группа.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если группа с данным UUID не найдена.
+    """
+    return await group_service.get_group(group_id)
+
+
+@router.put(
+    "/{group_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Обновляет запись о группе.",
+)
+async def update_group(
+    group_id: Annotated[UUID, Path()],
+    group_data: Annotated[GroupRequest, Body()],
+    _: Annotated[User, Depends(validate_access_token)],
+    group_service: Annotated[GroupService, Depends(get_group_service)],
+):
+    """Обновляет существующую группу по UUID.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    group_id : UUID
+        Уникальный идентификатор группы.
+    group_data : GroupRequest
+        Новые данные группы.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    group_service : GroupService
+        Сервис для работы с группами.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном обновлении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если группа с данным UUID не найдена.
+    """
+    return await group_service.update_group(group_id, group_data)
+
+
+@router.delete(
+    "/{group_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Удаляет запись о группе.",
+)
+async def delete_group(
+    group_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    group_service: Annotated[GroupService, Depends(get_group_service)],
+):
+    """Удаляет группу по UUID.
+
+    Клиенты группы не удаляются, удаляются только их связи с группой.
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    group_id : UUID
+        Уникальный идентификатор группы.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    group_service : GroupService
+        Сервис для работы с группами.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном удалении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если группа с данным UUID не найдена.
+    """
+    return await group_service.delete_group(group_id)
+
+
+@router.get(
+    "/{group_id}/members",
+    response_model=GroupMembersResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает страницу участников группы.",
+)
+@query_budget(3)
+async def group_members(
+    group_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    client_service: Annotated[ClientService, Depends(get_clients_service)],
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=settings.GROUP_MEMBERS_PAGE_SIZE_MAX,
+            description="Размер страницы.",
+        ),
+    ] = settings.GROUP_MEMBERS_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Курсор следующей страницы.")
+    ] = None,
+):
+    """Получение участников группы постранично.
+
+    Участники возвращаются в алфавитном порядке в сокращённом представлении
+    клиента вместе с ролью в группе.
+
+    Parameters
+    ----------
+    group_id : UUID
+        Уникальный идентификатор группы.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    client_service : ClientService
+        Сервис для работы с клиентами.
+    limit : int
+        Размер страницы, не больше `GROUP_MEMBERS_PAGE_SIZE_MAX`.
+    cursor : str | None
+        Курсор, полученный вместе с предыдущей страницей.
+
+    Returns
+    -------
+    GroupMembersResponse
+        Страница участников группы и курсор следующей страницы.
+    """
+    return await client_service.get_group_members(group_id, limit, cursor)
+
+
+@router.post(
+    "/{group_id}/members",
+    response_model=CreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Добавляет клиента в группу.",
+)
+async def add_group_member(
+    group_id: Annotated[UUID, Path()],
+    member_data: Annotated[GroupMemberRequest, Body()],
+    _: Annotated[User, Depends(validate_access_token)],
+    group_service: Annotated[GroupService, Depends(get_group_service)],
+):
+    """Добавляет клиента в группу с указанной ролью.
+
+    Количество участников группы увеличивается в той же транзакции.
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    group_id : UUID
+        Уникальный идентификатор группы.
+    member_data : GroupMemberRequest
+        Добавляемый клиент и его роль в группе.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    group_service : GroupService
+        Сервис для работы с группами.
+
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешном добавлении с кодом 201.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если группа или клиент не найдены
+        или клиент уже состоит в группе.
+    """
+    return await group_service.add_member(group_id, member_data)
+
+
+@router.delete(
+    "/{group_id}/members/{client_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Исключает клиента из группы.",
+)
+async def remove_group_member(
+    group_id: Annotated[UUID, Path()],
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    group_service: Annotated[GroupService, Depends(get_group_service)],
+):
+    """Исключает клиента из группы.
+
+    Количество участников группы уменьшается в той же транзакции.
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    group_id : UUID
+        Уникальный идентификатор группы.
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    group_service : GroupService
+        Сервис для работы с группами.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном исключении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если клиент не состоит в группе.
+    """
+    return await group_service.remove_member(group_id, client_id)
@@ -0,0 +1,105 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.dependencies.session import engine
+from app.core.metrics import request_metrics
+from app.core.response_cache import response_cache
+from app.core.token_cache import access_token_cache
+from app.schemas.v1.responses import (
+    PoolStatsResponse,
+    ResponseCacheStatsResponse,
+    TokenCacheStatsResponse,
+)
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["metrics"],
+)
+
+
+@router.get(
+    "/",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Показатели процесса в формате Prometheus.",
+)
+async def prometheus_metrics():
+    """Запрос на получение показателей процесса в текстовом формате Prometheus.
+
+    Включает гистограммы длительности запросов по маршрутам, количество запросов
+    по кодам ответа (для расчёта доли ошибок), количество запросов в обработке,
+    количество SQL-запросов и время работы с базой данных на один запрос,
+    а также состояние пула соединений.
+
+    Счётчики относятся к текущему процессу (воркеру) и сбрасываются при его перезапуске.
+
+    Returns
+    -------
+    response : PlainTextResponse
+        Показатели в формате ``text/plain; version=0.0.4``.
+    """
+    return PlainTextResponse(
+        request_metrics.render(engine.pool.snapshot()),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get(
+    "/token_cache",
+    response_model=TokenCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Статистика кэша токенов доступа.",
+)
+async def token_cache_stats():
+    """Запрос на получение статистики кэша проверенных токенов доступа.
+
+    Счётчики относятся к текущему процессу (воркеру) и сбрасываются при его перезапуске.
+
+    Returns
+    -------
+    response : TokenCacheStatsResponse
+        Размер кэша, его ёмкость, количество попаданий и промахов.
+    """
+    return TokenCacheStatsResponse(**access_token_cache.stats())
+
+
+@router.get(
+    "/response_cache",
+    response_model=ResponseCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Статистика кэша ответов.",
+)
+async def response_cache_stats():
+    """Запрос на получение статистики кэша ответов читающих эндпоинтов.
+
+    Счётчики относятся к текущему процессу (воркеру) и сбрасываются при его перезапуске.
+
+    Returns
+    -------
+    response : ResponseCacheStatsResponse
+        Количество попаданий, промахов и ответов ``304 Not Modified``.
+    """
+    return ResponseCacheStatsResponse(**response_cache.stats())
+
+
+@router.get(
+    "/pool",
+    response_model=PoolStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Статистика пула соединений с базой данных.",
+)
+async def pool_stats():
+    """Запрос на получение статистики пула соединений с базой данных.
+
+    Позволяет подобрать размер пула для воркера под нагрузкой: большое значение ``waits``
+    или ненулевое ``timeouts`` означает, что пула не хватает, а частые ``overflow_checkouts`` —
+    что ``DATABASE_POOL_SIZE`` стоит увеличить.
+
+    Счётчики относятся к текущему процессу (воркеру) и сбрасываются при его перезапуске.
+
+    Returns
+    -------
+    response : PoolStatsResponse
+        Текущее состояние пула и накопительные счётчики выдачи соединений.
+    """
+    return PoolStatsResponse(**engine.pool.snapshot())
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import Annotated
 from uuid import UUID
 
@@ -7,24 +8,109 @@ from fastapi import (
     status,
     Body,
     Path,
+    Query,
 )
 
 from app.api.dependencies.services import get_season_ticket_service
 from app.api.dependencies.tokens import validate_access_token
+from app.core.config import Settings, get_settings
 from app.database.tables.entities import User
 from app.schemas.v1.requests import SeasonTicketRequest
 from app.schemas.v1.responses import (
     CreatedResponse,
+    SeasonTicketResponse,
+    SeasonTicketsResponse,
     StandardResponse,
 )
 from app.services import SeasonTicketService
 
+settings: Settings = get_settings()
+
 router = APIRouter(
     prefix="/season_tickets",
     tags=["season_tickets"],
 )
 
 
+@router.get(
+    "/expiring",
+    response_model=SeasonTicketsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает абонементы, срок действия которых скоро истекает.",
+)
+async def expiring_season_tickets(
+    _: Annotated[User, Depends(validate_access_token)],
+    season_ticket_service: Annotated[
+        SeasonTicketService, Depends(get_season_ticket_service)
+    ],
+    within: Annotated[
+        timedelta,
+        Query(description="Период от текущего момента (длительность ISO 8601)."),
+    ] = timedelta(days=7),
+    limit: Annotated[
+        int,
+        Query(
+            ge=1,
+            le=settings.SEASON_TICKETS_EXPIRING_LIMIT_MAX,
+            description="Максимальное количество абонементов.",
+        ),
+    ] = settings.SEASON_TICKETS_EXPIRING_LIMIT,
+):
+    """Возвращает абонементы, срок действия которых истекает в ближайший период.
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    season_ticket_service : SeasonTicketService
+        Сервис для работы с абонементами.
+    within : timedelta
+        Период от текущего момента, например ``P7D`` или ``PT12H``. По умолчанию 7 дней.
+    limit : int
+        Максимальное количество абонементов, не больше `SEASON_TICKETS_EXPIRING_LIMIT_MAX`.
+
+    Returns
+    -------
+    SeasonTicketsResponse
+        Абонементы в порядке истечения срока действия.
+    """
+    return await season_ticket_service.get_expiring_season_tickets(within, limit)
+
+
+@router.get(
+    "/current/{client_id}",
+    response_model=SeasonTicketResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает действующий абонемент клиента.",
+)
+async def current_season_ticket(
+    client_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    season_ticket_service: Annotated[
+        SeasonTicketService, Depends(get_season_ticket_service)
+    ],
+):
+    """Возвращает действующий абонемент клиента.
+
+    Действующим считается не истёкший абонемент с наибольшим сроком действия.
+
+    Parameters
+    ----------
+    client_id : UUID
+        Уникальный идентификатор клиента.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    season_ticket_service : SeasonTicketService
+        Сервис для работы с абонементами.
+
+    Returns
+    -------
+    SeasonTicketResponse
+        Действующий абонемент клиента.
+    """
+    return await season_ticket_service.get_current_season_ticket(client_id)
+
+
 @router.post(
     "/",
     response_model=CreatedResponse,
@@ -0,0 +1,96 @@
+from typing import Annotated, List
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Body,
+)
+
+from app.api.dependencies.services import get_transaction_service
+from app.api.dependencies.tokens import validate_access_token
+from app.core.config import Settings, get_settings
+from app.database.tables.entities import User
+from app.schemas.v1.requests import TransactionRequest
+from app.schemas.v1.responses import CreatedResponse, TransactionBatchResponse
+from app.services import TransactionService
+
+settings: Settings = get_settings()
+
+router = APIRouter(
+    prefix="/transactions",
+    tags=["transactions"],
+)
+
+
+@router.post(
+    "/",
+    response_model=CreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Проводит транзакцию клиента.",
+)
+async def add_transaction(
+    transaction_data: Annotated[TransactionRequest, Body()],
+    _: Annotated[User, Depends(validate_access_token)],
+    transaction_service: Annotated[
+        TransactionService, Depends(get_transaction_service)
+    ],
+):
+    """Проводит транзакцию и изменяет баланс клиента.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    transaction_data : TransactionRequest
+        Данные новой транзакции.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    transaction_service : TransactionService
+        Сервис для работы с транзакциями.
+
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешном проведении транзакции с кодом 201.
+    """
+    return await transaction_service.add_transaction(transaction_data)
+
+
+@router.post(
+    "/batch",
+    response_model=TransactionBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Проводит несколько транзакций.",
+)
+async def add_transactions(
+    transactions_data: Annotated[
+        List[TransactionRequest],
+        Body(min_length=1, max_length=settings.TRANSACTIONS_BATCH_MAX_SIZE),
+    ],
+    _: Annotated[User, Depends(validate_access_token)],
+    transaction_service: Annotated[
+        TransactionService, Depends(get_transaction_service)
+    ],
+):
+    """Проводит несколько транзакций одной транзакцией базы данных.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    transactions_data : List[TransactionRequest]
+        Данные новых транзакций, не больше `TRANSACTIONS_BATCH_MAX_SIZE`.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    transaction_service : TransactionService
+        Сервис для работы с транзакциями.
+
+    Returns
+    -------
+    TransactionBatchResponse
+        Результаты по каждой транзакции в порядке запроса.
+    """
+    return TransactionBatchResponse(
+        items=await transaction_service.add_transactions(transactions_data)
+    )
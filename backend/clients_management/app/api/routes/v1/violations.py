@@ -0,0 +1,174 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    status,
+    Body,
+    Path,
+)
+
+from app.api.dependencies.services import get_violation_service
+from app.api.dependencies.tokens import validate_access_token
+from app.database.tables.entities import User
+from app.schemas.v1.requests import ViolationRequest, ViolationUpdateRequest
+from app.schemas.v1.responses import (
+    CreatedResponse,
+    StandardResponse,
+    ViolationResponse,
+)
+from app.services import ViolationService
+
+router = APIRouter(
+    prefix="/violations",
+    tags=["violations"],
+)
+
+
+@router.post(
+    "/",
+    response_model=CreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Добавляет запись о новом нарушении.",
+)
+async def add_violation(
+    violation_data: Annotated[ViolationRequest, Body()],
+    _: Annotated[User, Depends(validate_access_token)],
+    violation_service: Annotated[ViolationService, Depends(get_violation_service)],
+):
+    """Добавляет новое нарушение клиента.
+
+    Создаёт запись нарушения и в той же транзакции пересчитывает количество
+    нарушений клиента в сводке. Требуется авторизация.
+
+    Parameters
+    ----------
+    violation_data : ViolationRequest
+        Данные нового нарушения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    violation_service : ViolationService
+        Сервис для работы с нарушениями.
+
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешном создании нарушения с кодом 201.
+    """
+    return await violation_service.add_violation(violation_data)
+
+
+@router.get(
+    "/{violation_id}",
+    response_model=ViolationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает запись о нарушении.",
+)
+async def get_violation(
+    violation_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    violation_service: Annotated[ViolationService, Depends(get_violation_service)],
+):
+    """Возвращает нарушение по UUID.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    violation_id : UUID
+        Уникальный идентификатор нарушения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    violation_service : ViolationService
+        Сервис для работы с нарушениями.
+
+    Returns
+    -------
+    ViolationResponse
+        Нарушение.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если нарушение с данным UUID не найдено.
+    """
+    return await violation_service.get_violation(violation_id)
+
+
+@router.put(
+    "/{violation_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Обновляет запись о нарушении.",
+)
+async def update_violation(
+    violation_id: Annotated[UUID, Path()],
+    violation_data: Annotated[ViolationUpdateRequest, Body()],
+    _: Annotated[User, Depends(validate_access_token)],
+    violation_service: Annotated[ViolationService, Depends(get_violation_service)],
+):
+    """Обновляет существующее нарушение по UUID.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    violation_id : UUID
+        Уникальный идентификатор нарушения.
+    violation_data : ViolationUpdateRequest
+        Новые данные нарушения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    violation_service : ViolationService
+        Сервис для работы с нарушениями.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном обновлении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если нарушение с данным UUID не найдено.
+    """
+    return await violation_service.update_violation(violation_id, violation_data)
+
+
+@router.delete(
+    "/{violation_id}",
+    response_model=StandardResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Удаляет запись о нарушении.",
+)
+async def delete_violation(
+    violation_id: Annotated[UUID, Path()],
+    _: Annotated[User, Depends(validate_access_token)],
+    violation_service: Annotated[ViolationService, Depends(get_violation_service)],
+):
+    """Удаляет нарушение по UUID.
+
+    Удаляет запись нарушения и в той же транзакции пересчитывает количество
+    нарушений клиента в сводке. Требуется авторизация.
+
+    Parameters
+    ----------
+    violation_id : UUID
+        Уникальный идентификатор нарушения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    violation_service : ViolationService
+        Сервис для работы с нарушениями.
+
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном удалении с кодом 200.
+
+    Raises
+    ------
+    HTTPException
+        Возвращается, если нарушение с данным UUID не найдено.
+    """
+    return await violation_service.delete_violation(violation_id)
@@ -1,26 +1,35 @@
-from typing import Annotated
+from typing import Annotated, List
 from uuid import UUID
-from datetime import datetime, timezone
 
 from fastapi import (
     APIRouter,
     Depends,
     status,
     Body,
-    Path,
+    Header,
     HTTPException,
+    Path,
 )
-from sqlalchemy import select, delete
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from app.api.dependencies.session import get_session
+from app.api.dependencies.services import get_visit_service
+from app.api.dependencies.session import get_session_maker
 from app.api.dependencies.tokens import validate_access_token
-from app.database.tables.entities import User, Visit
+from app.core.config import Settings, get_settings
+from app.core.query_budget import query_budget
+from app.database.tables.entities import User
 from app.schemas.v1.requests import VisitRequest
 from app.schemas.v1.responses import (
+    ActiveVisitsResponse,
     CreatedResponse,
+    FreeBoxesResponse,
     StandardResponse,
+    VisitBatchResponse,
 )
+from app.services import VisitService
+from app.services.visit_batcher import visit_start_batcher
+
+settings: Settings = get_settings()
 
 router = APIRouter(
     prefix="/visits",
@@ -28,6 +37,62 @@ router = APIRouter(
 )
 
 
+@router.get(
+    "/active",
+    response_model=ActiveVisitsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает клиентов, находящихся в зале.",
+)
+@query_budget(1)
+async def get_active_visits(
+    _: Annotated[User, Depends(validate_access_token)],
+):
+    """Возвращает незавершённые посещения.
+
+    Данные берутся из индекса заполненности в памяти процесса, без запросов к базе данных.
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+
+    Returns
+    -------
+    ActiveVisitsResponse
+        Незавершённые посещения в порядке их начала.
+    """
+    return VisitService.get_active_visits()
+
+
+@router.get(
+    "/boxes/free",
+    response_model=FreeBoxesResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Возвращает свободные ящики.",
+)
+@query_budget(1)
+async def get_free_boxes(
+    _: Annotated[User, Depends(validate_access_token)],
+):
+    """Возвращает свободные ящики.
+
+    Данные берутся из индекса заполненности в памяти процесса, без запросов к базе данных.
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+
+    Returns
+    -------
+    FreeBoxesResponse
+        Номера свободных ящиков, общее количество ящиков и количество занятых.
+    """
+    return VisitService.get_free_boxes()
+
+
 @router.post(
     "/start",
     response_model=CreatedResponse,
@@ -37,27 +102,128 @@ router = APIRouter(
 async def start_visit(
     visit_data: Annotated[VisitRequest, Body()],
     _: Annotated[User, Depends(validate_access_token)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    visit_service: Annotated[VisitService, Depends(get_visit_service)],
+    session_maker: Annotated[async_sessionmaker, Depends(get_session_maker)],
 ):
-    session.add(visit := Visit(**visit_data.model_dump()))
-    await session.flush()
+    """Регистрирует начало посещения.
+
+    Если включена настройка `VISITS_MICRO_BATCHING`, запросы, поступившие в течение
+    `VISITS_MICRO_BATCH_WINDOW_MS`, записываются одной транзакцией.
+    Если включена настройка `VISITS_REQUIRE_SEASON_TICKET`, клиент без действующего
+    абонемента получает ответ 403 с причиной отказа.
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    visit_data : VisitRequest
+        Данные нового посещения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    visit_service : VisitService
+        Сервис для работы с посещениями.
+    session_maker : async_sessionmaker
+        Фабрика асинхронных сессий для пакетной записи.
 
-    try:
-        await session.commit()
-    except Exception as _:
-        await session.rollback()
+    Returns
+    -------
+    CreatedResponse
+        Сообщение об успешной регистрации посещения с кодом 201.
+    """
+    if not settings.VISITS_MICRO_BATCHING:
+        return await visit_service.start_visit(visit_data)
+
+    item = await visit_start_batcher.submit(session_maker, visit_data)
+
+    if item.status == "not_found":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Клиент с id={visit_data.client_id} не найден!",
+        )
 
+    if item.status != "started":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Неизвестная ошибка.",
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=item.detail,
         )
 
     return CreatedResponse(
         message="Посещение успешно зарегистрировано.",
-        id=visit.id,
+        id=item.id,
     )
 
 
+@router.post(
+    "/start/batch",
+    response_model=VisitBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Добавляет записи о нескольких посещениях.",
+)
+@query_budget(4)
+async def start_visits(
+    visits_data: Annotated[
+        List[VisitRequest],
+        Body(min_length=1, max_length=settings.VISITS_BATCH_MAX_SIZE),
+    ],
+    _: Annotated[User, Depends(validate_access_token)],
+    visit_service: Annotated[VisitService, Depends(get_visit_service)],
+):
+    """Регистрирует начало нескольких посещений одной транзакцией.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    visits_data : List[VisitRequest]
+        Данные новых посещений, не больше `VISITS_BATCH_MAX_SIZE`.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    visit_service : VisitService
+        Сервис для работы с посещениями.
+
+    Returns
+    -------
+    VisitBatchResponse
+        Результаты по каждому посещению в порядке запроса.
+    """
+    return VisitBatchResponse(items=await visit_service.start_visits(visits_data))
+
+
+@router.post(
+    "/end/batch",
+    response_model=VisitBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Закрывает несколько посещений.",
+)
+@query_budget(3)
+async def end_visits(
+    visit_ids: Annotated[
+        List[UUID],
+        Body(min_length=1, max_length=settings.VISITS_BATCH_MAX_SIZE),
+    ],
+    _: Annotated[User, Depends(validate_access_token)],
+    visit_service: Annotated[VisitService, Depends(get_visit_service)],
+):
+    """Завершает несколько посещений одной транзакцией.
+
+    Требуется авторизация.
+
+    Parameters
+    ----------
+    visit_ids : List[UUID]
+        UUID посещений, не больше `VISITS_BATCH_MAX_SIZE`.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    visit_service : VisitService
+        Сервис для работы с посещениями.
+
+    Returns
+    -------
+    VisitBatchResponse
+        Результаты по каждому посещению в порядке запроса.
+    """
+    return VisitBatchResponse(items=await visit_service.end_visits(visit_ids))
+
+
 @router.put(
     "/end/{visit_id}",
     response_model=StandardResponse,
@@ -67,22 +233,40 @@ async def start_visit(
 async def end_visit(
     visit_id: Annotated[UUID, Path()],
     _: Annotated[User, Depends(validate_access_token)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    visit_service: Annotated[VisitService, Depends(get_visit_service)],
+    idempotency_key: Annotated[
+        str | None, Header(alias="Idempotency-Key", max_length=128)
+    ] = None,
 ):
-    visit: Visit = await session.scalar(select(Visit).where(Visit.id == visit_id))
-    visit.visit_end = datetime.now(timezone.utc)
+    """Завершает посещение.
 
-    try:
-        await session.commit()
-    except Exception as _:
-        await session.rollback()
+    Требуется авторизация.
 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Неизвестная ошибка.",
-        )
+    Parameters
+    ----------
+    visit_id : UUID
+        UUID посещения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    visit_service : VisitService
+        Сервис для работы с посещениями.
+    idempotency_key : str | None
+        Ключ идемпотентности из заголовка `Idempotency-Key`. Повтор запроса
+        с тем же ключом возвращает исходный ответ.
 
-    return StandardResponse(message="Посещение успешно завершено.")
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном завершении посещения.
+
+    Raises
+    ------
+    HTTPException
+        - 404 Not Found: если посещение не найдено.
+        - 409 Conflict: если посещение уже завершено (и ключ идемпотентности не передан
+          или ранее не использовался).
+    """
+    return await visit_service.end_visit(visit_id, idempotency_key)
 
 
 @router.delete(
@@ -91,21 +275,27 @@ async def end_visit(
     status_code=status.HTTP_200_OK,
     summary="Удаляет запись о посещении.",
 )
-async def delete_season_ticket(
+async def delete_visit(
     visit_id: Annotated[UUID, Path()],
     _: Annotated[User, Depends(validate_access_token)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+    visit_service: Annotated[VisitService, Depends(get_visit_service)],
 ):
-    await session.execute(delete(Visit).where(Visit.id == visit_id))
+    """Удаляет посещение.
 
-    try:
-        await session.commit()
-    except Exception as _:
-        await session.rollback()
+    Требуется авторизация.
 
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Неизвестная ошибка.",
-        )
+    Parameters
+    ----------
+    visit_id : UUID
+        UUID посещения.
+    _ : User
+        Авторизованный пользователь (через validate_access_token).
+    visit_service : VisitService
+        Сервис для работы с посещениями.
 
-    return StandardResponse(message="Посещение успешно удалено.")
+    Returns
+    -------
+    StandardResponse
+        Сообщение об успешном удалении посещения.
+    """
+    return await visit_service.delete_visit(visit_id)
@@ -0,0 +1,60 @@
+"""Обслуживание агрегатов аналитики.
+
+Использование::
+
+    python -m app.commands.analytics roll_up
+    python -m app.commands.analytics rebuild
+
+``roll_up`` добавляет в агрегаты новые записи так же, как фоновая задача,
+``rebuild`` перестраивает агрегаты по всей истории (после изменения
+``ANALYTICS_TIMEZONE``).
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+
+from app.api.dependencies.session import AsyncSessionMaker
+from app.core.config import Settings, get_settings
+from app.repositories import AnalyticsRepository
+from app.services import AnalyticsService
+
+settings: Settings = get_settings()
+
+
+async def main(command: str) -> int:
+    """Выполняет команду обслуживания агрегатов.
+
+    Parameters
+    ----------
+    command : str
+        ``roll_up`` или ``rebuild``.
+
+    Returns
+    -------
+    exit_code : int
+        Код завершения процесса.
+    """
+    until = datetime.now(timezone.utc) - timedelta(
+        seconds=settings.ANALYTICS_ROLLUP_LAG_SECONDS
+    )
+
+    async with AsyncSessionMaker() as session:
+        analytics_service = AnalyticsService(AnalyticsRepository(session))
+
+        if command == "rebuild":
+            hours, days = await analytics_service.rebuild(until)
+        else:
+            hours, days = await analytics_service.roll_up(until)
+
+    print(f"Агрегаты обновлены, часовых строк: {hours}, дневных строк: {days}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Обслуживание агрегатов аналитики.")
+    parser.add_argument("command", choices=("roll_up", "rebuild"))
+
+    sys.exit(asyncio.run(main(parser.parse_args().command)))
@@ -0,0 +1,55 @@
+"""Обслуживание сводки по клиентам.
+
+Использование::
+
+    python -m app.commands.client_summary rebuild
+    python -m app.commands.client_summary check
+
+Команда ``check`` завершается с кодом 1, если найдены клиенты с несогласованной сводкой.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from app.api.dependencies.session import AsyncSessionMaker
+from app.repositories import ClientSummaryRepository
+from app.services import ClientSummaryService
+
+
+async def main(command: str) -> int:
+    """Выполняет команду обслуживания сводки.
+
+    Parameters
+    ----------
+    command : str
+        ``rebuild`` или ``check``.
+
+    Returns
+    -------
+    exit_code : int
+        Код завершения процесса.
+    """
+    async with AsyncSessionMaker() as session:
+        client_summary_service = ClientSummaryService(ClientSummaryRepository(session))
+
+        if command == "rebuild":
+            count = await client_summary_service.rebuild()
+            print(f"Сводка перестроена, строк: {count}.")
+
+            return 0
+
+        client_ids = await client_summary_service.check()
+        for client_id in client_ids:
+            print(client_id)
+
+        print(f"Несогласованных строк сводки: {len(client_ids)}.", file=sys.stderr)
+
+        return 1 if client_ids else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Обслуживание сводки по клиентам.")
+    parser.add_argument("command", choices=("rebuild", "check"))
+
+    sys.exit(asyncio.run(main(parser.parse_args().command)))
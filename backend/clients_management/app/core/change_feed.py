@@ -0,0 +1,284 @@
+import asyncio
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Set
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import Settings, get_settings
+
+settings: Settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    """Событие ленты изменений.
+
+    Attributes
+    ----------
+    seq : int
+        Порядковый номер события в процессе.
+    frame : str
+        Событие, уже сериализованное в формат Server-Sent Events.
+    """
+
+    seq: int
+    frame: str
+
+
+class ChangeSubscription:
+    """Подписка одного соединения на ленту изменений.
+
+    Новые события попадают в ограниченную очередь подписки. Если соединение не успевает
+    их читать и очередь заполняется, подписка отключается: очередь очищается,
+    а поток завершается, после чего клиент переподключается с последним полученным
+    идентификатором события и получает пропущенные события из истории ленты.
+
+    Attributes
+    ----------
+    feed : ChangeFeed
+        Лента, на которую оформлена подписка.
+    backlog : List[ChangeEvent]
+        События из истории, которые нужно отправить до новых.
+    reset : bool
+        Нужно ли сообщить клиенту, что продолжить с его события невозможно.
+
+    Methods
+    -------
+    stream(keepalive)
+        Возвращает поток событий в формате Server-Sent Events.
+    offer(event)
+        Кладёт событие в очередь подписки, не дожидаясь места в ней.
+    """
+
+    def __init__(
+        self,
+        feed: "ChangeFeed",
+        queue_size: int,
+        backlog: List[ChangeEvent],
+        reset: bool,
+    ):
+        self.feed: ChangeFeed = feed
+        self.backlog: List[ChangeEvent] = backlog
+        self.reset: bool = reset
+
+        self._queue: asyncio.Queue[ChangeEvent | None] = asyncio.Queue(queue_size)
+
+    async def stream(self, keepalive: float) -> AsyncIterator[str]:
+        """Возвращает поток событий в формате Server-Sent Events.
+
+        Parameters
+        ----------
+        keepalive : float
+            Через сколько секунд без событий отправляется комментарий,
+            не дающий прокси закрыть соединение.
+
+        Yields
+        ------
+        frame : str
+            Событие или комментарий в формате Server-Sent Events.
+        """
+        try:
+            if self.reset:
+                yield self.feed.reset_frame()
+
+            for event in self.backlog:
+                yield event.frame
+
+            self.backlog = []
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), keepalive)
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    return
+
+                yield event.frame
+        finally:
+            self.feed.unsubscribe(self)
+
+    def offer(self, event: ChangeEvent) -> bool:
+        """Кладёт событие в очередь подписки, не дожидаясь места в ней.
+
+        Parameters
+        ----------
+        event : ChangeEvent
+            Опубликованное событие.
+
+        Returns
+        -------
+        accepted : bool
+            False, если очередь заполнена и подписка отключена.
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+            self._queue.put_nowait(None)
+
+            return False
+
+        return True
+
+
+class ChangeFeed:
+    """Лента изменений посещений, клиентов и абонементов в памяти процесса.
+
+    Сервисы публикуют компактные события после коммита; каждое событие получает
+    порядковый номер, сохраняется в ограниченной истории и раздаётся подписчикам
+    без ожидания, поэтому медленное соединение не задерживает запись.
+
+    Идентификатор события имеет вид ``<эпоха>-<номер>``, где эпоха меняется при каждом
+    запуске процесса. Подписчик, переподключившийся с идентификатором последнего
+    полученного события, получает пропущенные события из истории; если их там уже нет
+    или идентификатор относится к другой эпохе, он получает событие ``reset``
+    и должен заново загрузить данные.
+
+    Attributes
+    ----------
+    history_size : int
+        Количество последних событий, доступных для продолжения.
+    queue_size : int
+        Размер очереди каждого подписчика.
+    epoch : str
+        Эпоха текущего процесса.
+    published : int
+        Количество опубликованных событий.
+    overflows : int
+        Количество подписок, отключённых из-за заполненной очереди.
+
+    Methods
+    -------
+    publish(event_type, data)
+        Публикует событие.
+    subscribe(last_event_id)
+        Оформляет подписку, продолжающую ленту после указанного события.
+    unsubscribe(subscription)
+        Отменяет подписку.
+    reset_frame()
+        Возвращает событие ``reset`` с текущим идентификатором.
+    clear()
+        Очищает историю, подписки и счётчики.
+
+    Notes
+    -----
+    - Лента принадлежит процессу: подписчик получает только события, опубликованные
+      воркером, который обслуживает его соединение.
+    """
+
+    def __init__(self, history_size: int, queue_size: int):
+        self.history_size: int = history_size
+        self.queue_size: int = queue_size
+        self.epoch: str = uuid4().hex[:8]
+        self.published: int = 0
+        self.overflows: int = 0
+
+        self._seq: int = 0
+        self._history: Deque[ChangeEvent] = deque(maxlen=history_size)
+        self._subscriptions: Set[ChangeSubscription] = set()
+
+    def publish(self, event_type: str, data: Dict[str, Any]):
+        """Публикует событие.
+
+        Parameters
+        ----------
+        event_type : str
+            Тип события, например ``visit.started``.
+        data : Dict[str, Any]
+            Данные события.
+        """
+        self._seq += 1
+        self.published += 1
+
+        payload = json.dumps(
+            jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")
+        )
+        event = ChangeEvent(
+            seq=self._seq,
+            frame=f"{self._id_line()}event: {event_type}\ndata: {payload}\n\n",
+        )
+
+        self._history.append(event)
+
+        for subscription in list(self._subscriptions):
+            if not subscription.offer(event):
+                self._subscriptions.discard(subscription)
+                self.overflows += 1
+
+    def subscribe(self, last_event_id: str | None) -> ChangeSubscription:
+        """Оформляет подписку, продолжающую ленту после указанного события.
+
+        Parameters
+        ----------
+        last_event_id : str | None
+            Идентификатор последнего полученного события или None
+            для подписки только на новые события.
+
+        Returns
+        -------
+        subscription : ChangeSubscription
+            Подписка с событиями из истории, пропущенными клиентом.
+        """
+        backlog, reset = [], False
+
+        if last_event_id is not None:
+            epoch, _, seq = last_event_id.partition("-")
+            oldest = self._history[0].seq if self._history else self._seq + 1
+
+            if (
+                epoch != self.epoch
+                or not seq.isdigit()
+                or int(seq) > self._seq
+                or int(seq) < oldest - 1
+            ):
+                reset = True
+            else:
+                backlog = [event for event in self._history if event.seq > int(seq)]
+
+        subscription = ChangeSubscription(self, self.queue_size, backlog, reset)
+        self._subscriptions.add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription):
+        """Отменяет подписку.
+
+        Parameters
+        ----------
+        subscription : ChangeSubscription
+            Отменяемая подписка.
+        """
+        self._subscriptions.discard(subscription)
+
+    def reset_frame(self) -> str:
+        """Возвращает событие ``reset`` с текущим идентификатором.
+
+        Returns
+        -------
+        frame : str
+            Событие в формате Server-Sent Events.
+        """
+        return f"{self._id_line()}event: reset\ndata: {{}}\n\n"
+
+    def clear(self):
+        """Очищает историю, подписки и счётчики."""
+        self._seq = 0
+        self._history.clear()
+        self._subscriptions.clear()
+        self.published = self.overflows = 0
+
+    def _id_line(self) -> str:
+        return f"id: {self.epoch}-{self._seq}\n"
+
+
+change_feed: ChangeFeed = ChangeFeed(
+    settings.CHANGE_FEED_HISTORY_SIZE, settings.CHANGE_FEED_QUEUE_SIZE
+)
@@ -1,6 +1,6 @@
 from functools import lru_cache
 from os.path import abspath
-from typing import List
+from typing import List, Literal
 
 from pydantic import EmailStr, field_validator
 from pydantic_settings import SettingsConfigDict, BaseSettings
@@ -51,6 +51,22 @@ class Settings(BaseSettings):
         Строка подключения (ссылка) к базе данных.
     TEST_DATABASE_URL : str
         Строка подключения к тестовой базе данных.
+    DATABASE_POOL_SIZE : int
+        Количество постоянных соединений в пуле.
+    DATABASE_MAX_OVERFLOW : int
+        Количество соединений, которые могут быть открыты сверх ``DATABASE_POOL_SIZE``.
+    DATABASE_POOL_TIMEOUT : float
+        Время ожидания свободного соединения в секундах.
+    DATABASE_POOL_RECYCLE : int
+        Время жизни соединения в секундах, после которого оно переоткрывается.
+        Значение -1 отключает переоткрытие.
+    DATABASE_POOL_PRE_PING : bool
+        Проверять ли соединение дополнительным запросом при каждой выдаче из пула.
+    DATABASE_STATEMENT_CACHE_SIZE : int
+        Размер кэша подготовленных выражений asyncpg на соединение.
+        Значение 0 отключает кэш (необходимо при работе через pgbouncer).
+    DATABASE_STATEMENT_TIMEOUT_MS : int
+        Серверный ``statement_timeout`` в миллисекундах. Значение 0 отключает ограничение.
     JWT_SECRET_KEY : str
         Секретный ключ для кодирования JSON Web Token.
     JWT_ALGORITHM : str
@@ -59,6 +75,130 @@ class Settings(BaseSettings):
         Время жизни access-токена в минутах.
     REFRESH_TOKEN_LIFETIME_DAYS : int
         Время жизни refresh-токена в днях.
+    ACCESS_TOKEN_CACHE_SIZE : int
+        Максимальное количество проверенных токенов доступа в кэше процесса.
+        Значение 0 отключает кэш.
+    EVENTS_TOKEN_LIFETIME_SECONDS : int
+        Время жизни токена подписки на ленту изменений в секундах. Токен проверяется
+        только при подключении, поэтому его достаточно для открытия соединения.
+    IDEMPOTENCY_STORE_SIZE : int
+        Максимальное количество ответов, сохранённых по ключам идемпотентности.
+        Значение 0 отключает хранилище.
+    IDEMPOTENCY_KEY_TTL_SECONDS : float
+        Время хранения ответа по ключу идемпотентности в секундах.
+    RESPONSE_CACHE_BACKEND : Literal["memory", "redis"]
+        Хранилище кэша ответов: ``memory`` — LRU-кэш в памяти процесса,
+        ``redis`` — сервер Redis (требуется пакет ``redis``).
+    RESPONSE_CACHE_REDIS_URL : str
+        Строка подключения к Redis для кэша ответов.
+    RESPONSE_CACHE_SIZE : int
+        Максимальное количество ответов в кэше процесса. Значение 0 отключает кэш.
+    RESPONSE_CACHE_TTL_SECONDS : float
+        Время жизни ответа в кэше в секундах.
+    CHANGE_FEED_HISTORY_SIZE : int
+        Количество последних событий ленты изменений, с которых можно продолжить
+        после переподключения.
+    CHANGE_FEED_QUEUE_SIZE : int
+        Размер очереди событий одного подписчика ленты изменений. Подписчик,
+        не успевающий читать события, отключается и должен переподключиться.
+    CHANGE_FEED_KEEPALIVE_SECONDS : float
+        Период отправки комментария в ленту изменений при отсутствии событий.
+    QUERY_BUDGET_MODE : Literal["off", "warn", "raise"]
+        Проверка бюджета SQL-запросов маршрутов и поиска N+1: ``off`` — отключена,
+        ``warn`` — нарушения пишутся в журнал, ``raise`` — запрос завершается ошибкой
+        (для тестов и CI).
+    QUERY_BUDGET_REPEAT_THRESHOLD : int
+        Сколько раз SQL-запрос одной формы может выполниться за HTTP-запрос,
+        прежде чем он будет считаться N+1.
+    PASSWORD_HASH_WORKERS : int
+        Количество потоков пула хеширования паролей.
+    PASSWORD_HASH_QUEUE_DEPTH : int
+        Максимальное количество задач хеширования, ожидающих свободного потока.
+        При заполнении очереди запросы аутентификации отклоняются с кодом 503.
+    CLIENTS_PAGE_SIZE : int
+        Размер страницы списка клиентов по умолчанию.
+    CLIENTS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы списка клиентов.
+    CLIENTS_STREAM_CHUNK_SIZE : int
+        Количество строк, получаемых из серверного курсора за одну итерацию
+        при потоковой выдаче клиентов.
+    CLIENTS_IMPORT_CHUNK_SIZE : int
+        Количество строк пакетного импорта клиентов, записываемых одним INSERT.
+    CLIENTS_IMPORT_MAX_ERRORS : int
+        Максимальное количество ошибок по строкам в ответе на пакетный импорт.
+    CLIENTS_SEARCH_LIMIT : int
+        Количество результатов поиска клиентов по умолчанию.
+    CLIENTS_SEARCH_LIMIT_MAX : int
+        Максимально допустимое количество результатов поиска клиентов.
+    SEASON_TICKETS_EXPIRING_LIMIT : int
+        Количество абонементов в ответе на запрос истекающих абонементов по умолчанию.
+    SEASON_TICKETS_EXPIRING_LIMIT_MAX : int
+        Максимально допустимое количество абонементов в ответе на запрос истекающих абонементов.
+    SEASON_TICKET_EXPIRY_INTERVAL_SECONDS : float
+        Период фоновой проверки истёкших абонементов в секундах. Значение 0 отключает проверку.
+    SEASON_TICKET_EXPIRY_BATCH_SIZE : int
+        Количество абонементов, помечаемых истёкшими одним запросом.
+    TRANSACTIONS_BATCH_MAX_SIZE : int
+        Максимальное количество транзакций в одном пакетном запросе.
+    TRANSACTIONS_PAGE_SIZE : int
+        Размер страницы истории транзакций клиента по умолчанию.
+    TRANSACTIONS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы истории транзакций клиента.
+    TRANSACTIONS_RETENTION_DAYS : int
+        Через сколько дней транзакции, уже учтённые в снимке баланса, удаляются
+        (0 — не удалять).
+    BALANCE_SNAPSHOT_INTERVAL_SECONDS : float
+        Период создания снимков баланса в секундах (0 — не создавать).
+    BALANCE_SNAPSHOT_AGE_SECONDS : float
+        Возраст в секундах, после которого транзакция попадает в снимок баланса.
+    VIOLATIONS_PAGE_SIZE : int
+        Размер страницы нарушений клиента по умолчанию.
+    VIOLATIONS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы нарушений клиента.
+    COMMENTS_PAGE_SIZE : int
+        Размер страницы комментариев о клиенте по умолчанию.
+    COMMENTS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы комментариев о клиенте.
+    COMPLAINTS_PAGE_SIZE : int
+        Размер страницы жалоб на клиента по умолчанию.
+    COMPLAINTS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы жалоб на клиента.
+    GROUP_MEMBERS_PAGE_SIZE : int
+        Размер страницы участников группы по умолчанию.
+    GROUP_MEMBERS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы участников группы.
+    ANALYTICS_TIMEZONE : str
+        Часовой пояс (IANA), в котором считаются дни, недели, месяцы и часы тепловой карты.
+        После изменения агрегаты нужно перестроить.
+    ANALYTICS_ROLLUP_INTERVAL_SECONDS : float
+        Период обновления агрегатов аналитики в секундах (0 — не обновлять).
+    ANALYTICS_ROLLUP_LAG_SECONDS : float
+        Возраст в секундах, после которого посещение или транзакция попадает в агрегаты.
+    ANALYTICS_RANGE_MAX_DAYS : int
+        Максимальная длина периода в днях в запросах аналитики.
+    GYM_BOX_COUNT : int
+        Количество ящиков в зале. Ящики нумеруются от 1 до ``GYM_BOX_COUNT``.
+    VISITS_REQUIRE_SEASON_TICKET : bool
+        Допускать ли в зал только клиентов с действующим абонементом.
+    VISITS_BATCH_MAX_SIZE : int
+        Максимальное количество элементов в одном пакетном запросе начала или завершения посещений.
+    VISITS_MICRO_BATCHING : bool
+        Объединять ли одиночные запросы начала посещения, поступившие почти одновременно,
+        в одну запись.
+    VISITS_MICRO_BATCH_WINDOW_MS : float
+        Время в миллисекундах, в течение которого накапливаются одиночные запросы.
+    VISITS_MICRO_BATCH_MAX_SIZE : int
+        Количество накопленных запросов, при котором запись выполняется, не дожидаясь окончания окна.
+    VISITS_PAGE_SIZE : int
+        Размер страницы истории посещений клиента по умолчанию.
+    VISITS_PAGE_SIZE_MAX : int
+        Максимально допустимый размер страницы истории посещений клиента.
+    VISIT_PARTITIONS_AHEAD : int
+        Количество будущих месяцев, для которых при запуске приложения и периодически
+        создаются секции таблицы посещений (только PostgreSQL).
+    VISIT_PARTITIONS_INTERVAL_SECONDS : float
+        Период фонового создания секций таблицы посещений в секундах.
+        Значение 0 отключает периодическое создание.
     """
 
     APP_NAME: str
@@ -92,10 +232,85 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     TEST_DATABASE_URL: str
 
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 0
+
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str
     ACCESS_TOKEN_LIFETIME_MINUTES: int
     REFRESH_TOKEN_LIFETIME_DAYS: int
+    ACCESS_TOKEN_CACHE_SIZE: int = 4096
+    EVENTS_TOKEN_LIFETIME_SECONDS: int = 60
+
+    IDEMPOTENCY_STORE_SIZE: int = 10000
+    IDEMPOTENCY_KEY_TTL_SECONDS: float = 86400.0
+
+    RESPONSE_CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    RESPONSE_CACHE_SIZE: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+
+    CHANGE_FEED_HISTORY_SIZE: int = 1000
+    CHANGE_FEED_QUEUE_SIZE: int = 256
+    CHANGE_FEED_KEEPALIVE_SECONDS: float = 15.0
+
+    QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] = "off"
+    QUERY_BUDGET_REPEAT_THRESHOLD: int = 5
+
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_DEPTH: int = 64
+
+    CLIENTS_PAGE_SIZE: int = 100
+    CLIENTS_PAGE_SIZE_MAX: int = 1000
+    CLIENTS_STREAM_CHUNK_SIZE: int = 500
+    CLIENTS_IMPORT_CHUNK_SIZE: int = 1000
+    CLIENTS_IMPORT_MAX_ERRORS: int = 1000
+    CLIENTS_SEARCH_LIMIT: int = 20
+    CLIENTS_SEARCH_LIMIT_MAX: int = 100
+
+    SEASON_TICKETS_EXPIRING_LIMIT: int = 100
+    SEASON_TICKETS_EXPIRING_LIMIT_MAX: int = 1000
+    SEASON_TICKET_EXPIRY_INTERVAL_SECONDS: float = 60.0
+    SEASON_TICKET_EXPIRY_BATCH_SIZE: int = 500
+
+    TRANSACTIONS_BATCH_MAX_SIZE: int = 500
+    TRANSACTIONS_PAGE_SIZE: int = 50
+    TRANSACTIONS_PAGE_SIZE_MAX: int = 500
+    TRANSACTIONS_RETENTION_DAYS: int = 0
+    BALANCE_SNAPSHOT_INTERVAL_SECONDS: float = 3600.0
+    BALANCE_SNAPSHOT_AGE_SECONDS: float = 3600.0
+
+    VIOLATIONS_PAGE_SIZE: int = 50
+    VIOLATIONS_PAGE_SIZE_MAX: int = 500
+    COMMENTS_PAGE_SIZE: int = 50
+    COMMENTS_PAGE_SIZE_MAX: int = 500
+    COMPLAINTS_PAGE_SIZE: int = 50
+    COMPLAINTS_PAGE_SIZE_MAX: int = 500
+
+    GROUP_MEMBERS_PAGE_SIZE: int = 50
+    GROUP_MEMBERS_PAGE_SIZE_MAX: int = 500
+
+    ANALYTICS_TIMEZONE: str = "UTC"
+    ANALYTICS_ROLLUP_INTERVAL_SECONDS: float = 300.0
+    ANALYTICS_ROLLUP_LAG_SECONDS: float = 60.0
+    ANALYTICS_RANGE_MAX_DAYS: int = 366
+
+    GYM_BOX_COUNT: int = 100
+
+    VISITS_REQUIRE_SEASON_TICKET: bool = True
+    VISITS_BATCH_MAX_SIZE: int = 500
+    VISITS_MICRO_BATCHING: bool = False
+    VISITS_MICRO_BATCH_WINDOW_MS: float = 5.0
+    VISITS_MICRO_BATCH_MAX_SIZE: int = 100
+    VISITS_PAGE_SIZE: int = 50
+    VISITS_PAGE_SIZE_MAX: int = 500
+    VISIT_PARTITIONS_AHEAD: int = 3
+    VISIT_PARTITIONS_INTERVAL_SECONDS: float = 86400.0
 
     model_config = SettingsConfigDict(
         env_file=(abspath(".env"), abspath("../.env")),
@@ -0,0 +1,56 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, List
+
+
+def encode_cursor(*values: Any) -> str:
+    """Кодирует значения ключа сортировки в непрозрачный курсор.
+
+    Используется для keyset-пагинации: курсор содержит значения ключа сортировки
+    последней записи страницы. Значения приводятся к строкам.
+
+    Parameters
+    ----------
+    *values : Any
+        Значения ключа сортировки последней записи страницы.
+
+    Returns
+    -------
+    cursor : str
+        Курсор в формате base64url без выравнивания.
+    """
+    raw = json.dumps([str(value) for value in values], ensure_ascii=False)
+
+    return urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[str]:
+    """Декодирует курсор, созданный ``encode_cursor()``.
+
+    Parameters
+    ----------
+    cursor : str
+        Курсор из запроса клиента.
+    length : int
+        Ожидаемое количество значений в курсоре.
+
+    Returns
+    -------
+    values : List[str]
+        Строковые значения ключа сортировки.
+
+    Raises
+    ------
+    ValueError
+        Если курсор повреждён или содержит неожиданное количество значений.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(urlsafe_b64decode(padded.encode("ascii")))
+    except (UnicodeError, ValueError) as error:
+        raise ValueError("Malformed cursor.") from error
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Malformed cursor.")
+
+    return [str(value) for value in values]
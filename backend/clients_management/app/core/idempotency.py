@@ -0,0 +1,96 @@
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+from pydantic import BaseModel
+
+from app.core.config import Settings, get_settings
+
+settings: Settings = get_settings()
+
+
+class IdempotencyStore:
+    """Ограниченное хранилище ответов на запросы с ключом идемпотентности.
+
+    Повторный запрос с тем же ключом получает сохранённый ответ, а не выполняется заново.
+    Запись живёт `ttl` секунд; при превышении `max_size` вытесняются самые старые записи.
+
+    Attributes
+    ----------
+    max_size : int
+        Максимальное количество записей. Значение 0 отключает хранилище.
+    ttl : float
+        Время жизни записи в секундах.
+
+    Methods
+    -------
+    get(key)
+        Возвращает сохранённый ответ или None.
+    put(key, response)
+        Сохраняет ответ для ключа.
+    clear()
+        Очищает хранилище.
+
+    Notes
+    -----
+    - Хранилище принадлежит процессу: повтор, попавший на другой воркер, выполняется заново
+      и получает ответ, соответствующий текущему состоянию записи.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+
+        self._entries: OrderedDict[str, Tuple[float, BaseModel]] = OrderedDict()
+
+    def get(self, key: str) -> BaseModel | None:
+        """Возвращает сохранённый ответ.
+
+        Parameters
+        ----------
+        key : str
+            Ключ идемпотентности вместе с областью его действия.
+
+        Returns
+        -------
+        response : BaseModel | None
+            Сохранённый ответ или None, если ключ не встречался или запись истекла.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires_at, response = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        return response
+
+    def put(self, key: str, response: BaseModel):
+        """Сохраняет ответ для ключа.
+
+        Parameters
+        ----------
+        key : str
+            Ключ идемпотентности вместе с областью его действия.
+        response : BaseModel
+            Ответ, возвращённый на первый запрос.
+        """
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Очищает хранилище."""
+        self._entries.clear()
+
+
+idempotency_store: IdempotencyStore = IdempotencyStore(
+    settings.IDEMPOTENCY_STORE_SIZE, settings.IDEMPOTENCY_KEY_TTL_SECONDS
+)
@@ -0,0 +1,41 @@
+import re
+from typing import Any, Dict, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+
+def parse_unique_violation(
+    integrity_error: IntegrityError, data: Dict[str, Any]
+) -> Tuple[str, str] | None:
+    """Извлекает конфликтующий столбец и значение из ошибки уникальности.
+
+    Parameters
+    ----------
+    integrity_error : IntegrityError
+        Ошибка, полученная при записи в базу данных.
+    data : Dict[str, Any]
+        Записываемые данные. Используются для получения значения,
+        так как текст ошибки SQLite его не содержит.
+
+    Returns
+    -------
+    violation : Tuple[str, str] | None
+        Пара (столбец, значение) или None, если ошибка не связана с нарушением уникальности.
+
+    Notes
+    -----
+    - Поддерживаются тексты ошибок PostgreSQL и SQLite (используется в тестах).
+    """
+    message = str(integrity_error.orig)
+
+    if "UNIQUE constraint failed" in message:
+        column, *_ = re.search(r"\.(\w+)", message).groups()
+
+        return column, str(data.get(column))
+
+    if result := re.search(r'"\((.*)\)=\((.*)\)"', message):
+        column, value = result.groups()
+
+        return column, value
+
+    return None
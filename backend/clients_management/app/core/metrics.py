@@ -0,0 +1,443 @@
+import re
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Границы корзин гистограмм длительности запросов и времени работы с БД, в секундах."""
+
+STATEMENT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100)
+"""Границы корзин гистограммы количества SQL-запросов на один HTTP-запрос."""
+
+POOL_METRICS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("size", "db_pool_size", "gauge", "Количество постоянных соединений пула."),
+    ("checked_out", "db_pool_checked_out", "gauge", "Количество выданных соединений."),
+    ("checked_in", "db_pool_checked_in", "gauge", "Количество свободных соединений."),
+    ("overflow", "db_pool_overflow", "gauge", "Количество соединений сверх пула."),
+    ("checkouts", "db_pool_checkouts_total", "counter", "Количество выдач соединений."),
+    ("waits", "db_pool_waits_total", "counter", "Количество выдач с ожиданием."),
+    (
+        "wait_time_total",
+        "db_pool_wait_seconds_total",
+        "counter",
+        "Суммарное время ожидания соединения в секундах.",
+    ),
+    (
+        "wait_time_max",
+        "db_pool_wait_seconds_max",
+        "gauge",
+        "Максимальное время ожидания соединения в секундах.",
+    ),
+    (
+        "timeouts",
+        "db_pool_timeouts_total",
+        "counter",
+        "Количество выдач, завершившихся ошибкой по таймауту.",
+    ),
+    (
+        "overflow_checkouts",
+        "db_pool_overflow_checkouts_total",
+        "counter",
+        "Количество выдач сверх размера пула.",
+    ),
+)
+"""Показатели ``InstrumentedAsyncQueuePool.snapshot()``: ключ, имя, тип и описание."""
+
+Labels = Tuple[Tuple[str, str], ...]
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+")
+_PLACEHOLDER_LIST = re.compile(r"\(\?(?:, ?\?)*\)")
+_ROW_LIST = re.compile(r"\(\?\)(?:, ?\(\?\))+")
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """Работа с базой данных в рамках одного HTTP-запроса.
+
+    Attributes
+    ----------
+    statements : int
+        Количество выполненных SQL-запросов.
+    db_time : float
+        Суммарное время выполнения SQL-запросов в секундах.
+    shapes : Dict[str, int] | None
+        Количество выполнений SQL-запросов каждой формы; заполняется,
+        только если включена проверка бюджета запросов.
+    """
+
+    statements: int = 0
+    db_time: float = 0.0
+    shapes: Dict[str, int] | None = None
+
+
+class Histogram:
+    """Гистограмма в формате Prometheus с набором меток.
+
+    Attributes
+    ----------
+    name : str
+        Имя показателя.
+    description : str
+        Описание показателя (``# HELP``).
+    buckets : Tuple[float, ...]
+        Верхние границы корзин по возрастанию, без ``+Inf``.
+
+    Methods
+    -------
+    observe(labels, value)
+        Учитывает наблюдение.
+    render()
+        Возвращает строки показателя в текстовом формате Prometheus.
+    """
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...]):
+        self.name: str = name
+        self.description: str = description
+        self.buckets: Tuple[float, ...] = buckets
+
+        self._series: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labels: Labels, value: float):
+        """Учитывает наблюдение.
+
+        Parameters
+        ----------
+        labels : Labels
+            Пары (имя метки, значение).
+        value : float
+            Наблюдаемое значение.
+        """
+        if (series := self._series.get(labels)) is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def render(self) -> List[str]:
+        """Возвращает строки показателя в текстовом формате Prometheus.
+
+        Returns
+        -------
+        lines : List[str]
+            Строки ``# HELP``, ``# TYPE`` и кумулятивные корзины каждой серии.
+        """
+        lines = _header(self.name, "histogram", self.description)
+
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                bucket_labels = (*labels, ("le", _format_bound(bound)))
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                )
+
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total[0]}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+
+        return lines
+
+    def clear(self):
+        self._series.clear()
+
+
+class RequestMetrics:
+    """Показатели HTTP-запросов и работы с базой данных в памяти процесса.
+
+    Собирает длительность запросов по маршрутам, количество запросов по кодам ответа,
+    количество запросов в обработке, а также количество SQL-запросов и время работы
+    с базой данных на один HTTP-запрос. SQL-запросы учитываются обработчиками событий
+    движка SQLAlchemy и относятся к HTTP-запросу через контекстную переменную.
+
+    Attributes
+    ----------
+    in_flight : int
+        Количество запросов в обработке.
+    statements_total : int
+        Количество SQL-запросов с момента запуска процесса, включая фоновые задачи.
+    db_time_total : float
+        Суммарное время SQL-запросов в секундах с момента запуска процесса.
+
+    Methods
+    -------
+    instrument(engine)
+        Подписывается на события выполнения запросов движка.
+    observe(method, route, status, duration, stats)
+        Учитывает завершённый HTTP-запрос.
+    render(pool_snapshot)
+        Возвращает все показатели в текстовом формате Prometheus.
+    clear()
+        Сбрасывает показатели.
+
+    Notes
+    -----
+    - Показатели относятся к текущему процессу (воркеру): при нескольких воркерах
+      Prometheus должен опрашивать каждый из них.
+    """
+
+    def __init__(self):
+        self.in_flight: int = 0
+        self.statements_total: int = 0
+        self.db_time_total: float = 0.0
+
+        self.current: ContextVar[RequestStats | None] = ContextVar(
+            "request_stats", default=None
+        )
+
+        self._requests: Dict[Labels, int] = {}
+        self._duration = Histogram(
+            "http_request_duration_seconds",
+            "Длительность обработки HTTP-запроса в секундах.",
+            LATENCY_BUCKETS,
+        )
+        self._statements = Histogram(
+            "http_request_db_statements",
+            "Количество SQL-запросов на один HTTP-запрос.",
+            STATEMENT_BUCKETS,
+        )
+        self._db_time = Histogram(
+            "http_request_db_seconds",
+            "Время выполнения SQL-запросов на один HTTP-запрос в секундах.",
+            LATENCY_BUCKETS,
+        )
+
+    def instrument(self, engine: AsyncEngine):
+        """Подписывается на события выполнения запросов движка.
+
+        Parameters
+        ----------
+        engine : AsyncEngine
+            Асинхронный движок SQLAlchemy.
+        """
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(conn, *_):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(conn, cursor, statement, *_):
+            elapsed = time.perf_counter() - conn.info["query_started"].pop()
+
+            self.statements_total += 1
+            self.db_time_total += elapsed
+
+            if (stats := self.current.get()) is not None:
+                stats.statements += 1
+                stats.db_time += elapsed
+
+                if stats.shapes is not None:
+                    shape = statement_shape(statement)
+                    stats.shapes[shape] = stats.shapes.get(shape, 0) + 1
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _handle_error(context):
+            if context.connection is not None:
+                started = context.connection.info.get("query_started")
+                if started:
+                    started.pop()
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        stats: RequestStats,
+    ):
+        """Учитывает завершённый HTTP-запрос.
+
+        Parameters
+        ----------
+        method : str
+            HTTP-метод.
+        route : str
+            Шаблон пути маршрута, например ``/api/v1/clients/{client_id}``.
+        status : int
+            Код ответа.
+        duration : float
+            Длительность обработки в секундах.
+        stats : RequestStats
+            Работа с базой данных в рамках запроса.
+        """
+        labels = (("method", method), ("route", route))
+        status_labels = (*labels, ("status", str(status)))
+
+        self._requests[status_labels] = self._requests.get(status_labels, 0) + 1
+        self._duration.observe(labels, duration)
+        self._statements.observe(labels, stats.statements)
+        self._db_time.observe(labels, stats.db_time)
+
+    def render(self, pool_snapshot: Dict[str, Any]) -> str:
+        """Возвращает все показатели в текстовом формате Prometheus.
+
+        Parameters
+        ----------
+        pool_snapshot : Dict[str, Any]
+            Состояние пула соединений, ``InstrumentedAsyncQueuePool.snapshot()``.
+
+        Returns
+        -------
+        text : str
+            Показатели в формате ``text/plain; version=0.0.4``.
+        """
+        lines = _header(
+            "http_requests_in_flight", "gauge", "Количество запросов в обработке."
+        )
+        lines.append(f"http_requests_in_flight {self.in_flight}")
+
+        lines += _header(
+            "http_requests_total",
+            "counter",
+            "Количество обработанных HTTP-запросов по маршрутам и кодам ответа.",
+        )
+        for labels, count in sorted(self._requests.items()):
+            lines.append(f"http_requests_total{_format_labels(labels)} {count}")
+
+        lines += self._duration.render()
+        lines += self._statements.render()
+        lines += self._db_time.render()
+
+        lines += _header(
+            "db_statements_total", "counter", "Количество выполненных SQL-запросов."
+        )
+        lines.append(f"db_statements_total {self.statements_total}")
+        lines += _header(
+            "db_statement_seconds_total",
+            "counter",
+            "Суммарное время выполнения SQL-запросов в секундах.",
+        )
+        lines.append(f"db_statement_seconds_total {self.db_time_total}")
+
+        for key, name, metric_type, description in POOL_METRICS:
+            if key not in pool_snapshot:
+                continue
+
+            lines += _header(name, metric_type, description)
+            lines.append(f"{name} {pool_snapshot[key]}")
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """Сбрасывает показатели."""
+        self.in_flight = self.statements_total = 0
+        self.db_time_total = 0.0
+        self._requests.clear()
+        self._duration.clear()
+        self._statements.clear()
+        self._db_time.clear()
+
+
+class MetricsMiddleware:
+    """ASGI-middleware, собирающее показатели HTTP-запросов в `request_metrics`.
+
+    Запрос учитывается под шаблоном пути найденного маршрута, поэтому количество
+    серий не зависит от значений параметров пути. Запросы, для которых маршрут
+    не найден, учитываются под маршрутом ``unmatched``. Необработанное исключение
+    учитывается как ответ с кодом 500.
+
+    Attributes
+    ----------
+    app : ASGIApp
+        Оборачиваемое приложение.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_metrics.current.set(stats)
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        request_metrics.in_flight += 1
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_metrics.in_flight -= 1
+            request_metrics.current.reset(token)
+
+            route = scope.get("route")
+            request_metrics.observe(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status,
+                time.perf_counter() - started,
+                stats,
+            )
+
+
+def statement_shape(statement: str) -> str:
+    """Приводит SQL-запрос к форме, не зависящей от количества параметров.
+
+    Параметры ``IN (...)`` и строки ``VALUES`` разворачиваются в разное количество
+    заполнителей в зависимости от данных; в форме они сворачиваются в один,
+    поэтому одинаковые по смыслу запросы имеют одинаковую форму.
+
+    Parameters
+    ----------
+    statement : str
+        Текст SQL-запроса с заполнителями параметров.
+
+    Returns
+    -------
+    shape : str
+        Форма запроса.
+    """
+    shape = _PLACEHOLDER.sub("?", " ".join(statement.split()))
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+
+    return _ROW_LIST.sub("(?)", shape)
+
+
+def _header(name: str, metric_type: str, description: str) -> List[str]:
+    return [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+
+
+def _format_bound(bound: float | str) -> str:
+    return bound if isinstance(bound, str) else repr(float(bound))
+
+
+def _format_labels(labels: Labels) -> str:
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels
+    )
+
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+request_metrics: RequestMetrics = RequestMetrics()
@@ -0,0 +1,196 @@
+import logging
+from dataclasses import dataclass
+from typing import Callable, List, TypeVar
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import Settings, get_settings
+from app.core.metrics import RequestStats, request_metrics
+
+settings: Settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+Endpoint = TypeVar("Endpoint", bound=Callable)
+
+QUERY_BUDGET_ATTRIBUTE = "__query_budget__"
+"""Атрибут функции маршрута, в котором хранится её бюджет SQL-запросов."""
+
+
+@dataclass(frozen=True, slots=True)
+class QueryBudget:
+    """Бюджет SQL-запросов маршрута.
+
+    Attributes
+    ----------
+    statements : int | None
+        Максимальное количество SQL-запросов на один HTTP-запрос
+        или None, если количество не ограничено.
+    allow_repeats : bool
+        Не считать повторы одной формы запроса признаком N+1
+        (например, для пакетной записи частями).
+    """
+
+    statements: int | None = None
+    allow_repeats: bool = False
+
+
+def query_budget(
+    statements: int | None = None, *, allow_repeats: bool = False
+) -> Callable[[Endpoint], Endpoint]:
+    """Объявляет бюджет SQL-запросов маршрута.
+
+    Указывается под декоратором маршрута::
+
+        @router.get("/{client_id}")
+        @query_budget(4)
+        async def client_by_id(...): ...
+
+    Parameters
+    ----------
+    statements : int | None
+        Максимальное количество SQL-запросов на один HTTP-запрос, включая запросы
+        зависимостей (например, проверки токена). Не должно зависеть от объёма данных.
+    allow_repeats : bool
+        Не считать повторы одной формы запроса признаком N+1.
+
+    Returns
+    -------
+    decorator : Callable[[Endpoint], Endpoint]
+        Декоратор, сохраняющий бюджет в атрибуте функции маршрута.
+    """
+
+    def decorator(endpoint: Endpoint) -> Endpoint:
+        budget = QueryBudget(statements, allow_repeats)
+        setattr(endpoint, QUERY_BUDGET_ATTRIBUTE, budget)
+
+        return endpoint
+
+    return decorator
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Маршрут превысил бюджет SQL-запросов или выполнил запросы по схеме N+1."""
+
+
+class QueryBudgetGuard:
+    """Проверка бюджета SQL-запросов маршрутов и поиск N+1.
+
+    После обработки HTTP-запроса сравнивает количество выполненных SQL-запросов
+    с бюджетом, объявленным через `query_budget`, и ищет формы запросов,
+    повторившиеся не меньше `repeat_threshold` раз — типичный признак ленивой
+    загрузки связей в цикле.
+
+    Attributes
+    ----------
+    mode : str
+        ``off``, ``warn`` или ``raise``.
+    enabled : bool
+        Включена ли проверка.
+    repeat_threshold : int
+        Количество повторов одной формы, начиная с которого запрос считается N+1.
+    violations : int
+        Количество HTTP-запросов с нарушениями.
+
+    Methods
+    -------
+    check(method, route, stats)
+        Проверяет завершённый HTTP-запрос.
+    clear()
+        Сбрасывает счётчик нарушений.
+    """
+
+    def __init__(self, mode: str, repeat_threshold: int):
+        self.mode: str = mode
+        self.repeat_threshold: int = repeat_threshold
+        self.violations: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def check(self, method: str, route: BaseRoute | None, stats: RequestStats):
+        """Проверяет завершённый HTTP-запрос.
+
+        Parameters
+        ----------
+        method : str
+            HTTP-метод.
+        route : BaseRoute | None
+            Найденный маршрут.
+        stats : RequestStats
+            Работа с базой данных в рамках запроса.
+
+        Raises
+        ------
+        QueryBudgetExceeded
+            Если найдено нарушение и включён режим ``raise``.
+        """
+        if route is None:
+            return
+
+        problems: List[str] = []
+
+        budget: QueryBudget = getattr(
+            getattr(route, "endpoint", None), QUERY_BUDGET_ATTRIBUTE, QueryBudget()
+        )
+
+        if budget.statements is not None and stats.statements > budget.statements:
+            problems.append(
+                f"{stats.statements} SQL statements, budget is {budget.statements}"
+            )
+
+        if not budget.allow_repeats:
+            for shape, count in (stats.shapes or {}).items():
+                if count >= self.repeat_threshold:
+                    problems.append(f"N+1: {count} x {shape}")
+
+        if not problems:
+            return
+
+        self.violations += 1
+        message = f"{method} {getattr(route, 'path', route)}: " + "; ".join(problems)
+
+        if self.mode == "raise":
+            raise QueryBudgetExceeded(message)
+
+        logger.warning(message)
+
+    def clear(self):
+        """Сбрасывает счётчик нарушений."""
+        self.violations = 0
+
+
+class QueryBudgetMiddleware:
+    """ASGI-middleware, проверяющее бюджет SQL-запросов маршрутов.
+
+    Использует показатели запроса, собираемые `MetricsMiddleware`, поэтому должно
+    находиться внутри него. При выключенной проверке не выполняет никакой работы.
+
+    Attributes
+    ----------
+    app : ASGIApp
+        Оборачиваемое приложение.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        stats = request_metrics.current.get()
+
+        if scope["type"] != "http" or stats is None or not query_budget_guard.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        stats.shapes = {}
+
+        await self.app(scope, receive, send)
+
+        query_budget_guard.check(scope["method"], scope.get("route"), stats)
+
+
+query_budget_guard: QueryBudgetGuard = QueryBudgetGuard(
+    settings.QUERY_BUDGET_MODE, settings.QUERY_BUDGET_REPEAT_THRESHOLD
+)
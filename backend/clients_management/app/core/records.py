@@ -0,0 +1,97 @@
+import csv
+import json
+from codecs import getincrementaldecoder
+from typing import Any, AsyncIterator, Dict, Tuple
+
+CSV_MEDIA_TYPE = "text/csv"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Разбивает поток байтов на строки.
+
+    Байты декодируются инкрементально (UTF-8), поэтому многобайтовые символы
+    на границе порций не повреждаются. Пустые строки пропускаются.
+
+    Parameters
+    ----------
+    chunks : AsyncIterator[bytes]
+        Поток порций тела запроса.
+
+    Yields
+    ------
+    line : str
+        Очередная непустая строка без символов перевода строки.
+    """
+    decoder = getincrementaldecoder("utf-8-sig")()
+    tail = ""
+
+    async for chunk in chunks:
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+
+        for line in lines:
+            if line := line.rstrip("\r"):
+                yield line
+
+    if line := (tail + decoder.decode(b"", final=True)).rstrip("\r"):
+        yield line
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], media_type: str
+) -> AsyncIterator[Tuple[int, Dict[str, Any] | str]]:
+    """Разбирает поток CSV или NDJSON на записи.
+
+    Parameters
+    ----------
+    chunks : AsyncIterator[bytes]
+        Поток порций тела запроса.
+    media_type : str
+        ``text/csv`` (первая строка — заголовок) или ``application/x-ndjson``.
+
+    Yields
+    ------
+    record : Tuple[int, Dict[str, Any] | str]
+        Номер записи (с единицы, без учёта заголовка) и словарь значений
+        либо текст ошибки разбора строки.
+
+    Notes
+    -----
+    - Пустые значения CSV передаются как None.
+    - Поля CSV, содержащие перевод строки, не поддерживаются.
+    """
+    header = None
+    number = 0
+
+    async for line in iter_lines(chunks):
+        if media_type == CSV_MEDIA_TYPE:
+            values = next(csv.reader([line]))
+
+            if header is None:
+                header = [value.strip() for value in values]
+                continue
+
+            number += 1
+
+            if len(values) != len(header):
+                yield number, f"Expected {len(header)} columns, got {len(values)}."
+                continue
+
+            yield number, {
+                key: value if value != "" else None
+                for key, value in zip(header, values)
+            }
+        else:
+            number += 1
+
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield number, "Malformed JSON."
+                continue
+
+            if not isinstance(record, dict):
+                yield number, "Expected a JSON object."
+                continue
+
+            yield number, record
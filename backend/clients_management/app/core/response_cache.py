@@ -0,0 +1,371 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.core.config import Settings, get_settings
+
+settings: Settings = get_settings()
+
+CLIENTS_SCOPE: str = "clients"
+"""Область, версия которой меняется при любом изменении списка клиентов."""
+
+GROUPS_SCOPE: str = "groups"
+"""Область, версия которой меняется при изменении групп и их состава."""
+
+
+def client_scope(client_id: UUID) -> str:
+    """Возвращает область отдельного клиента.
+
+    Parameters
+    ----------
+    client_id : UUID
+        UUID клиента.
+
+    Returns
+    -------
+    scope : str
+        Имя области, версия которой меняется при изменении данных клиента.
+    """
+    return f"client:{client_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """Сериализованный ответ, сохранённый в кэше.
+
+    Attributes
+    ----------
+    etag : str
+        Строгий ETag ответа (в кавычках), дайджест тела.
+    body : bytes
+        Тело ответа в формате JSON.
+    """
+
+    etag: str
+    body: bytes
+
+
+class MemoryResponseCacheBackend:
+    """Ограниченный LRU-кэш ответов в памяти процесса.
+
+    Запись живёт `ttl` секунд; при превышении `max_size` вытесняется запись,
+    к которой дольше всего не обращались. Версии областей хранятся в словаре
+    процесса и поэтому видны только его запросам.
+
+    Attributes
+    ----------
+    max_size : int
+        Максимальное количество ответов. Значение 0 отключает кэш.
+    ttl : float
+        Время жизни ответа в секундах.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+
+        self._entries: OrderedDict[str, Tuple[float, CachedResponse]] = OrderedDict()
+        self._versions: Dict[str, int] = {}
+
+    async def get_versions(self, scopes: Sequence[str]) -> List[int]:
+        return [self._versions.get(scope, 0) for scope in scopes]
+
+    async def bump_versions(self, scopes: Iterable[str]):
+        for scope in scopes:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    async def get(self, key: str) -> CachedResponse | None:
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires_at, response = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+
+        return response
+
+    async def put(self, key: str, response: CachedResponse):
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def clear(self):
+        self._entries.clear()
+        self._versions.clear()
+
+    async def close(self):
+        pass
+
+
+class RedisResponseCacheBackend:
+    """Кэш ответов в Redis (или совместимом сервере), общий для всех воркеров.
+
+    Ответы записываются с временем жизни `ttl`, версии областей — счётчиками ``INCR``
+    без времени жизни. Ограничение по памяти задаётся политикой вытеснения сервера;
+    подходит ``volatile-lru``, при которой вытесняются только ответы, но не версии.
+
+    Attributes
+    ----------
+    url : str
+        Строка подключения к серверу.
+    ttl : float
+        Время жизни ответа в секундах.
+    prefix : str
+        Префикс ключей кэша.
+
+    Notes
+    -----
+    - Требует установленного пакета ``redis``; без него создание хранилища
+      завершается ошибкой ``RuntimeError``.
+    """
+
+    def __init__(self, url: str, ttl: float, prefix: str = "response_cache:"):
+        try:
+            from redis.asyncio import Redis
+        except ImportError as import_error:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the 'redis' package."
+            ) from import_error
+
+        self.url: str = url
+        self.ttl: float = ttl
+        self.prefix: str = prefix
+
+        self._redis = Redis.from_url(url)
+
+    def _version_key(self, scope: str) -> str:
+        return f"{self.prefix}version:{scope}"
+
+    async def get_versions(self, scopes: Sequence[str]) -> List[int]:
+        values = await self._redis.mget([self._version_key(scope) for scope in scopes])
+
+        return [int(value) if value is not None else 0 for value in values]
+
+    async def bump_versions(self, scopes: Iterable[str]):
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for scope in scopes:
+                pipeline.incr(self._version_key(scope))
+
+            await pipeline.execute()
+
+    async def get(self, key: str) -> CachedResponse | None:
+        if (value := await self._redis.get(f"{self.prefix}{key}")) is None:
+            return None
+
+        etag, _, body = value.partition(b"\n")
+
+        return CachedResponse(etag=etag.decode("ascii"), body=body)
+
+    async def put(self, key: str, response: CachedResponse):
+        await self._redis.set(
+            f"{self.prefix}{key}",
+            response.etag.encode("ascii") + b"\n" + response.body,
+            px=int(self.ttl * 1000),
+        )
+
+    async def clear(self):
+        async for key in self._redis.scan_iter(match=f"{self.prefix}*"):
+            await self._redis.delete(key)
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+ResponseCacheBackend = MemoryResponseCacheBackend | RedisResponseCacheBackend
+
+
+class ResponseCache:
+    """Кэш сериализованных ответов читающих эндпоинтов с поддержкой ETag.
+
+    Ключ ответа составляется из пути запроса, параметров запроса и текущих версий
+    областей, от которых зависит ответ. Пишущие операции после коммита увеличивают
+    версии затронутых областей, поэтому прежние записи больше не находятся
+    и вытесняются по LRU или времени жизни.
+
+    Ответ из кэша отдаётся готовыми байтами без повторной сериализации, а запрос
+    с заголовком ``If-None-Match``, совпадающим с ETag, получает ``304 Not Modified``
+    без тела.
+
+    Attributes
+    ----------
+    backend : ResponseCacheBackend
+        Хранилище ответов и версий.
+    hits : int
+        Количество ответов, отданных из кэша.
+    misses : int
+        Количество ответов, построенных заново.
+    not_modified : int
+        Количество ответов ``304 Not Modified``.
+
+    Methods
+    -------
+    serve(request, scopes, produce)
+        Возвращает ответ из кэша или строит и сохраняет его.
+    invalidate(*scopes)
+        Увеличивает версии областей.
+    invalidate_clients(*client_ids)
+        Увеличивает версии списка клиентов и областей отдельных клиентов.
+    clear()
+        Очищает кэш и счётчики.
+    close()
+        Закрывает соединение с хранилищем.
+    stats()
+        Возвращает текущие счётчики кэша.
+
+    Notes
+    -----
+    - Версии читаются до выполнения запросов к базе данных, а увеличиваются после
+      коммита, поэтому ответ, построенный во время записи, сохраняется под старой
+      версией и не будет отдан после неё.
+    - С хранилищем в памяти версии принадлежат процессу: запись, выполненная
+      другим воркером, становится видна не позже чем через `RESPONSE_CACHE_TTL_SECONDS`.
+    - Ответы не зависят от пользователя, поэтому кэш общий для всех пользователей;
+      авторизация проверяется до обращения к кэшу.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend):
+        self.backend: ResponseCacheBackend = backend
+        self.hits: int = 0
+        self.misses: int = 0
+        self.not_modified: int = 0
+
+    async def serve(
+        self,
+        request: Request,
+        scopes: Sequence[str],
+        produce: Callable[[], Awaitable[BaseModel]],
+    ) -> Response:
+        """Возвращает ответ из кэша или строит и сохраняет его.
+
+        Parameters
+        ----------
+        request : Request
+            Текущий запрос.
+        scopes : Sequence[str]
+            Области, от которых зависит ответ.
+        produce : Callable[[], Awaitable[BaseModel]]
+            Функция, строящая модель ответа при промахе кэша.
+
+        Returns
+        -------
+        response : Response
+            Ответ ``200 OK`` с телом и заголовком ``ETag``
+            либо ``304 Not Modified``.
+        """
+        versions = await self.backend.get_versions(scopes)
+        key = hashlib.sha256(
+            repr(
+                (
+                    request.url.path,
+                    sorted(request.query_params.multi_items()),
+                    versions,
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+
+        if (cached := await self.backend.get(key)) is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+            body = (await produce()).model_dump_json().encode("utf-8")
+            cached = CachedResponse(
+                etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+                body=body,
+            )
+
+            await self.backend.put(key, cached)
+
+        headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+
+        if self._matches(request.headers.get("if-none-match"), cached.etag):
+            self.not_modified += 1
+
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            content=cached.body, media_type="application/json", headers=headers
+        )
+
+    async def invalidate(self, *scopes: str):
+        """Увеличивает версии областей.
+
+        Вызывается после коммита изменений, от которых зависят ответы этих областей.
+
+        Parameters
+        ----------
+        *scopes : str
+            Изменённые области.
+        """
+        await self.backend.bump_versions(scopes)
+
+    async def invalidate_clients(self, *client_ids: UUID):
+        """Увеличивает версии списка клиентов и областей отдельных клиентов.
+
+        Parameters
+        ----------
+        *client_ids : UUID
+            UUID изменённых клиентов.
+        """
+        await self.invalidate(CLIENTS_SCOPE, *map(client_scope, client_ids))
+
+    async def clear(self):
+        """Очищает кэш и обнуляет счётчики."""
+        await self.backend.clear()
+        self.hits = self.misses = self.not_modified = 0
+
+    async def close(self):
+        """Закрывает соединение с хранилищем."""
+        await self.backend.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Возвращает текущие счётчики кэша.
+
+        Returns
+        -------
+        stats : Dict[str, int]
+            Количество попаданий, промахов и ответов ``304 Not Modified``.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+    @staticmethod
+    def _matches(if_none_match: str | None, etag: str) -> bool:
+        if if_none_match is None:
+            return False
+
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+        return "*" in tags or etag in tags
+
+
+def _create_backend() -> ResponseCacheBackend:
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisResponseCacheBackend(
+            settings.RESPONSE_CACHE_REDIS_URL, settings.RESPONSE_CACHE_TTL_SECONDS
+        )
+
+    return MemoryResponseCacheBackend(
+        settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS
+    )
+
+
+response_cache: ResponseCache = ResponseCache(_create_backend())
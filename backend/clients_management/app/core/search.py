@@ -0,0 +1,277 @@
+import heapq
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+PHONE_QUERY = re.compile(r"^[\d\s()+\-]+$")
+NON_DIGIT = re.compile(r"\D")
+
+
+@dataclass(frozen=True, slots=True)
+class SearchQuery:
+    """Нормализованный поисковый запрос по клиентам.
+
+    Attributes
+    ----------
+    text : str
+        Запрос в нижнем регистре для сравнения с ФИО и адресом электронной почты.
+    digits : str | None
+        Цифры запроса для сравнения с номером телефона. None, если запрос
+        не похож на номер телефона.
+    """
+
+    text: str
+    digits: str | None
+
+    @classmethod
+    def parse(cls, query: str) -> "SearchQuery":
+        """Нормализует строку запроса.
+
+        Parameters
+        ----------
+        query : str
+            Строка, введённая пользователем.
+
+        Returns
+        -------
+        SearchQuery
+            Нормализованный запрос.
+        """
+        text = query.strip().lower()
+        digits = NON_DIGIT.sub("", text) if PHONE_QUERY.match(text) else ""
+
+        return cls(text=text, digits=digits or None)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchEntry:
+    """Клиент в поисковом индексе.
+
+    Attributes
+    ----------
+    id : UUID
+        UUID клиента.
+    surname : str
+        Фамилия клиента в исходном виде (используется для упорядочивания).
+    fields : Tuple[str, ...]
+        Фамилия, имя, отчество и адрес электронной почты в нижнем регистре.
+    phone : str
+        Цифры номера телефона.
+    """
+
+    id: UUID
+    surname: str
+    fields: Tuple[str, ...]
+    phone: str
+
+    @classmethod
+    def create(
+        cls,
+        id: UUID,
+        surname: str,
+        name: str,
+        patronymic: str | None,
+        email: str | None,
+        phone: str,
+    ) -> "SearchEntry":
+        """Создаёт элемент индекса из значений столбцов клиента."""
+        return cls(
+            id=id,
+            surname=surname,
+            fields=tuple(
+                (value or "").lower() for value in (surname, name, patronymic, email)
+            ),
+            phone=NON_DIGIT.sub("", phone or ""),
+        )
+
+    def rank(self, query: SearchQuery) -> int | None:
+        """Вычисляет ранг совпадения с запросом.
+
+        Ранги совпадают с ранжированием поиска на стороне PostgreSQL:
+
+        - 0 — фамилия начинается с запроса или номер телефона оканчивается его цифрами;
+        - 1 — имя, отчество или адрес электронной почты начинается с запроса;
+        - 2 — запрос встречается внутри любого поля.
+
+        Parameters
+        ----------
+        query : SearchQuery
+            Нормализованный запрос.
+
+        Returns
+        -------
+        rank : int | None
+            Ранг совпадения или None, если клиент не подходит под запрос.
+        """
+        if self.fields[0].startswith(query.text) or (
+            query.digits and self.phone.endswith(query.digits)
+        ):
+            return 0
+
+        if any(field.startswith(query.text) for field in self.fields[1:]):
+            return 1
+
+        if any(query.text in field for field in self.fields) or (
+            query.digits and query.digits in self.phone
+        ):
+            return 2
+
+        return None
+
+
+def trigrams(value: str) -> Set[str]:
+    """Возвращает множество триграмм строки."""
+    return {value[index : index + 3] for index in range(len(value) - 2)}
+
+
+class ClientSearchIndex:
+    """Триграммный индекс поиска клиентов в памяти процесса.
+
+    Резервная реализация поиска для баз данных без расширения ``pg_trgm``
+    (например, тестовой SQLite). Строится из базы данных при первом поиске
+    и обновляется инкрементально при добавлении, изменении и удалении клиентов.
+
+    Для запросов длиной от трёх символов кандидаты выбираются пересечением
+    списков клиентов по триграммам запроса и затем проверяются; более короткие
+    запросы проверяются по всем клиентам.
+
+    Attributes
+    ----------
+    ready : bool
+        Построен ли индекс. Пока индекс не построен, изменения игнорируются.
+
+    Methods
+    -------
+    rebuild(entries)
+        Заменяет содержимое индекса переданными клиентами.
+    put(entry)
+        Добавляет или обновляет клиента.
+    remove(client_id)
+        Убирает клиента.
+    search(query, limit)
+        Возвращает UUID подходящих клиентов в порядке ранжирования.
+    clear()
+        Очищает индекс и помечает его как непостроенный.
+
+    Notes
+    -----
+    - Индекс принадлежит процессу: изменения, выполненные другими воркерами,
+      попадают в него только после перестройки.
+    """
+
+    def __init__(self):
+        self.ready: bool = False
+
+        self._entries: Dict[UUID, SearchEntry] = {}
+        self._postings: Dict[str, Set[UUID]] = {}
+
+    def rebuild(self, entries: Iterable[SearchEntry]):
+        """Заменяет содержимое индекса переданными клиентами.
+
+        Parameters
+        ----------
+        entries : Iterable[SearchEntry]
+            Все клиенты.
+        """
+        self._entries.clear()
+        self._postings.clear()
+
+        for entry in entries:
+            self._add(entry)
+
+        self.ready = True
+
+    def put(self, entry: SearchEntry):
+        """Добавляет или обновляет клиента.
+
+        Parameters
+        ----------
+        entry : SearchEntry
+            Новое состояние клиента.
+        """
+        if not self.ready:
+            return
+
+        self.remove(entry.id)
+        self._add(entry)
+
+    def remove(self, client_id: UUID):
+        """Убирает клиента.
+
+        Parameters
+        ----------
+        client_id : UUID
+            UUID клиента. Неизвестный UUID игнорируется.
+        """
+        if (entry := self._entries.pop(client_id, None)) is None:
+            return
+
+        for trigram in self._entry_trigrams(entry):
+            postings = self._postings[trigram]
+            postings.discard(client_id)
+
+            if not postings:
+                del self._postings[trigram]
+
+    def search(self, query: SearchQuery, limit: int) -> List[UUID]:
+        """Возвращает UUID подходящих клиентов в порядке ранжирования.
+
+        Parameters
+        ----------
+        query : SearchQuery
+            Нормализованный запрос.
+        limit : int
+            Максимальное количество результатов.
+
+        Returns
+        -------
+        client_ids : List[UUID]
+            UUID клиентов, упорядоченные по рангу, фамилии и UUID.
+        """
+        ranked = []
+        for client_id in self._candidates(query):
+            entry = self._entries[client_id]
+
+            if (rank := entry.rank(query)) is not None:
+                ranked.append((rank, entry.surname, entry.id))
+
+        return [client_id for *_, client_id in heapq.nsmallest(limit, ranked)]
+
+    def clear(self):
+        """Очищает индекс и помечает его как непостроенный."""
+        self._entries.clear()
+        self._postings.clear()
+        self.ready = False
+
+    def _add(self, entry: SearchEntry):
+        """Добавляет клиента в словарь и списки триграмм."""
+        self._entries[entry.id] = entry
+
+        for trigram in self._entry_trigrams(entry):
+            self._postings.setdefault(trigram, set()).add(entry.id)
+
+    def _candidates(self, query: SearchQuery) -> Iterable[UUID]:
+        """Выбирает клиентов, которые могут подходить под запрос."""
+        needles = [query.text] + ([query.digits] if query.digits else [])
+
+        if any(len(needle) < 3 for needle in needles):
+            return self._entries.keys()
+
+        candidates: Set[UUID] = set()
+        for needle in needles:
+            postings = sorted(
+                (self._postings.get(trigram, set()) for trigram in trigrams(needle)),
+                key=len,
+            )
+            candidates |= set.intersection(*postings)
+
+        return candidates
+
+    @staticmethod
+    def _entry_trigrams(entry: SearchEntry) -> Set[str]:
+        """Возвращает триграммы всех полей клиента."""
+        return set().union(*(trigrams(value) for value in (*entry.fields, entry.phone)))
+
+
+client_search_index: ClientSearchIndex = ClientSearchIndex()
@@ -1,7 +1,30 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Tuple, TypeVar
+
 from passlib.context import CryptContext
 
+from app.core.config import Settings, get_settings
+
+settings: Settings = get_settings()
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+_T = TypeVar("_T")
+
+_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_slots: asyncio.Semaphore = asyncio.Semaphore(
+    settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_DEPTH
+)
+
+
+class PasswordHasherOverloadedError(RuntimeError):
+    """Очередь пула хеширования паролей заполнена."""
+
 
 def hash_(
     secret: str | bytes, scheme: str = None, category: str = None, **kwargs
@@ -65,3 +88,86 @@ def verify(
         ``True``, если хеш пароля соответствует переданному паролю, в ином случае ``False``.
     """
     return pwd_context.verify(secret, hashed, scheme, category, **kwargs)
+
+
+async def _run_in_pool(function: Callable[..., _T], *args) -> _T:
+    """Выполняет функцию хеширования в пуле потоков.
+
+    bcrypt освобождает GIL на время вычисления хеша, поэтому пул потоков
+    разгружает цикл событий без накладных расходов пула процессов.
+    Одновременно в пуле и его очереди находится не более
+    ``PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_DEPTH`` задач.
+
+    Parameters
+    ----------
+    function : Callable[..., _T]
+        Блокирующая функция.
+    *args
+        Аргументы функции.
+
+    Returns
+    -------
+    result : _T
+        Результат функции.
+
+    Raises
+    ------
+    PasswordHasherOverloadedError
+        Если очередь пула заполнена.
+    """
+    if _slots.locked():
+        raise PasswordHasherOverloadedError()
+
+    async with _slots:
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, partial(function, *args)
+        )
+
+
+async def hash_async(secret: str | bytes) -> str:
+    """Асинхронная версия ``hash_()``, выполняемая в пуле хеширования.
+
+    Parameters
+    ----------
+    secret : str or bytes
+        Пароль для хеширования.
+
+    Returns
+    -------
+    hashed : str
+        Хеш пароля в соответствии со схемой по умолчанию.
+
+    Raises
+    ------
+    PasswordHasherOverloadedError
+        Если очередь пула хеширования заполнена.
+    """
+    return await _run_in_pool(pwd_context.hash, secret)
+
+
+async def verify_and_update_async(
+    secret: str | bytes, hashed: str | bytes
+) -> Tuple[bool, str | None]:
+    """Проверяет пароль и при необходимости перехеширует его в пуле хеширования.
+
+    Прокси для метода ``CryptContext.verify_and_update()``: если хеш корректен,
+    но устарел (``needs_update()``), возвращается новый хеш пароля.
+
+    Parameters
+    ----------
+    secret : str or bytes
+        Пароль для проверки.
+    hashed : str or bytes
+        Хеш пароля.
+
+    Returns
+    -------
+    result : Tuple[bool, str | None]
+        Флаг соответствия пароля хешу и новый хеш, если старый нужно заменить, иначе None.
+
+    Raises
+    ------
+    PasswordHasherOverloadedError
+        Если очередь пула хеширования заполнена.
+    """
+    return await _run_in_pool(pwd_context.verify_and_update, secret, hashed)
@@ -0,0 +1,176 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Set
+from uuid import UUID
+
+from app.core.config import Settings, get_settings
+
+settings: Settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedIdentity:
+    """Личность пользователя, сохранённая в кэше токенов доступа.
+
+    Attributes
+    ----------
+    id : UUID
+        UUID пользователя.
+    username : str
+        Логин пользователя.
+    email : str | None
+        Адрес электронной почты пользователя.
+    expires_at : float
+        Момент истечения токена (``exp``) в секундах Unix-времени.
+    """
+
+    id: UUID
+    username: str
+    email: str | None
+    expires_at: float
+
+
+class AccessTokenCache:
+    """Ограниченный LRU-кэш проверенных токенов доступа.
+
+    Ключом служит SHA-256 дайджест токена, поэтому сами токены в памяти не хранятся.
+    Запись живёт до истечения токена (``exp``) либо до явной инвалидации
+    при ротации токена обновления или удалении пользователя.
+
+    Attributes
+    ----------
+    max_size : int
+        Максимальное количество записей. Значение 0 отключает кэш.
+    hits : int
+        Количество попаданий в кэш.
+    misses : int
+        Количество промахов кэша.
+
+    Methods
+    -------
+    get(token)
+        Возвращает сохранённую личность пользователя или None.
+    put(token, identity)
+        Сохраняет личность пользователя для токена.
+    invalidate_user(username)
+        Удаляет все записи пользователя.
+    clear()
+        Очищает кэш и счётчики.
+    stats()
+        Возвращает текущие счётчики кэша.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+
+        self._entries: OrderedDict[bytes, CachedIdentity] = OrderedDict()
+        self._by_username: Dict[str, Set[bytes]] = {}
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> CachedIdentity | None:
+        """Возвращает сохранённую личность пользователя для токена.
+
+        Parameters
+        ----------
+        token : str
+            JSON Web Token, токен доступа.
+
+        Returns
+        -------
+        identity : CachedIdentity | None
+            Личность пользователя, если токен уже проверялся и ещё не истёк, иначе None.
+        """
+        digest = self._digest(token)
+
+        if (identity := self._entries.get(digest)) is None:
+            self.misses += 1
+            return None
+
+        if identity.expires_at <= time.time():
+            self._remove(digest)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(digest)
+        self.hits += 1
+
+        return identity
+
+    def put(self, token: str, identity: CachedIdentity):
+        """Сохраняет личность пользователя для токена.
+
+        При превышении ``max_size`` вытесняется запись, к которой дольше всего не обращались.
+
+        Parameters
+        ----------
+        token : str
+            JSON Web Token, токен доступа.
+        identity : CachedIdentity
+            Проверенная личность пользователя.
+        """
+        if self.max_size <= 0:
+            return
+
+        digest = self._digest(token)
+
+        self._entries[digest] = identity
+        self._entries.move_to_end(digest)
+        self._by_username.setdefault(identity.username, set()).add(digest)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, username: str):
+        """Удаляет все записи пользователя.
+
+        Parameters
+        ----------
+        username : str
+            Логин пользователя.
+        """
+        for digest in self._by_username.pop(username, set()):
+            self._entries.pop(digest, None)
+
+    def clear(self):
+        """Очищает кэш и обнуляет счётчики."""
+        self._entries.clear()
+        self._by_username.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Возвращает текущие счётчики кэша.
+
+        Returns
+        -------
+        stats : Dict[str, int]
+            Размер кэша, его ёмкость, количество попаданий и промахов.
+        """
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _remove(self, digest: bytes):
+        if (identity := self._entries.pop(digest, None)) is None:
+            return
+
+        digests = self._by_username.get(identity.username)
+        if digests is not None:
+            digests.discard(digest)
+
+            if not digests:
+                del self._by_username[identity.username]
+
+
+access_token_cache: AccessTokenCache = AccessTokenCache(
+    settings.ACCESS_TOKEN_CACHE_SIZE
+)
@@ -0,0 +1,112 @@
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass(slots=True)
+class PoolStats:
+    """Накопительные счётчики пула соединений.
+
+    Attributes
+    ----------
+    checkouts : int
+        Количество выдач соединений из пула.
+    waits : int
+        Количество выдач, которым пришлось ждать освобождения соединения,
+        так как пул и его переполнение были исчерпаны.
+    wait_time_total : float
+        Суммарное время ожидания соединения в секундах.
+    wait_time_max : float
+        Максимальное время ожидания соединения в секундах.
+    timeouts : int
+        Количество выдач, завершившихся ошибкой по ``pool_timeout``.
+    overflow_checkouts : int
+        Количество выдач, для которых было открыто соединение сверх ``pool_size``.
+    """
+
+    checkouts: int = 0
+    waits: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    timeouts: int = 0
+    overflow_checkouts: int = 0
+
+    def as_dict(self) -> Dict[str, int | float]:
+        return asdict(self)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Асинхронный пул соединений, собирающий статистику выдачи соединений.
+
+    Поведение совпадает с ``AsyncAdaptedQueuePool``; дополнительно ведутся счётчики
+    ``PoolStats``, которые сохраняются при пересоздании пула (``engine.dispose()``).
+
+    Attributes
+    ----------
+    stats : PoolStats
+        Накопительные счётчики пула.
+
+    Methods
+    -------
+    snapshot()
+        Возвращает счётчики вместе с текущим состоянием пула.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.stats: PoolStats = PoolStats()
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        pool = super().recreate()
+        pool.stats = self.stats
+
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        must_wait = (
+            self.checkedin() == 0
+            and self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+        )
+        overflow_before = self._overflow
+        started = time.perf_counter()
+
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            if must_wait:
+                elapsed = time.perf_counter() - started
+
+                self.stats.waits += 1
+                self.stats.wait_time_total += elapsed
+                self.stats.wait_time_max = max(self.stats.wait_time_max, elapsed)
+
+        self.stats.checkouts += 1
+        if self._overflow > overflow_before and self._overflow > 0:
+            self.stats.overflow_checkouts += 1
+
+        return entry
+
+    def snapshot(self) -> Dict[str, int | float]:
+        """Возвращает счётчики вместе с текущим состоянием пула.
+
+        Returns
+        -------
+        snapshot : Dict[str, int | float]
+            Счётчики ``PoolStats``, а также размер пула, количество выданных
+            и свободных соединений и текущее переполнение.
+        """
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self._overflow, 0),
+            **self.stats.as_dict(),
+        }
@@ -1,5 +1,10 @@
 from .client import Client
+from .client_balance import ClientBalance
+from .client_summary import ClientSummary
+from .daily_rollup import DailyRollup
 from .group import Group
+from .hourly_visit_rollup import HourlyVisitRollup
+from .rollup_watermark import RollupWatermark
 from .season_ticket import SeasonTicket
 from .transaction import Transaction
 from .user import User
@@ -3,7 +3,7 @@ from uuid import UUID, uuid4
 
 from pydantic import EmailStr
 from pydantic_extra_types.phone_numbers import PhoneNumber
-from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy import DDL, Index, PrimaryKeyConstraint, event, text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -33,6 +33,33 @@ class Client(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint("id", name="client_pkey"),
+        Index("client_surname_id_idx", "surname", "id"),
+        # триграммные индексы поиска клиентов (расширение pg_trgm)
+        Index(
+            "client_surname_trgm_idx",
+            text("lower(surname) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "client_name_trgm_idx",
+            text("lower(name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "client_patronymic_trgm_idx",
+            text("lower(patronymic) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "client_email_trgm_idx",
+            text("lower(email) gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "client_phone_trgm_idx",
+            text(r"regexp_replace(phone, '\D', '', 'g') gin_trgm_ops"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
         {
             "comment": "Таблица с записями о клиентах.",
         },
@@ -72,7 +99,11 @@ class Client(Base):
         "Violation", back_populates="client", cascade="all, delete-orphan"
     )
     visits: Mapped[List["Visit"]] = relationship(
-        "Visit", back_populates="client", cascade="all, delete-orphan"
+        "Visit",
+        back_populates="client",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     comments: Mapped[List["Comment"]] = relationship(
@@ -95,3 +126,10 @@ class Client(Base):
             f"photo_url={self.photo_url!r}"
             f")>"
         )
+
+
+event.listen(
+    Client.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,48 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import DateTime, Numeric, Uuid
+
+from app.database.tables.base import Base
+
+
+class ClientBalance(Base):
+    __tablename__ = "client_balance"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("client_id", name="client_balance_pkey"),
+        ForeignKeyConstraint(
+            ["client_id"],
+            ["client.id"],
+            name="client_balance_client_id_fk",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        {
+            "comment": "Баланс клиентов и снимок баланса по старым транзакциям.",
+        },
+    )
+
+    client_id: Mapped[UUID] = mapped_column(Uuid())
+    balance: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0, server_default="0"
+    )
+    snapshot_balance: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), nullable=False, default=0, server_default="0"
+    )
+    snapshot_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"client_id={self.client_id!r}, "
+            f"balance={self.balance!r}, "
+            f"snapshot_balance={self.snapshot_balance!r}, "
+            f"snapshot_at={self.snapshot_at!r}"
+            f")>"
+        )
@@ -0,0 +1,52 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import DateTime, Integer, String, Uuid
+
+from app.database.tables.base import Base
+
+
+class ClientSummary(Base):
+    __tablename__ = "client_summary"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("client_id", name="client_summary_pkey"),
+        ForeignKeyConstraint(
+            ["client_id"],
+            ["client.id"],
+            name="client_summary_client_id_fk",
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        Index("client_summary_season_ticket_id_idx", "season_ticket_id"),
+        {
+            "comment": "Денормализованная сводка по клиентам для списка клиентов.",
+        },
+    )
+
+    client_id: Mapped[UUID] = mapped_column(Uuid())
+    season_ticket_id: Mapped[UUID] = mapped_column(Uuid(), nullable=True)
+    season_ticket_type: Mapped[str] = mapped_column(String(256), nullable=True)
+    season_ticket_expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    violation_count: Mapped[int] = mapped_column(
+        Integer(), nullable=False, default=0, server_default="0"
+    )
+    complaint_count: Mapped[int] = mapped_column(
+        Integer(), nullable=False, default=0, server_default="0"
+    )
+    last_visit: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"client_id={self.client_id!r}, "
+            f"season_ticket_type={self.season_ticket_type!r}, "
+            f"violation_count={self.violation_count!r}, "
+            f"complaint_count={self.complaint_count!r}, "
+            f"last_visit={self.last_visit!r}"
+            f")>"
+        )
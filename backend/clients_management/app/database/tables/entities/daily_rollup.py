@@ -0,0 +1,40 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import Date, Integer, Numeric
+
+from app.database.tables.base import Base
+
+
+class DailyRollup(Base):
+    __tablename__ = "daily_rollup"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("day", name="daily_rollup_pkey"),
+        {
+            "comment": "Посещения и выручка по дням (в часовом поясе аналитики).",
+        },
+    )
+
+    day: Mapped[date] = mapped_column(Date())
+    visits: Mapped[int] = mapped_column(
+        Integer(), nullable=False, default=0, server_default="0"
+    )
+    revenue: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), nullable=False, default=0, server_default="0"
+    )
+    transactions: Mapped[int] = mapped_column(
+        Integer(), nullable=False, default=0, server_default="0"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"day={self.day!r}, "
+            f"visits={self.visits!r}, "
+            f"revenue={self.revenue!r}, "
+            f"transactions={self.transactions!r}"
+            f")>"
+        )
@@ -7,7 +7,7 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
 )
-from sqlalchemy.types import String, Uuid
+from sqlalchemy.types import Integer, String, Uuid
 
 from app.database.tables.base import Base
 
@@ -28,6 +28,9 @@ class Group(Base):
 
     id: Mapped[UUID] = mapped_column(Uuid(), default=uuid4)
     type: Mapped[str] = mapped_column(String(256), nullable=False)
+    member_count: Mapped[int] = mapped_column(
+        Integer(), nullable=False, default=0, server_default="0"
+    )
 
     relationships: Mapped[List["Relationship"]] = relationship(
         "Relationship", back_populates="group"
@@ -42,6 +45,7 @@ class Group(Base):
         return (
             f"<{self.__class__.__name__}("
             f"id={self.id!r}, "
-            f"type={self.type!r}"
+            f"type={self.type!r}, "
+            f"member_count={self.member_count!r}"
             f")>"
         )
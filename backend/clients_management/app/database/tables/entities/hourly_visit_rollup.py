@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import DateTime, Integer
+
+from app.database.tables.base import Base
+
+
+class HourlyVisitRollup(Base):
+    __tablename__ = "hourly_visit_rollup"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("hour", "box", name="hourly_visit_rollup_pkey"),
+        {
+            "comment": "Количество начатых посещений по часам (UTC) и ящикам.",
+        },
+    )
+
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    box: Mapped[int] = mapped_column(Integer())
+    visits: Mapped[int] = mapped_column(Integer(), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"hour={self.hour!r}, "
+            f"box={self.box!r}, "
+            f"visits={self.visits!r}"
+            f")>"
+        )
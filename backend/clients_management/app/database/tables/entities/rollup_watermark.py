@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import PrimaryKeyConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import DateTime, String
+
+from app.database.tables.base import Base
+
+
+class RollupWatermark(Base):
+    __tablename__ = "rollup_watermark"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("name", name="rollup_watermark_pkey"),
+        {
+            "comment": "Граница, до которой исходные записи учтены в агрегатах.",
+        },
+    )
+
+    name: Mapped[str] = mapped_column(String(64))
+    rolled_up_until: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}("
+            f"name={self.name!r}, "
+            f"rolled_up_until={self.rolled_up_until!r}"
+            f")>"
+        )
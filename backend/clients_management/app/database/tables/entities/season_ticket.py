@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint, text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -28,6 +28,17 @@ class SeasonTicket(Base):
             onupdate="CASCADE",
             ondelete="CASCADE",
         ),
+        Index(
+            "season_ticket_client_id_expires_at_idx",
+            "client_id",
+            text("expires_at DESC"),
+        ),
+        Index(
+            "season_ticket_pending_expiry_idx",
+            "expires_at",
+            postgresql_where=text("expired_at IS NULL"),
+            sqlite_where=text("expired_at IS NULL"),
+        ),
         {
             "comment": "Таблица с записями об абонементах клиентов.",
         },
@@ -37,6 +48,7 @@ class SeasonTicket(Base):
     client_id: Mapped[UUID] = mapped_column(Uuid())
     type: Mapped[str] = mapped_column(String(256))
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    expired_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
 
     client: Mapped["Client"] = relationship("Client", back_populates="season_tickets")
 
@@ -1,14 +1,15 @@
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint, text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
     relationship,
 )
-from sqlalchemy.types import DateTime, Uuid, Float
+from sqlalchemy.types import DateTime, Numeric, Uuid
 
 from app.database.tables.base import Base
 
@@ -28,6 +29,12 @@ class Transaction(Base):
             onupdate="CASCADE",
             ondelete="CASCADE",
         ),
+        Index(
+            "transaction_client_id_timestamp_idx",
+            "client_id",
+            text('"timestamp" DESC'),
+            text("id DESC"),
+        ),
         {
             "comment": "Таблица с записями о транзакциях клиентов.",
         },
@@ -35,7 +42,7 @@ class Transaction(Base):
 
     id: Mapped[UUID] = mapped_column(Uuid(), default=uuid4)
     client_id: Mapped[UUID] = mapped_column(Uuid())
-    amount: Mapped[float] = mapped_column(Float())
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
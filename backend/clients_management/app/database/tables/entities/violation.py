@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint, text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -28,6 +28,12 @@ class Violation(Base):
             onupdate="CASCADE",
             ondelete="CASCADE",
         ),
+        Index(
+            "violation_client_id_claimed_at_idx",
+            "client_id",
+            text("claimed_at DESC"),
+            text("id DESC"),
+        ),
         {
             "comment": "Таблица с записями о нарушениях клиентов.",
         },
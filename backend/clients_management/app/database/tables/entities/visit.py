@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint, text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -20,7 +20,7 @@ class Visit(Base):
     __tablename__ = "visit"
 
     __table_args__ = (
-        PrimaryKeyConstraint("id", name="visit_pkey"),
+        PrimaryKeyConstraint("id", "visit_start", name="visit_pkey"),
         ForeignKeyConstraint(
             ["client_id"],
             ["client.id"],
@@ -28,8 +28,21 @@ class Visit(Base):
             onupdate="CASCADE",
             ondelete="CASCADE",
         ),
+        Index(
+            "visit_client_id_visit_start_idx",
+            "client_id",
+            text("visit_start DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "visit_open_idx",
+            "box",
+            postgresql_where=text("visit_end IS NULL"),
+            sqlite_where=text("visit_end IS NULL"),
+        ),
         {
             "comment": "Таблица с записями о посещениях.",
+            "postgresql_partition_by": "RANGE (visit_start)",
         },
     )
 
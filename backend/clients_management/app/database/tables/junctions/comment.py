@@ -1,13 +1,14 @@
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Index, PrimaryKeyConstraint, func, text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
     relationship,
 )
-from sqlalchemy.types import String, Uuid
+from sqlalchemy.types import DateTime, String, Uuid
 
 from app.database.tables.base import Base
 
@@ -34,6 +35,13 @@ class Comment(Base):
             onupdate="CASCADE",
             ondelete="CASCADE",
         ),
+        Index(
+            "comment_client_id_created_at_idx",
+            "client_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index("comment_user_id_idx", "user_id"),
         {
             "comment": "Таблица с записями о комментариях пользователей о клиентах.",
         },
@@ -43,6 +51,12 @@ class Comment(Base):
     user_id: Mapped[UUID] = mapped_column(Uuid())
     client_id: Mapped[UUID] = mapped_column(Uuid())
     comment: Mapped[str] = mapped_column(String(1024), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+    )
 
     user: Mapped["User"] = relationship("User", back_populates="comments")
     client: Mapped["Client"] = relationship("Client", back_populates="comments")
@@ -53,6 +67,7 @@ class Comment(Base):
             f"id={self.id!r}, "
             f"user_id={self.user_id!r}, "
             f"client_id={self.client_id!r}, "
-            f"comment={self.comment!r}"
+            f"comment={self.comment!r}, "
+            f"created_at={self.created_at!r}"
             f")>"
         )
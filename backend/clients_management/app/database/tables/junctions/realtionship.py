@@ -1,7 +1,12 @@
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKeyConstraint, PrimaryKeyConstraint
+from sqlalchemy import (
+    ForeignKeyConstraint,
+    Index,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -34,6 +39,10 @@ class Relationship(Base):
             onupdate="CASCADE",
             ondelete="CASCADE",
         ),
+        UniqueConstraint(
+            "group_id", "client_id", name="relationship_group_id_client_id_key"
+        ),
+        Index("relationship_client_id_idx", "client_id"),
         {
             "comment": "Таблица с записями о связях между клиентами.",
         },
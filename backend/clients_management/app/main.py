@@ -1,8 +1,20 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.dependencies.session import AsyncSessionMaker
 from app.api.routes.v1 import api_v1_router
 from app.core.config import Settings, get_settings
+from app.core.metrics import MetricsMiddleware
+from app.core.query_budget import QueryBudgetMiddleware
+from app.core.response_cache import response_cache
+from app.repositories import ClientSummaryRepository, VisitRepository
+from app.services import VisitService
+from app.services.analytics_rollup import analytics_rollup_scheduler
+from app.services.balance_snapshot import balance_snapshot_scheduler
+from app.services.season_ticket_expiry import season_ticket_expiry_scheduler
+from app.services.visit_partitions import visit_partition_scheduler
 
 settings: Settings = get_settings()
 
@@ -19,6 +31,10 @@ tags_metadata = [
         "name": "clients",
         "description": "Операции с **клиентами**: _добавление_, _удаление_, _редактирование_.",
     },
+    {
+        "name": "groups",
+        "description": "Операции с **группами** клиентов: _добавление_, _удаление_, _редактирование_, _состав_.",
+    },
     {
         "name": "season_tickets",
         "description": "Операции с **абонементами**: _добавление_, _удаление_, _редактирование_.",
@@ -27,8 +43,76 @@ tags_metadata = [
         "name": "visits",
         "description": "Операции с **посещениями**: _добавление_, _удаление_, _редактирование_.",
     },
+    {
+        "name": "transactions",
+        "description": "Операции с **транзакциями** клиентов: _проведение_, _пакетное проведение_.",
+    },
+    {
+        "name": "violations",
+        "description": "Операции с **нарушениями** клиентов: _добавление_, _удаление_, _редактирование_.",
+    },
+    {
+        "name": "comments",
+        "description": "Операции с **комментариями** о клиентах: _добавление_, _удаление_, _редактирование_.",
+    },
+    {
+        "name": "complaints",
+        "description": "Операции с **жалобами** на клиентов: _добавление_, _удаление_, _редактирование_.",
+    },
+    {
+        "name": "analytics",
+        "description": "Отчёты по **выручке** и **посещаемости**: _по периодам_, _тепловые карты_.",
+    },
+    {
+        "name": "events",
+        "description": "**Лента изменений** посещений, клиентов и абонементов в формате Server-Sent Events.",
+    },
+    {
+        "name": "metrics",
+        "description": "Внутренние **метрики** процесса приложения.",
+    },
 ]
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Жизненный цикл приложения.
+
+    При запуске создаёт секции таблицы посещений на ближайшие месяцы,
+    перестраивает индекс заполненности зала по незавершённым посещениям
+    и запускает фоновую проверку истёкших абонементов, создание снимков балансов,
+    обновление агрегатов аналитики и создание секций таблицы посещений.
+    """
+    async with AsyncSessionMaker() as session:
+        visit_service = VisitService(
+            VisitRepository(session), ClientSummaryRepository(session)
+        )
+
+        await visit_service.maintain_partitions(settings.VISIT_PARTITIONS_AHEAD)
+        await visit_service.rebuild_occupancy()
+        await visit_service.rebuild_ticket_validity()
+
+    if settings.SEASON_TICKET_EXPIRY_INTERVAL_SECONDS > 0:
+        season_ticket_expiry_scheduler.start(AsyncSessionMaker)
+
+    if settings.BALANCE_SNAPSHOT_INTERVAL_SECONDS > 0:
+        balance_snapshot_scheduler.start(AsyncSessionMaker)
+
+    if settings.ANALYTICS_ROLLUP_INTERVAL_SECONDS > 0:
+        analytics_rollup_scheduler.start(AsyncSessionMaker)
+
+    if settings.VISIT_PARTITIONS_INTERVAL_SECONDS > 0:
+        visit_partition_scheduler.start(AsyncSessionMaker)
+
+    yield
+
+    await season_ticket_expiry_scheduler.stop()
+    await balance_snapshot_scheduler.stop()
+    await analytics_rollup_scheduler.stop()
+    await visit_partition_scheduler.stop()
+    await response_cache.close()
+
+
 clients_management = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
@@ -39,6 +123,7 @@ clients_management = FastAPI(
         "email": settings.ADMIN_EMAIL,
     },
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
 
 clients_management.add_middleware(
@@ -48,5 +133,7 @@ clients_management.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+clients_management.add_middleware(QueryBudgetMiddleware)
+clients_management.add_middleware(MetricsMiddleware)
 
 clients_management.include_router(api_v1_router)
@@ -1,3 +1,13 @@
+from .analytics_repository import AnalyticsRepository
+from .client_balance_repository import ClientBalanceRepository
+from .client_record_repository import ClientRecordRepository
 from .client_repository import ClientRepository
+from .client_summary_repository import ClientSummaryRepository
+from .comment_repository import CommentRepository
+from .complaint_repository import ComplaintRepository
+from .group_repository import GroupRepository
 from .seson_ticket_repository import SeasonTicketRepository
+from .transaction_repository import TransactionRepository
 from .user_repository import UserRepository
+from .violation_repository import ViolationRepository
+from .visit_repository import VisitRepository
@@ -0,0 +1,325 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Mapping, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime
+
+from app.database.tables.entities import (
+    DailyRollup,
+    HourlyVisitRollup,
+    RollupWatermark,
+    Transaction,
+    Visit,
+)
+from app.repositories.client_balance_repository import DIALECT_INSERTS
+from app.repositories.interface import RepositoryInterface
+
+WATERMARK_NAME = "analytics"
+
+HOUR_BUCKETS = {
+    "postgresql": lambda column: func.date_trunc(
+        "hour", column, "UTC", type_=DateTime(timezone=True)
+    ),
+    "sqlite": lambda column: func.strftime(
+        "%Y-%m-%d %H:00:00.000000", column, type_=DateTime(timezone=True)
+    ),
+}
+
+
+class AnalyticsRepository(RepositoryInterface):
+    """Репозиторий аналитики.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Агрегирует исходные таблицы посещений и транзакций по часам и поддерживает
+    таблицы агрегатов `hourly_visit_rollup` и `daily_rollup`, из которых
+    читаются отчёты.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    get_watermark()
+        Возвращает границу, до которой записи учтены в агрегатах.
+    claim_watermark(since, until)
+        Сдвигает границу агрегатов, если её не сдвинул другой процесс.
+    aggregate_visits(since, until)
+        Считает начатые посещения по часам и ящикам по исходной таблице.
+    aggregate_transactions(since, until)
+        Считает выручку и количество транзакций по часам по исходной таблице.
+    add_hourly_visits(rows)
+        Прибавляет посещения к часовым агрегатам.
+    add_daily(rows)
+        Прибавляет посещения и выручку к дневным агрегатам.
+    get_daily(start, end)
+        Возвращает дневные агрегаты за период.
+    get_hourly_visits(since, until, box)
+        Возвращает часовые агрегаты посещений за период.
+    clear()
+        Удаляет все агрегаты и границу.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    def _hour_bucket(self, column: ColumnElement) -> ColumnElement:
+        """Строит выражение начала часа (UTC) для столбца времени."""
+        return HOUR_BUCKETS[self.session.bind.dialect.name](column)
+
+    async def get_watermark(self) -> datetime | None:
+        """Возвращает границу, до которой записи учтены в агрегатах.
+
+        Returns
+        -------
+        datetime | None
+            Граница (не включительно) или None, если агрегаты ещё не строились.
+        """
+        return await self.session.scalar(
+            select(RollupWatermark.rolled_up_until).where(
+                RollupWatermark.name == WATERMARK_NAME
+            )
+        )
+
+    async def claim_watermark(self, since: datetime | None, until: datetime) -> bool:
+        """Сдвигает границу агрегатов, если её не сдвинул другой процесс.
+
+        Граница изменяется условным UPDATE (или INSERT при первом запуске),
+        поэтому из нескольких процессов, одновременно обновляющих агрегаты
+        от одной границы, запись удаётся ровно одному: в PostgreSQL остальные
+        ждут блокировку строки и после фиксации первого не находят прежнего значения.
+
+        Parameters
+        ----------
+        since : datetime | None
+            Прочитанная ранее граница.
+        until : datetime
+            Новая граница.
+
+        Returns
+        -------
+        bool
+            True, если граница сдвинута этим вызовом.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        if since is None:
+            dialect_insert = DIALECT_INSERTS[self.session.bind.dialect.name]
+            statement = (
+                dialect_insert(RollupWatermark)
+                .values(name=WATERMARK_NAME, rolled_up_until=until)
+                .on_conflict_do_nothing(index_elements=[RollupWatermark.name])
+            )
+        else:
+            statement = (
+                update(RollupWatermark)
+                .where(
+                    RollupWatermark.name == WATERMARK_NAME,
+                    RollupWatermark.rolled_up_until == since,
+                )
+                .values(rolled_up_until=until)
+            )
+
+        result = await self.session.execute(statement)
+
+        return result.rowcount == 1
+
+    async def aggregate_visits(
+        self, since: datetime | None, until: datetime
+    ) -> List[Tuple[datetime, int, int]]:
+        """Считает начатые посещения по часам и ящикам по исходной таблице.
+
+        Parameters
+        ----------
+        since : datetime | None
+            Нижняя граница `visit_start` (включительно). None — без ограничения.
+        until : datetime
+            Верхняя граница `visit_start` (не включительно).
+
+        Returns
+        -------
+        rows : List[Tuple[datetime, int, int]]
+            Начало часа (UTC), номер ящика и количество посещений.
+
+        Notes
+        -----
+        - Условия на `visit_start` позволяют PostgreSQL отсечь секции за другие месяцы.
+        """
+        hour = self._hour_bucket(Visit.visit_start)
+        statement = (
+            select(hour, Visit.box, func.count())
+            .where(Visit.visit_start < until)
+            .group_by(hour, Visit.box)
+        )
+
+        if since is not None:
+            statement = statement.where(Visit.visit_start >= since)
+
+        result = await self.session.execute(statement)
+
+        return [tuple(row) for row in result.all()]
+
+    async def aggregate_transactions(
+        self, since: datetime | None, until: datetime
+    ) -> List[Tuple[datetime, Decimal, int]]:
+        """Считает выручку и количество транзакций по часам по исходной таблице.
+
+        Parameters
+        ----------
+        since : datetime | None
+            Нижняя граница `timestamp` (включительно). None — без ограничения.
+        until : datetime
+            Верхняя граница `timestamp` (не включительно).
+
+        Returns
+        -------
+        rows : List[Tuple[datetime, Decimal, int]]
+            Начало часа (UTC), сумма транзакций и их количество.
+        """
+        hour = self._hour_bucket(Transaction.timestamp)
+        statement = (
+            select(hour, func.sum(Transaction.amount), func.count())
+            .where(Transaction.timestamp < until)
+            .group_by(hour)
+        )
+
+        if since is not None:
+            statement = statement.where(Transaction.timestamp >= since)
+
+        result = await self.session.execute(statement)
+
+        return [tuple(row) for row in result.all()]
+
+    async def add_hourly_visits(self, rows: Sequence[Mapping]):
+        """Прибавляет посещения к часовым агрегатам.
+
+        Выполняется запросом ``INSERT ... ON CONFLICT (hour, box) DO UPDATE``
+        с пакетной передачей строк.
+
+        Parameters
+        ----------
+        rows : Sequence[Mapping]
+            Значения `hour`, `box` и `visits`.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        if not rows:
+            return
+
+        dialect_insert = DIALECT_INSERTS[self.session.bind.dialect.name]
+        statement = dialect_insert(HourlyVisitRollup)
+
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[HourlyVisitRollup.hour, HourlyVisitRollup.box],
+                set_={
+                    "visits": HourlyVisitRollup.visits + statement.excluded.visits,
+                },
+            ),
+            list(rows),
+        )
+
+    async def add_daily(self, rows: Sequence[Mapping]):
+        """Прибавляет посещения и выручку к дневным агрегатам.
+
+        Выполняется запросом ``INSERT ... ON CONFLICT (day) DO UPDATE``
+        с пакетной передачей строк.
+
+        Parameters
+        ----------
+        rows : Sequence[Mapping]
+            Значения `day`, `visits`, `revenue` и `transactions`.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        if not rows:
+            return
+
+        dialect_insert = DIALECT_INSERTS[self.session.bind.dialect.name]
+        statement = dialect_insert(DailyRollup)
+
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[DailyRollup.day],
+                set_={
+                    "visits": DailyRollup.visits + statement.excluded.visits,
+                    "revenue": DailyRollup.revenue + statement.excluded.revenue,
+                    "transactions": (
+                        DailyRollup.transactions + statement.excluded.transactions
+                    ),
+                },
+            ),
+            list(rows),
+        )
+
+    async def get_daily(self, start: date, end: date) -> List[DailyRollup]:
+        """Возвращает дневные агрегаты за период.
+
+        Parameters
+        ----------
+        start : date
+            Первый день периода.
+        end : date
+            Последний день периода (включительно).
+
+        Returns
+        -------
+        rows : List[DailyRollup]
+            Агрегаты по дням в порядке возрастания. Дни без записей пропускаются.
+        """
+        result = await self.session.scalars(
+            select(DailyRollup)
+            .where(DailyRollup.day >= start, DailyRollup.day <= end)
+            .order_by(DailyRollup.day)
+        )
+
+        return list(result.all())
+
+    async def get_hourly_visits(
+        self, since: datetime, until: datetime, box: int | None = None
+    ) -> List[Tuple[datetime, int, int]]:
+        """Возвращает часовые агрегаты посещений за период.
+
+        Parameters
+        ----------
+        since : datetime
+            Нижняя граница часа (включительно).
+        until : datetime
+            Верхняя граница часа (не включительно).
+        box : int | None
+            Номер ящика. None — все ящики.
+
+        Returns
+        -------
+        rows : List[Tuple[datetime, int, int]]
+            Начало часа (UTC), номер ящика и количество посещений.
+        """
+        statement = select(
+            HourlyVisitRollup.hour, HourlyVisitRollup.box, HourlyVisitRollup.visits
+        ).where(HourlyVisitRollup.hour >= since, HourlyVisitRollup.hour < until)
+
+        if box is not None:
+            statement = statement.where(HourlyVisitRollup.box == box)
+
+        result = await self.session.execute(statement)
+
+        return [tuple(row) for row in result.all()]
+
+    async def clear(self):
+        """Удаляет все агрегаты и границу.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        for table in (HourlyVisitRollup, DailyRollup, RollupWatermark):
+            await self.session.execute(delete(table))
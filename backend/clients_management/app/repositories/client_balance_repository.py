@@ -0,0 +1,147 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Mapping
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.tables.entities import ClientBalance, Transaction
+from app.repositories.interface import RepositoryInterface
+
+DIALECT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class ClientBalanceRepository(RepositoryInterface):
+    """Репозиторий балансов клиентов.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Поддерживает таблицу `client_balance`: текущий баланс изменяется на сумму
+    каждой новой транзакции, поэтому чтение баланса не зависит от длины истории.
+    Снимок баланса (`snapshot_balance` на момент `snapshot_at`) позволяет
+    удалять старые транзакции, не меняя баланс.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    get_balance(client_id)
+        Возвращает баланс клиента.
+    apply_amounts(amounts)
+        Прибавляет суммы новых транзакций к балансам клиентов.
+    take_snapshots(before)
+        Переносит в снимки балансов транзакции раньше заданного момента.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def get_balance(self, client_id: UUID) -> ClientBalance | None:
+        """Возвращает баланс клиента.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        ClientBalance | None
+            Баланс клиента или None, если у клиента ещё не было транзакций.
+        """
+        return await self.session.get(ClientBalance, client_id)
+
+    async def apply_amounts(self, amounts: Mapping[UUID, Decimal]):
+        """Прибавляет суммы новых транзакций к балансам клиентов.
+
+        Выполняется одним запросом ``INSERT ... ON CONFLICT (client_id) DO UPDATE``:
+        строка баланса создаётся при первой транзакции клиента, а для остальных
+        клиентов баланс увеличивается атомарно, без предварительного чтения.
+
+        Parameters
+        ----------
+        amounts : Mapping[UUID, Decimal]
+            Суммы новых транзакций по UUID клиентов.
+
+        Notes
+        -----
+        - Строки упорядочиваются по UUID клиента, чтобы параллельные пакеты
+          блокировали строки баланса в одном порядке.
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        if not amounts:
+            return
+
+        dialect_insert = DIALECT_INSERTS[self.session.bind.dialect.name]
+        statement = dialect_insert(ClientBalance).values(
+            [
+                {"client_id": client_id, "balance": amounts[client_id]}
+                for client_id in sorted(amounts)
+            ]
+        )
+
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[ClientBalance.client_id],
+                set_={"balance": ClientBalance.balance + statement.excluded.balance},
+            )
+        )
+
+    async def take_snapshots(self, before: datetime) -> int:
+        """Переносит в снимки балансов транзакции раньше заданного момента.
+
+        Одним UPDATE к снимку каждого клиента прибавляется сумма его транзакций
+        между предыдущим `snapshot_at` и `before`, после чего `snapshot_at`
+        сдвигается на `before`. Коррелированный подзапрос читает только новые
+        транзакции по индексу `transaction_client_id_timestamp_idx`.
+
+        Parameters
+        ----------
+        before : datetime
+            Новая граница снимков (не включительно).
+
+        Returns
+        -------
+        count : int
+            Количество обновлённых снимков.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        amount = (
+            select(func.coalesce(func.sum(Transaction.amount), 0))
+            .where(
+                Transaction.client_id == ClientBalance.client_id,
+                Transaction.timestamp < before,
+                or_(
+                    ClientBalance.snapshot_at.is_(None),
+                    Transaction.timestamp >= ClientBalance.snapshot_at,
+                ),
+            )
+            .scalar_subquery()
+        )
+
+        result = await self.session.execute(
+            update(ClientBalance)
+            .where(
+                or_(
+                    ClientBalance.snapshot_at.is_(None),
+                    ClientBalance.snapshot_at < before,
+                )
+            )
+            .values(
+                snapshot_balance=ClientBalance.snapshot_balance + amount,
+                snapshot_at=before,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
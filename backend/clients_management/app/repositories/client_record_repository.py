@@ -0,0 +1,216 @@
+from datetime import datetime
+from typing import Generic, List, Tuple, Type, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy import delete, exists, literal, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime, Uuid
+
+from app.database.tables.entities import Client
+from app.database.tables.junctions import Comment, Complaint
+from app.repositories.interface import RepositoryInterface
+
+Record = TypeVar("Record", Comment, Complaint)
+
+
+class ClientRecordRepository(RepositoryInterface, Generic[Record]):
+    """Базовый репозиторий записей пользователей о клиентах.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Общая часть репозиториев комментариев и жалоб: записи принадлежат автору,
+    изменяются и удаляются одним запросом с условием на автора и выдаются
+    постранично по ключу (`created_at`, `id`).
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+    model : Type[Record]
+        Таблица записей; задаётся в наследнике.
+
+    Methods
+    -------
+    client_exists(client_id)
+        Проверяет, существует ли клиент.
+    get_record_by_id(record_id)
+        Возвращает запись по её UUID.
+    get_client_records(client_id, limit, after)
+        Возвращает страницу записей о клиенте.
+    add_record(user_id, record_data)
+        Добавляет новую запись в сессию базы данных.
+    update_record(record_id, user_id, record_data)
+        Обновляет запись автора одним запросом UPDATE.
+    delete_record(record_id, user_id)
+        Удаляет запись автора одним запросом DELETE.
+    """
+
+    model: Type[Record]
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def client_exists(self, client_id: UUID) -> bool:
+        """Проверяет, существует ли клиент с переданным UUID.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        bool
+            True, если клиент найден.
+        """
+        return await self.session.scalar(select(exists().where(Client.id == client_id)))
+
+    async def get_record_by_id(self, record_id: UUID) -> Record | None:
+        """Возвращает запись по её UUID.
+
+        Parameters
+        ----------
+        record_id : UUID
+            Уникальный идентификатор записи.
+
+        Returns
+        -------
+        Record | None
+            Запись или None, если она не найдена.
+        """
+        return await self.session.get(self.model, record_id)
+
+    async def get_client_records(
+        self,
+        client_id: UUID,
+        limit: int,
+        after: Tuple[datetime, UUID] | None = None,
+    ) -> List[Record]:
+        """Возвращает страницу записей о клиенте.
+
+        Поддерживает keyset-пагинацию по паре (`created_at`, `id`) в порядке убывания.
+        Запрос обслуживается индексом `<таблица>_client_id_created_at_idx`.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        limit : int
+            Максимальное количество записей.
+        after : Tuple[datetime, UUID] | None
+            Ключ сортировки (`created_at`, UUID) последней записи предыдущей страницы.
+
+        Returns
+        -------
+        records : List[Record]
+            Записи от новых к старым.
+        """
+        model = self.model
+        statement = (
+            select(model)
+            .where(model.client_id == client_id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(model.created_at, model.id)
+                < tuple_(
+                    literal(after[0], DateTime(timezone=True)),
+                    literal(after[1], Uuid()),
+                )
+            )
+
+        result = await self.session.scalars(statement)
+
+        return list(result.all())
+
+    async def add_record(self, user_id: UUID, record_data: BaseModel) -> Record:
+        """Добавляет новую запись в сессию базы данных.
+
+        Parameters
+        ----------
+        user_id : UUID
+            UUID автора записи.
+        record_data : BaseModel
+            Данные новой записи.
+
+        Returns
+        -------
+        record : Record
+            Созданная запись.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        self.session.add(
+            record := self.model(user_id=user_id, **record_data.model_dump())
+        )
+        await self.session.flush()
+
+        return record
+
+    async def update_record(
+        self, record_id: UUID, user_id: UUID, record_data: BaseModel
+    ) -> UUID | None:
+        """Обновляет запись автора одним запросом UPDATE.
+
+        Parameters
+        ----------
+        record_id : UUID
+            Уникальный идентификатор записи.
+        user_id : UUID
+            UUID пользователя, изменяющего запись.
+        record_data : BaseModel
+            Новые данные записи.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор обновлённой записи или `None`, если запись
+            не найдена или принадлежит другому пользователю.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        model = self.model
+
+        return await self.session.scalar(
+            update(model)
+            .where(model.id == record_id, model.user_id == user_id)
+            .values(**record_data.model_dump())
+            .returning(model.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_record(self, record_id: UUID, user_id: UUID) -> UUID | None:
+        """Удаляет запись автора одним запросом DELETE.
+
+        Parameters
+        ----------
+        record_id : UUID
+            Уникальный идентификатор записи.
+        user_id : UUID
+            UUID пользователя, удаляющего запись.
+
+        Returns
+        -------
+        UUID | None
+            UUID клиента удалённой записи или `None`, если запись
+            не найдена или принадлежит другому пользователю.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        model = self.model
+
+        return await self.session.scalar(
+            delete(model)
+            .where(model.id == record_id, model.user_id == user_id)
+            .returning(model.client_id)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,10 +1,34 @@
-from typing import List
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Row,
+    Select,
+    and_,
+    case,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.types import String, Uuid
 
-from app.database.tables.entities import Client
+from app.database.tables.entities import (
+    Client,
+    ClientSummary,
+    Group,
+)
+from app.database.tables.junctions import Relationship
+from app.core.search import SearchQuery
 from app.repositories.interface import RepositoryInterface
 from app.schemas.v1.requests import ClientRequest
 
@@ -22,30 +46,315 @@ class ClientRepository(RepositoryInterface):
 
     Methods
     -------
-    get_all_clients()
-        Возвращает записи всех клиентов в БД.
+    get_all_clients(limit, after)
+        Возвращает сокращённое представление клиентов одним запросом.
+    stream_all_clients(chunk_size)
+        Построчно выдаёт сокращённое представление всех клиентов.
+    stream_clients_export(chunk_size)
+        Порциями выдаёт строки выгрузки клиентов.
+    search_clients(query, limit)
+        Ищет клиентов по триграммным индексам PostgreSQL.
+    get_clients_by_ids(client_ids)
+        Возвращает сокращённое представление указанных клиентов.
+    get_search_entries()
+        Возвращает поля клиентов, по которым выполняется поиск.
+    get_client_by_id(client_id)
+        Возвращает клиента по его UUID.
+    get_client_with_season_tickets(client_id)
+        Возвращает клиента вместе с его абонементами.
+    get_client_groups(client_id)
+        Возвращает группы клиента вместе с количеством участников.
+    group_exists(group_id)
+        Проверяет, существует ли группа.
+    get_group_members(group_id, limit, after)
+        Возвращает сокращённое представление участников группы.
+    add_client(client_data)
+        Добавляет нового клиента в сессию базы данных.
+    add_clients(clients)
+        Добавляет несколько клиентов многострочным INSERT.
+    update_client(client_id, client_data)
+        Обновляет клиента одним запросом UPDATE.
+    delete_client(client)
+        Помечает объект клиента для удаления из базы данных.
     """
 
     def __init__(self, session: AsyncSession):
         super().__init__(session)
 
-    async def get_all_clients(self) -> List[Client]:
-        """Возвращает записи всех клиентов в БД.
+    @property
+    def supports_trigram_search(self) -> bool:
+        """Поддерживает ли база данных поиск по триграммным индексам (``pg_trgm``)."""
+        return self.session.bind.dialect.name == "postgresql"
 
-        Формирует запрос к базе данных на получение списка всех клиентов,
-        отсортированного по фамилии пользователя.
-        Полученный скаляр переводится в built-in структуру `list`.
+    @staticmethod
+    def _like_pattern(value: str, prefix: str = "%", suffix: str = "%") -> str:
+        """Экранирует значение для оператора LIKE и добавляет подстановочные символы."""
+        escaped = value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+        return f"{prefix}{escaped}{suffix}"
+
+    @staticmethod
+    def _compact_clients_statement() -> Select:
+        """Строит запрос сокращённого представления клиентов.
+
+        Проекция совпадает по полям с `CompactClientModel` и читается из сводки
+        `client_summary`, присоединённой по первичному ключу:
+
+        - тип текущего абонемента — тип абонемента сводки, если он ещё действует;
+        - флаг нарушителя — ненулевое количество нарушений в сводке;
+        - последнее посещение — последнее посещение из сводки;
+        - количества нарушений и жалоб — счётчики сводки.
 
         Returns
         -------
-        clients : List[Client]
-            Список записей пользователей из базы данных.
+        statement : Select
+            Запрос, упорядоченный по паре (`surname`, `id`).
+        """
+        now = datetime.now(timezone.utc)
+
+        season_ticket_type = case(
+            (
+                ClientSummary.season_ticket_expires_at > now,
+                ClientSummary.season_ticket_type,
+            ),
+            else_=null(),
+        )
+
+        return (
+            select(
+                Client.id,
+                Client.name,
+                Client.surname,
+                Client.patronymic,
+                Client.sex,
+                Client.email,
+                Client.phone,
+                Client.photo_url,
+                season_ticket_type.label("season_ticket_type"),
+                (func.coalesce(ClientSummary.violation_count, 0) > 0).label(
+                    "is_violator"
+                ),
+                ClientSummary.last_visit.label("last_visit"),
+                func.coalesce(ClientSummary.violation_count, 0).label(
+                    "violation_count"
+                ),
+                func.coalesce(ClientSummary.complaint_count, 0).label(
+                    "complaint_count"
+                ),
+            )
+            .outerjoin(ClientSummary, ClientSummary.client_id == Client.id)
+            .order_by(Client.surname, Client.id)
+        )
+
+    async def get_all_clients(
+        self, limit: int | None = None, after: Tuple[str, UUID] | None = None
+    ) -> List[Row]:
+        """Возвращает сокращённое представление клиентов одним запросом.
+
+        Поддерживает keyset-пагинацию по паре (`surname`, `id`): при переданном `after`
+        возвращаются только записи, следующие за указанной в порядке сортировки.
+
+        Parameters
+        ----------
+        limit : int | None
+            Максимальное количество записей. Если не передано, возвращаются все записи.
+        after : Tuple[str, UUID] | None
+            Ключ сортировки (фамилия, UUID) последней записи предыдущей страницы.
+
+        Returns
+        -------
+        rows : List[Row]
+            Список строк с полями `CompactClientModel`, где `last_visit` имеет тип `datetime`.
 
         Notes
         -----
+        - Количество запросов не зависит от числа клиентов (всегда один SELECT).
         - Список клиентов возвращается в алфавитном порядке.
         """
-        result = await self.session.scalars(select(Client).order_by(Client.surname))
+        statement = self._compact_clients_statement()
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(Client.surname, Client.id)
+                > tuple_(literal(after[0], String()), literal(after[1], Uuid()))
+            )
+
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        result = await self.session.execute(statement)
+
+        return list(result.all())
+
+    async def stream_all_clients(self, chunk_size: int) -> AsyncIterator[Row]:
+        """Построчно выдаёт сокращённое представление всех клиентов.
+
+        Читает результат серверным курсором порциями по `chunk_size` строк,
+        поэтому полный список клиентов никогда не хранится в памяти.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Количество строк, получаемых из курсора за одну итерацию.
+
+        Yields
+        ------
+        row : Row
+            Строка с полями `CompactClientModel`.
+
+        Notes
+        -----
+        - Проекция состоит из нескольких столбцов, поэтому используется ``session.stream()``,
+          а не ``session.stream_scalars()``; поведение курсора у них одинаковое.
+        - Сессия должна оставаться открытой до окончания итерации.
+        """
+        result = await self.session.stream(
+            self._compact_clients_statement().execution_options(yield_per=chunk_size)
+        )
+
+        async for row in result:
+            yield row
+
+    async def stream_clients_export(self, chunk_size: int) -> AsyncIterator[List[Row]]:
+        """Порциями выдаёт строки выгрузки клиентов.
+
+        Проекция совпадает с `_compact_clients_statement()`, включая количества
+        нарушений и жалоб клиента из сводки `client_summary`.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Количество строк в одной порции, получаемой из серверного курсора.
+
+        Yields
+        ------
+        rows : List[Row]
+            Очередная порция строк, не больше `chunk_size`.
+
+        Notes
+        -----
+        - В памяти одновременно находится только одна порция.
+        - Сессия должна оставаться открытой до окончания итерации.
+        """
+        result = await self.session.stream(
+            self._compact_clients_statement().execution_options(yield_per=chunk_size)
+        )
+
+        async for rows in result.partitions():
+            yield rows
+
+    async def search_clients(self, query: SearchQuery, limit: int) -> List[Row]:
+        """Ищет клиентов по триграммным индексам PostgreSQL.
+
+        Клиент подходит, если запрос встречается в фамилии, имени, отчестве или адресе
+        электронной почты (без учёта регистра), либо цифры запроса встречаются в номере
+        телефона. Условия ``LIKE '%...%'`` обслуживаются GIN-индексами ``gin_trgm_ops``
+        по тем же выражениям (`client_*_trgm_idx`).
+
+        Результаты ранжируются так же, как в `SearchEntry.rank()`:
+
+        - 0 — фамилия начинается с запроса или номер телефона оканчивается его цифрами;
+        - 1 — имя, отчество или адрес электронной почты начинается с запроса;
+        - 2 — запрос встречается внутри любого поля.
+
+        Parameters
+        ----------
+        query : SearchQuery
+            Нормализованный запрос.
+        limit : int
+            Максимальное количество результатов.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полями `CompactClientModel`, упорядоченные по рангу, фамилии и UUID.
+
+        Notes
+        -----
+        - Требует расширения ``pg_trgm`` (см. `supports_trigram_search`).
+        """
+        surname, *fields = (
+            func.lower(column)
+            for column in (Client.surname, Client.name, Client.patronymic, Client.email)
+        )
+        # константы подставляются литералами, чтобы выражение совпало с индексом
+        phone = func.regexp_replace(
+            Client.phone,
+            literal_column(r"'\D'"),
+            literal_column("''"),
+            literal_column("'g'"),
+        )
+
+        text_contains = self._like_pattern(query.text)
+        text_prefix = self._like_pattern(query.text, prefix="")
+
+        contains = [
+            column.like(text_contains, escape="/") for column in (surname, *fields)
+        ]
+        first = [surname.like(text_prefix, escape="/")]
+        if query.digits:
+            contains.append(phone.like(self._like_pattern(query.digits)))
+            first.append(phone.like(self._like_pattern(query.digits, suffix="")))
+
+        rank = case(
+            (or_(*first), 0),
+            (or_(*(column.like(text_prefix, escape="/") for column in fields)), 1),
+            else_=2,
+        )
+
+        result = await self.session.execute(
+            self._compact_clients_statement()
+            .where(or_(*contains))
+            .order_by(None)
+            .order_by(rank, Client.surname, Client.id)
+            .limit(limit)
+        )
+
+        return list(result.all())
+
+    async def get_clients_by_ids(self, client_ids: List[UUID]) -> List[Row]:
+        """Возвращает сокращённое представление указанных клиентов.
+
+        Parameters
+        ----------
+        client_ids : List[UUID]
+            UUID клиентов.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полями `CompactClientModel` в алфавитном порядке.
+            Несуществующие UUID пропускаются.
+        """
+        if not client_ids:
+            return []
+
+        result = await self.session.execute(
+            self._compact_clients_statement().where(Client.id.in_(client_ids))
+        )
+
+        return list(result.all())
+
+    async def get_search_entries(self) -> List[Row]:
+        """Возвращает поля клиентов, по которым выполняется поиск.
+
+        Используется для построения поискового индекса в памяти процесса.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полями `id`, `surname`, `name`, `patronymic`, `email` и `phone`.
+        """
+        result = await self.session.execute(
+            select(
+                Client.id,
+                Client.surname,
+                Client.name,
+                Client.patronymic,
+                Client.email,
+                Client.phone,
+            )
+        )
 
         return list(result.all())
 
@@ -73,6 +382,112 @@ class ClientRepository(RepositoryInterface):
         """
         return await self.session.scalar(select(Client).where(Client.id == client_id))
 
+    async def get_client_with_season_tickets(self, client_id: UUID) -> Client:
+        """Возвращает клиента вместе с его абонементами.
+
+        Абонементы загружаются одним дополнительным запросом (`selectinload`),
+        поэтому обращение к `client.season_tickets` не выполняет ленивую загрузку.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        Client | None
+            Объект клиента с загруженными абонементами или None, если клиент не найден.
+        """
+        return await self.session.scalar(
+            select(Client)
+            .options(selectinload(Client.season_tickets))
+            .where(Client.id == client_id)
+        )
+
+    async def get_client_groups(self, client_id: UUID) -> List[Row]:
+        """Возвращает группы клиента вместе с количеством участников.
+
+        Количество участников читается из поддерживаемого столбца `group.member_count`,
+        без обращения к записям участников.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полями `id`, `type` и `quantity`.
+        """
+        result = await self.session.execute(
+            select(Group.id, Group.type, Group.member_count.label("quantity"))
+            .join(Relationship, Relationship.group_id == Group.id)
+            .where(Relationship.client_id == client_id)
+        )
+
+        return list(result.all())
+
+    async def group_exists(self, group_id: UUID) -> bool:
+        """Проверяет, существует ли группа с переданным UUID.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+
+        Returns
+        -------
+        bool
+            True, если группа найдена.
+        """
+        return await self.session.scalar(select(exists().where(Group.id == group_id)))
+
+    async def get_group_members(
+        self, group_id: UUID, limit: int, after: Tuple[str, UUID] | None = None
+    ) -> List[Row]:
+        """Возвращает сокращённое представление участников группы.
+
+        Проекция совпадает с `_compact_clients_statement()` и дополнена ролью
+        клиента в группе. Поддерживает keyset-пагинацию по паре (`surname`, `id`).
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        limit : int
+            Максимальное количество записей.
+        after : Tuple[str, UUID] | None
+            Ключ сортировки (фамилия, UUID) последней записи предыдущей страницы.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полями `GroupMemberModel` в алфавитном порядке.
+        """
+        statement = (
+            self._compact_clients_statement()
+            .add_columns(Relationship.role)
+            .join(
+                Relationship,
+                and_(
+                    Relationship.client_id == Client.id,
+                    Relationship.group_id == group_id,
+                ),
+            )
+            .limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(Client.surname, Client.id)
+                > tuple_(literal(after[0], String()), literal(after[1], Uuid()))
+            )
+
+        result = await self.session.execute(statement)
+
+        return list(result.all())
+
     async def add_client(self, client_data: ClientRequest) -> Client:
         """Добавляет нового клиента в сессию базы данных.
 
@@ -94,11 +509,66 @@ class ClientRepository(RepositoryInterface):
 
         return client
 
+    async def add_clients(self, clients: List[Dict[str, Any]]):
+        """Добавляет несколько клиентов многострочным INSERT.
+
+        Запись выполняется в точке сохранения (SAVEPOINT): при ошибке откатывается
+        только эта вставка, а транзакция сессии остаётся рабочей.
+
+        Parameters
+        ----------
+        clients : List[Dict[str, Any]]
+            Значения столбцов клиентов, включая заранее сгенерированный `id`.
+
+        Raises
+        ------
+        IntegrityError
+            Если хотя бы одна строка нарушает ограничения таблицы.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        async with self.session.begin_nested():
+            await self.session.execute(insert(Client), clients)
+
+    async def update_client(
+        self, client_id: UUID, client_data: ClientRequest
+    ) -> UUID | None:
+        """Обновляет клиента одним запросом UPDATE.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        client_data : ClientRequest
+            Новые значения полей клиента.
+
+        Returns
+        -------
+        UUID | None
+            UUID обновлённого клиента или None, если клиент не найден.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        - Запись не загружается в сессию перед обновлением.
+        """
+        return await self.session.scalar(
+            update(Client)
+            .where(Client.id == client_id)
+            .values(**client_data.model_dump())
+            .returning(Client.id)
+            .execution_options(synchronize_session=False)
+        )
+
     async def delete_client(self, client: Client):
         """Помечает объект клиента для удаления из базы данных.
 
         Удаляет объект клиента из текущей сессии SQLAlchemy.
         Окончательное удаление происходит после вызова `commit()`.
+        Количество участников групп клиента уменьшается одним запросом UPDATE
+        в той же транзакции.
 
         Parameters
         ----------
@@ -110,4 +580,16 @@ class ClientRepository(RepositoryInterface):
         - Метод не вызывает commit — вызывающий код должен зафиксировать изменения.
         - Удаление происходит асинхронно.
         """
+        await self.session.execute(
+            update(Group)
+            .where(
+                Group.id.in_(
+                    select(Relationship.group_id).where(
+                        Relationship.client_id == client.id
+                    )
+                )
+            )
+            .values(member_count=Group.member_count - 1)
+            .execution_options(synchronize_session=False)
+        )
         await self.session.delete(client)
@@ -0,0 +1,398 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.tables.entities import (
+    Client,
+    ClientSummary,
+    SeasonTicket,
+    Violation,
+    Visit,
+)
+from app.database.tables.junctions import Complaint
+from app.repositories.interface import RepositoryInterface
+
+SEASON_TICKET_COLUMNS: Tuple[str, ...] = (
+    "season_ticket_id",
+    "season_ticket_type",
+    "season_ticket_expires_at",
+)
+
+
+class ClientSummaryRepository(RepositoryInterface):
+    """Репозиторий сводки по клиентам.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Поддерживает денормализованную таблицу `client_summary`, из которой читается
+    список клиентов: каждая операция записи пересчитывает только затронутые строки
+    сводки, а полная перестройка и проверка согласованности выполняются отдельно.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    add_summaries(client_ids)
+        Создаёт пустые строки сводки для новых клиентов.
+    get_season_ticket_expiries(client_ids)
+        Возвращает наибольшие сроки действия абонементов клиентов.
+    refresh_season_tickets(client_ids, season_ticket_ids)
+        Пересчитывает абонемент в строках сводки.
+    change_violation_count(client_id, delta)
+        Атомарно изменяет количество нарушений в строке сводки.
+    change_complaint_count(client_id, delta)
+        Атомарно изменяет количество жалоб в строке сводки.
+    refresh_last_visit(client_ids)
+        Пересчитывает последнее посещение в строках сводки.
+    record_visit_start(client_ids, visit_start)
+        Сдвигает последнее посещение клиентов на новое время начала посещения.
+    rebuild()
+        Полностью перестраивает сводку по исходным таблицам.
+    find_inconsistent()
+        Возвращает UUID клиентов, сводка которых расходится с исходными таблицами.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    @staticmethod
+    def _computed_columns(client_id: ColumnElement) -> Dict[str, ColumnElement]:
+        """Строит коррелированные подзапросы, вычисляющие столбцы сводки.
+
+        Абонемент сводки — абонемент клиента с наибольшим `expires_at`
+        (индекс `season_ticket_client_id_expires_at_idx`). Если он истёк,
+        истекли и все остальные, поэтому при чтении достаточно сравнить
+        `season_ticket_expires_at` с текущим временем.
+
+        Parameters
+        ----------
+        client_id : ColumnElement
+            Столбец внешнего запроса с UUID клиента.
+
+        Returns
+        -------
+        columns : Dict[str, ColumnElement]
+            Выражения для каждого вычисляемого столбца `ClientSummary`.
+        """
+
+        def season_ticket(column: ColumnElement) -> ColumnElement:
+            return (
+                select(column)
+                .where(SeasonTicket.client_id == client_id)
+                .order_by(SeasonTicket.expires_at.desc(), SeasonTicket.id.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+
+        return {
+            "season_ticket_id": season_ticket(SeasonTicket.id),
+            "season_ticket_type": season_ticket(SeasonTicket.type),
+            "season_ticket_expires_at": season_ticket(SeasonTicket.expires_at),
+            "violation_count": (
+                select(func.count())
+                .select_from(Violation)
+                .where(Violation.client_id == client_id)
+                .scalar_subquery()
+            ),
+            "complaint_count": (
+                select(func.count())
+                .select_from(Complaint)
+                .where(Complaint.client_id == client_id)
+                .scalar_subquery()
+            ),
+            "last_visit": (
+                select(func.max(Visit.visit_start))
+                .where(Visit.client_id == client_id)
+                .scalar_subquery()
+            ),
+        }
+
+    async def _refresh(
+        self, columns: Iterable[str], condition: ColumnElement
+    ) -> List[Row]:
+        """Пересчитывает указанные столбцы в строках сводки, подходящих под условие.
+
+        Parameters
+        ----------
+        columns : Iterable[str]
+            Имена пересчитываемых столбцов.
+        condition : ColumnElement
+            Условие отбора строк сводки.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полем `client_id` и новыми значениями пересчитанных столбцов.
+        """
+        computed = self._computed_columns(ClientSummary.client_id)
+
+        result = await self.session.execute(
+            update(ClientSummary)
+            .where(condition)
+            .values({column: computed[column] for column in columns})
+            .returning(
+                ClientSummary.client_id,
+                *(getattr(ClientSummary, column) for column in columns),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        return list(result.all())
+
+    async def _change_count(self, column: ColumnElement, client_id: UUID, delta: int):
+        """Изменяет счётчик в строке сводки на `delta`.
+
+        Выполняется запросом ``UPDATE ... SET <счётчик> = <счётчик> + delta``,
+        как `GroupRepository.change_member_count`. Пересчёт коррелированным
+        ``count(*)`` в READ COMMITTED терял бы изменения: второй из двух
+        одновременных UPDATE, дождавшись блокировки строки, перечитывает строку,
+        но не видит вставленную другой транзакцией запись в исходной таблице.
+
+        Parameters
+        ----------
+        column : ColumnElement
+            Столбец счётчика `ClientSummary`.
+        client_id : UUID
+            UUID клиента.
+        delta : int
+            Изменение счётчика.
+        """
+        await self.session.execute(
+            update(ClientSummary)
+            .where(ClientSummary.client_id == client_id)
+            .values({column: column + delta})
+            .execution_options(synchronize_session=False)
+        )
+
+    async def add_summaries(self, client_ids: Iterable[UUID]):
+        """Создаёт пустые строки сводки для новых клиентов.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            UUID новых клиентов.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        if rows := [{"client_id": client_id} for client_id in client_ids]:
+            await self.session.execute(insert(ClientSummary), rows)
+
+    async def get_season_ticket_expiries(
+        self, client_ids: Iterable[UUID] | None = None
+    ) -> Dict[UUID, datetime | None]:
+        """Возвращает наибольшие сроки действия абонементов клиентов.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID] | None
+            UUID клиентов. Если не переданы, возвращаются сроки всех клиентов.
+
+        Returns
+        -------
+        expiries : Dict[UUID, datetime | None]
+            Сроки по UUID клиентов (None — у клиента нет абонементов).
+            Несуществующие клиенты в результат не попадают.
+        """
+        statement = select(
+            ClientSummary.client_id, ClientSummary.season_ticket_expires_at
+        )
+
+        if client_ids is not None:
+            statement = statement.where(ClientSummary.client_id.in_(list(client_ids)))
+
+        result = await self.session.execute(statement)
+
+        return {client_id: expires_at for client_id, expires_at in result.all()}
+
+    async def refresh_season_tickets(
+        self,
+        client_ids: Iterable[UUID] = (),
+        season_ticket_ids: Iterable[UUID] = (),
+    ) -> Dict[UUID, datetime | None]:
+        """Пересчитывает абонемент в строках сводки.
+
+        Пересчитываются строки переданных клиентов, а также строки, в которых
+        сейчас записан один из переданных абонементов — это покрывает перенос
+        абонемента другому клиенту.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            UUID клиентов, абонементы которых изменились.
+        season_ticket_ids : Iterable[UUID]
+            UUID изменённых или удалённых абонементов.
+
+        Returns
+        -------
+        expiries : Dict[UUID, datetime | None]
+            Новые наибольшие сроки действия абонементов пересчитанных клиентов.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        rows = await self._refresh(
+            SEASON_TICKET_COLUMNS,
+            or_(
+                ClientSummary.client_id.in_(list(client_ids)),
+                ClientSummary.season_ticket_id.in_(list(season_ticket_ids)),
+            ),
+        )
+
+        return {row.client_id: row.season_ticket_expires_at for row in rows}
+
+    async def change_violation_count(self, client_id: UUID, delta: int):
+        """Атомарно изменяет количество нарушений в строке сводки.
+
+        Parameters
+        ----------
+        client_id : UUID
+            UUID клиента, нарушения которого изменились.
+        delta : int
+            Изменение количества нарушений.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        await self._change_count(ClientSummary.violation_count, client_id, delta)
+
+    async def change_complaint_count(self, client_id: UUID, delta: int):
+        """Атомарно изменяет количество жалоб в строке сводки.
+
+        Parameters
+        ----------
+        client_id : UUID
+            UUID клиента, жалобы на которого изменились.
+        delta : int
+            Изменение количества жалоб.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        await self._change_count(ClientSummary.complaint_count, client_id, delta)
+
+    async def refresh_last_visit(self, client_ids: Iterable[UUID]):
+        """Пересчитывает последнее посещение в строках сводки.
+
+        Используется при удалении посещений, когда новое значение нельзя
+        получить из старого.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            UUID клиентов, посещения которых изменились.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        await self._refresh(
+            ("last_visit",), ClientSummary.client_id.in_(list(client_ids))
+        )
+
+    async def record_visit_start(
+        self, client_ids: Iterable[UUID], visit_start: datetime
+    ):
+        """Сдвигает последнее посещение клиентов на новое время начала посещения.
+
+        Значение обновляется без обращения к таблице посещений: строка меняется,
+        только если `visit_start` позже уже записанного последнего посещения.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            UUID клиентов, начавших посещение.
+        visit_start : datetime
+            Время начала посещения.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        await self.session.execute(
+            update(ClientSummary)
+            .where(
+                ClientSummary.client_id.in_(list(client_ids)),
+                or_(
+                    ClientSummary.last_visit.is_(None),
+                    ClientSummary.last_visit < visit_start,
+                ),
+            )
+            .values(last_visit=visit_start)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def rebuild(self) -> int:
+        """Полностью перестраивает сводку по исходным таблицам.
+
+        Сводка очищается и заполняется одним ``INSERT ... SELECT`` по таблице клиентов.
+
+        Returns
+        -------
+        count : int
+            Количество строк в перестроенной сводке.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        computed = self._computed_columns(Client.id)
+
+        await self.session.execute(delete(ClientSummary))
+        await self.session.execute(
+            insert(ClientSummary).from_select(
+                ["client_id", *computed], select(Client.id, *computed.values())
+            )
+        )
+
+        return await self.session.scalar(
+            select(func.count()).select_from(ClientSummary)
+        )
+
+    async def find_inconsistent(self) -> List[UUID]:
+        """Возвращает UUID клиентов, сводка которых расходится с исходными таблицами.
+
+        Расхождением считается отсутствие строки сводки или отличие хотя бы одного
+        вычисляемого столбца от значения, посчитанного по исходным таблицам.
+
+        Returns
+        -------
+        client_ids : List[UUID]
+            UUID клиентов с несогласованной сводкой, упорядоченные по возрастанию.
+        """
+        computed = self._computed_columns(Client.id)
+
+        result = await self.session.scalars(
+            select(Client.id)
+            .outerjoin(ClientSummary, ClientSummary.client_id == Client.id)
+            .where(
+                or_(
+                    ClientSummary.client_id.is_(None),
+                    *(
+                        getattr(ClientSummary, column).is_distinct_from(expression)
+                        for column, expression in computed.items()
+                    ),
+                )
+            )
+            .order_by(Client.id)
+        )
+
+        return list(result.all())
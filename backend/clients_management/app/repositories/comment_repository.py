@@ -0,0 +1,13 @@
+from app.database.tables.junctions import Comment
+from app.repositories.client_record_repository import ClientRecordRepository
+
+
+class CommentRepository(ClientRecordRepository[Comment]):
+    """Репозиторий комментариев о клиентах.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Отвечает за взаимодействие с таблицей комментариев пользователей о клиентах;
+    операции описаны в `ClientRecordRepository`.
+    """
+
+    model = Comment
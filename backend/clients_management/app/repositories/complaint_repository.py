@@ -0,0 +1,13 @@
+from app.database.tables.junctions import Complaint
+from app.repositories.client_record_repository import ClientRecordRepository
+
+
+class ComplaintRepository(ClientRecordRepository[Complaint]):
+    """Репозиторий жалоб на клиентов.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Отвечает за взаимодействие с таблицей жалоб пользователей на клиентов;
+    операции описаны в `ClientRecordRepository`.
+    """
+
+    model = Complaint
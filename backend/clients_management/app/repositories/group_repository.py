@@ -0,0 +1,230 @@
+from uuid import UUID
+
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.tables.entities import Group
+from app.database.tables.junctions import Relationship
+from app.repositories.client_balance_repository import DIALECT_INSERTS
+from app.repositories.interface import RepositoryInterface
+from app.schemas.v1.requests import GroupMemberRequest, GroupRequest
+
+
+class GroupRepository(RepositoryInterface):
+    """Репозиторий групп клиентов.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Отвечает за взаимодействие с таблицей групп и таблицей связей клиентов с группами.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    get_group_by_id(group_id)
+        Возвращает группу по её UUID.
+    add_group(group_data)
+        Добавляет новую группу в сессию базы данных.
+    update_group(group_id, group_data)
+        Обновляет группу одним запросом UPDATE.
+    delete_group(group_id)
+        Удаляет группу одним запросом DELETE.
+    change_member_count(group_id, delta)
+        Атомарно изменяет количество участников группы.
+    add_member(group_id, member_data)
+        Добавляет клиента в группу, если он ещё не состоит в ней.
+    remove_member(group_id, client_id)
+        Удаляет клиента из группы.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def get_group_by_id(self, group_id: UUID) -> Group | None:
+        """Возвращает группу по её UUID.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+
+        Returns
+        -------
+        Group | None
+            Группа или None, если она не найдена.
+        """
+        return await self.session.get(Group, group_id)
+
+    async def add_group(self, group_data: GroupRequest) -> Group:
+        """Добавляет новую группу в сессию базы данных.
+
+        Parameters
+        ----------
+        group_data : GroupRequest
+            Данные новой группы.
+
+        Returns
+        -------
+        group : Group
+            Созданная запись группы.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        self.session.add(group := Group(**group_data.model_dump()))
+        await self.session.flush()
+
+        return group
+
+    async def update_group(
+        self, group_id: UUID, group_data: GroupRequest
+    ) -> UUID | None:
+        """Обновляет группу одним запросом UPDATE.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        group_data : GroupRequest
+            Новые данные группы.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор обновлённой группы или `None`, если группа не найдена.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            update(Group)
+            .where(Group.id == group_id)
+            .values(**group_data.model_dump())
+            .returning(Group.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_group(self, group_id: UUID) -> UUID | None:
+        """Удаляет группу одним запросом DELETE.
+
+        Связи группы с клиентами удаляются каскадно внешним ключом
+        `relationship_group_id_fk`.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор удалённой группы или `None`, если группа не найдена.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            delete(Group)
+            .where(Group.id == group_id)
+            .returning(Group.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def change_member_count(self, group_id: UUID, delta: int) -> UUID | None:
+        """Атомарно изменяет количество участников группы.
+
+        Выполняется запросом ``UPDATE ... SET member_count = member_count + delta``,
+        который в PostgreSQL блокирует строку группы до конца транзакции,
+        поэтому одновременные изменения состава одной группы не теряются.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        delta : int
+            Изменение количества участников.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор группы или `None`, если группа не найдена.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            update(Group)
+            .where(Group.id == group_id)
+            .values(member_count=Group.member_count + delta)
+            .returning(Group.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def add_member(
+        self, group_id: UUID, member_data: GroupMemberRequest
+    ) -> UUID | None:
+        """Добавляет клиента в группу, если он ещё не состоит в ней.
+
+        Выполняется запросом ``INSERT ... ON CONFLICT (group_id, client_id) DO NOTHING``.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        member_data : GroupMemberRequest
+            Добавляемый клиент и его роль в группе.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор созданной связи или `None`, если клиент уже состоит в группе.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        dialect_insert = DIALECT_INSERTS[self.session.bind.dialect.name]
+
+        return await self.session.scalar(
+            dialect_insert(Relationship)
+            .values(group_id=group_id, **member_data.model_dump())
+            .on_conflict_do_nothing(
+                index_elements=[Relationship.group_id, Relationship.client_id]
+            )
+            .returning(Relationship.id)
+        )
+
+    async def remove_member(self, group_id: UUID, client_id: UUID) -> UUID | None:
+        """Удаляет клиента из группы.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор удалённой связи или `None`, если клиент не состоит в группе.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            delete(Relationship)
+            .where(
+                Relationship.group_id == group_id,
+                Relationship.client_id == client_id,
+            )
+            .returning(Relationship.id)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,6 +1,8 @@
+from datetime import datetime
+from typing import List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.tables.entities import SeasonTicket
@@ -23,8 +25,16 @@ class SeasonTicketRepository(RepositoryInterface):
     -------
     get_season_ticket_by_id(season_ticket_id)
         Возвращает абонемент по его UUID.
+    get_current_season_ticket(client_id, now)
+        Возвращает действующий абонемент клиента с наибольшим сроком действия.
+    get_expiring_season_tickets(now, until, limit)
+        Возвращает абонементы, срок действия которых истекает в заданный период.
+    mark_expired(now, limit)
+        Помечает истёкшими абонементы, срок действия которых прошёл.
     add_season_ticket(season_ticket_data)
         Добавляет новый абонемент в сессию базы данных.
+    update_season_ticket(season_ticket_id, season_ticket_data)
+        Обновляет абонемент одним запросом UPDATE.
     delete_season_ticket(season_ticket)
         Удаляет абонемент из сессии базы данных.
     """
@@ -55,6 +65,113 @@ class SeasonTicketRepository(RepositoryInterface):
             select(SeasonTicket).where(SeasonTicket.id == season_ticket_id)
         )
 
+    async def get_current_season_ticket(
+        self, client_id: UUID, now: datetime
+    ) -> SeasonTicket | None:
+        """Возвращает действующий абонемент клиента с наибольшим сроком действия.
+
+        Запрос обслуживается индексом `season_ticket_client_id_expires_at_idx`.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        now : datetime
+            Текущее время.
+
+        Returns
+        -------
+        SeasonTicket | None
+            Абонемент с `expires_at` позже `now` или None, если действующих абонементов нет.
+        """
+        return await self.session.scalar(
+            select(SeasonTicket)
+            .where(SeasonTicket.client_id == client_id, SeasonTicket.expires_at > now)
+            .order_by(SeasonTicket.expires_at.desc(), SeasonTicket.id.desc())
+            .limit(1)
+        )
+
+    async def get_expiring_season_tickets(
+        self, now: datetime, until: datetime, limit: int
+    ) -> List[SeasonTicket]:
+        """Возвращает абонементы, срок действия которых истекает в заданный период.
+
+        Запрос обслуживается частичным индексом `season_ticket_pending_expiry_idx`.
+
+        Parameters
+        ----------
+        now : datetime
+            Начало периода (не включительно).
+        until : datetime
+            Конец периода (включительно).
+        limit : int
+            Максимальное количество абонементов.
+
+        Returns
+        -------
+        season_tickets : List[SeasonTicket]
+            Абонементы в порядке истечения срока действия.
+        """
+        result = await self.session.scalars(
+            select(SeasonTicket)
+            .where(
+                SeasonTicket.expired_at.is_(None),
+                SeasonTicket.expires_at > now,
+                SeasonTicket.expires_at <= until,
+            )
+            .order_by(SeasonTicket.expires_at, SeasonTicket.id)
+            .limit(limit)
+        )
+
+        return list(result.all())
+
+    async def mark_expired(self, now: datetime, limit: int) -> List[Row]:
+        """Помечает истёкшими абонементы, срок действия которых прошёл.
+
+        Выполняется одним запросом ``UPDATE ... WHERE id IN (SELECT ... LIMIT n)
+        RETURNING``. Подзапрос обслуживается частичным индексом
+        `season_ticket_pending_expiry_idx`, а в PostgreSQL пропускает строки,
+        заблокированные другим воркером (``FOR UPDATE SKIP LOCKED``).
+
+        Parameters
+        ----------
+        now : datetime
+            Текущее время, записываемое в `expired_at`.
+        limit : int
+            Максимальное количество абонементов, помечаемых за один вызов.
+
+        Returns
+        -------
+        rows : List[Row]
+            Строки с полями `id`, `client_id`, `type` и `expires_at` помеченных абонементов.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        pending = (
+            select(SeasonTicket.id)
+            .where(SeasonTicket.expired_at.is_(None), SeasonTicket.expires_at <= now)
+            .order_by(SeasonTicket.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        result = await self.session.execute(
+            update(SeasonTicket)
+            .where(SeasonTicket.id.in_(pending.scalar_subquery()))
+            .values(expired_at=now)
+            .returning(
+                SeasonTicket.id,
+                SeasonTicket.client_id,
+                SeasonTicket.type,
+                SeasonTicket.expires_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        return list(result.all())
+
     async def add_season_ticket(
         self, season_ticket_data: SeasonTicketRequest
     ) -> SeasonTicket:
@@ -85,6 +202,38 @@ class SeasonTicketRepository(RepositoryInterface):
 
         return season_ticket
 
+    async def update_season_ticket(
+        self, season_ticket_id: UUID, season_ticket_data: SeasonTicketRequest
+    ) -> UUID | None:
+        """Обновляет абонемент одним запросом UPDATE.
+
+        Parameters
+        ----------
+        season_ticket_id : UUID
+            Идентификатор абонемента.
+        season_ticket_data : SeasonTicketRequest
+            Новые данные абонемента.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор обновлённого абонемента или `None`, если абонемент не найден.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        - Запись не загружается в сессию перед обновлением.
+        - Отметка об истечении сбрасывается: если новый срок уже прошёл,
+          абонемент снова будет помечен истёкшим при следующей проверке.
+        """
+        return await self.session.scalar(
+            update(SeasonTicket)
+            .where(SeasonTicket.id == season_ticket_id)
+            .values(**season_ticket_data.model_dump(), expired_at=None)
+            .returning(SeasonTicket.id)
+            .execution_options(synchronize_session=False)
+        )
+
     async def delete_season_ticket(self, season_ticket: SeasonTicket):
         """Удаляет абонемент из сессии базы данных.
 
@@ -98,6 +247,8 @@ class SeasonTicketRepository(RepositoryInterface):
         Notes
         -----
         - Метод не вызывает `commit()`, это должно быть сделано вызывающим кодом.
-        - Удаление происходит асинхронно.
+        - Удаление сразу сбрасывается в базу данных (`flush()`), чтобы последующие
+          запросы той же транзакции его учитывали.
         """
         await self.session.delete(season_ticket)
+        await self.session.flush()
@@ -0,0 +1,178 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, exists, insert, literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime, Uuid
+
+from app.database.tables.entities import Client, ClientBalance, Transaction
+from app.repositories.interface import RepositoryInterface
+from app.schemas.v1.requests import TransactionRequest
+
+
+class TransactionRepository(RepositoryInterface):
+    """Репозиторий транзакций.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Отвечает за взаимодействие с таблицей транзакций клиентов.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    get_client_transactions(client_id, limit, after)
+        Возвращает страницу истории транзакций клиента.
+    get_existing_client_ids(client_ids)
+        Возвращает UUID существующих клиентов из переданных.
+    add_transaction(transaction_data)
+        Добавляет новую транзакцию в сессию базы данных.
+    add_transactions(transactions)
+        Добавляет несколько транзакций многострочным INSERT.
+    delete_compacted(before)
+        Удаляет старые транзакции, уже учтённые в снимке баланса.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def get_client_transactions(
+        self,
+        client_id: UUID,
+        limit: int,
+        after: Tuple[datetime, UUID] | None = None,
+    ) -> List[Transaction]:
+        """Возвращает страницу истории транзакций клиента.
+
+        Поддерживает keyset-пагинацию по паре (`timestamp`, `id`) в порядке убывания.
+        Запрос обслуживается индексом `transaction_client_id_timestamp_idx`.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        limit : int
+            Максимальное количество записей.
+        after : Tuple[datetime, UUID] | None
+            Ключ сортировки (`timestamp`, UUID) последней записи предыдущей страницы.
+
+        Returns
+        -------
+        transactions : List[Transaction]
+            Транзакции от новых к старым.
+        """
+        statement = (
+            select(Transaction)
+            .where(Transaction.client_id == client_id)
+            .order_by(Transaction.timestamp.desc(), Transaction.id.desc())
+            .limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(Transaction.timestamp, Transaction.id)
+                < tuple_(
+                    literal(after[0], DateTime(timezone=True)),
+                    literal(after[1], Uuid()),
+                )
+            )
+
+        result = await self.session.scalars(statement)
+
+        return list(result.all())
+
+    async def get_existing_client_ids(self, client_ids: Iterable[UUID]) -> Set[UUID]:
+        """Возвращает UUID существующих клиентов из переданных.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            Проверяемые UUID клиентов.
+
+        Returns
+        -------
+        client_ids : Set[UUID]
+            UUID клиентов, найденных в базе данных.
+        """
+        result = await self.session.scalars(
+            select(Client.id).where(Client.id.in_(list(client_ids)))
+        )
+
+        return set(result.all())
+
+    async def add_transaction(
+        self, transaction_data: TransactionRequest
+    ) -> Transaction:
+        """Добавляет новую транзакцию в сессию базы данных.
+
+        Parameters
+        ----------
+        transaction_data : TransactionRequest
+            Данные новой транзакции.
+
+        Returns
+        -------
+        transaction : Transaction
+            Созданная запись транзакции.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        self.session.add(transaction := Transaction(**transaction_data.model_dump()))
+        await self.session.flush()
+
+        return transaction
+
+    async def add_transactions(self, transactions: List[Dict[str, Any]]):
+        """Добавляет несколько транзакций многострочным INSERT.
+
+        Parameters
+        ----------
+        transactions : List[Dict[str, Any]]
+            Значения столбцов транзакций, включая заранее сгенерированные `id`
+            и `timestamp`.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        await self.session.execute(insert(Transaction), transactions)
+
+    async def delete_compacted(self, before: datetime) -> int:
+        """Удаляет старые транзакции, уже учтённые в снимке баланса.
+
+        Удаляются только транзакции раньше `before`, которые попали в снимок
+        баланса своего клиента (`timestamp` раньше `client_balance.snapshot_at`),
+        поэтому баланс клиента после удаления не меняется.
+
+        Parameters
+        ----------
+        before : datetime
+            Граница удаления (не включительно).
+
+        Returns
+        -------
+        count : int
+            Количество удалённых транзакций.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        result = await self.session.execute(
+            delete(Transaction)
+            .where(
+                Transaction.timestamp < before,
+                exists().where(
+                    ClientBalance.client_id == Transaction.client_id,
+                    ClientBalance.snapshot_at > Transaction.timestamp,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        return result.rowcount
@@ -28,6 +28,8 @@ class UserRepository(RepositoryInterface):
         Возвращает модель пользователя по его username.
     update_refresh_token(user, refresh_token)
         Перезаписывает токен обновления пользователя.
+    update_password(user, hashed)
+        Перезаписывает хеш пароля пользователя.
     add_user(user_info)
         Добавляет в базу данных новую запись о сотруднике.
     """
@@ -84,6 +86,21 @@ class UserRepository(RepositoryInterface):
         user.refresh_token = refresh_token
         await self.commit()
 
+    async def update_password(self, user: User, hashed: AnyStr):
+        """Перезаписывает хеш пароля пользователя.
+
+        Используется для прозрачного перехеширования пароля, если его хеш устарел.
+
+        Parameters
+        ----------
+        user : User
+            Объект пользователя.
+        hashed : AnyStr
+            Новый хеш пароля.
+        """
+        user.password = hashed
+        await self.commit()
+
     async def add_user(self, user_info: SignUpRequest):
         """Добавляет в базу данных новую запись о сотруднике.
 
@@ -0,0 +1,196 @@
+from datetime import datetime
+from typing import List, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, exists, literal, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime, Uuid
+
+from app.database.tables.entities import Client, Violation
+from app.repositories.interface import RepositoryInterface
+from app.schemas.v1.requests import ViolationRequest, ViolationUpdateRequest
+
+
+class ViolationRepository(RepositoryInterface):
+    """Репозиторий нарушений.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Отвечает за взаимодействие с таблицей нарушений клиентов.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    client_exists(client_id)
+        Проверяет, существует ли клиент.
+    get_violation_by_id(violation_id)
+        Возвращает нарушение по его UUID.
+    get_client_violations(client_id, limit, after)
+        Возвращает страницу нарушений клиента.
+    add_violation(violation_data)
+        Добавляет новое нарушение в сессию базы данных.
+    update_violation(violation_id, violation_data)
+        Обновляет нарушение одним запросом UPDATE.
+    delete_violation(violation_id)
+        Удаляет нарушение одним запросом DELETE.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def client_exists(self, client_id: UUID) -> bool:
+        """Проверяет, существует ли клиент с переданным UUID.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        bool
+            True, если клиент найден.
+        """
+        return await self.session.scalar(select(exists().where(Client.id == client_id)))
+
+    async def get_violation_by_id(self, violation_id: UUID) -> Violation | None:
+        """Возвращает нарушение по его UUID.
+
+        Parameters
+        ----------
+        violation_id : UUID
+            Уникальный идентификатор нарушения.
+
+        Returns
+        -------
+        Violation | None
+            Нарушение или None, если оно не найдено.
+        """
+        return await self.session.get(Violation, violation_id)
+
+    async def get_client_violations(
+        self,
+        client_id: UUID,
+        limit: int,
+        after: Tuple[datetime, UUID] | None = None,
+    ) -> List[Violation]:
+        """Возвращает страницу нарушений клиента.
+
+        Поддерживает keyset-пагинацию по паре (`claimed_at`, `id`) в порядке убывания.
+        Запрос обслуживается индексом `violation_client_id_claimed_at_idx`.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        limit : int
+            Максимальное количество записей.
+        after : Tuple[datetime, UUID] | None
+            Ключ сортировки (`claimed_at`, UUID) последней записи предыдущей страницы.
+
+        Returns
+        -------
+        violations : List[Violation]
+            Нарушения от новых к старым.
+        """
+        statement = (
+            select(Violation)
+            .where(Violation.client_id == client_id)
+            .order_by(Violation.claimed_at.desc(), Violation.id.desc())
+            .limit(limit)
+        )
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(Violation.claimed_at, Violation.id)
+                < tuple_(
+                    literal(after[0], DateTime(timezone=True)),
+                    literal(after[1], Uuid()),
+                )
+            )
+
+        result = await self.session.scalars(statement)
+
+        return list(result.all())
+
+    async def add_violation(self, violation_data: ViolationRequest) -> Violation:
+        """Добавляет новое нарушение в сессию базы данных.
+
+        Parameters
+        ----------
+        violation_data : ViolationRequest
+            Данные нового нарушения.
+
+        Returns
+        -------
+        violation : Violation
+            Созданная запись нарушения.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        self.session.add(
+            violation := Violation(
+                **violation_data.model_dump(exclude_none=True),
+            )
+        )
+        await self.session.flush()
+
+        return violation
+
+    async def update_violation(
+        self, violation_id: UUID, violation_data: ViolationUpdateRequest
+    ) -> UUID | None:
+        """Обновляет нарушение одним запросом UPDATE.
+
+        Parameters
+        ----------
+        violation_id : UUID
+            Уникальный идентификатор нарушения.
+        violation_data : ViolationUpdateRequest
+            Новые данные нарушения.
+
+        Returns
+        -------
+        UUID | None
+            Идентификатор обновлённого нарушения или `None`, если нарушение не найдено.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            update(Violation)
+            .where(Violation.id == violation_id)
+            .values(**violation_data.model_dump())
+            .returning(Violation.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_violation(self, violation_id: UUID) -> UUID | None:
+        """Удаляет нарушение одним запросом DELETE.
+
+        Parameters
+        ----------
+        violation_id : UUID
+            Уникальный идентификатор нарушения.
+
+        Returns
+        -------
+        UUID | None
+            UUID клиента удалённого нарушения или `None`, если нарушение не найдено.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            delete(Violation)
+            .where(Violation.id == violation_id)
+            .returning(Violation.client_id)
+            .execution_options(synchronize_session=False)
+        )
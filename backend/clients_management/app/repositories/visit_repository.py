@@ -0,0 +1,302 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, insert, literal, select, text, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import DateTime, Uuid
+
+from app.database.tables.entities import Client, Visit
+from app.repositories.interface import RepositoryInterface
+from app.schemas.v1.requests import VisitRequest
+
+
+class VisitRepository(RepositoryInterface):
+    """Репозиторий посещений.
+
+    Реализация паттерна Репозиторий. Является объектом доступа к данным (DAO).
+    Реализует основные CRUD операции с посещениями.
+
+    Attributes
+    ----------
+    session : AsyncSession
+        Объект асинхронной сессии запроса.
+
+    Methods
+    -------
+    get_visit_by_id(visit_id)
+        Возвращает посещение по его UUID.
+    get_open_visits()
+        Возвращает все незавершённые посещения.
+    get_client_visits(client_id, since, until, limit, after)
+        Возвращает страницу истории посещений клиента.
+    ensure_partitions(months_ahead)
+        Создаёт помесячные секции таблицы посещений.
+    get_existing_visit_ids(visit_ids)
+        Возвращает UUID существующих посещений из переданных.
+    get_existing_client_ids(client_ids)
+        Возвращает UUID существующих клиентов из переданных.
+    add_visit(visit_data)
+        Добавляет новое посещение в сессию базы данных.
+    add_visits(visits)
+        Добавляет несколько посещений многострочным INSERT.
+    end_visits(visit_ids, visit_end)
+        Завершает незавершённые посещения одним UPDATE.
+    delete_visit(visit_id)
+        Удаляет посещение по его UUID.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(session)
+
+    async def get_visit_by_id(self, visit_id: UUID) -> Visit:
+        """Возвращает посещение по его UUID.
+
+        Parameters
+        ----------
+        visit_id : UUID
+            Уникальный идентификатор посещения.
+
+        Returns
+        -------
+        Visit | None
+            Объект посещения, если найден, иначе None.
+        """
+        return await self.session.scalar(select(Visit).where(Visit.id == visit_id))
+
+    async def get_open_visits(self) -> List[Visit]:
+        """Возвращает все незавершённые посещения.
+
+        Запрос обслуживается частичным индексом `visit_open_idx`,
+        поэтому его стоимость зависит от числа открытых посещений, а не от размера истории.
+
+        Returns
+        -------
+        visits : List[Visit]
+            Посещения, у которых не заполнено `visit_end`.
+        """
+        result = await self.session.scalars(
+            select(Visit).where(Visit.visit_end.is_(None)).order_by(Visit.box)
+        )
+
+        return list(result.all())
+
+    async def get_client_visits(
+        self,
+        client_id: UUID,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int | None = None,
+        after: Tuple[datetime, UUID] | None = None,
+    ) -> List[Visit]:
+        """Возвращает страницу истории посещений клиента.
+
+        Поддерживает keyset-пагинацию по паре (`visit_start`, `id`) в порядке убывания:
+        при переданном `after` возвращаются только посещения, следующие за указанным.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        since : datetime | None
+            Нижняя граница `visit_start` (включительно).
+        until : datetime | None
+            Верхняя граница `visit_start` (не включительно).
+        limit : int | None
+            Максимальное количество записей.
+        after : Tuple[datetime, UUID] | None
+            Ключ сортировки (`visit_start`, UUID) последней записи предыдущей страницы.
+
+        Returns
+        -------
+        visits : List[Visit]
+            Посещения от новых к старым.
+
+        Notes
+        -----
+        - Условия на `visit_start` позволяют PostgreSQL отсечь секции за другие месяцы.
+        - Внутри секции запрос обслуживается индексом `visit_client_id_visit_start_idx`
+          (`client_id`, `visit_start DESC`, `id DESC`) без дополнительной сортировки.
+        """
+        statement = (
+            select(Visit)
+            .where(Visit.client_id == client_id)
+            .order_by(Visit.visit_start.desc(), Visit.id.desc())
+        )
+
+        if since is not None:
+            statement = statement.where(Visit.visit_start >= since)
+
+        if until is not None:
+            statement = statement.where(Visit.visit_start < until)
+
+        if after is not None:
+            statement = statement.where(
+                tuple_(Visit.visit_start, Visit.id)
+                < tuple_(
+                    literal(after[0], DateTime(timezone=True)),
+                    literal(after[1], Uuid()),
+                )
+            )
+
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        result = await self.session.scalars(statement)
+
+        return list(result.all())
+
+    async def ensure_partitions(self, months_ahead: int):
+        """Создаёт помесячные секции таблицы посещений.
+
+        Вызывает функцию `visit_ensure_partitions()`, созданную миграцией,
+        для текущего месяца и `months_ahead` следующих. Уже существующие секции не изменяются;
+        посещения, попавшие в секцию по умолчанию, переносятся в созданную секцию месяца.
+
+        Parameters
+        ----------
+        months_ahead : int
+            Количество будущих месяцев, для которых создаются секции.
+
+        Notes
+        -----
+        - Для СУБД, отличных от PostgreSQL, ничего не делает: секционирование
+          используется только в PostgreSQL.
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        if self.session.bind.dialect.name != "postgresql":
+            return
+
+        await self.session.execute(
+            text("SELECT visit_ensure_partitions(current_date, :months_ahead)"),
+            {"months_ahead": months_ahead},
+        )
+
+    async def get_existing_visit_ids(self, visit_ids: Iterable[UUID]) -> Set[UUID]:
+        """Возвращает UUID существующих посещений из переданных.
+
+        Parameters
+        ----------
+        visit_ids : Iterable[UUID]
+            Проверяемые UUID посещений.
+
+        Returns
+        -------
+        visit_ids : Set[UUID]
+            UUID посещений, найденных в базе данных.
+        """
+        result = await self.session.scalars(
+            select(Visit.id).where(Visit.id.in_(list(visit_ids)))
+        )
+
+        return set(result.all())
+
+    async def get_existing_client_ids(self, client_ids: Iterable[UUID]) -> Set[UUID]:
+        """Возвращает UUID существующих клиентов из переданных.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            Проверяемые UUID клиентов.
+
+        Returns
+        -------
+        client_ids : Set[UUID]
+            UUID клиентов, найденных в базе данных.
+        """
+        result = await self.session.scalars(
+            select(Client.id).where(Client.id.in_(list(client_ids)))
+        )
+
+        return set(result.all())
+
+    async def add_visit(self, visit_data: VisitRequest) -> Visit:
+        """Добавляет новое посещение в сессию базы данных.
+
+        Parameters
+        ----------
+        visit_data : VisitRequest
+            Данные нового посещения.
+
+        Returns
+        -------
+        visit : Visit
+            Созданная запись посещения.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        self.session.add(visit := Visit(**visit_data.model_dump()))
+        await self.session.flush()
+
+        return visit
+
+    async def add_visits(self, visits: List[Dict[str, Any]]):
+        """Добавляет несколько посещений многострочным INSERT.
+
+        Parameters
+        ----------
+        visits : List[Dict[str, Any]]
+            Значения столбцов посещений, включая заранее сгенерированные `id` и `visit_start`.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        await self.session.execute(insert(Visit), visits)
+
+    async def end_visits(
+        self, visit_ids: Iterable[UUID], visit_end: datetime
+    ) -> Set[UUID]:
+        """Завершает незавершённые посещения одним UPDATE.
+
+        Parameters
+        ----------
+        visit_ids : Iterable[UUID]
+            UUID завершаемых посещений.
+        visit_end : datetime
+            Время завершения.
+
+        Returns
+        -------
+        visit_ids : Set[UUID]
+            UUID посещений, которые были открыты и завершены этим запросом.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        result = await self.session.execute(
+            update(Visit)
+            .where(Visit.id.in_(list(visit_ids)), Visit.visit_end.is_(None))
+            .values(visit_end=visit_end)
+            .returning(Visit.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        return set(result.scalars().all())
+
+    async def delete_visit(self, visit_id: UUID) -> UUID | None:
+        """Удаляет посещение по его UUID.
+
+        Parameters
+        ----------
+        visit_id : UUID
+            Уникальный идентификатор посещения.
+
+        Returns
+        -------
+        UUID | None
+            UUID клиента удалённого посещения или None, если посещение не найдено.
+
+        Notes
+        -----
+        - Метод не выполняет `commit()` — изменения необходимо зафиксировать отдельно.
+        """
+        return await self.session.scalar(
+            delete(Visit)
+            .where(Visit.id == visit_id)
+            .returning(Visit.client_id)
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,56 @@
+from datetime import date
+from decimal import Decimal
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+AnalyticsPeriod = Literal["day", "week", "month"]
+
+
+class RevenuePeriodModel(BaseModel):
+    """Выручка за один период отчёта.
+
+    Attributes
+    ----------
+    period_start : date
+        Первый день периода (для недели — понедельник).
+    revenue : Decimal
+        Сумма транзакций за период.
+    transactions : int
+        Количество транзакций за период.
+    """
+
+    period_start: date = Field(examples=["2025-06-02"])
+    revenue: Decimal = Field(examples=["15250.00"])
+    transactions: int = Field(examples=[42])
+
+
+class AttendancePeriodModel(BaseModel):
+    """Посещаемость за один период отчёта.
+
+    Attributes
+    ----------
+    period_start : date
+        Первый день периода (для недели — понедельник).
+    visits : int
+        Количество начатых за период посещений.
+    """
+
+    period_start: date = Field(examples=["2025-06-02"])
+    visits: int = Field(examples=[310])
+
+
+class BoxHeatmapModel(BaseModel):
+    """Тепловая карта посещений одного ящика.
+
+    Attributes
+    ----------
+    box : int
+        Номер ящика.
+    visits : List[List[int]]
+        Матрица 7×24: количество посещений, начатых в день недели
+        (0 — понедельник) и час.
+    """
+
+    box: int = Field(examples=[56])
+    visits: List[List[int]] = Field()
@@ -67,6 +67,10 @@ class CompactClientModel(_BaseClientModel):
     last_visit : date
         Дата последнего посещения в формате YYYY-MM-DD.
         Может быть None, если клиент ещё не посещал заведение.
+    violation_count : int
+        Количество нарушений клиента.
+    complaint_count : int
+        Количество жалоб на клиента.
 
     Notes
     -----
@@ -77,6 +81,22 @@ class CompactClientModel(_BaseClientModel):
     season_ticket_type: str | None = Field(examples=["семейный"])
     is_violator: bool = Field(examples=[True])
     last_visit: date | None = Field(examples=["2025-06-02"])
+    violation_count: int = Field(examples=[2])
+    complaint_count: int = Field(examples=[0])
+
+
+class GroupMemberModel(CompactClientModel):
+    """Сокращённая модель клиента как участника группы.
+
+    Наследует все поля от `CompactClientModel` и добавляет роль клиента в группе.
+
+    Attributes
+    ----------
+    role : str
+        Роль клиента в группе.
+    """
+
+    role: str = Field(examples=["родитель"])
 
 
 class ClientModel(_BaseClientModel):
@@ -0,0 +1,28 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class CommentModel(BaseModel):
+    """Модель комментария пользователя о клиенте.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор комментария.
+    client_id : UUID
+        UUID клиента, о котором оставлен комментарий.
+    user_id : UUID
+        UUID автора комментария.
+    comment : str
+        Текст комментария.
+    created_at : datetime
+        Время создания комментария.
+    """
+
+    id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    user_id: UUID = Field(examples=["5b0a9c1e-2f4d-4e8a-9c3b-7d6e5f4a3b2c"])
+    comment: str = Field(examples=["Просит шкафчик у окна."])
+    created_at: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
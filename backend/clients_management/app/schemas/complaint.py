@@ -0,0 +1,28 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ComplaintModel(BaseModel):
+    """Модель жалобы пользователя на клиента.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор жалобы.
+    client_id : UUID
+        UUID клиента, на которого подана жалоба.
+    user_id : UUID
+        UUID автора жалобы.
+    complaint : str
+        Текст жалобы.
+    created_at : datetime
+        Время создания жалобы.
+    """
+
+    id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    user_id: UUID = Field(examples=["5b0a9c1e-2f4d-4e8a-9c3b-7d6e5f4a3b2c"])
+    complaint: str = Field(examples=["Не вернул полотенце."])
+    created_at: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
@@ -40,7 +40,8 @@ class CompactGroupModel(_BaseGroupModel):
     Notes
     -----
     - Используется в endpoints, возвращающих списки групп без детализации.
-    - quantity автоматически пересчитывается при изменении состава группы.
+    - quantity читается из столбца `group.member_count`, который изменяется
+      в той же транзакции, что и состав группы.
     """
 
     quantity: int = Field(examples=[5])
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class RowErrorModel(BaseModel):
+    """Модель ошибки обработки строки пакетного запроса.
+
+    Attributes
+    ----------
+    row : int
+        Номер строки во входных данных (с единицы, без учёта заголовка).
+    detail : str
+        Описание ошибки.
+    """
+
+    row: int = Field(examples=[17])
+    detail: str = Field(
+        examples=['User with phone="tel:+7-999-138-21-29" already exists!']
+    )
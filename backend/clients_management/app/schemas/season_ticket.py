@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -32,3 +33,27 @@ class SeasonTicketModel(BaseModel):
     id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
     type: str = Field(examples=["семейный"])
     expires_at: str = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
+
+
+class ClientSeasonTicketModel(BaseModel):
+    """Модель абонемента вместе с UUID его владельца.
+
+    Используется в выборках абонементов, не привязанных к одному клиенту
+    (истекающие, истёкшие абонементы), и для текущего абонемента клиента.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор абонемента.
+    client_id : UUID
+        UUID клиента, на которого оформлен абонемент.
+    type : str
+        Тип абонемента.
+    expires_at : datetime
+        Дата и время истечения срока действия абонемента.
+    """
+
+    id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    client_id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    type: str = Field(examples=["семейный"])
+    expires_at: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
@@ -0,0 +1,42 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TransactionModel(BaseModel):
+    """Модель транзакции из истории клиента.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор транзакции.
+    amount : Decimal
+        Сумма транзакции.
+    timestamp : datetime
+        Время проведения транзакции.
+    """
+
+    id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    amount: Decimal = Field(examples=["1500.00"])
+    timestamp: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
+
+
+class TransactionBatchItemModel(BaseModel):
+    """Результат обработки одного элемента пакетного запроса транзакций.
+
+    Attributes
+    ----------
+    index : int
+        Позиция элемента в запросе (с нуля).
+    id : UUID | None
+        UUID транзакции. Для не найденного клиента — None.
+    status : Literal["created", "not_found"]
+        Результат обработки элемента.
+    """
+
+    index: int = Field(examples=[0])
+    id: UUID | None = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    status: Literal["created", "not_found"] = Field(examples=["created"])
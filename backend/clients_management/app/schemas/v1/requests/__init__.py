@@ -1,4 +1,9 @@
 from .client import ClientRequest
+from .comment import CommentRequest, CommentUpdateRequest
+from .complaint import ComplaintRequest, ComplaintUpdateRequest
+from .group import GroupMemberRequest, GroupRequest
 from .seson_ticket import SeasonTicketRequest
 from .sign_up import SignUpRequest
+from .transaction import TransactionRequest
+from .violation import ViolationRequest, ViolationUpdateRequest
 from .visit import VisitRequest
@@ -0,0 +1,36 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class CommentRequest(BaseModel):
+    """Схема запроса на создание комментария о клиенте.
+
+    Автор комментария определяется по токену доступа.
+
+    Attributes
+    ----------
+    client_id : UUID
+        UUID клиента, о котором оставлен комментарий.
+    comment : str
+        Текст комментария.
+    """
+
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    comment: str = Field(
+        min_length=1, max_length=1024, examples=["Просит шкафчик у окна."]
+    )
+
+
+class CommentUpdateRequest(BaseModel):
+    """Схема запроса на изменение комментария о клиенте.
+
+    Attributes
+    ----------
+    comment : str
+        Новый текст комментария.
+    """
+
+    comment: str = Field(
+        min_length=1, max_length=1024, examples=["Просит шкафчик у окна."]
+    )
@@ -0,0 +1,36 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ComplaintRequest(BaseModel):
+    """Схема запроса на создание жалобы на клиента.
+
+    Автор жалобы определяется по токену доступа.
+
+    Attributes
+    ----------
+    client_id : UUID
+        UUID клиента, на которого подана жалоба.
+    complaint : str
+        Текст жалобы.
+    """
+
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    complaint: str = Field(
+        min_length=1, max_length=1024, examples=["Не вернул полотенце."]
+    )
+
+
+class ComplaintUpdateRequest(BaseModel):
+    """Схема запроса на изменение жалобы на клиента.
+
+    Attributes
+    ----------
+    complaint : str
+        Новый текст жалобы.
+    """
+
+    complaint: str = Field(
+        min_length=1, max_length=1024, examples=["Не вернул полотенце."]
+    )
@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class GroupRequest(BaseModel):
+    """Схема запроса на создание или изменение группы клиентов.
+
+    Attributes
+    ----------
+    type : str
+        Тип группы. Определяет правила взаимодействия с группой.
+    """
+
+    type: str = Field(min_length=1, max_length=256, examples=["семья"])
+
+
+class GroupMemberRequest(BaseModel):
+    """Схема запроса на добавление клиента в группу.
+
+    Attributes
+    ----------
+    client_id : UUID
+        UUID добавляемого клиента.
+    role : str
+        Роль клиента в группе.
+    """
+
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    role: str = Field(min_length=1, max_length=256, examples=["родитель"])
@@ -0,0 +1,22 @@
+from decimal import Decimal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TransactionRequest(BaseModel):
+    """Схема запроса на создание транзакции.
+
+    Используется в качестве схемы представления запроса на создание транзакции.
+
+    Attributes
+    ----------
+    client_id : UUID
+        UUID клиента, по счёту которого проводится транзакция.
+    amount : Decimal
+        Сумма транзакции: положительная для пополнения, отрицательная для списания.
+        Не более двух знаков после запятой.
+    """
+
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    amount: Decimal = Field(max_digits=12, decimal_places=2, examples=["1500.00"])
@@ -0,0 +1,41 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ViolationRequest(BaseModel):
+    """Схема запроса на создание нарушения.
+
+    Используется в качестве схемы представления запроса на создание нарушения.
+
+    Attributes
+    ----------
+    client_id : UUID
+        UUID клиента, допустившего нарушение.
+    detail : str
+        Описание нарушения.
+    claimed_at : datetime | None
+        Время нарушения. Если не передано, используется текущее время.
+    """
+
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    detail: str = Field(min_length=1, max_length=256, examples=["опоздание"])
+    claimed_at: datetime | None = Field(
+        default=None, examples=["2025-06-02 12:32:11.000311+00:00"]
+    )
+
+
+class ViolationUpdateRequest(BaseModel):
+    """Схема запроса на изменение нарушения.
+
+    Attributes
+    ----------
+    detail : str
+        Описание нарушения.
+    claimed_at : datetime
+        Время нарушения.
+    """
+
+    detail: str = Field(min_length=1, max_length=256, examples=["опоздание"])
+    claimed_at: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
@@ -1,5 +1,28 @@
+from .analytics import AttendanceResponse, HeatmapResponse, RevenueResponse
 from .app_info import AppInfoResponse
-from .client import ClientsResponse, ClientResponse
+from .client import ClientsImportResponse, ClientsResponse, ClientResponse
+from .comment import CommentResponse, CommentsResponse
+from .complaint import ComplaintResponse, ComplaintsResponse
 from .created import CreatedResponse
+from .events import EventsTokenResponse
+from .group import GroupMembersResponse, GroupResponse
 from .jwt import TokenResponse
+from .metrics import (
+    PoolStatsResponse,
+    ResponseCacheStatsResponse,
+    TokenCacheStatsResponse,
+)
+from .season_ticket import SeasonTicketResponse, SeasonTicketsResponse
 from .standard import StandardResponse
+from .transaction import (
+    BalanceResponse,
+    TransactionBatchResponse,
+    TransactionsResponse,
+)
+from .violation import ViolationResponse, ViolationsResponse
+from .visit import (
+    ActiveVisitsResponse,
+    FreeBoxesResponse,
+    VisitBatchResponse,
+    VisitsResponse,
+)
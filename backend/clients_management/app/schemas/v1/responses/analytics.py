@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.analytics import (
+    AnalyticsPeriod,
+    AttendancePeriodModel,
+    BoxHeatmapModel,
+    RevenuePeriodModel,
+)
+from .standard import StandardResponse
+
+
+class RevenueResponse(StandardResponse):
+    """Модель ответа с выручкой по периодам.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    period : AnalyticsPeriod
+        Длина периода: ``day``, ``week`` или ``month``.
+    items : List[RevenuePeriodModel]
+        Выручка по периодам в порядке возрастания, включая периоды без транзакций.
+    rolled_up_until : datetime | None
+        Граница, до которой транзакции учтены в агрегатах.
+    """
+
+    period: AnalyticsPeriod = Field(examples=["day"])
+    items: List[RevenuePeriodModel] = Field()
+    rolled_up_until: datetime | None = Field(
+        default=None, examples=["2025-06-02 12:30:00+00:00"]
+    )
+
+
+class AttendanceResponse(StandardResponse):
+    """Модель ответа с посещаемостью по периодам.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    period : AnalyticsPeriod
+        Длина периода: ``day``, ``week`` или ``month``.
+    items : List[AttendancePeriodModel]
+        Посещаемость по периодам в порядке возрастания, включая периоды без посещений.
+    rolled_up_until : datetime | None
+        Граница, до которой посещения учтены в агрегатах.
+    """
+
+    period: AnalyticsPeriod = Field(examples=["day"])
+    items: List[AttendancePeriodModel] = Field()
+    rolled_up_until: datetime | None = Field(
+        default=None, examples=["2025-06-02 12:30:00+00:00"]
+    )
+
+
+class HeatmapResponse(StandardResponse):
+    """Модель ответа с тепловыми картами посещений по ящикам.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    boxes : List[BoxHeatmapModel]
+        Тепловые карты ящиков, в которых были посещения, по возрастанию номера.
+    rolled_up_until : datetime | None
+        Граница, до которой посещения учтены в агрегатах.
+    """
+
+    boxes: List[BoxHeatmapModel] = Field()
+    rolled_up_until: datetime | None = Field(
+        default=None, examples=["2025-06-02 12:30:00+00:00"]
+    )
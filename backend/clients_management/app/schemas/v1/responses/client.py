@@ -3,6 +3,7 @@ from typing import List
 from pydantic import Field
 
 from app.schemas.client import CompactClientModel, ClientModel
+from app.schemas.row_error import RowErrorModel
 from .standard import StandardResponse
 
 
@@ -38,6 +39,8 @@ class ClientsResponse(StandardResponse):
     clients : List[CompactClientModel]
         Список объектов клиентов, где каждый элемент соответствует модели CompactClient.
         Может быть пустым, если клиенты не найдены.
+    next_cursor : str | None
+        Непрозрачный курсор следующей страницы. None, если страница последняя.
 
     Notes
     -----
@@ -47,3 +50,25 @@ class ClientsResponse(StandardResponse):
     """
 
     clients: List[CompactClientModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyLQodC10LzRkdC90L7QsiJd"])
+
+
+class ClientsImportResponse(StandardResponse):
+    """Модель ответа на пакетный импорт клиентов.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    imported : int
+        Количество добавленных клиентов.
+    failed : int
+        Количество отклонённых строк.
+    errors : List[RowErrorModel]
+        Ошибки по строкам. Список ограничен настройкой `CLIENTS_IMPORT_MAX_ERRORS`,
+        полное количество ошибок содержится в `failed`.
+    """
+
+    imported: int = Field(examples=[19998])
+    failed: int = Field(examples=[2])
+    errors: List[RowErrorModel] = Field()
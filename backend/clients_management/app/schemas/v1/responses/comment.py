@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.comment import CommentModel
+from .standard import StandardResponse
+
+
+class CommentResponse(StandardResponse):
+    """Модель ответа с одним комментарием о клиенте.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    comment : CommentModel
+        Комментарий.
+    """
+
+    comment: CommentModel = Field()
+
+
+class CommentsResponse(StandardResponse):
+    """Модель ответа со страницей комментариев о клиенте.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    comments : List[CommentModel]
+        Комментарии о клиенте от новых к старым.
+    next_cursor : str | None
+        Курсор следующей страницы или None, если страница последняя.
+    """
+
+    comments: List[CommentModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyIyMDI1LTA2LTAyIl0"])
@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.complaint import ComplaintModel
+from .standard import StandardResponse
+
+
+class ComplaintResponse(StandardResponse):
+    """Модель ответа с одной жалобой на клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    complaint : ComplaintModel
+        Жалоба.
+    """
+
+    complaint: ComplaintModel = Field()
+
+
+class ComplaintsResponse(StandardResponse):
+    """Модель ответа со страницей жалоб на клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    complaints : List[ComplaintModel]
+        Жалобы на клиента от новых к старым.
+    next_cursor : str | None
+        Курсор следующей страницы или None, если страница последняя.
+    """
+
+    complaints: List[ComplaintModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyIyMDI1LTA2LTAyIl0"])
@@ -0,0 +1,26 @@
+from pydantic import Field
+
+from .standard import StandardResponse
+
+
+class EventsTokenResponse(StandardResponse):
+    """Модель ответа с токеном подписки на ленту изменений.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    token : str
+        Короткоживущий JWT, передаваемый в параметре ``token`` запроса ``/events/``.
+    expires_in : int
+        Время жизни токена в секундах.
+    """
+
+    token: str = Field(
+        examples=[
+            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+            ".eyJzdWIiOiJkZXNrX3VzZXIiLCJzY29wZSI6ImV2ZW50cyJ9"
+            ".SflKxwRJSMeKKF2QT4fwpMeJf36POk6yJV_adQssw5c"
+        ]
+    )
+    expires_in: int = Field(examples=[60])
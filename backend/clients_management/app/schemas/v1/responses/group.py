@@ -0,0 +1,38 @@
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.client import GroupMemberModel
+from app.schemas.group import CompactGroupModel
+from .standard import StandardResponse
+
+
+class GroupResponse(StandardResponse):
+    """Модель ответа с одной группой клиентов.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    group : CompactGroupModel
+        Группа вместе с количеством участников.
+    """
+
+    group: CompactGroupModel = Field()
+
+
+class GroupMembersResponse(StandardResponse):
+    """Модель ответа со страницей участников группы.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    members : List[GroupMemberModel]
+        Участники группы в алфавитном порядке.
+    next_cursor : str | None
+        Курсор следующей страницы или None, если страница последняя.
+    """
+
+    members: List[GroupMemberModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyLQodC10LzRkdC90L7QsiJd"])
@@ -0,0 +1,87 @@
+from pydantic import Field
+
+from .standard import StandardResponse
+
+
+class TokenCacheStatsResponse(StandardResponse):
+    """Модель ответа со статистикой кэша токенов доступа.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    size : int
+        Текущее количество записей в кэше.
+    max_size : int
+        Максимальное количество записей в кэше.
+    hits : int
+        Количество попаданий в кэш с момента запуска процесса.
+    misses : int
+        Количество промахов кэша с момента запуска процесса.
+    """
+
+    size: int = Field(examples=[128])
+    max_size: int = Field(examples=[4096])
+    hits: int = Field(examples=[10542])
+    misses: int = Field(examples=[311])
+
+
+class ResponseCacheStatsResponse(StandardResponse):
+    """Модель ответа со статистикой кэша ответов.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    hits : int
+        Количество ответов, отданных из кэша, с момента запуска процесса.
+    misses : int
+        Количество ответов, построенных заново, с момента запуска процесса.
+    not_modified : int
+        Количество ответов ``304 Not Modified`` с момента запуска процесса.
+    """
+
+    hits: int = Field(examples=[8734])
+    misses: int = Field(examples=[912])
+    not_modified: int = Field(examples=[7220])
+
+
+class PoolStatsResponse(StandardResponse):
+    """Модель ответа со статистикой пула соединений с базой данных.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    size : int
+        Количество постоянных соединений пула.
+    checked_out : int
+        Количество соединений, выданных в данный момент.
+    checked_in : int
+        Количество свободных соединений в пуле.
+    overflow : int
+        Количество открытых соединений сверх размера пула.
+    checkouts : int
+        Количество выдач соединений с момента запуска процесса.
+    waits : int
+        Количество выдач, ожидавших освобождения соединения.
+    wait_time_total : float
+        Суммарное время ожидания соединения в секундах.
+    wait_time_max : float
+        Максимальное время ожидания соединения в секундах.
+    timeouts : int
+        Количество выдач, завершившихся ошибкой по таймауту.
+    overflow_checkouts : int
+        Количество выдач, потребовавших соединения сверх размера пула.
+    """
+
+    size: int = Field(examples=[5])
+    checked_out: int = Field(examples=[2])
+    checked_in: int = Field(examples=[3])
+    overflow: int = Field(examples=[0])
+    checkouts: int = Field(examples=[18211])
+    waits: int = Field(examples=[12])
+    wait_time_total: float = Field(examples=[0.734])
+    wait_time_max: float = Field(examples=[0.121])
+    timeouts: int = Field(examples=[0])
+    overflow_checkouts: int = Field(examples=[40])
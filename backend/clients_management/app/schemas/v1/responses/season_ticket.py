@@ -0,0 +1,34 @@
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.season_ticket import ClientSeasonTicketModel
+from .standard import StandardResponse
+
+
+class SeasonTicketResponse(StandardResponse):
+    """Модель ответа с одним абонементом.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    season_ticket : ClientSeasonTicketModel
+        Абонемент.
+    """
+
+    season_ticket: ClientSeasonTicketModel = Field()
+
+
+class SeasonTicketsResponse(StandardResponse):
+    """Модель ответа со списком абонементов.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    season_tickets : List[ClientSeasonTicketModel]
+        Абонементы в порядке истечения срока действия.
+    """
+
+    season_tickets: List[ClientSeasonTicketModel] = Field()
@@ -0,0 +1,63 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List
+from uuid import UUID
+
+from pydantic import Field
+
+from app.schemas.transaction import TransactionBatchItemModel, TransactionModel
+from .standard import StandardResponse
+
+
+class BalanceResponse(StandardResponse):
+    """Модель ответа с балансом клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    client_id : UUID
+        UUID клиента.
+    balance : Decimal
+        Сумма всех транзакций клиента.
+    snapshot_at : datetime | None
+        Момент последнего снимка баланса. Транзакции раньше него могут быть
+        удалены из истории, но по-прежнему учтены в балансе.
+    """
+
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    balance: Decimal = Field(examples=["1250.50"])
+    snapshot_at: datetime | None = Field(
+        default=None, examples=["2025-06-02 11:00:00+00:00"]
+    )
+
+
+class TransactionBatchResponse(StandardResponse):
+    """Модель ответа на пакетный запрос транзакций.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    items : List[TransactionBatchItemModel]
+        Результаты в порядке элементов запроса.
+    """
+
+    items: List[TransactionBatchItemModel] = Field()
+
+
+class TransactionsResponse(StandardResponse):
+    """Модель ответа со страницей истории транзакций клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    transactions : List[TransactionModel]
+        Транзакции от новых к старым.
+    next_cursor : str | None
+        Курсор следующей страницы или None, если страница последняя.
+    """
+
+    transactions: List[TransactionModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyIyMDI1LTA2LTAyIl0"])
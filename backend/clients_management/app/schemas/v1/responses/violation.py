@@ -0,0 +1,37 @@
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.violation import ViolationModel
+from .standard import StandardResponse
+
+
+class ViolationResponse(StandardResponse):
+    """Модель ответа с одним нарушением клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    violation : ViolationModel
+        Нарушение.
+    """
+
+    violation: ViolationModel = Field()
+
+
+class ViolationsResponse(StandardResponse):
+    """Модель ответа со страницей нарушений клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    violations : List[ViolationModel]
+        Нарушения клиента от новых к старым.
+    next_cursor : str | None
+        Курсор следующей страницы или None, если страница последняя.
+    """
+
+    violations: List[ViolationModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyIyMDI1LTA2LTAyIl0"])
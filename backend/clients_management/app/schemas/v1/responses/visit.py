@@ -0,0 +1,71 @@
+from typing import List
+
+from pydantic import Field
+
+from app.schemas.visit import ActiveVisitModel, VisitBatchItemModel, VisitModel
+from .standard import StandardResponse
+
+
+class ActiveVisitsResponse(StandardResponse):
+    """Модель ответа со списком незавершённых посещений.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    visits : List[ActiveVisitModel]
+        Незавершённые посещения в порядке их начала.
+    """
+
+    visits: List[ActiveVisitModel] = Field()
+
+
+class FreeBoxesResponse(StandardResponse):
+    """Модель ответа со списком свободных ящиков.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    boxes : List[int]
+        Номера свободных ящиков по возрастанию.
+    total : int
+        Общее количество ящиков в зале.
+    occupied : int
+        Количество занятых ящиков.
+    """
+
+    boxes: List[int] = Field(examples=[[1, 2, 5]])
+    total: int = Field(examples=[100])
+    occupied: int = Field(examples=[97])
+
+
+class VisitBatchResponse(StandardResponse):
+    """Модель ответа на пакетный запрос начала или завершения посещений.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    items : List[VisitBatchItemModel]
+        Результаты по элементам в порядке запроса.
+    """
+
+    items: List[VisitBatchItemModel] = Field()
+
+
+class VisitsResponse(StandardResponse):
+    """Модель ответа со страницей истории посещений клиента.
+
+    См. ``StandardResponse`` для получения информации об унаследованных атрибутах.
+
+    Attributes
+    ----------
+    visits : List[VisitModel]
+        Посещения от новых к старым.
+    next_cursor : str | None
+        Непрозрачный курсор следующей страницы. None, если страница последняя.
+    """
+
+    visits: List[VisitModel] = Field()
+    next_cursor: str | None = Field(default=None, examples=["WyIyMDI1LTA2LTAyIl0"])
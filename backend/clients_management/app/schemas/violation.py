@@ -0,0 +1,25 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ViolationModel(BaseModel):
+    """Модель нарушения клиента.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор нарушения.
+    client_id : UUID
+        UUID клиента, допустившего нарушение.
+    detail : str
+        Описание нарушения.
+    claimed_at : datetime
+        Время нарушения.
+    """
+
+    id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    detail: str = Field(examples=["опоздание"])
+    claimed_at: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
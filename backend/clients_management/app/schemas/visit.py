@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class ActiveVisitModel(BaseModel):
+    """Модель незавершённого посещения.
+
+    Используется для отображения клиентов, находящихся в зале в данный момент.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор посещения.
+    client_id : UUID
+        UUID клиента, который находится в зале.
+    box : int
+        Номер ящика, занятого клиентом.
+    visit_start : datetime
+        Время начала посещения.
+    """
+
+    id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    client_id: UUID = Field(examples=["8e1b38e9-b559-9f67-a2e8-a1839ee1d6a1"])
+    box: int = Field(examples=[56])
+    visit_start: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
+
+
+class VisitBatchItemModel(BaseModel):
+    """Результат обработки одного элемента пакетного запроса посещений.
+
+    Attributes
+    ----------
+    index : int
+        Позиция элемента в запросе (с нуля).
+    id : UUID | None
+        UUID посещения. Для не допущенного клиента — None.
+    status : Literal[...]
+        Результат обработки элемента: ``started``, ``ended``, ``not_found``,
+        ``already_ended``, ``no_season_ticket`` или ``season_ticket_expired``.
+    detail : str | None
+        Причина отказа в допуске для статусов ``no_season_ticket``
+        и ``season_ticket_expired``.
+    """
+
+    index: int = Field(examples=[0])
+    id: UUID | None = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    status: Literal[
+        "started",
+        "ended",
+        "not_found",
+        "already_ended",
+        "no_season_ticket",
+        "season_ticket_expired",
+    ] = Field(examples=["started"])
+    detail: str | None = Field(default=None, examples=[None])
+
+
+class VisitModel(BaseModel):
+    """Модель посещения из истории клиента.
+
+    Attributes
+    ----------
+    id : UUID
+        Уникальный идентификатор посещения.
+    box : int
+        Номер ящика, который использовал клиент.
+    visit_start : datetime
+        Время начала посещения.
+    visit_end : datetime | None
+        Время завершения посещения. None, если посещение ещё не завершено.
+    """
+
+    id: UUID = Field(examples=["1c2f5e0a-7d3b-4a4e-9e61-0b8a2d3c4f5e"])
+    box: int = Field(examples=[56])
+    visit_start: datetime = Field(examples=["2025-06-02 12:32:11.000311+00:00"])
+    visit_end: datetime | None = Field(examples=["2025-06-02 14:05:42.000311+00:00"])
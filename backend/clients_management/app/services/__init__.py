@@ -1,3 +1,16 @@
+from .analytics_rollup import AnalyticsRollupScheduler
+from .analytics_service import AnalyticsService
 from .auth_service import AuthService
+from .balance_snapshot import BalanceSnapshotScheduler
+from .client_record_service import ClientRecordService
+from .client_summary_service import ClientSummaryService
 from .clients_service import ClientService
+from .comment_service import CommentService
+from .complaint_service import ComplaintService
+from .group_service import GroupService
 from .season_ticket_service import SeasonTicketService
+from .season_ticket_expiry import SeasonTicketExpiryScheduler
+from .transaction_service import TransactionService
+from .visit_service import VisitService
+from .visit_batcher import VisitStartBatcher
+from .violation_service import ViolationService
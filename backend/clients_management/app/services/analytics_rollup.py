@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.repositories import AnalyticsRepository
+from app.services.analytics_service import AnalyticsService
+
+settings: Settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsRollupScheduler:
+    """Фоновое обновление агрегатов аналитики.
+
+    Раз в `interval` секунд добавляет в часовые и дневные агрегаты посещения
+    и транзакции, появившиеся после предыдущего запуска и ставшие старше `lag`.
+
+    Attributes
+    ----------
+    interval : float
+        Период в секундах.
+    lag : timedelta
+        Возраст, после которого запись попадает в агрегаты.
+
+    Methods
+    -------
+    run_once(session_maker)
+        Добавляет в агрегаты новые записи.
+    start(session_maker)
+        Запускает периодическое выполнение в фоновой задаче.
+    stop()
+        Останавливает фоновую задачу.
+
+    Notes
+    -----
+    - Граница агрегатов отстоит от текущего момента на `lag`, поэтому записи,
+      которые ещё не зафиксированы другими воркерами, в агрегаты не попадают.
+    - Первый запуск заполняет агрегаты по всей истории.
+    """
+
+    def __init__(self, interval: float, lag: timedelta):
+        self.interval: float = interval
+        self.lag: timedelta = lag
+
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self, session_maker: async_sessionmaker) -> Tuple[int, int]:
+        """Добавляет в агрегаты новые записи.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+
+        Returns
+        -------
+        counts : Tuple[int, int]
+            Количество изменённых часовых и дневных строк агрегатов.
+        """
+        until = datetime.now(timezone.utc) - self.lag
+
+        async with session_maker() as session:
+            analytics_service = AnalyticsService(AnalyticsRepository(session))
+            hours, days = await analytics_service.roll_up(until)
+
+        logger.info("Analytics rollups updated: %d hours, %d days.", hours, days)
+
+        return hours, days
+
+    def start(self, session_maker: async_sessionmaker):
+        """Запускает периодическое выполнение в фоновой задаче.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(session_maker))
+
+    async def stop(self):
+        """Останавливает фоновую задачу."""
+        if (task := self._task) is None:
+            return
+
+        self._task = None
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, session_maker: async_sessionmaker):
+        """Обновляет агрегаты каждые `interval` секунд до остановки."""
+        while True:
+            try:
+                await self.run_once(session_maker)
+            except Exception:
+                logger.exception("Analytics rollup failed.")
+
+            await asyncio.sleep(self.interval)
+
+
+analytics_rollup_scheduler: AnalyticsRollupScheduler = AnalyticsRollupScheduler(
+    settings.ANALYTICS_ROLLUP_INTERVAL_SECONDS,
+    timedelta(seconds=settings.ANALYTICS_ROLLUP_LAG_SECONDS),
+)
@@ -0,0 +1,346 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from decimal import Decimal
+from typing import Dict, Iterator, List, Tuple
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException, status
+
+from app.core.config import Settings, get_settings
+from app.repositories import AnalyticsRepository
+from app.schemas.analytics import (
+    AnalyticsPeriod,
+    AttendancePeriodModel,
+    BoxHeatmapModel,
+    RevenuePeriodModel,
+)
+from app.schemas.v1.responses import (
+    AttendanceResponse,
+    HeatmapResponse,
+    RevenueResponse,
+)
+
+settings: Settings = get_settings()
+
+ANALYTICS_TIMEZONE: tzinfo = (
+    timezone.utc
+    if settings.ANALYTICS_TIMEZONE == "UTC"
+    else ZoneInfo(settings.ANALYTICS_TIMEZONE)
+)
+
+
+class AnalyticsService:
+    """Сервисный слой аналитики выручки и посещаемости.
+
+    Отчёты читаются только из агрегатов: дневного (`daily_rollup`) для выручки
+    и посещаемости и часового по ящикам (`hourly_visit_rollup`) для тепловых
+    карт. Агрегаты дополняются фоновой задачей: каждый запуск считает по исходным
+    таблицам только записи после предыдущей границы. Делегирует операции
+    с базой данных репозиторию `AnalyticsRepository`.
+
+    Attributes
+    ----------
+    analytics_repo : AnalyticsRepository
+        Репозиторий аналитики, выполняющий прямое взаимодействие с базой данных.
+
+    Methods
+    -------
+    roll_up(until)
+        Добавляет в агрегаты записи до заданного момента.
+    rebuild(until)
+        Перестраивает агрегаты по всей истории.
+    get_revenue(period, start, end)
+        Возвращает выручку по периодам.
+    get_attendance(period, start, end)
+        Возвращает посещаемость по периодам.
+    get_heatmap(start, end, box)
+        Возвращает тепловые карты посещений по ящикам.
+
+    Notes
+    -----
+    - Дни, недели, месяцы и часы тепловой карты считаются в часовом поясе
+      ``ANALYTICS_TIMEZONE``.
+    - Агрегаты накопительные: удаление посещений и транзакций (в том числе
+      вместе с клиентом или при уплотнении истории) их не уменьшает.
+    """
+
+    def __init__(self, analytics_repo: AnalyticsRepository):
+        self.analytics_repo: AnalyticsRepository = analytics_repo
+
+    async def roll_up(self, until: datetime) -> Tuple[int, int]:
+        """Добавляет в агрегаты записи до заданного момента.
+
+        Посещения и транзакции между предыдущей границей и `until` группируются
+        по часам в базе данных, часы — по дням в часовом поясе аналитики,
+        и результат прибавляется к агрегатам в одной транзакции со сдвигом границы.
+
+        Parameters
+        ----------
+        until : datetime
+            Новая граница агрегатов (не включительно).
+
+        Returns
+        -------
+        counts : Tuple[int, int]
+            Количество изменённых часовых и дневных строк агрегатов.
+
+        Notes
+        -----
+        - Если границу одновременно сдвинул другой процесс, запуск ничего не меняет,
+          поэтому записи не учитываются дважды.
+        """
+        since = await self.analytics_repo.get_watermark()
+
+        if since is not None and self._as_utc(since) >= until:
+            return 0, 0
+
+        if not await self.analytics_repo.claim_watermark(since, until):
+            await self.analytics_repo.rollback()
+
+            return 0, 0
+
+        hourly = [
+            {"hour": self._as_utc(hour), "box": box, "visits": visits}
+            for hour, box, visits in await self.analytics_repo.aggregate_visits(
+                since, until
+            )
+        ]
+
+        daily: Dict[date, Dict] = defaultdict(
+            lambda: {"visits": 0, "revenue": Decimal(0), "transactions": 0}
+        )
+        for row in hourly:
+            daily[self._local_day(row["hour"])]["visits"] += row["visits"]
+
+        for hour, revenue, count in await self.analytics_repo.aggregate_transactions(
+            since, until
+        ):
+            day = daily[self._local_day(self._as_utc(hour))]
+            day["revenue"] += revenue
+            day["transactions"] += count
+
+        daily_rows = [{"day": day, **values} for day, values in sorted(daily.items())]
+
+        await self.analytics_repo.add_hourly_visits(hourly)
+        await self.analytics_repo.add_daily(daily_rows)
+
+        await self.analytics_repo.commit()
+
+        return len(hourly), len(daily_rows)
+
+    async def rebuild(self, until: datetime) -> Tuple[int, int]:
+        """Перестраивает агрегаты по всей истории.
+
+        Нужна после изменения ``ANALYTICS_TIMEZONE``.
+
+        Parameters
+        ----------
+        until : datetime
+            Новая граница агрегатов (не включительно).
+
+        Returns
+        -------
+        counts : Tuple[int, int]
+            Количество часовых и дневных строк агрегатов.
+        """
+        await self.analytics_repo.clear()
+
+        return await self.roll_up(until)
+
+    async def get_revenue(
+        self, period: AnalyticsPeriod, start: date, end: date
+    ) -> RevenueResponse:
+        """Возвращает выручку по периодам.
+
+        Parameters
+        ----------
+        period : AnalyticsPeriod
+            Длина периода: ``day``, ``week`` или ``month``.
+        start : date
+            Первый день отчёта.
+        end : date
+            Последний день отчёта (включительно).
+
+        Returns
+        -------
+        RevenueResponse
+            Выручка и количество транзакций по периодам. Крайние периоды
+            учитывают только дни внутри отчёта.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если период отчёта некорректен или слишком длинный.
+        """
+        self._check_range(start, end)
+
+        totals: Dict[date, List] = defaultdict(lambda: [Decimal(0), 0])
+        for row in await self.analytics_repo.get_daily(start, end):
+            total = totals[self._period_start(row.day, period)]
+            total[0] += row.revenue
+            total[1] += row.transactions
+
+        return RevenueResponse(
+            period=period,
+            items=[
+                RevenuePeriodModel(
+                    period_start=period_start,
+                    revenue=totals[period_start][0],
+                    transactions=totals[period_start][1],
+                )
+                for period_start in self._periods(period, start, end)
+            ],
+            rolled_up_until=self._as_utc(await self.analytics_repo.get_watermark()),
+        )
+
+    async def get_attendance(
+        self, period: AnalyticsPeriod, start: date, end: date
+    ) -> AttendanceResponse:
+        """Возвращает посещаемость по периодам.
+
+        Parameters
+        ----------
+        period : AnalyticsPeriod
+            Длина периода: ``day``, ``week`` или ``month``.
+        start : date
+            Первый день отчёта.
+        end : date
+            Последний день отчёта (включительно).
+
+        Returns
+        -------
+        AttendanceResponse
+            Количество начатых посещений по периодам. Крайние периоды
+            учитывают только дни внутри отчёта.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если период отчёта некорректен или слишком длинный.
+        """
+        self._check_range(start, end)
+
+        totals: Dict[date, int] = defaultdict(int)
+        for row in await self.analytics_repo.get_daily(start, end):
+            totals[self._period_start(row.day, period)] += row.visits
+
+        return AttendanceResponse(
+            period=period,
+            items=[
+                AttendancePeriodModel(
+                    period_start=period_start, visits=totals[period_start]
+                )
+                for period_start in self._periods(period, start, end)
+            ],
+            rolled_up_until=self._as_utc(await self.analytics_repo.get_watermark()),
+        )
+
+    async def get_heatmap(
+        self, start: date, end: date, box: int | None = None
+    ) -> HeatmapResponse:
+        """Возвращает тепловые карты посещений по ящикам.
+
+        Parameters
+        ----------
+        start : date
+            Первый день отчёта.
+        end : date
+            Последний день отчёта (включительно).
+        box : int | None
+            Номер ящика. None — все ящики.
+
+        Returns
+        -------
+        HeatmapResponse
+            Матрицы «день недели × час» с количеством начатых посещений.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если период отчёта некорректен или слишком длинный.
+        """
+        self._check_range(start, end)
+
+        rows = await self.analytics_repo.get_hourly_visits(
+            self._day_start(start), self._day_start(end + timedelta(days=1)), box
+        )
+
+        heatmaps: Dict[int, List[List[int]]] = {}
+        for hour, row_box, visits in rows:
+            if row_box not in heatmaps:
+                heatmaps[row_box] = [[0] * 24 for _ in range(7)]
+
+            local = self._as_utc(hour).astimezone(ANALYTICS_TIMEZONE)
+            heatmaps[row_box][local.weekday()][local.hour] += visits
+
+        return HeatmapResponse(
+            boxes=[
+                BoxHeatmapModel(box=row_box, visits=heatmaps[row_box])
+                for row_box in sorted(heatmaps)
+            ],
+            rolled_up_until=self._as_utc(await self.analytics_repo.get_watermark()),
+        )
+
+    @staticmethod
+    def _check_range(start: date, end: date):
+        """Выбрасывает 400, если период отчёта пуст или длиннее допустимого."""
+        if end < start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Конец периода раньше начала.",
+            )
+
+        if (end - start).days >= settings.ANALYTICS_RANGE_MAX_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Период не может быть длиннее "
+                    f"{settings.ANALYTICS_RANGE_MAX_DAYS} дней."
+                ),
+            )
+
+    @staticmethod
+    def _period_start(day: date, period: AnalyticsPeriod) -> date:
+        """Возвращает первый день периода, в который входит день."""
+        if period == "week":
+            return day - timedelta(days=day.weekday())
+
+        if period == "month":
+            return day.replace(day=1)
+
+        return day
+
+    @classmethod
+    def _periods(
+        cls, period: AnalyticsPeriod, start: date, end: date
+    ) -> Iterator[date]:
+        """Перечисляет первые дни периодов, пересекающихся с отчётом."""
+        period_start = cls._period_start(start, period)
+
+        while period_start <= end:
+            yield period_start
+
+            if period == "month":
+                period_start = (period_start + timedelta(days=31)).replace(day=1)
+            else:
+                period_start += timedelta(days=7 if period == "week" else 1)
+
+    @staticmethod
+    def _day_start(day: date) -> datetime:
+        """Возвращает начало дня в часовом поясе аналитики как момент в UTC."""
+        return datetime.combine(day, time(), tzinfo=ANALYTICS_TIMEZONE).astimezone(
+            timezone.utc
+        )
+
+    @staticmethod
+    def _local_day(hour: datetime) -> date:
+        """Возвращает день в часовом поясе аналитики, к которому относится час."""
+        return hour.astimezone(ANALYTICS_TIMEZONE).date()
+
+    @staticmethod
+    def _as_utc(moment: datetime | None) -> datetime | None:
+        """Приводит время без часового пояса (SQLite) к UTC."""
+        if moment is not None and moment.tzinfo is None:
+            return moment.replace(tzinfo=timezone.utc)
+
+        return moment
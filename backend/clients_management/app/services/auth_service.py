@@ -1,27 +1,53 @@
-import re
+from datetime import timedelta
 from typing import AnyStr, Dict
 
 from fastapi import HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from jose import ExpiredSignatureError, JWTError
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from app.core.config import Settings, get_settings
-from app.core.jwt import create_jwt_pair, jwt_decode
-from app.core.security import hash_, verify
+from app.core.integrity import parse_unique_violation
+from app.core.jwt import create_jwt, create_jwt_pair, jwt_decode
+from app.core.security import (
+    PasswordHasherOverloadedError,
+    hash_async,
+    verify_and_update_async,
+)
+from app.core.token_cache import CachedIdentity, access_token_cache
 from app.database.tables.entities import User
 from app.repositories import UserRepository
 from app.schemas.v1.requests import SignUpRequest
-from app.schemas.v1.responses import TokenResponse, StandardResponse
+from app.schemas.v1.responses import (
+    EventsTokenResponse,
+    StandardResponse,
+    TokenResponse,
+)
 
 settings: Settings = get_settings()
 
+EVENTS_TOKEN_SCOPE = "events"
+"""Область действия токена, который принимается только лентой изменений."""
+
 credentials_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail="Could not validate credentials.",
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+overloaded_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Too many authentication requests, try again later.",
+    headers={"Retry-After": "1"},
+)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target: User):
+    """Удаляет из кэша токенов доступа записи удалённого пользователя."""
+    access_token_cache.invalidate_user(target.username)
+
 
 class AuthService:
     """Сервис аутентификации и авторизации.
@@ -49,8 +75,14 @@ class AuthService:
         Реализует бизнес-логику авторизации по токену доступа.
     validate_refresh_token(refresh_token)
         Реализует бизнес-логику авторизации по токену обновления.
+    create_events_token(user)
+        Выдаёт короткоживущий токен подписки на ленту изменений.
+    validate_events_token(events_token)
+        Реализует бизнес-логику авторизации по токену подписки на ленту изменений.
     _get_jwt_pair(user)
         Генерирует новую пару JWT.
+    _decode_token(token)
+        Декодирует JWT и проверяет его подпись и срок действия.
     _get_user_from_token(token)
         Получает запись из репозитория на основе данных из JWT.
     """
@@ -73,17 +105,35 @@ class AuthService:
         -------
         response : TokenResponse
             Модель ответа сервера с вложенной парой JWT.
+
+        Notes
+        -----
+        - Проверка пароля выполняется в пуле хеширования и не блокирует цикл событий.
+        - Если хеш пароля устарел (например, изменилось число раундов bcrypt),
+          он прозрачно заменяется новым.
         """
         user = await self.user_repo.get_user_by_username(form_data.username)
 
+        verified, new_hash = False, None
+        if user is not None:
+            try:
+                verified, new_hash = await verify_and_update_async(
+                    form_data.password, user.password
+                )
+            except PasswordHasherOverloadedError:
+                raise overloaded_exception
+
         # проверка на существование пользователя и соответствие пароля
-        if not (user and verify(form_data.password, user.password)):
+        if not verified:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        if new_hash is not None:
+            await self.user_repo.update_password(user, new_hash)
+
         return TokenResponse(**await self._get_jwt_pair(user), token_type="bearer")
 
     async def sign_up(self, sign_up_data: SignUpRequest) -> StandardResponse:
@@ -101,24 +151,20 @@ class AuthService:
         response : StandardResponse
             Положительный ответ о регистрации пользователя.
         """
-        sign_up_data.password = hash_(sign_up_data.password)
+        try:
+            sign_up_data.password = await hash_async(sign_up_data.password)
+        except PasswordHasherOverloadedError:
+            raise overloaded_exception
 
         try:
             await self.user_repo.add_user(sign_up_data)
         except IntegrityError as integrity_error:
             await self.user_repo.rollback()
 
-            # Необходимо для тестов, т.к. текст ошибки SQLite отличается от PostgreSQL
-            if "sqlite3" in str(integrity_error):
-                column, *_ = re.search(r"\.(.*)", str(integrity_error.orig)).groups()
-                value: str = sign_up_data.model_dump()[column]
-
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail=f'User with {column}="{value}" already exists!',
-                )
-            elif result := re.search(r'"\((.*)\)=\((.*)\)"', str(integrity_error.orig)):
-                column, value = result.groups()
+            if result := parse_unique_violation(
+                integrity_error, sign_up_data.model_dump()
+            ):
+                column, value = result
 
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
@@ -160,6 +206,9 @@ class AuthService:
         Получает JSON Web Token (JWT) в качестве ввода, декодирует его и проверяет,
         существует ли пользователь в репозитории. Возвращает модель записи пользователя.
 
+        Результат проверки сохраняется в кэше процесса до истечения токена,
+        поэтому повторные запросы с тем же токеном не обращаются к базе данных.
+
         Parameters
         ----------
         access_token : AnyStr
@@ -168,9 +217,33 @@ class AuthService:
         Returns
         -------
         user : User
-            Объект пользователя.
+            Объект пользователя. При попадании в кэш — объект, не связанный с сессией,
+            с заполненными полями ``id``, ``username`` и ``email``.
         """
-        return await self._get_user_from_token(access_token)
+        if (identity := access_token_cache.get(access_token)) is not None:
+            return User(
+                id=identity.id, username=identity.username, email=identity.email
+            )
+
+        payload = self._decode_token(access_token)
+
+        # токен ленты изменений передаётся в URL и не должен заменять токен доступа
+        if payload.get("scope") is not None:
+            raise credentials_exception
+
+        user = await self._get_user_from_token(access_token, payload)
+
+        access_token_cache.put(
+            access_token,
+            CachedIdentity(
+                id=user.id,
+                username=user.username,
+                email=user.email,
+                expires_at=float(payload["exp"]),
+            ),
+        )
+
+        return user
 
     async def validate_refresh_token(self, refresh_token: str) -> User:
         """Метод валидации токена обновления.
@@ -195,6 +268,54 @@ class AuthService:
 
         return user
 
+    @staticmethod
+    def create_events_token(user: User) -> EventsTokenResponse:
+        """Выдаёт короткоживущий токен подписки на ленту изменений.
+
+        Браузерный ``EventSource`` не может передать заголовок ``Authorization``,
+        поэтому лента изменений принимает токен в параметре запроса. Чтобы токен
+        в URL (а значит, и в журналах прокси) не давал доступа к остальному API,
+        он ограничен областью ``events`` и живёт `EVENTS_TOKEN_LIFETIME_SECONDS`.
+
+        Parameters
+        ----------
+        user : User
+            Авторизованный пользователь.
+
+        Returns
+        -------
+        EventsTokenResponse
+            Токен и его время жизни в секундах.
+        """
+        token = create_jwt(
+            {"sub": user.username, "scope": EVENTS_TOKEN_SCOPE},
+            timedelta(seconds=settings.EVENTS_TOKEN_LIFETIME_SECONDS),
+        )
+
+        return EventsTokenResponse(
+            token=token, expires_in=settings.EVENTS_TOKEN_LIFETIME_SECONDS
+        )
+
+    async def validate_events_token(self, events_token: str) -> User:
+        """Метод валидации токена подписки на ленту изменений.
+
+        Parameters
+        ----------
+        events_token : str
+            JSON Web Token с областью действия ``events``.
+
+        Returns
+        -------
+        user : User
+            Объект пользователя.
+        """
+        payload = self._decode_token(events_token)
+
+        if payload.get("scope") != EVENTS_TOKEN_SCOPE:
+            raise credentials_exception
+
+        return await self._get_user_from_token(events_token, payload)
+
     async def _get_jwt_pair(self, user: User) -> Dict[AnyStr, AnyStr]:
         """Метод создания новой пары JWT.
 
@@ -228,13 +349,15 @@ class AuthService:
                 detail="Incorrect request.",
             )
 
+        access_token_cache.invalidate_user(user.username)
+
         return tokens
 
-    async def _get_user_from_token(self, token: str) -> User:
-        """Метод получения записи пользователя с помощью данных из JWT.
+    @staticmethod
+    def _decode_token(token: str) -> Dict:
+        """Метод декодирования JWT.
 
-        Получает JWT в качестве ввода, декодирует его и проверяет, существует ли пользователь в репозитории.
-        Возвращает модель записи пользователя.
+        Проверяет подпись и срок действия токена, а также наличие в нём имени пользователя.
 
         Parameters
         ----------
@@ -243,12 +366,11 @@ class AuthService:
 
         Returns
         -------
-        user : User
-            Модель записи пользователя.
+        payload : Dict
+            Данные, закодированные в JWT.
         """
         try:
-            if (username := jwt_decode(token).get("sub")) is None:
-                raise credentials_exception
+            payload = jwt_decode(token)
         except ExpiredSignatureError:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -258,14 +380,33 @@ class AuthService:
         except JWTError:
             raise credentials_exception
 
-        if (user := await self.user_repo.get_user_by_username(username)) is None:
+        if payload.get("sub") is None:
             raise credentials_exception
 
-        try:
-            await self.user_repo.commit()
-        except IntegrityError:
-            await self.user_repo.rollback()
+        return payload
+
+    async def _get_user_from_token(self, token: str, payload: Dict = None) -> User:
+        """Метод получения записи пользователя с помощью данных из JWT.
+
+        Получает JWT в качестве ввода, декодирует его и проверяет, существует ли пользователь в репозитории.
+        Возвращает модель записи пользователя.
+
+        Parameters
+        ----------
+        token : str
+            JSON Web Token.
+        payload : Dict, optional
+            Уже декодированные данные токена. Если не переданы, токен декодируется.
+
+        Returns
+        -------
+        user : User
+            Модель записи пользователя.
+        """
+        if payload is None:
+            payload = self._decode_token(token)
 
+        if (user := await self.user_repo.get_user_by_username(payload["sub"])) is None:
             raise credentials_exception
 
         return user
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.repositories import ClientBalanceRepository, TransactionRepository
+from app.services.transaction_service import TransactionService
+
+settings: Settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceSnapshotScheduler:
+    """Фоновое создание снимков балансов и уплотнение истории транзакций.
+
+    Раз в `interval` секунд переносит в снимки балансов транзакции старше
+    `snapshot_age` и, если задан `retention`, удаляет учтённые в снимках
+    транзакции старше `retention`. Текущий баланс при этом не меняется:
+    он поддерживается при записи каждой транзакции.
+
+    Attributes
+    ----------
+    interval : float
+        Период в секундах.
+    snapshot_age : timedelta
+        Возраст, после которого транзакция попадает в снимок.
+    retention : timedelta | None
+        Возраст, после которого учтённая в снимке транзакция удаляется.
+        None — транзакции не удаляются.
+
+    Methods
+    -------
+    run_once(session_maker)
+        Создаёт снимки и удаляет учтённые в них старые транзакции.
+    start(session_maker)
+        Запускает периодическое выполнение в фоновой задаче.
+    stop()
+        Останавливает фоновую задачу.
+
+    Notes
+    -----
+    - Граница снимка отстоит от текущего момента на `snapshot_age`, поэтому
+      транзакции, которые ещё не зафиксированы другими воркерами, в снимок
+      не попадают.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        snapshot_age: timedelta,
+        retention: timedelta | None = None,
+    ):
+        self.interval: float = interval
+        self.snapshot_age: timedelta = snapshot_age
+        self.retention: timedelta | None = retention
+
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self, session_maker: async_sessionmaker) -> Tuple[int, int]:
+        """Создаёт снимки и удаляет учтённые в них старые транзакции.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+
+        Returns
+        -------
+        counts : Tuple[int, int]
+            Количество обновлённых снимков и количество удалённых транзакций.
+        """
+        now = datetime.now(timezone.utc)
+        snapshot_before = now - self.snapshot_age
+        delete_before = None
+
+        if self.retention is not None:
+            delete_before = min(now - self.retention, snapshot_before)
+
+        async with session_maker() as session:
+            transaction_service = TransactionService(
+                TransactionRepository(session), ClientBalanceRepository(session)
+            )
+            snapshots, deleted = await transaction_service.compact(
+                snapshot_before, delete_before
+            )
+
+        logger.info(
+            "Balance snapshots: %d, transactions compacted: %d.", snapshots, deleted
+        )
+
+        return snapshots, deleted
+
+    def start(self, session_maker: async_sessionmaker):
+        """Запускает периодическое выполнение в фоновой задаче.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(session_maker))
+
+    async def stop(self):
+        """Останавливает фоновую задачу."""
+        if (task := self._task) is None:
+            return
+
+        self._task = None
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, session_maker: async_sessionmaker):
+        """Выполняет уплотнение каждые `interval` секунд до остановки."""
+        while True:
+            try:
+                await self.run_once(session_maker)
+            except Exception:
+                logger.exception("Balance snapshot failed.")
+
+            await asyncio.sleep(self.interval)
+
+
+balance_snapshot_scheduler: BalanceSnapshotScheduler = BalanceSnapshotScheduler(
+    settings.BALANCE_SNAPSHOT_INTERVAL_SECONDS,
+    timedelta(seconds=settings.BALANCE_SNAPSHOT_AGE_SECONDS),
+    (
+        timedelta(days=settings.TRANSACTIONS_RETENTION_DAYS)
+        if settings.TRANSACTIONS_RETENTION_DAYS > 0
+        else None
+    ),
+)
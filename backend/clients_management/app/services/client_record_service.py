@@ -0,0 +1,331 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, List, Type
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cursor import decode_cursor, encode_cursor
+from app.database.tables.entities import User
+from app.repositories.client_record_repository import ClientRecordRepository, Record
+from app.schemas.v1.responses import (
+    CreatedResponse,
+    StandardResponse,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordMessages:
+    """Тексты ответов сервиса записей о клиентах.
+
+    Attributes
+    ----------
+    created : str
+        Сообщение об успешном добавлении.
+    updated : str
+        Сообщение об успешном обновлении.
+    deleted : str
+        Сообщение об успешном удалении.
+    not_found : str
+        Описание ошибки 404 для отсутствующей записи.
+    forbidden : str
+        Описание ошибки 403 для чужой записи.
+    """
+
+    created: str
+    updated: str
+    deleted: str
+    not_found: str
+    forbidden: str
+
+
+class ClientRecordService(Generic[Record]):
+    """Базовый сервисный слой для записей пользователей о клиентах.
+
+    Общая бизнес-логика комментариев и жалоб: создание, просмотр, постраничная
+    выдача записей клиента, изменение и удаление. Изменять и удалять запись может
+    только её автор. Наследник задаёт модели ответа и тексты сообщений, а также
+    при необходимости переопределяет хуки `_on_added`, `_on_deleted`
+    и `_after_commit`.
+
+    Attributes
+    ----------
+    record_repo : ClientRecordRepository[Record]
+        Репозиторий записей, выполняющий прямое взаимодействие с базой данных.
+    field : str
+        Имя поля с текстом записи в таблице и в модели записи.
+    page_field : str
+        Имя поля со списком записей в ответе со страницей.
+    model : Type[BaseModel]
+        Модель записи.
+    response : Type[StandardResponse]
+        Модель ответа с одной записью.
+    page_response : Type[StandardResponse]
+        Модель ответа со страницей записей.
+    messages : RecordMessages
+        Тексты ответов.
+
+    Methods
+    -------
+    add_record(user, record_data)
+        Добавляет новую запись.
+    get_record(record_id)
+        Возвращает запись по UUID.
+    get_client_records(client_id, limit, cursor)
+        Возвращает страницу записей о клиенте.
+    update_record(record_id, user, record_data)
+        Обновляет запись по UUID.
+    delete_record(record_id, user)
+        Удаляет запись по UUID.
+    """
+
+    field: str
+    page_field: str
+    model: Type[BaseModel]
+    response: Type[StandardResponse]
+    page_response: Type[StandardResponse]
+    messages: RecordMessages
+
+    def __init__(self, record_repo: ClientRecordRepository[Record]):
+        self.record_repo: ClientRecordRepository[Record] = record_repo
+
+    async def add_record(self, user: User, record_data: BaseModel) -> CreatedResponse:
+        """Добавляет новую запись.
+
+        Parameters
+        ----------
+        user : User
+            Автор записи.
+        record_data : BaseModel
+            Данные новой записи.
+
+        Returns
+        -------
+        CreatedResponse
+            Ответ с кодом 201 и UUID созданной записи.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если связанный клиент не существует.
+        """
+        try:
+            record: Record = await self.record_repo.add_record(user.id, record_data)
+            await self._on_added(record)
+            await self.record_repo.commit()
+        except IntegrityError as _:
+            await self.record_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Клиент с id={record_data.client_id} не найден!",
+            )
+
+        await self._after_commit(record.client_id)
+
+        return CreatedResponse(message=self.messages.created, id=record.id)
+
+    async def get_record(self, record_id: UUID) -> StandardResponse:
+        """Возвращает запись по UUID.
+
+        Parameters
+        ----------
+        record_id : UUID
+            Уникальный идентификатор записи.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ `response` с записью.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если запись не найдена.
+        """
+        record = await self.record_repo.get_record_by_id(record_id)
+
+        if record is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.messages.not_found,
+            )
+
+        return self.response(**{self.field: self._to_model(record)})
+
+    async def get_client_records(
+        self, client_id: UUID, limit: int, cursor: str | None = None
+    ) -> StandardResponse:
+        """Возвращает страницу записей о клиенте.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        limit : int
+            Размер страницы.
+        cursor : str | None
+            Курсор, полученный вместе с предыдущей страницей.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ `page_response` с записями от новых к старым
+            и курсором следующей страницы.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если курсор повреждён.
+            - 404 Not Found: если клиент не найден.
+
+        Notes
+        -----
+        - Существование клиента проверяется отдельным запросом только
+          для пустой первой страницы.
+        """
+        after = None
+        if cursor is not None:
+            try:
+                created_at, record_id = decode_cursor(cursor, 2)
+                after = (datetime.fromisoformat(created_at), UUID(record_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор.",
+                )
+
+        records: List[Record] = await self.record_repo.get_client_records(
+            client_id, limit=limit + 1, after=after
+        )
+
+        if not records and after is None:
+            if not await self.record_repo.client_exists(client_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Клиент с таким uuid не найден.",
+                )
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(
+                records[-1].created_at.isoformat(), records[-1].id
+            )
+
+        return self.page_response(
+            **{self.page_field: [self._to_model(record) for record in records]},
+            next_cursor=next_cursor,
+        )
+
+    async def update_record(
+        self, record_id: UUID, user: User, record_data: BaseModel
+    ) -> StandardResponse:
+        """Обновляет запись по UUID.
+
+        Обновляет текст одним запросом ``UPDATE ... RETURNING id`` с условием
+        на автора. Запись загружается отдельно, только если обновить её не удалось,
+        чтобы отличить отсутствующую запись от чужой.
+
+        Parameters
+        ----------
+        record_id : UUID
+            Уникальный идентификатор записи.
+        user : User
+            Пользователь, изменяющий запись.
+        record_data : BaseModel
+            Новые данные записи.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном обновлении.
+
+        Raises
+        ------
+        HTTPException
+            - 403 Forbidden: если запись оставлена другим пользователем.
+            - 404 Not Found: если запись с данным UUID не найдена.
+        """
+        updated_id = await self.record_repo.update_record(
+            record_id, user.id, record_data
+        )
+
+        if updated_id is None:
+            await self._raise_not_modified(record_id)
+
+        await self.record_repo.commit()
+
+        return StandardResponse(message=self.messages.updated)
+
+    async def delete_record(self, record_id: UUID, user: User) -> StandardResponse:
+        """Удаляет запись по UUID.
+
+        Удаляет запись одним запросом ``DELETE ... RETURNING client_id``
+        с условием на автора.
+
+        Parameters
+        ----------
+        record_id : UUID
+            Уникальный идентификатор записи.
+        user : User
+            Пользователь, удаляющий запись.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном удалении.
+
+        Raises
+        ------
+        HTTPException
+            - 403 Forbidden: если запись оставлена другим пользователем.
+            - 404 Not Found: если запись не найдена.
+        """
+        client_id = await self.record_repo.delete_record(record_id, user.id)
+
+        if client_id is None:
+            await self._raise_not_modified(record_id)
+
+        await self._on_deleted(client_id)
+        await self.record_repo.commit()
+
+        await self._after_commit(client_id)
+
+        return StandardResponse(message=self.messages.deleted)
+
+    async def _on_added(self, record: Record):
+        """Хук, вызываемый после добавления записи в той же транзакции."""
+
+    async def _on_deleted(self, client_id: UUID):
+        """Хук, вызываемый после удаления записи о клиенте в той же транзакции."""
+
+    async def _after_commit(self, client_id: UUID):
+        """Хук, вызываемый после фиксации добавления или удаления записи."""
+
+    async def _raise_not_modified(self, record_id: UUID):
+        """Выбрасывает 404 или 403 для записи, которую не удалось изменить."""
+        await self.record_repo.rollback()
+
+        if await self.record_repo.get_record_by_id(record_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.messages.not_found,
+            )
+
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=self.messages.forbidden,
+        )
+
+    def _to_model(self, record: Record) -> BaseModel:
+        """Преобразует запись таблицы в модель `model`."""
+        return self.model(
+            id=record.id,
+            client_id=record.client_id,
+            user_id=record.user_id,
+            created_at=record.created_at,
+            **{self.field: getattr(record, self.field)},
+        )
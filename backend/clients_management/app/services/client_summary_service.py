@@ -0,0 +1,59 @@
+from typing import List
+from uuid import UUID
+
+from app.core.response_cache import CLIENTS_SCOPE, response_cache
+from app.repositories import ClientSummaryRepository
+
+
+class ClientSummaryService:
+    """Сервисный слой обслуживания сводки по клиентам.
+
+    Сводка `client_summary` поддерживается инкрементально сервисами клиентов,
+    абонементов и посещений. Этот сервис выполняет полную перестройку сводки
+    и проверку её согласованности с исходными таблицами.
+
+    Attributes
+    ----------
+    client_summary_repo : ClientSummaryRepository
+        Репозиторий сводки по клиентам.
+
+    Methods
+    -------
+    rebuild()
+        Полностью перестраивает сводку и фиксирует изменения.
+    check()
+        Возвращает UUID клиентов с несогласованной сводкой.
+    """
+
+    def __init__(self, client_summary_repo: ClientSummaryRepository):
+        self.client_summary_repo: ClientSummaryRepository = client_summary_repo
+
+    async def rebuild(self) -> int:
+        """Полностью перестраивает сводку и фиксирует изменения.
+
+        Returns
+        -------
+        count : int
+            Количество строк в перестроенной сводке.
+        """
+        try:
+            count = await self.client_summary_repo.rebuild()
+            await self.client_summary_repo.commit()
+        except Exception:
+            await self.client_summary_repo.rollback()
+            raise
+
+        await response_cache.invalidate(CLIENTS_SCOPE)
+
+        return count
+
+    async def check(self) -> List[UUID]:
+        """Возвращает UUID клиентов с несогласованной сводкой.
+
+        Returns
+        -------
+        client_ids : List[UUID]
+            UUID клиентов, для которых строка сводки отсутствует
+            или расходится с исходными таблицами.
+        """
+        return await self.client_summary_repo.find_inconsistent()
@@ -1,23 +1,60 @@
-import asyncio
-import re
-from typing import List
-from uuid import UUID
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Literal, Tuple
+from uuid import UUID, uuid4
 
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
-
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.change_feed import change_feed
+from app.core.config import Settings, get_settings
+from app.core.cursor import decode_cursor, encode_cursor
+from app.core.integrity import parse_unique_violation
+from app.core.response_cache import (
+    CLIENTS_SCOPE,
+    GROUPS_SCOPE,
+    client_scope,
+    response_cache,
+)
+from app.core.search import SearchEntry, SearchQuery, client_search_index
 from app.database.tables.entities import Client
-from app.repositories import ClientRepository
-from app.schemas.client import CompactClientModel, ClientModel
+from app.repositories import ClientRepository, ClientSummaryRepository
+from app.schemas.client import CompactClientModel, ClientModel, GroupMemberModel
 from app.schemas.group import CompactGroupModel
+from app.schemas.row_error import RowErrorModel
 from app.schemas.season_ticket import SeasonTicketModel
 from app.schemas.v1.requests import ClientRequest
 from app.schemas.v1.responses import (
     ClientResponse,
+    ClientsImportResponse,
     ClientsResponse,
     CreatedResponse,
+    GroupMembersResponse,
     StandardResponse,
 )
+from app.services.ticket_validity import ticket_validity_map
+
+settings: Settings = get_settings()
+
+EXPORT_COLUMNS: Tuple[str, ...] = (
+    "id",
+    "name",
+    "surname",
+    "patronymic",
+    "sex",
+    "email",
+    "phone",
+    "photo_url",
+    "season_ticket_type",
+    "last_visit",
+    "violation_count",
+    "complaint_count",
+)
 
 
 class ClientService:
@@ -27,66 +64,379 @@ class ClientService:
     ----------
     client_repo : ClientRepository
         Репозиторий клиентов, слой операций с БД.
+    client_summary_repo : ClientSummaryRepository
+        Репозиторий сводки по клиентам, из которой читается список клиентов.
 
     Methods
     -------
     """
 
-    def __init__(self, client_repo: ClientRepository):
+    def __init__(
+        self,
+        client_repo: ClientRepository,
+        client_summary_repo: ClientSummaryRepository,
+    ):
         self.client_repo: ClientRepository = client_repo
+        self.client_summary_repo: ClientSummaryRepository = client_summary_repo
 
-    async def get_all_clients(self) -> ClientsResponse:
-        """Получение краткой информации обо всех клиентах.
+    async def get_all_clients(
+        self, limit: int, cursor: str | None = None
+    ) -> ClientsResponse:
+        """Получение краткой информации о клиентах постранично.
 
-        Метод получает все записи клиентов из репозитория и преобразует их
+        Метод получает из репозитория готовую проекцию клиентов и преобразует её
         в компактное представление, подходящее для отображения списка.
-        Для каждого клиента дополнительно загружает:
+        Для каждого клиента проекция уже содержит:
         - Тип текущего абонемента (если есть)
         - Наличие нарушений
         - Дату последнего посещения (если есть)
 
+        Parameters
+        ----------
+        limit : int
+            Размер страницы.
+        cursor : str | None
+            Курсор, полученный вместе с предыдущей страницей. Если не передан,
+            возвращается первая страница.
+
         Возвращает
         --------
         response : ClientsResponse
-            Объект ответа, содержащий список экземпляров CompactClientModel.
+            Объект ответа, содержащий список экземпляров CompactClientModel
+            и курсор следующей страницы.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если курсор повреждён.
 
         Примечания
         --------
-        - Метод выполняет дополнительные асинхронные запросы для связанных данных,
-          что может повлиять на производительность при большом количестве клиентов.
-        - Учитывается только текущий абонемент и последнее посещение, если их несколько.
+        - Все связанные данные вычисляются одним SQL-запросом, количество запросов
+          не растёт с числом клиентов.
+        - Пагинация выполняется по ключу (`surname`, `id`), поэтому страницы стабильны
+          при добавлении и удалении клиентов между запросами.
+        - Тип абонемента берётся из действующего (не просроченного) абонемента
+          с наибольшим сроком действия. Ранее возвращался первый абонемент по `expires_at`,
+          даже если он уже истёк; теперь при отсутствии действующего абонемента возвращается None.
         - Флаг нарушений имеет значение True, если у клиента есть хотя бы одно нарушение.
         """
-        records = await self.client_repo.get_all_clients()
-
-        clients = []
-        for client in records:
-            season_tickets, visits, violations = await asyncio.gather(
-                client.awaitable_attrs.season_tickets,
-                client.awaitable_attrs.visits,
-                client.awaitable_attrs.violations,
-            )
+        after = None
+        if cursor is not None:
+            try:
+                surname, client_id = decode_cursor(cursor, 2)
+                after = (surname, UUID(client_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор.",
+                )
+
+        records = await self.client_repo.get_all_clients(limit=limit + 1, after=after)
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(records[-1].surname, records[-1].id)
+
+        return ClientsResponse(
+            clients=[self._to_compact_client(record) for record in records],
+            next_cursor=next_cursor,
+        )
+
+    async def get_group_members(
+        self, group_id: UUID, limit: int, cursor: str | None = None
+    ) -> GroupMembersResponse:
+        """Возвращает страницу участников группы.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        limit : int
+            Размер страницы.
+        cursor : str | None
+            Курсор, полученный вместе с предыдущей страницей.
 
-            season_ticket_type = season_tickets[0].type if season_tickets else None
-            last_visit = visits[0].visit_start.date() if visits else None
-
-            clients.append(
-                CompactClientModel(
-                    id=client.id,
-                    name=client.name,
-                    surname=client.surname,
-                    patronymic=client.patronymic,
-                    sex=client.sex,
-                    email=client.email,
-                    phone=client.phone,
-                    photo_url=client.photo_url,
-                    season_ticket_type=season_ticket_type,
-                    is_violator=bool(violations),
-                    last_visit=last_visit,
+        Returns
+        -------
+        GroupMembersResponse
+            Участники группы в алфавитном порядке вместе с ролями
+            и курсор следующей страницы.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если курсор повреждён.
+            - 404 Not Found: если группа не найдена.
+
+        Notes
+        -----
+        - Существование группы проверяется отдельным запросом только
+          для пустой первой страницы.
+        """
+        after = None
+        if cursor is not None:
+            try:
+                surname, client_id = decode_cursor(cursor, 2)
+                after = (surname, UUID(client_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор.",
                 )
-            )
 
-        return ClientsResponse(clients=clients)
+        records = await self.client_repo.get_group_members(
+            group_id, limit=limit + 1, after=after
+        )
+
+        if not records and after is None:
+            if not await self.client_repo.group_exists(group_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Группа с таким uuid не найдена.",
+                )
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = encode_cursor(records[-1].surname, records[-1].id)
+
+        return GroupMembersResponse(
+            members=[
+                GroupMemberModel(
+                    **self._to_compact_client(record).model_dump(), role=record.role
+                )
+                for record in records
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def search_clients(self, query: str, limit: int) -> ClientsResponse:
+        """Ищет клиентов по части ФИО, адреса электронной почты или номера телефона.
+
+        В PostgreSQL поиск выполняется одним запросом по триграммным индексам.
+        В остальных базах данных (например, в тестовой SQLite) используется индекс
+        в памяти процесса `client_search_index`: он строится при первом поиске,
+        после чего база данных запрашивается только за найденными клиентами.
+
+        Parameters
+        ----------
+        query : str
+            Строка поиска: часть фамилии, имени, отчества, адреса электронной почты
+            или цифры номера телефона.
+        limit : int
+            Максимальное количество результатов.
+
+        Returns
+        -------
+        response : ClientsResponse
+            Найденные клиенты в порядке ранжирования (см. `SearchEntry.rank()`),
+            `next_cursor` всегда равен None.
+        """
+        search_query = SearchQuery.parse(query)
+
+        if self.client_repo.supports_trigram_search:
+            records = await self.client_repo.search_clients(search_query, limit)
+        else:
+            if not client_search_index.ready:
+                client_search_index.rebuild(
+                    SearchEntry.create(*row)
+                    for row in await self.client_repo.get_search_entries()
+                )
+
+            client_ids = client_search_index.search(search_query, limit)
+            by_id = {
+                record.id: record
+                for record in await self.client_repo.get_clients_by_ids(client_ids)
+            }
+            records = [
+                by_id[client_id] for client_id in client_ids if client_id in by_id
+            ]
+
+        return ClientsResponse(
+            clients=[self._to_compact_client(record) for record in records]
+        )
+
+    @staticmethod
+    async def stream_all_clients(
+        session_maker: async_sessionmaker, chunk_size: int
+    ) -> AsyncIterator[str]:
+        """Потоковая выдача краткой информации обо всех клиентах в формате NDJSON.
+
+        Открывает собственную сессию, так как сессия запроса закрывается
+        до начала отправки тела потокового ответа. Каждая строка результата
+        сериализуется и отдаётся сразу после получения из серверного курсора.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика асинхронных сессий.
+        chunk_size : int
+            Количество строк, получаемых из курсора за одну итерацию.
+
+        Yields
+        ------
+        line : str
+            JSON-представление `CompactClientModel` с завершающим переводом строки.
+        """
+        async with session_maker() as session:
+            client_repo = ClientRepository(session)
+
+            async for record in client_repo.stream_all_clients(chunk_size):
+                yield ClientService._to_compact_client(record).model_dump_json() + "\n"
+
+    @staticmethod
+    async def export_clients(
+        session_maker: async_sessionmaker,
+        chunk_size: int,
+        export_format: Literal["csv", "columnar"],
+    ) -> AsyncIterator[str]:
+        """Потоковая выгрузка клиентов для отчётности.
+
+        Читает клиентов из серверного курсора порциями по `chunk_size` строк
+        и сериализует каждую порцию сразу после получения, без промежуточных
+        Pydantic-моделей. Объём памяти не зависит от количества клиентов.
+
+        Поддерживаются два формата:
+
+        - ``csv`` — строка заголовка и по одной строке на клиента;
+        - ``columnar`` — NDJSON, где первая строка содержит список столбцов
+          (``{"columns": [...]}``), а каждая следующая — одну порцию в виде
+          словаря «столбец → массив значений».
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика асинхронных сессий.
+        chunk_size : int
+            Количество строк в одной порции.
+        export_format : Literal["csv", "columnar"]
+            Формат выгрузки.
+
+        Yields
+        ------
+        data : str
+            Очередной фрагмент выгрузки.
+        """
+        if export_format == "csv":
+            yield ClientService._to_csv([EXPORT_COLUMNS])
+        else:
+            yield json.dumps({"columns": EXPORT_COLUMNS}) + "\n"
+
+        async with session_maker() as session:
+            client_repo = ClientRepository(session)
+
+            async for rows in client_repo.stream_clients_export(chunk_size):
+                values = [
+                    tuple(
+                        ClientService._export_value(getattr(row, column))
+                        for column in EXPORT_COLUMNS
+                    )
+                    for row in rows
+                ]
+
+                if export_format == "csv":
+                    yield ClientService._to_csv(values)
+                else:
+                    columns = dict(zip(EXPORT_COLUMNS, map(list, zip(*values))))
+                    yield json.dumps(columns, ensure_ascii=False) + "\n"
+
+    @staticmethod
+    def _export_value(value: Any) -> Any:
+        """Приводит значение столбца выгрузки к сериализуемому виду.
+
+        Parameters
+        ----------
+        value : Any
+            Значение из строки результата.
+
+        Returns
+        -------
+        value : Any
+            UUID и даты — строками (даты в ISO 8601), остальные значения без изменений.
+        """
+        if isinstance(value, UUID):
+            return str(value)
+
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+
+        return value
+
+    @staticmethod
+    def _to_csv(rows: List[Tuple]) -> str:
+        """Сериализует строки в CSV.
+
+        Parameters
+        ----------
+        rows : List[Tuple]
+            Строки значений.
+
+        Returns
+        -------
+        data : str
+            Фрагмент CSV. Значения None записываются пустыми полями.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+
+        return buffer.getvalue()
+
+    @staticmethod
+    def _to_search_entry(client_id: UUID, client: Dict[str, Any]) -> SearchEntry:
+        """Преобразует значения столбцов клиента в элемент поискового индекса.
+
+        Parameters
+        ----------
+        client_id : UUID
+            UUID клиента.
+        client : Dict[str, Any]
+            Значения столбцов клиента.
+
+        Returns
+        -------
+        SearchEntry
+            Элемент индекса `client_search_index`.
+        """
+        return SearchEntry.create(
+            client_id,
+            client["surname"],
+            client["name"],
+            client["patronymic"],
+            client["email"],
+            client["phone"],
+        )
+
+    @staticmethod
+    def _to_compact_client(record: Row) -> CompactClientModel:
+        """Преобразует строку проекции репозитория в `CompactClientModel`.
+
+        Parameters
+        ----------
+        record : Row
+            Строка, полученная из ``ClientRepository.get_all_clients()``.
+
+        Returns
+        -------
+        client : CompactClientModel
+            Сокращённая модель клиента.
+        """
+        return CompactClientModel(
+            id=record.id,
+            name=record.name,
+            surname=record.surname,
+            patronymic=record.patronymic,
+            sex=record.sex,
+            email=record.email,
+            phone=record.phone,
+            photo_url=record.photo_url,
+            season_ticket_type=record.season_ticket_type,
+            is_violator=bool(record.is_violator),
+            last_visit=record.last_visit.date() if record.last_visit else None,
+            violation_count=record.violation_count,
+            complaint_count=record.complaint_count,
+        )
 
     async def get_client_by_id(self, client_id: UUID) -> ClientResponse:
         """Получить информацию о клиенте по его UUID.
@@ -108,8 +458,13 @@ class ClientService:
         -------
         HTTPException
             - 404 NOT_FOUND: если клиент с указанным UUID не найден в репозитории.
+
+        Notes
+        -----
+        - Метод выполняет фиксированное число запросов (клиент, его абонементы и группы
+          с количеством участников) независимо от размера групп.
         """
-        client_record = await self.client_repo.get_client_by_id(client_id)
+        client_record = await self.client_repo.get_client_with_season_tickets(client_id)
 
         if client_record is None:
             raise HTTPException(
@@ -117,10 +472,7 @@ class ClientService:
                 detail="Клиент с таким uuid не найден.",
             )
 
-        group_records, season_ticket_records = await asyncio.gather(
-            client_record.awaitable_attrs.groups,
-            client_record.awaitable_attrs.season_tickets,
-        )
+        group_records = await self.client_repo.get_client_groups(client_id)
 
         groups: List[CompactGroupModel] = list()
         for group in group_records:
@@ -128,12 +480,12 @@ class ClientService:
                 CompactGroupModel(
                     id=group.id,
                     type=group.type,
-                    quantity=len(await group.awaitable_attrs.clients),
+                    quantity=group.quantity,
                 )
             )
 
         season_tickets: List[SeasonTicketModel] = list()
-        for season_ticket in season_ticket_records:
+        for season_ticket in client_record.season_tickets:
             season_tickets.append(
                 SeasonTicketModel(
                     id=season_ticket.id,
@@ -186,15 +538,19 @@ class ClientService:
         - Использует `client_repo.add_client()` для сохранения клиента.
         - В случае ошибки вызывает `client_repo.rollback()`.
         - Производит парсинг сообщения об ошибке базы данных для извлечения конфликтующего столбца и значения.
+        - В той же транзакции создаётся пустая строка сводки клиента.
         """
         try:
             client: Client = await self.client_repo.add_client(client_data)
+            await self.client_summary_repo.add_summaries([client.id])
             await self.client_repo.commit()
         except IntegrityError as integrity_error:
             await self.client_repo.rollback()
 
-            if result := re.search(r'"\((.*)\)=\((.*)\)"', str(integrity_error.orig)):
-                column, value = result.groups()
+            if result := parse_unique_violation(
+                integrity_error, client_data.model_dump()
+            ):
+                column, value = result
 
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
@@ -206,18 +562,144 @@ class ClientService:
                 detail="Not enough data in request.",
             )
 
+        client_search_index.put(
+            self._to_search_entry(client.id, client_data.model_dump())
+        )
+        await response_cache.invalidate(CLIENTS_SCOPE)
+        change_feed.publish("client.created", {"id": client.id})
+
         return CreatedResponse(
             message="Клиент создан успешно.",
             id=client.id,
         )
 
+    async def import_clients(
+        self, records: AsyncIterator[Tuple[int, Dict[str, Any] | str]]
+    ) -> ClientsImportResponse:
+        """Пакетно добавляет клиентов из потока записей.
+
+        Записи валидируются схемой `ClientRequest` и записываются порциями
+        по `CLIENTS_IMPORT_CHUNK_SIZE` строк: одна порция — один многострочный INSERT
+        и один коммит. Если порция нарушает ограничения таблицы, она повторяется
+        построчно, чтобы принять корректные строки и сообщить о каждой ошибочной.
+
+        Parameters
+        ----------
+        records : AsyncIterator[Tuple[int, Dict[str, Any] | str]]
+            Поток пар (номер строки, значения полей или текст ошибки разбора),
+            например, результат ``iter_records()``.
+
+        Returns
+        -------
+        ClientsImportResponse
+            Количество добавленных клиентов и отчёт об ошибках по строкам.
+
+        Notes
+        -----
+        - Ошибки уникальности описываются так же, как в `add_client()`.
+        - Уже зафиксированные порции не откатываются при ошибках в последующих.
+        """
+        imported, errors = 0, []
+        chunk: List[Tuple[int, Dict[str, Any]]] = []
+
+        async for number, record in records:
+            if isinstance(record, str):
+                errors.append(RowErrorModel(row=number, detail=record))
+                continue
+
+            try:
+                client_data = ClientRequest.model_validate(record)
+            except ValidationError as validation_error:
+                errors.append(
+                    RowErrorModel(
+                        row=number,
+                        detail="; ".join(
+                            f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                            for error in validation_error.errors()
+                        ),
+                    )
+                )
+                continue
+
+            chunk.append((number, {"id": uuid4(), **client_data.model_dump()}))
+
+            if len(chunk) >= settings.CLIENTS_IMPORT_CHUNK_SIZE:
+                imported += await self._write_clients_chunk(chunk, errors)
+                chunk = []
+
+        if chunk:
+            imported += await self._write_clients_chunk(chunk, errors)
+
+        return ClientsImportResponse(
+            message=f"Импортировано клиентов: {imported}.",
+            imported=imported,
+            failed=len(errors),
+            errors=sorted(errors, key=lambda error: error.row)[
+                : settings.CLIENTS_IMPORT_MAX_ERRORS
+            ],
+        )
+
+    async def _write_clients_chunk(
+        self, chunk: List[Tuple[int, Dict[str, Any]]], errors: List[RowErrorModel]
+    ) -> int:
+        """Записывает порцию клиентов и фиксирует изменения.
+
+        Parameters
+        ----------
+        chunk : List[Tuple[int, Dict[str, Any]]]
+            Пары (номер строки, значения столбцов клиента).
+        errors : List[RowErrorModel]
+            Список, в который добавляются ошибки записи строк.
+
+        Returns
+        -------
+        imported : int
+            Количество записанных клиентов.
+
+        Notes
+        -----
+        - Строки сводки записанных клиентов создаются одним INSERT в той же транзакции.
+        """
+        try:
+            await self.client_repo.add_clients([client for _, client in chunk])
+            client_ids = [client["id"] for _, client in chunk]
+        except IntegrityError:
+            client_ids = []
+
+            for number, client in chunk:
+                try:
+                    await self.client_repo.add_clients([client])
+                    client_ids.append(client["id"])
+                except IntegrityError as integrity_error:
+                    if result := parse_unique_violation(integrity_error, client):
+                        column, value = result
+                        detail = f'User with {column}="{value}" already exists!'
+                    else:
+                        detail = "Not enough data in request."
+
+                    errors.append(RowErrorModel(row=number, detail=detail))
+
+        await self.client_summary_repo.add_summaries(client_ids)
+        await self.client_repo.commit()
+
+        written = set(client_ids)
+        for _, client in chunk:
+            if client["id"] in written:
+                client_search_index.put(self._to_search_entry(client["id"], client))
+
+        if client_ids:
+            await response_cache.invalidate(CLIENTS_SCOPE)
+            change_feed.publish("clients.imported", {"count": len(client_ids)})
+
+        return len(client_ids)
+
     async def update_client(
         self, client_id: UUID, client_data: ClientRequest
     ) -> StandardResponse:
         """Обновляет данные существующего клиента по его UUID.
 
-        Получает текущую запись клиента из базы данных и обновляет её на основе переданных данных.
-        Если клиент с указанным UUID не найден, возбуждает исключение.
+        Обновляет запись одним запросом ``UPDATE ... RETURNING id``, без предварительной
+        загрузки клиента. Если клиент с указанным UUID не найден, возбуждает исключение.
 
         Parameters
         ----------
@@ -240,28 +722,20 @@ class ClientService:
 
         Notes
         -----
-        - Использует `get_client_by_id()` для получения текущих данных клиента.
-        - Все поля из `client_data` переносятся в объект клиента через `setattr`.
+        - Использует `client_repo.update_client()`; все поля из `client_data`
+          записываются одним UPDATE.
         - Транзакция сохраняется вызовом `commit()` в `client_repo`.
         """
-        client_record = await self.client_repo.get_client_by_id(client_id)
-
-        if client_record is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Клиент с таким uuid не найден.",
-            )
-
-        for key, value in client_data.model_dump().items():
-            setattr(client_record, key, value)
-
         try:
+            updated_id = await self.client_repo.update_client(client_id, client_data)
             await self.client_repo.commit()
         except IntegrityError as integrity_error:
             await self.client_repo.rollback()
 
-            if result := re.search(r'"\((.*)\)=\((.*)\)"', str(integrity_error.orig)):
-                column, value = result.groups()
+            if result := parse_unique_violation(
+                integrity_error, client_data.model_dump()
+            ):
+                column, value = result
 
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
@@ -273,6 +747,18 @@ class ClientService:
                 detail="Неизвестная ошибка.",
             )
 
+        if updated_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Клиент с таким uuid не найден.",
+            )
+
+        client_search_index.put(
+            self._to_search_entry(client_id, client_data.model_dump())
+        )
+        await response_cache.invalidate_clients(client_id)
+        change_feed.publish("client.updated", {"id": client_id})
+
         return StandardResponse(message="Данные о клиенте успешно обновлены.")
 
     async def delete_client(self, client_id: UUID) -> StandardResponse:
@@ -313,4 +799,11 @@ class ClientService:
         await self.client_repo.delete_client(client)
         await self.client_repo.commit()
 
+        client_search_index.remove(client_id)
+        ticket_validity_map.invalidate(client_id)
+        await response_cache.invalidate(
+            CLIENTS_SCOPE, client_scope(client_id), GROUPS_SCOPE
+        )
+        change_feed.publish("client.deleted", {"id": client_id})
+
         return StandardResponse(message="Клиент успешно удалён.")
@@ -0,0 +1,34 @@
+from app.database.tables.junctions import Comment
+from app.repositories import CommentRepository
+from app.schemas.comment import CommentModel
+from app.schemas.v1.responses import CommentResponse, CommentsResponse
+from app.services.client_record_service import ClientRecordService, RecordMessages
+
+
+class CommentService(ClientRecordService[Comment]):
+    """Сервисный слой для управления комментариями о клиентах.
+
+    Операции описаны в `ClientRecordService`. Изменять и удалять комментарий
+    может только его автор.
+
+    Attributes
+    ----------
+    record_repo : CommentRepository
+        Репозиторий комментариев, выполняющий прямое взаимодействие с базой данных.
+    """
+
+    field = "comment"
+    page_field = "comments"
+    model = CommentModel
+    response = CommentResponse
+    page_response = CommentsResponse
+    messages = RecordMessages(
+        created="Комментарий успешно добавлен.",
+        updated="Комментарий успешно обновлён.",
+        deleted="Комментарий успешно удалён.",
+        not_found="Комментарий с таким uuid не найден.",
+        forbidden="Изменять комментарий может только его автор.",
+    )
+
+    def __init__(self, comment_repo: CommentRepository):
+        super().__init__(comment_repo)
@@ -0,0 +1,56 @@
+from uuid import UUID
+
+from app.core.response_cache import response_cache
+from app.database.tables.junctions import Complaint
+from app.repositories import ClientSummaryRepository, ComplaintRepository
+from app.schemas.complaint import ComplaintModel
+from app.schemas.v1.responses import ComplaintResponse, ComplaintsResponse
+from app.services.client_record_service import ClientRecordService, RecordMessages
+
+
+class ComplaintService(ClientRecordService[Complaint]):
+    """Сервисный слой для управления жалобами на клиентов.
+
+    Операции описаны в `ClientRecordService`. Изменять и удалять жалобу может
+    только её автор. При добавлении и удалении жалобы в той же транзакции
+    изменяется количество жалоб в сводке по клиентам, а после фиксации
+    сбрасывается кэш ответов клиента.
+
+    Attributes
+    ----------
+    record_repo : ComplaintRepository
+        Репозиторий жалоб, выполняющий прямое взаимодействие с базой данных.
+    client_summary_repo : ClientSummaryRepository
+        Репозиторий сводки по клиентам.
+    """
+
+    field = "complaint"
+    page_field = "complaints"
+    model = ComplaintModel
+    response = ComplaintResponse
+    page_response = ComplaintsResponse
+    messages = RecordMessages(
+        created="Жалоба успешно добавлена.",
+        updated="Жалоба успешно обновлена.",
+        deleted="Жалоба успешно удалена.",
+        not_found="Жалоба с таким uuid не найдена.",
+        forbidden="Изменять жалобу может только её автор.",
+    )
+
+    def __init__(
+        self,
+        complaint_repo: ComplaintRepository,
+        client_summary_repo: ClientSummaryRepository,
+    ):
+        super().__init__(complaint_repo)
+
+        self.client_summary_repo: ClientSummaryRepository = client_summary_repo
+
+    async def _on_added(self, complaint: Complaint):
+        await self.client_summary_repo.change_complaint_count(complaint.client_id, 1)
+
+    async def _on_deleted(self, client_id: UUID):
+        await self.client_summary_repo.change_complaint_count(client_id, -1)
+
+    async def _after_commit(self, client_id: UUID):
+        await response_cache.invalidate_clients(client_id)
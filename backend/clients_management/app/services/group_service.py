@@ -0,0 +1,263 @@
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+from app.core.response_cache import GROUPS_SCOPE, client_scope, response_cache
+from app.database.tables.entities import Group
+from app.repositories import GroupRepository
+from app.schemas.group import CompactGroupModel
+from app.schemas.v1.requests import GroupMemberRequest, GroupRequest
+from app.schemas.v1.responses import (
+    CreatedResponse,
+    GroupResponse,
+    StandardResponse,
+)
+
+
+class GroupService:
+    """Сервисный слой для управления группами клиентов и их составом.
+
+    Отвечает за бизнес-логику создания, изменения и удаления групп,
+    а также добавления и исключения участников. Количество участников хранится
+    в столбце `group.member_count` и изменяется в той же транзакции, что и состав
+    группы, поэтому размер группы никогда не считается по записям участников.
+    Делегирует операции с базой данных репозиторию `GroupRepository`.
+
+    Attributes
+    ----------
+    group_repo : GroupRepository
+        Репозиторий групп, выполняющий прямое взаимодействие с базой данных.
+
+    Methods
+    -------
+    add_group(group_data)
+        Добавляет новую группу.
+    get_group(group_id)
+        Возвращает группу по UUID.
+    update_group(group_id, group_data)
+        Обновляет группу по UUID.
+    delete_group(group_id)
+        Удаляет группу по UUID.
+    add_member(group_id, member_data)
+        Добавляет клиента в группу.
+    remove_member(group_id, client_id)
+        Исключает клиента из группы.
+    """
+
+    def __init__(self, group_repo: GroupRepository):
+        self.group_repo: GroupRepository = group_repo
+
+    async def add_group(self, group_data: GroupRequest) -> CreatedResponse:
+        """Добавляет новую группу.
+
+        Parameters
+        ----------
+        group_data : GroupRequest
+            Данные новой группы.
+
+        Returns
+        -------
+        CreatedResponse
+            Ответ с кодом 201 и UUID созданной группы.
+        """
+        group: Group = await self.group_repo.add_group(group_data)
+        await self.group_repo.commit()
+
+        return CreatedResponse(
+            message="Группа успешно добавлена.",
+            id=group.id,
+        )
+
+    async def get_group(self, group_id: UUID) -> GroupResponse:
+        """Возвращает группу по UUID.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+
+        Returns
+        -------
+        GroupResponse
+            Группа вместе с количеством участников.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если группа не найдена.
+        """
+        group = await self.group_repo.get_group_by_id(group_id)
+
+        if group is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Группа с таким uuid не найдена.",
+            )
+
+        return GroupResponse(
+            group=CompactGroupModel(
+                id=group.id, type=group.type, quantity=group.member_count
+            )
+        )
+
+    async def update_group(
+        self, group_id: UUID, group_data: GroupRequest
+    ) -> StandardResponse:
+        """Обновляет группу по UUID.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        group_data : GroupRequest
+            Новые данные группы.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном обновлении.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если группа с данным UUID не найдена.
+        """
+        if await self.group_repo.update_group(group_id, group_data) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Группа с таким uuid не найдена.",
+            )
+
+        await self.group_repo.commit()
+        await response_cache.invalidate(GROUPS_SCOPE)
+
+        return StandardResponse(message="Данные о группе успешно обновлены.")
+
+    async def delete_group(self, group_id: UUID) -> StandardResponse:
+        """Удаляет группу по UUID вместе со связями с её участниками.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном удалении.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если группа не найдена.
+        """
+        if await self.group_repo.delete_group(group_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Группа с таким uuid не найдена.",
+            )
+
+        await self.group_repo.commit()
+        await response_cache.invalidate(GROUPS_SCOPE)
+
+        return StandardResponse(message="Группа успешно удалена.")
+
+    async def add_member(
+        self, group_id: UUID, member_data: GroupMemberRequest
+    ) -> CreatedResponse:
+        """Добавляет клиента в группу.
+
+        Количество участников увеличивается запросом UPDATE, который блокирует
+        строку группы, а связь записывается запросом ``INSERT ... ON CONFLICT DO NOTHING``.
+        Если клиент уже состоит в группе, транзакция откатывается вместе
+        с изменением количества.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        member_data : GroupMemberRequest
+            Добавляемый клиент и его роль в группе.
+
+        Returns
+        -------
+        CreatedResponse
+            Ответ с кодом 201 и UUID созданной связи.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если группа или клиент не существует.
+            - 409 Conflict: если клиент уже состоит в группе.
+        """
+        try:
+            if await self.group_repo.change_member_count(group_id, 1) is None:
+                await self.group_repo.rollback()
+
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Группа с таким uuid не найдена.",
+                )
+
+            relationship_id = await self.group_repo.add_member(group_id, member_data)
+
+            if relationship_id is None:
+                await self.group_repo.rollback()
+
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Клиент уже состоит в группе.",
+                )
+
+            await self.group_repo.commit()
+        except IntegrityError as _:
+            await self.group_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Клиент с id={member_data.client_id} не найден!",
+            )
+
+        await response_cache.invalidate(
+            GROUPS_SCOPE, client_scope(member_data.client_id)
+        )
+
+        return CreatedResponse(
+            message="Клиент успешно добавлен в группу.",
+            id=relationship_id,
+        )
+
+    async def remove_member(self, group_id: UUID, client_id: UUID) -> StandardResponse:
+        """Исключает клиента из группы.
+
+        Связь удаляется, и количество участников уменьшается в одной транзакции.
+
+        Parameters
+        ----------
+        group_id : UUID
+            Уникальный идентификатор группы.
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном исключении.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если клиент не состоит в группе.
+        """
+        if await self.group_repo.remove_member(group_id, client_id) is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Клиент не состоит в группе.",
+            )
+
+        await self.group_repo.change_member_count(group_id, -1)
+        await self.group_repo.commit()
+        await response_cache.invalidate(GROUPS_SCOPE, client_scope(client_id))
+
+        return StandardResponse(message="Клиент успешно исключён из группы.")
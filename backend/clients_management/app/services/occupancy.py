@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Set
+from uuid import UUID
+
+from app.core.config import Settings, get_settings
+
+settings: Settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class OpenVisit:
+    """Незавершённое посещение в индексе заполненности зала.
+
+    Attributes
+    ----------
+    id : UUID
+        UUID посещения.
+    client_id : UUID
+        UUID клиента.
+    box : int
+        Номер ящика, занятого клиентом.
+    visit_start : datetime
+        Время начала посещения.
+    """
+
+    id: UUID
+    client_id: UUID
+    box: int
+    visit_start: datetime
+
+
+class OccupancyIndex:
+    """Индекс заполненности зала в памяти процесса.
+
+    Хранит незавершённые посещения и занятые ими ящики. Перестраивается из базы данных
+    при запуске приложения и обновляется инкрементально при начале, завершении
+    и удалении посещений, поэтому ответы на вопросы «кто сейчас в зале»
+    и «какие ящики свободны» не требуют запросов к базе данных.
+
+    Attributes
+    ----------
+    box_count : int
+        Количество ящиков в зале (номера от 1 до `box_count`).
+
+    Methods
+    -------
+    rebuild(visits)
+        Заменяет содержимое индекса переданными посещениями.
+    open(visit)
+        Регистрирует начатое посещение.
+    close(visit_id)
+        Убирает завершённое или удалённое посещение.
+    active()
+        Возвращает незавершённые посещения.
+    free_boxes()
+        Возвращает номера свободных ящиков.
+    clear()
+        Очищает индекс.
+
+    Notes
+    -----
+    - Индекс принадлежит процессу: при нескольких воркерах каждый ведёт собственную копию
+      и видит только посещения, изменённые через него после перестроения.
+    """
+
+    def __init__(self, box_count: int):
+        self.box_count: int = box_count
+
+        self._visits: Dict[UUID, OpenVisit] = {}
+        self._box_visits: Dict[int, Set[UUID]] = {}
+        self._free_boxes: Set[int] = set(range(1, box_count + 1))
+
+    @property
+    def occupied_count(self) -> int:
+        """Количество занятых ящиков."""
+        return len(self._box_visits)
+
+    @property
+    def free_count(self) -> int:
+        """Количество свободных ящиков."""
+        return len(self._free_boxes)
+
+    def rebuild(self, visits: Iterable[OpenVisit]):
+        """Заменяет содержимое индекса переданными посещениями.
+
+        Parameters
+        ----------
+        visits : Iterable[OpenVisit]
+            Все незавершённые посещения.
+        """
+        self.clear()
+
+        for visit in visits:
+            self.open(visit)
+
+    def open(self, visit: OpenVisit):
+        """Регистрирует начатое посещение.
+
+        Parameters
+        ----------
+        visit : OpenVisit
+            Начатое посещение.
+        """
+        self.close(visit.id)
+
+        self._visits[visit.id] = visit
+        self._box_visits.setdefault(visit.box, set()).add(visit.id)
+        self._free_boxes.discard(visit.box)
+
+    def close(self, visit_id: UUID):
+        """Убирает завершённое или удалённое посещение.
+
+        Parameters
+        ----------
+        visit_id : UUID
+            UUID посещения. Неизвестные UUID игнорируются.
+        """
+        if (visit := self._visits.pop(visit_id, None)) is None:
+            return
+
+        visits = self._box_visits[visit.box]
+        visits.discard(visit_id)
+
+        if not visits:
+            del self._box_visits[visit.box]
+
+            if 1 <= visit.box <= self.box_count:
+                self._free_boxes.add(visit.box)
+
+    def active(self) -> List[OpenVisit]:
+        """Возвращает незавершённые посещения.
+
+        Returns
+        -------
+        visits : List[OpenVisit]
+            Незавершённые посещения в порядке их начала.
+        """
+        return sorted(self._visits.values(), key=lambda visit: visit.visit_start)
+
+    def free_boxes(self) -> List[int]:
+        """Возвращает номера свободных ящиков.
+
+        Returns
+        -------
+        boxes : List[int]
+            Номера свободных ящиков по возрастанию.
+        """
+        return sorted(self._free_boxes)
+
+    def clear(self):
+        """Очищает индекс."""
+        self._visits.clear()
+        self._box_visits.clear()
+        self._free_boxes = set(range(1, self.box_count + 1))
+
+
+occupancy_index: OccupancyIndex = OccupancyIndex(settings.GYM_BOX_COUNT)
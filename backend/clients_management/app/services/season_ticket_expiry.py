@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from typing import Callable, List
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.repositories import ClientSummaryRepository, SeasonTicketRepository
+from app.schemas.season_ticket import ClientSeasonTicketModel
+from app.services.season_ticket_service import SeasonTicketService
+
+settings: Settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+ExpiryListener = Callable[[List[ClientSeasonTicketModel]], None]
+
+
+class SeasonTicketExpiryScheduler:
+    """Фоновая проверка истёкших абонементов.
+
+    Раз в `interval` секунд помечает истёкшими абонементы, срок действия которых
+    прошёл, порциями по `batch_size` штук, и передаёт каждую порцию подписчикам.
+    Список клиентов при этом не пересчитывает сроки абонементов: он сравнивает
+    срок из сводки по клиентам с текущим временем.
+
+    Attributes
+    ----------
+    interval : float
+        Период проверки в секундах.
+    batch_size : int
+        Количество абонементов, помечаемых одним запросом.
+
+    Methods
+    -------
+    subscribe(listener)
+        Добавляет подписчика на истечение абонементов.
+    run_once(session_maker)
+        Помечает все истёкшие абонементы и оповещает подписчиков.
+    start(session_maker)
+        Запускает периодическую проверку в фоновой задаче.
+    stop()
+        Останавливает фоновую задачу.
+
+    Notes
+    -----
+    - Несколько воркеров могут выполнять проверку одновременно: в PostgreSQL
+      каждый абонемент помечается и передаётся подписчикам ровно одним из них.
+    """
+
+    def __init__(self, interval: float, batch_size: int):
+        self.interval: float = interval
+        self.batch_size: int = batch_size
+
+        self._listeners: List[ExpiryListener] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, listener: ExpiryListener):
+        """Добавляет подписчика на истечение абонементов.
+
+        Parameters
+        ----------
+        listener : ExpiryListener
+            Функция, получающая порцию только что помеченных абонементов.
+        """
+        self._listeners.append(listener)
+
+    async def run_once(self, session_maker: async_sessionmaker) -> int:
+        """Помечает все истёкшие абонементы и оповещает подписчиков.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+
+        Returns
+        -------
+        count : int
+            Количество помеченных абонементов.
+        """
+        count = 0
+
+        while True:
+            async with session_maker() as session:
+                season_ticket_service = SeasonTicketService(
+                    SeasonTicketRepository(session), ClientSummaryRepository(session)
+                )
+                season_tickets = await season_ticket_service.expire_season_tickets(
+                    self.batch_size
+                )
+
+            if season_tickets:
+                count += len(season_tickets)
+                self._emit(season_tickets)
+
+            if len(season_tickets) < self.batch_size:
+                return count
+
+    def start(self, session_maker: async_sessionmaker):
+        """Запускает периодическую проверку в фоновой задаче.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(session_maker))
+
+    async def stop(self):
+        """Останавливает фоновую задачу."""
+        if (task := self._task) is None:
+            return
+
+        self._task = None
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, session_maker: async_sessionmaker):
+        """Выполняет проверку каждые `interval` секунд до остановки."""
+        while True:
+            try:
+                await self.run_once(session_maker)
+            except Exception:
+                logger.exception("Season ticket expiry check failed.")
+
+            await asyncio.sleep(self.interval)
+
+    def _emit(self, season_tickets: List[ClientSeasonTicketModel]):
+        """Передаёт порцию помеченных абонементов подписчикам."""
+        logger.info("Season tickets expired: %d.", len(season_tickets))
+
+        for listener in self._listeners:
+            try:
+                listener(season_tickets)
+            except Exception:
+                logger.exception("Season ticket expiry listener failed.")
+
+
+season_ticket_expiry_scheduler: SeasonTicketExpiryScheduler = (
+    SeasonTicketExpiryScheduler(
+        settings.SEASON_TICKET_EXPIRY_INTERVAL_SECONDS,
+        settings.SEASON_TICKET_EXPIRY_BATCH_SIZE,
+    )
+)
@@ -1,24 +1,40 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 
+from app.core.change_feed import change_feed
+from app.core.response_cache import response_cache
 from app.database.tables.entities import SeasonTicket
-from app.repositories import SeasonTicketRepository
+from app.repositories import ClientSummaryRepository, SeasonTicketRepository
+from app.schemas.season_ticket import ClientSeasonTicketModel
 from app.schemas.v1.requests import SeasonTicketRequest
-from app.schemas.v1.responses import CreatedResponse, StandardResponse
+from app.schemas.v1.responses import (
+    CreatedResponse,
+    SeasonTicketResponse,
+    SeasonTicketsResponse,
+    StandardResponse,
+)
+from app.services.ticket_validity import ticket_validity_map
 
 
 class SeasonTicketService:
     """Сервисный слой для управления абонементами.
 
     Отвечает за бизнес-логику, связанную с созданием, обновлением и удалением абонементов.
-    Делегирует операции с базой данных репозиторию `SeasonTicketRepository`.
+    Делегирует операции с базой данных репозиторию `SeasonTicketRepository`
+    и в той же транзакции пересчитывает абонемент в сводке по клиентам.
+    После коммита новые сроки действия записываются в кэш допуска посещений.
 
     Attributes
     ----------
     season_ticket_repo : SeasonTicketRepository
         Репозиторий абонементов, выполняющий прямое взаимодействие с базой данных.
+    client_summary_repo : ClientSummaryRepository
+        Репозиторий сводки по клиентам.
 
     Methods
     -------
@@ -28,10 +44,21 @@ class SeasonTicketService:
         Обновляет существующий абонемент по UUID.
     delete_season_ticket(season_ticket_id)
         Удаляет абонемент по UUID.
+    get_current_season_ticket(client_id)
+        Возвращает действующий абонемент клиента.
+    get_expiring_season_tickets(within, limit)
+        Возвращает абонементы, срок действия которых скоро истекает.
+    expire_season_tickets(limit)
+        Помечает истёкшими абонементы, срок действия которых прошёл.
     """
 
-    def __init__(self, season_ticket_repo: SeasonTicketRepository):
+    def __init__(
+        self,
+        season_ticket_repo: SeasonTicketRepository,
+        client_summary_repo: ClientSummaryRepository,
+    ):
         self.season_ticket_repo: SeasonTicketRepository = season_ticket_repo
+        self.client_summary_repo: ClientSummaryRepository = client_summary_repo
 
     async def add_season_ticket(
         self, season_ticket_data: SeasonTicketRequest
@@ -61,6 +88,9 @@ class SeasonTicketService:
             season_ticket: SeasonTicket = (
                 await self.season_ticket_repo.add_season_ticket(season_ticket_data)
             )
+            expiries = await self.client_summary_repo.refresh_season_tickets(
+                client_ids=[season_ticket.client_id]
+            )
             await self.season_ticket_repo.commit()
         except IntegrityError as _:
             await self.season_ticket_repo.rollback()
@@ -70,6 +100,13 @@ class SeasonTicketService:
                 detail=f"Клиент с id={season_ticket_data.client_id} не найден!",
             )
 
+        ticket_validity_map.update(expiries)
+        await response_cache.invalidate_clients(season_ticket.client_id)
+        change_feed.publish(
+            "season_ticket.created",
+            {"id": season_ticket.id, "client_id": season_ticket.client_id},
+        )
+
         return CreatedResponse(
             message="Абонемент успешно добавлен.",
             id=season_ticket.id,
@@ -82,8 +119,9 @@ class SeasonTicketService:
     ) -> StandardResponse:
         """Обновляет существующий абонемент по его UUID.
 
-        Находит абонемент по UUID, обновляет поля на основе переданных данных и фиксирует изменения.
-        В случае ошибки базы данных или отсутствия записи выбрасывает соответствующее исключение.
+        Обновляет поля одним запросом ``UPDATE ... RETURNING id``, без предварительной
+        загрузки записи, и фиксирует изменения. В случае ошибки базы данных
+        или отсутствия записи выбрасывает соответствующее исключение.
 
         Parameters
         ----------
@@ -104,20 +142,16 @@ class SeasonTicketService:
             - 500 Internal Server Error: при неизвестной ошибке коммита.
         """
 
-        season_ticket_record = await self.season_ticket_repo.get_season_ticket_by_id(
-            season_ticket_id
-        )
-
-        if season_ticket_record is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Абонемент с таким uuid не найден.",
-            )
-
-        for key, value in season_ticket_data.model_dump().items():
-            setattr(season_ticket_record, key, value)
-
+        expiries = {}
         try:
+            updated_id = await self.season_ticket_repo.update_season_ticket(
+                season_ticket_id, season_ticket_data
+            )
+            if updated_id is not None:
+                expiries = await self.client_summary_repo.refresh_season_tickets(
+                    client_ids=[season_ticket_data.client_id],
+                    season_ticket_ids=[updated_id],
+                )
             await self.season_ticket_repo.commit()
         except Exception as _:
             await self.season_ticket_repo.rollback()
@@ -127,6 +161,19 @@ class SeasonTicketService:
                 detail="Неизвестная ошибка.",
             )
 
+        if updated_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Абонемент с таким uuid не найден.",
+            )
+
+        ticket_validity_map.update(expiries)
+        await response_cache.invalidate_clients(season_ticket_data.client_id)
+        change_feed.publish(
+            "season_ticket.updated",
+            {"id": season_ticket_id, "client_id": season_ticket_data.client_id},
+        )
+
         return StandardResponse(message="Данные об абонементе успешно обновлены.")
 
     async def delete_season_ticket(self, season_ticket_id: UUID) -> StandardResponse:
@@ -162,6 +209,138 @@ class SeasonTicketService:
             )
 
         await self.season_ticket_repo.delete_season_ticket(season_ticket)
+        expiries = await self.client_summary_repo.refresh_season_tickets(
+            client_ids=[season_ticket.client_id]
+        )
         await self.season_ticket_repo.commit()
 
+        ticket_validity_map.update(expiries)
+        await response_cache.invalidate_clients(season_ticket.client_id)
+        change_feed.publish(
+            "season_ticket.deleted",
+            {"id": season_ticket_id, "client_id": season_ticket.client_id},
+        )
+
         return StandardResponse(message="Абонемент успешно удалён.")
+
+    async def get_current_season_ticket(self, client_id: UUID) -> SeasonTicketResponse:
+        """Возвращает действующий абонемент клиента.
+
+        Действующим считается не истёкший абонемент с наибольшим сроком действия.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        SeasonTicketResponse
+            Действующий абонемент клиента.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если у клиента нет действующего абонемента.
+        """
+        season_ticket = await self.season_ticket_repo.get_current_season_ticket(
+            client_id, datetime.now(timezone.utc)
+        )
+
+        if season_ticket is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Действующий абонемент не найден.",
+            )
+
+        return SeasonTicketResponse(
+            season_ticket=self._to_client_season_ticket(season_ticket)
+        )
+
+    async def get_expiring_season_tickets(
+        self, within: timedelta, limit: int
+    ) -> SeasonTicketsResponse:
+        """Возвращает абонементы, срок действия которых скоро истекает.
+
+        Parameters
+        ----------
+        within : timedelta
+            Период от текущего момента, в который должен истечь срок действия.
+        limit : int
+            Максимальное количество абонементов.
+
+        Returns
+        -------
+        SeasonTicketsResponse
+            Абонементы в порядке истечения срока действия.
+        """
+        now = datetime.now(timezone.utc)
+
+        season_tickets = await self.season_ticket_repo.get_expiring_season_tickets(
+            now, now + within, limit
+        )
+
+        return SeasonTicketsResponse(
+            season_tickets=[
+                self._to_client_season_ticket(season_ticket)
+                for season_ticket in season_tickets
+            ]
+        )
+
+    async def expire_season_tickets(self, limit: int) -> List[ClientSeasonTicketModel]:
+        """Помечает истёкшими абонементы, срок действия которых прошёл.
+
+        Parameters
+        ----------
+        limit : int
+            Максимальное количество абонементов, помечаемых за один вызов.
+
+        Returns
+        -------
+        season_tickets : List[ClientSeasonTicketModel]
+            Помеченные абонементы. Если их ровно `limit`, могли остаться непомеченные.
+        """
+        try:
+            rows = await self.season_ticket_repo.mark_expired(
+                datetime.now(timezone.utc), limit
+            )
+            await self.season_ticket_repo.commit()
+        except Exception:
+            await self.season_ticket_repo.rollback()
+            raise
+
+        if rows:
+            await response_cache.invalidate_clients(*{row.client_id for row in rows})
+            change_feed.publish(
+                "season_tickets.expired",
+                {
+                    "ids": [row.id for row in rows],
+                    "client_ids": [row.client_id for row in rows],
+                },
+            )
+
+        return [self._to_client_season_ticket(row) for row in rows]
+
+    @staticmethod
+    def _to_client_season_ticket(
+        season_ticket: SeasonTicket | Row,
+    ) -> ClientSeasonTicketModel:
+        """Преобразует запись абонемента в модель `ClientSeasonTicketModel`.
+
+        Parameters
+        ----------
+        season_ticket : SeasonTicket | Row
+            Запись абонемента или строка с полями `id`, `client_id`, `type`
+            и `expires_at`.
+
+        Returns
+        -------
+        ClientSeasonTicketModel
+            Абонемент вместе с UUID его владельца.
+        """
+        return ClientSeasonTicketModel(
+            id=season_ticket.id,
+            client_id=season_ticket.client_id,
+            type=season_ticket.type,
+            expires_at=season_ticket.expires_at,
+        )
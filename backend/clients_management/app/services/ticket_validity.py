@@ -0,0 +1,112 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Mapping, Set, Tuple
+from uuid import UUID
+
+
+class TicketValidityMap:
+    """Кэш сроков действия абонементов в памяти процесса.
+
+    Хранит для каждого клиента наибольший срок действия его абонементов
+    (None — абонементов нет) в UTC. Заполняется при запуске приложения
+    и обновляется сервисом абонементов после каждого изменения,
+    поэтому допуск клиента в зал обычно не требует запросов к базе данных.
+
+    Methods
+    -------
+    warm(expiries)
+        Заменяет содержимое кэша переданными сроками.
+    lookup(client_ids)
+        Разделяет клиентов на известных кэшу и неизвестных.
+    update(expiries)
+        Записывает актуальные сроки для клиентов.
+    invalidate(client_id)
+        Удаляет клиента из кэша.
+    clear()
+        Очищает кэш.
+
+    Notes
+    -----
+    - Кэш принадлежит процессу: изменения, выполненные другими воркерами,
+      в него не попадают. Поэтому положительный ответ кэша используется сразу,
+      а отрицательный перепроверяется по базе данных перед отказом в допуске.
+    """
+
+    def __init__(self):
+        self._expiries: Dict[UUID, datetime | None] = {}
+
+    def warm(self, expiries: Iterable[Tuple[UUID, datetime | None]]):
+        """Заменяет содержимое кэша переданными сроками.
+
+        Parameters
+        ----------
+        expiries : Iterable[Tuple[UUID, datetime | None]]
+            Пары (UUID клиента, наибольший срок действия его абонементов).
+        """
+        self._expiries = {
+            client_id: self._as_utc(expires_at) for client_id, expires_at in expiries
+        }
+
+    def lookup(
+        self, client_ids: Iterable[UUID]
+    ) -> Tuple[Dict[UUID, datetime | None], Set[UUID]]:
+        """Разделяет клиентов на известных кэшу и неизвестных.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            UUID клиентов.
+
+        Returns
+        -------
+        known : Dict[UUID, datetime | None]
+            Сроки действия абонементов клиентов, известных кэшу.
+        unknown : Set[UUID]
+            UUID клиентов, отсутствующих в кэше.
+        """
+        known, unknown = {}, set()
+
+        for client_id in client_ids:
+            if client_id in self._expiries:
+                known[client_id] = self._expiries[client_id]
+            else:
+                unknown.add(client_id)
+
+        return known, unknown
+
+    def update(self, expiries: Mapping[UUID, datetime | None]):
+        """Записывает актуальные сроки для клиентов.
+
+        Parameters
+        ----------
+        expiries : Mapping[UUID, datetime | None]
+            Наибольшие сроки действия абонементов по UUID клиентов.
+        """
+        self._expiries.update(
+            (client_id, self._as_utc(expires_at))
+            for client_id, expires_at in expiries.items()
+        )
+
+    def invalidate(self, client_id: UUID):
+        """Удаляет клиента из кэша.
+
+        Parameters
+        ----------
+        client_id : UUID
+            UUID клиента. Неизвестный UUID игнорируется.
+        """
+        self._expiries.pop(client_id, None)
+
+    def clear(self):
+        """Очищает кэш."""
+        self._expiries.clear()
+
+    @staticmethod
+    def _as_utc(expires_at: datetime | None) -> datetime | None:
+        """Дополняет время без часового пояса (SQLite) часовым поясом UTC."""
+        if expires_at is not None and expires_at.tzinfo is None:
+            return expires_at.replace(tzinfo=timezone.utc)
+
+        return expires_at
+
+
+ticket_validity_map: TicketValidityMap = TicketValidityMap()
@@ -0,0 +1,302 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, List, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cursor import decode_cursor, encode_cursor
+from app.database.tables.entities import Transaction
+from app.repositories import ClientBalanceRepository, TransactionRepository
+from app.schemas.transaction import TransactionBatchItemModel, TransactionModel
+from app.schemas.v1.requests import TransactionRequest
+from app.schemas.v1.responses import (
+    BalanceResponse,
+    CreatedResponse,
+    TransactionsResponse,
+)
+
+
+class TransactionService:
+    """Сервисный слой для управления транзакциями клиентов.
+
+    Отвечает за бизнес-логику проведения транзакций и поддерживает баланс
+    клиентов в той же транзакции базы данных, в которой записываются
+    сами транзакции. Делегирует операции с базой данных репозиториям
+    `TransactionRepository` и `ClientBalanceRepository`.
+
+    Attributes
+    ----------
+    transaction_repo : TransactionRepository
+        Репозиторий транзакций, выполняющий прямое взаимодействие с базой данных.
+    client_balance_repo : ClientBalanceRepository
+        Репозиторий балансов клиентов.
+
+    Methods
+    -------
+    add_transaction(transaction_data)
+        Проводит транзакцию.
+    add_transactions(transactions_data)
+        Проводит несколько транзакций одной транзакцией базы данных.
+    get_client_transactions(client_id, limit, cursor)
+        Возвращает страницу истории транзакций клиента.
+    get_balance(client_id)
+        Возвращает баланс клиента.
+    compact(snapshot_before, delete_before)
+        Создаёт снимки балансов и удаляет учтённые в них старые транзакции.
+    """
+
+    def __init__(
+        self,
+        transaction_repo: TransactionRepository,
+        client_balance_repo: ClientBalanceRepository,
+    ):
+        self.transaction_repo: TransactionRepository = transaction_repo
+        self.client_balance_repo: ClientBalanceRepository = client_balance_repo
+
+    async def add_transaction(
+        self, transaction_data: TransactionRequest
+    ) -> CreatedResponse:
+        """Проводит транзакцию.
+
+        Parameters
+        ----------
+        transaction_data : TransactionRequest
+            Данные новой транзакции.
+
+        Returns
+        -------
+        CreatedResponse
+            Ответ с кодом 201 и UUID созданной транзакции.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если связанный клиент не существует.
+
+        Notes
+        -----
+        - Баланс клиента изменяется в той же транзакции базы данных.
+        """
+        try:
+            transaction: Transaction = await self.transaction_repo.add_transaction(
+                transaction_data
+            )
+            await self.client_balance_repo.apply_amounts(
+                {transaction.client_id: transaction.amount}
+            )
+            await self.transaction_repo.commit()
+        except IntegrityError as _:
+            await self.transaction_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Клиент с id={transaction_data.client_id} не найден!",
+            )
+
+        return CreatedResponse(
+            message="Транзакция успешно проведена.",
+            id=transaction.id,
+        )
+
+    async def add_transactions(
+        self, transactions_data: List[TransactionRequest]
+    ) -> List[TransactionBatchItemModel]:
+        """Проводит несколько транзакций одной транзакцией базы данных.
+
+        Существование клиентов проверяется одним SELECT, транзакции записываются
+        одним многострочным INSERT, балансы обновляются одним
+        ``INSERT ... ON CONFLICT DO UPDATE`` с суммами по каждому клиенту.
+
+        Parameters
+        ----------
+        transactions_data : List[TransactionRequest]
+            Данные новых транзакций.
+
+        Returns
+        -------
+        items : List[TransactionBatchItemModel]
+            Результаты в порядке запроса: ``created`` или ``not_found``
+            (клиент не существует).
+        """
+        client_ids = await self.transaction_repo.get_existing_client_ids(
+            {transaction_data.client_id for transaction_data in transactions_data}
+        )
+        timestamp = datetime.now(timezone.utc)
+
+        items, transactions = [], []
+        amounts: Dict[UUID, Decimal] = defaultdict(Decimal)
+        for index, transaction_data in enumerate(transactions_data):
+            if transaction_data.client_id not in client_ids:
+                items.append(
+                    TransactionBatchItemModel(index=index, id=None, status="not_found")
+                )
+                continue
+
+            transaction_id = uuid4()
+            transactions.append(
+                {
+                    "id": transaction_id,
+                    "client_id": transaction_data.client_id,
+                    "amount": transaction_data.amount,
+                    "timestamp": timestamp,
+                }
+            )
+            amounts[transaction_data.client_id] += transaction_data.amount
+            items.append(
+                TransactionBatchItemModel(
+                    index=index, id=transaction_id, status="created"
+                )
+            )
+
+        if transactions:
+            try:
+                await self.transaction_repo.add_transactions(transactions)
+                await self.client_balance_repo.apply_amounts(amounts)
+                await self.transaction_repo.commit()
+            except Exception as _:
+                await self.transaction_repo.rollback()
+
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Неизвестная ошибка.",
+                )
+
+        return items
+
+    async def get_client_transactions(
+        self, client_id: UUID, limit: int, cursor: str | None = None
+    ) -> TransactionsResponse:
+        """Возвращает страницу истории транзакций клиента.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        limit : int
+            Размер страницы.
+        cursor : str | None
+            Курсор, полученный вместе с предыдущей страницей.
+
+        Returns
+        -------
+        TransactionsResponse
+            Транзакции от новых к старым и курсор следующей страницы.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если курсор повреждён.
+            - 404 Not Found: если клиент не найден.
+
+        Notes
+        -----
+        - Существование клиента проверяется отдельным запросом только
+          для пустой первой страницы.
+        """
+        after = None
+        if cursor is not None:
+            try:
+                timestamp, transaction_id = decode_cursor(cursor, 2)
+                after = (datetime.fromisoformat(timestamp), UUID(transaction_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор.",
+                )
+
+        transactions = await self.transaction_repo.get_client_transactions(
+            client_id, limit=limit + 1, after=after
+        )
+
+        if not transactions and after is None:
+            await self._ensure_client_exists(client_id)
+
+        next_cursor = None
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            next_cursor = encode_cursor(
+                transactions[-1].timestamp.isoformat(), transactions[-1].id
+            )
+
+        return TransactionsResponse(
+            transactions=[
+                TransactionModel(
+                    id=transaction.id,
+                    amount=transaction.amount,
+                    timestamp=transaction.timestamp,
+                )
+                for transaction in transactions
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def get_balance(self, client_id: UUID) -> BalanceResponse:
+        """Возвращает баланс клиента.
+
+        Баланс читается из одной строки `client_balance` по первичному ключу
+        и не зависит от количества транзакций клиента.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+
+        Returns
+        -------
+        BalanceResponse
+            Баланс клиента. Для клиента без транзакций — ноль.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если клиент не найден.
+        """
+        if (balance := await self.client_balance_repo.get_balance(client_id)) is None:
+            await self._ensure_client_exists(client_id)
+
+            return BalanceResponse(client_id=client_id, balance=Decimal("0.00"))
+
+        return BalanceResponse(
+            client_id=client_id,
+            balance=balance.balance,
+            snapshot_at=balance.snapshot_at,
+        )
+
+    async def compact(
+        self, snapshot_before: datetime, delete_before: datetime | None = None
+    ) -> Tuple[int, int]:
+        """Создаёт снимки балансов и удаляет учтённые в них старые транзакции.
+
+        Parameters
+        ----------
+        snapshot_before : datetime
+            Транзакции раньше этого момента переносятся в снимки балансов.
+        delete_before : datetime | None
+            Транзакции раньше этого момента, уже учтённые в снимках, удаляются.
+            None — транзакции не удаляются.
+
+        Returns
+        -------
+        counts : Tuple[int, int]
+            Количество обновлённых снимков и количество удалённых транзакций.
+        """
+        snapshots = await self.client_balance_repo.take_snapshots(snapshot_before)
+        deleted = 0
+
+        if delete_before is not None:
+            deleted = await self.transaction_repo.delete_compacted(delete_before)
+
+        await self.transaction_repo.commit()
+
+        return snapshots, deleted
+
+    async def _ensure_client_exists(self, client_id: UUID):
+        """Выбрасывает 404, если клиент с переданным UUID не существует."""
+        if not await self.transaction_repo.get_existing_client_ids({client_id}):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Клиент с таким uuid не найден.",
+            )
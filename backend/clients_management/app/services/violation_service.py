@@ -0,0 +1,274 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+from app.core.cursor import decode_cursor, encode_cursor
+from app.core.response_cache import response_cache
+from app.database.tables.entities import Violation
+from app.repositories import ClientSummaryRepository, ViolationRepository
+from app.schemas.v1.requests import ViolationRequest, ViolationUpdateRequest
+from app.schemas.v1.responses import (
+    CreatedResponse,
+    StandardResponse,
+    ViolationResponse,
+    ViolationsResponse,
+)
+from app.schemas.violation import ViolationModel
+
+
+class ViolationService:
+    """Сервисный слой для управления нарушениями клиентов.
+
+    Отвечает за бизнес-логику создания, изменения, удаления и просмотра нарушений.
+    Делегирует операции с базой данных репозиторию `ViolationRepository`
+    и в той же транзакции изменяет количество нарушений в сводке по клиентам,
+    из которой читается признак нарушителя в списке клиентов.
+
+    Attributes
+    ----------
+    violation_repo : ViolationRepository
+        Репозиторий нарушений, выполняющий прямое взаимодействие с базой данных.
+    client_summary_repo : ClientSummaryRepository
+        Репозиторий сводки по клиентам.
+
+    Methods
+    -------
+    add_violation(violation_data)
+        Добавляет новое нарушение.
+    get_violation(violation_id)
+        Возвращает нарушение по UUID.
+    get_client_violations(client_id, limit, cursor)
+        Возвращает страницу нарушений клиента.
+    update_violation(violation_id, violation_data)
+        Обновляет нарушение по UUID.
+    delete_violation(violation_id)
+        Удаляет нарушение по UUID.
+    """
+
+    def __init__(
+        self,
+        violation_repo: ViolationRepository,
+        client_summary_repo: ClientSummaryRepository,
+    ):
+        self.violation_repo: ViolationRepository = violation_repo
+        self.client_summary_repo: ClientSummaryRepository = client_summary_repo
+
+    async def add_violation(self, violation_data: ViolationRequest) -> CreatedResponse:
+        """Добавляет новое нарушение.
+
+        Parameters
+        ----------
+        violation_data : ViolationRequest
+            Данные нового нарушения.
+
+        Returns
+        -------
+        CreatedResponse
+            Ответ с кодом 201 и UUID созданного нарушения.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если связанный клиент не существует.
+        """
+        try:
+            violation: Violation = await self.violation_repo.add_violation(
+                violation_data
+            )
+            await self.client_summary_repo.change_violation_count(
+                violation.client_id, 1
+            )
+            await self.violation_repo.commit()
+        except IntegrityError as _:
+            await self.violation_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Клиент с id={violation_data.client_id} не найден!",
+            )
+
+        await response_cache.invalidate_clients(violation.client_id)
+
+        return CreatedResponse(
+            message="Нарушение успешно добавлено.",
+            id=violation.id,
+        )
+
+    async def get_violation(self, violation_id: UUID) -> ViolationResponse:
+        """Возвращает нарушение по UUID.
+
+        Parameters
+        ----------
+        violation_id : UUID
+            Уникальный идентификатор нарушения.
+
+        Returns
+        -------
+        ViolationResponse
+            Нарушение.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если нарушение не найдено.
+        """
+        violation = await self.violation_repo.get_violation_by_id(violation_id)
+
+        if violation is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Нарушение с таким uuid не найдено.",
+            )
+
+        return ViolationResponse(violation=self._to_violation(violation))
+
+    async def get_client_violations(
+        self, client_id: UUID, limit: int, cursor: str | None = None
+    ) -> ViolationsResponse:
+        """Возвращает страницу нарушений клиента.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        limit : int
+            Размер страницы.
+        cursor : str | None
+            Курсор, полученный вместе с предыдущей страницей.
+
+        Returns
+        -------
+        ViolationsResponse
+            Нарушения от новых к старым и курсор следующей страницы.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если курсор повреждён.
+            - 404 Not Found: если клиент не найден.
+
+        Notes
+        -----
+        - Существование клиента проверяется отдельным запросом только
+          для пустой первой страницы.
+        """
+        after = None
+        if cursor is not None:
+            try:
+                claimed_at, violation_id = decode_cursor(cursor, 2)
+                after = (datetime.fromisoformat(claimed_at), UUID(violation_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор.",
+                )
+
+        violations = await self.violation_repo.get_client_violations(
+            client_id, limit=limit + 1, after=after
+        )
+
+        if not violations and after is None:
+            if not await self.violation_repo.client_exists(client_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Клиент с таким uuid не найден.",
+                )
+
+        next_cursor = None
+        if len(violations) > limit:
+            violations = violations[:limit]
+            next_cursor = encode_cursor(
+                violations[-1].claimed_at.isoformat(), violations[-1].id
+            )
+
+        return ViolationsResponse(
+            violations=[self._to_violation(violation) for violation in violations],
+            next_cursor=next_cursor,
+        )
+
+    async def update_violation(
+        self, violation_id: UUID, violation_data: ViolationUpdateRequest
+    ) -> StandardResponse:
+        """Обновляет нарушение по UUID.
+
+        Обновляет поля одним запросом ``UPDATE ... RETURNING id``, без предварительной
+        загрузки записи. Количество нарушений клиента при этом не меняется.
+
+        Parameters
+        ----------
+        violation_id : UUID
+            Уникальный идентификатор нарушения.
+        violation_data : ViolationUpdateRequest
+            Новые данные нарушения.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном обновлении.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если нарушение с данным UUID не найдено.
+        """
+        updated_id = await self.violation_repo.update_violation(
+            violation_id, violation_data
+        )
+
+        if updated_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Нарушение с таким uuid не найдено.",
+            )
+
+        await self.violation_repo.commit()
+
+        return StandardResponse(message="Данные о нарушении успешно обновлены.")
+
+    async def delete_violation(self, violation_id: UUID) -> StandardResponse:
+        """Удаляет нарушение по UUID.
+
+        Удаляет запись одним запросом ``DELETE ... RETURNING client_id``
+        и в той же транзакции уменьшает количество нарушений клиента.
+
+        Parameters
+        ----------
+        violation_id : UUID
+            Уникальный идентификатор нарушения.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном удалении.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если нарушение не найдено.
+        """
+        client_id = await self.violation_repo.delete_violation(violation_id)
+
+        if client_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Нарушение с таким uuid не найдено.",
+            )
+
+        await self.client_summary_repo.change_violation_count(client_id, -1)
+        await self.violation_repo.commit()
+
+        await response_cache.invalidate_clients(client_id)
+
+        return StandardResponse(message="Нарушение успешно удалено.")
+
+    @staticmethod
+    def _to_violation(violation: Violation) -> ViolationModel:
+        """Преобразует запись нарушения в модель `ViolationModel`."""
+        return ViolationModel(
+            id=violation.id,
+            client_id=violation.client_id,
+            detail=violation.detail,
+            claimed_at=violation.claimed_at,
+        )
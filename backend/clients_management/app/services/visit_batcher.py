@@ -0,0 +1,117 @@
+import asyncio
+from typing import List, Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.repositories import ClientSummaryRepository, VisitRepository
+from app.schemas.v1.requests import VisitRequest
+from app.schemas.visit import VisitBatchItemModel
+from app.services.visit_service import VisitService
+
+settings: Settings = get_settings()
+
+
+class VisitStartBatcher:
+    """Объединяет одиночные запросы начала посещения в пакетную запись.
+
+    Первый запрос открывает окно длительностью `window` секунд. Все запросы,
+    поступившие в течение окна, записываются одной транзакцией через
+    ``VisitService.start_visits()``. Если накоплено `max_size` запросов,
+    запись выполняется сразу.
+
+    Attributes
+    ----------
+    window : float
+        Длительность окна накопления в секундах.
+    max_size : int
+        Количество запросов, при котором окно закрывается досрочно.
+
+    Methods
+    -------
+    submit(session_maker, visit_data)
+        Добавляет запрос в текущий пакет и ожидает результата его записи.
+
+    Notes
+    -----
+    - Пакет принадлежит процессу: запросы разных воркеров не объединяются.
+    """
+
+    def __init__(self, window: float, max_size: int):
+        self.window: float = window
+        self.max_size: int = max_size
+
+        self._pending: List[Tuple[VisitRequest, asyncio.Future]] = []
+        self._timer: asyncio.Task | None = None
+        self._session_maker: async_sessionmaker | None = None
+
+    async def submit(
+        self, session_maker: async_sessionmaker, visit_data: VisitRequest
+    ) -> VisitBatchItemModel:
+        """Добавляет запрос в текущий пакет и ожидает результата его записи.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий, через которую будет записан пакет.
+        visit_data : VisitRequest
+            Данные нового посещения.
+
+        Returns
+        -------
+        item : VisitBatchItemModel
+            Результат записи этого посещения.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        self._pending.append((visit_data, future))
+        self._session_maker = session_maker
+
+        if len(self._pending) >= self.max_size:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            asyncio.create_task(self._flush())
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+        return await future
+
+    async def _flush_later(self):
+        """Записывает пакет по окончании окна накопления."""
+        await asyncio.sleep(self.window)
+
+        self._timer = None
+        await self._flush()
+
+    async def _flush(self):
+        """Записывает накопленные запросы и передаёт результаты ожидающим."""
+        batch, self._pending = self._pending, []
+
+        if not batch:
+            return
+
+        try:
+            async with self._session_maker() as session:
+                visit_service = VisitService(
+                    VisitRepository(session), ClientSummaryRepository(session)
+                )
+                items = await visit_service.start_visits(
+                    [visit_data for visit_data, _ in batch]
+                )
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+
+            return
+
+        for (_, future), item in zip(batch, items):
+            if not future.done():
+                future.set_result(item)
+
+
+visit_start_batcher: VisitStartBatcher = VisitStartBatcher(
+    settings.VISITS_MICRO_BATCH_WINDOW_MS / 1000, settings.VISITS_MICRO_BATCH_MAX_SIZE
+)
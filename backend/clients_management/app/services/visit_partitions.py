@@ -0,0 +1,102 @@
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import Settings, get_settings
+from app.repositories import ClientSummaryRepository, VisitRepository
+from app.services.visit_service import VisitService
+
+settings: Settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class VisitPartitionScheduler:
+    """Фоновое создание помесячных секций таблицы посещений.
+
+    Раз в `interval` секунд создаёт секции на текущий месяц и `months_ahead`
+    следующих, поэтому долго работающий процесс не начинает складывать новые
+    посещения в секцию по умолчанию.
+
+    Attributes
+    ----------
+    interval : float
+        Период в секундах.
+    months_ahead : int
+        Количество будущих месяцев, для которых создаются секции.
+
+    Methods
+    -------
+    run_once(session_maker)
+        Создаёт недостающие секции.
+    start(session_maker)
+        Запускает периодическое выполнение в фоновой задаче.
+    stop()
+        Останавливает фоновую задачу.
+
+    Notes
+    -----
+    - Первый запуск выполняется через `interval` секунд: при запуске приложения
+      секции создаются в `lifespan` до приёма запросов.
+    """
+
+    def __init__(self, interval: float, months_ahead: int):
+        self.interval: float = interval
+        self.months_ahead: int = months_ahead
+
+        self._task: asyncio.Task | None = None
+
+    async def run_once(self, session_maker: async_sessionmaker):
+        """Создаёт недостающие секции.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+        """
+        async with session_maker() as session:
+            visit_service = VisitService(
+                VisitRepository(session), ClientSummaryRepository(session)
+            )
+            await visit_service.maintain_partitions(self.months_ahead)
+
+    def start(self, session_maker: async_sessionmaker):
+        """Запускает периодическое выполнение в фоновой задаче.
+
+        Parameters
+        ----------
+        session_maker : async_sessionmaker
+            Фабрика сессий базы данных.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(session_maker))
+
+    async def stop(self):
+        """Останавливает фоновую задачу."""
+        if (task := self._task) is None:
+            return
+
+        self._task = None
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, session_maker: async_sessionmaker):
+        """Создаёт секции каждые `interval` секунд до остановки."""
+        while True:
+            await asyncio.sleep(self.interval)
+
+            try:
+                await self.run_once(session_maker)
+            except Exception:
+                logger.exception("Visit partition maintenance failed.")
+
+
+visit_partition_scheduler: VisitPartitionScheduler = VisitPartitionScheduler(
+    settings.VISIT_PARTITIONS_INTERVAL_SECONDS,
+    settings.VISIT_PARTITIONS_AHEAD,
+)
@@ -0,0 +1,646 @@
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+from app.core.change_feed import change_feed
+from app.core.config import Settings, get_settings
+from app.core.cursor import decode_cursor, encode_cursor
+from app.core.idempotency import idempotency_store
+from app.core.response_cache import response_cache
+from app.database.tables.entities import Visit
+from app.repositories import ClientSummaryRepository, VisitRepository
+from app.schemas.v1.requests import VisitRequest
+from app.schemas.v1.responses import (
+    ActiveVisitsResponse,
+    CreatedResponse,
+    FreeBoxesResponse,
+    StandardResponse,
+    VisitsResponse,
+)
+from app.schemas.visit import ActiveVisitModel, VisitBatchItemModel, VisitModel
+from app.services.occupancy import OpenVisit, occupancy_index
+from app.services.ticket_validity import ticket_validity_map
+
+settings: Settings = get_settings()
+
+
+class VisitService:
+    """Сервисный слой для управления посещениями.
+
+    Отвечает за бизнес-логику начала, завершения и удаления посещений,
+    а также поддерживает индекс заполненности зала и последнее посещение
+    в сводке по клиентам в актуальном состоянии. Если включена настройка
+    `VISITS_REQUIRE_SEASON_TICKET`, в зал допускаются только клиенты
+    с действующим абонементом.
+    Делегирует операции с базой данных репозиторию `VisitRepository`.
+
+    Attributes
+    ----------
+    visit_repo : VisitRepository
+        Репозиторий посещений, выполняющий прямое взаимодействие с базой данных.
+    client_summary_repo : ClientSummaryRepository
+        Репозиторий сводки по клиентам.
+
+    Methods
+    -------
+    start_visit(visit_data)
+        Регистрирует начало посещения.
+    end_visit(visit_id, idempotency_key)
+        Завершает посещение.
+    delete_visit(visit_id)
+        Удаляет посещение.
+    start_visits(visits_data)
+        Регистрирует начало нескольких посещений одной транзакцией.
+    end_visits(visit_ids)
+        Завершает несколько посещений одной транзакцией.
+    get_active_visits()
+        Возвращает незавершённые посещения из индекса заполненности.
+    get_free_boxes()
+        Возвращает свободные ящики из индекса заполненности.
+    get_client_visits(client_id, since, until, limit, cursor)
+        Возвращает страницу истории посещений клиента.
+    rebuild_occupancy()
+        Перестраивает индекс заполненности по данным базы данных.
+    rebuild_ticket_validity()
+        Заполняет кэш сроков действия абонементов по сводке по клиентам.
+    maintain_partitions(months_ahead)
+        Создаёт секции таблицы посещений на ближайшие месяцы.
+    """
+
+    def __init__(
+        self,
+        visit_repo: VisitRepository,
+        client_summary_repo: ClientSummaryRepository,
+    ):
+        self.visit_repo: VisitRepository = visit_repo
+        self.client_summary_repo: ClientSummaryRepository = client_summary_repo
+
+    async def start_visit(self, visit_data: VisitRequest) -> CreatedResponse:
+        """Регистрирует начало посещения.
+
+        Parameters
+        ----------
+        visit_data : VisitRequest
+            Данные нового посещения.
+
+        Returns
+        -------
+        CreatedResponse
+            Ответ с кодом 201 и UUID созданного посещения.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если связанный клиент не существует.
+            - 403 Forbidden: если у клиента нет действующего абонемента.
+
+        Notes
+        -----
+        - Посещение попадает в индекс заполненности только после успешного коммита.
+        - Последнее посещение клиента в сводке обновляется в той же транзакции.
+        """
+        rejections = await self._check_season_tickets([visit_data.client_id])
+
+        if (rejection := rejections.get(visit_data.client_id)) is not None:
+            item_status, detail = rejection
+
+            raise HTTPException(
+                status_code=(
+                    status.HTTP_404_NOT_FOUND
+                    if item_status == "not_found"
+                    else status.HTTP_403_FORBIDDEN
+                ),
+                detail=detail,
+            )
+
+        try:
+            visit: Visit = await self.visit_repo.add_visit(visit_data)
+            await self.client_summary_repo.record_visit_start(
+                [visit.client_id], visit.visit_start
+            )
+            await self.visit_repo.commit()
+        except IntegrityError as _:
+            await self.visit_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Клиент с id={visit_data.client_id} не найден!",
+            )
+
+        occupancy_index.open(open_visit := self._to_open_visit(visit))
+        await response_cache.invalidate_clients(visit.client_id)
+        change_feed.publish("visit.started", asdict(open_visit))
+
+        return CreatedResponse(
+            message="Посещение успешно зарегистрировано.",
+            id=visit.id,
+        )
+
+    async def end_visit(
+        self, visit_id: UUID, idempotency_key: str | None = None
+    ) -> StandardResponse:
+        """Завершает посещение.
+
+        Посещение закрывается одним запросом
+        ``UPDATE ... WHERE id = :id AND visit_end IS NULL RETURNING id``,
+        без предварительной загрузки записи. Дополнительный SELECT выполняется
+        только если UPDATE не затронул ни одной строки — чтобы отличить
+        несуществующее посещение от уже завершённого.
+
+        Parameters
+        ----------
+        visit_id : UUID
+            Уникальный идентификатор посещения.
+        idempotency_key : str | None
+            Ключ идемпотентности. Повторный запрос с тем же ключом получает
+            исходный ответ вместо ошибки 409.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном завершении.
+
+        Raises
+        ------
+        HTTPException
+            - 404 Not Found: если посещение не найдено.
+            - 409 Conflict: если посещение уже завершено.
+            - 500 Internal Server Error: при неизвестной ошибке коммита.
+        """
+        key = f"visits.end:{visit_id}:{idempotency_key}" if idempotency_key else None
+
+        if key is not None and (response := idempotency_store.get(key)) is not None:
+            return response
+
+        try:
+            ended = await self.visit_repo.end_visits(
+                {visit_id}, datetime.now(timezone.utc)
+            )
+            await self.visit_repo.commit()
+        except Exception as _:
+            await self.visit_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Неизвестная ошибка.",
+            )
+
+        if not ended:
+            if await self.visit_repo.get_visit_by_id(visit_id) is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Посещение с таким UUID не найдено.",
+                )
+
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Посещение уже завершено.",
+            )
+
+        occupancy_index.close(visit_id)
+        change_feed.publish("visit.ended", {"id": visit_id})
+
+        response = StandardResponse(message="Посещение успешно завершено.")
+
+        if key is not None:
+            idempotency_store.put(key, response)
+
+        return response
+
+    async def delete_visit(self, visit_id: UUID) -> StandardResponse:
+        """Удаляет посещение.
+
+        Parameters
+        ----------
+        visit_id : UUID
+            Уникальный идентификатор посещения.
+
+        Returns
+        -------
+        StandardResponse
+            Ответ с кодом 200 и сообщением об успешном удалении.
+
+        Raises
+        ------
+        HTTPException
+            - 500 Internal Server Error: при неизвестной ошибке коммита.
+
+        Notes
+        -----
+        - Последнее посещение клиента в сводке пересчитывается в той же транзакции.
+        """
+        if (client_id := await self.visit_repo.delete_visit(visit_id)) is not None:
+            await self.client_summary_repo.refresh_last_visit([client_id])
+
+        try:
+            await self.visit_repo.commit()
+        except Exception as _:
+            await self.visit_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Неизвестная ошибка.",
+            )
+
+        occupancy_index.close(visit_id)
+
+        if client_id is not None:
+            await response_cache.invalidate_clients(client_id)
+            change_feed.publish(
+                "visit.deleted", {"id": visit_id, "client_id": client_id}
+            )
+
+        return StandardResponse(message="Посещение успешно удалено.")
+
+    async def start_visits(
+        self, visits_data: List[VisitRequest]
+    ) -> List[VisitBatchItemModel]:
+        """Регистрирует начало нескольких посещений одной транзакцией.
+
+        Существование клиентов проверяется одним SELECT, посещения записываются
+        одним многострочным INSERT, последнее посещение в сводке по клиентам
+        обновляется одним UPDATE.
+
+        Parameters
+        ----------
+        visits_data : List[VisitRequest]
+            Данные новых посещений.
+
+        Returns
+        -------
+        items : List[VisitBatchItemModel]
+            Результаты в порядке запроса: ``started``, ``not_found``
+            (клиент не существует), ``no_season_ticket`` или ``season_ticket_expired``
+            (у клиента нет действующего абонемента).
+        """
+        client_ids = await self.visit_repo.get_existing_client_ids(
+            {visit_data.client_id for visit_data in visits_data}
+        )
+        rejections = await self._check_season_tickets(client_ids)
+        visit_start = datetime.now(timezone.utc)
+
+        items, visits = [], []
+        for index, visit_data in enumerate(visits_data):
+            if visit_data.client_id not in client_ids:
+                items.append(
+                    VisitBatchItemModel(index=index, id=None, status="not_found")
+                )
+                continue
+
+            if (rejection := rejections.get(visit_data.client_id)) is not None:
+                item_status, detail = rejection
+                items.append(
+                    VisitBatchItemModel(
+                        index=index, id=None, status=item_status, detail=detail
+                    )
+                )
+                continue
+
+            visit = OpenVisit(
+                id=uuid4(),
+                client_id=visit_data.client_id,
+                box=visit_data.box,
+                visit_start=visit_start,
+            )
+            visits.append(visit)
+            items.append(
+                VisitBatchItemModel(index=index, id=visit.id, status="started")
+            )
+
+        if visits:
+            try:
+                await self.visit_repo.add_visits(
+                    [
+                        {
+                            "id": visit.id,
+                            "client_id": visit.client_id,
+                            "box": visit.box,
+                            "visit_start": visit.visit_start,
+                        }
+                        for visit in visits
+                    ]
+                )
+                await self.client_summary_repo.record_visit_start(
+                    {visit.client_id for visit in visits}, visit_start
+                )
+                await self.visit_repo.commit()
+            except Exception as _:
+                await self.visit_repo.rollback()
+
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Неизвестная ошибка.",
+                )
+
+        for visit in visits:
+            occupancy_index.open(visit)
+
+        if visits:
+            await response_cache.invalidate_clients(
+                *{visit.client_id for visit in visits}
+            )
+            change_feed.publish(
+                "visits.started", {"visits": [asdict(visit) for visit in visits]}
+            )
+
+        return items
+
+    async def end_visits(self, visit_ids: List[UUID]) -> List[VisitBatchItemModel]:
+        """Завершает несколько посещений одной транзакцией.
+
+        Открытые посещения закрываются одним UPDATE. Для остальных UUID
+        одним SELECT определяется, существуют ли они.
+
+        Parameters
+        ----------
+        visit_ids : List[UUID]
+            UUID завершаемых посещений.
+
+        Returns
+        -------
+        items : List[VisitBatchItemModel]
+            Результаты в порядке запроса: ``ended``, ``already_ended`` или ``not_found``.
+            Повторяющийся в запросе UUID завершается один раз, остальные его вхождения
+            получают ``already_ended``.
+        """
+        try:
+            ended = await self.visit_repo.end_visits(
+                set(visit_ids), datetime.now(timezone.utc)
+            )
+            await self.visit_repo.commit()
+        except Exception as _:
+            await self.visit_repo.rollback()
+
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Неизвестная ошибка.",
+            )
+
+        rest = set(visit_ids) - ended
+        existing = await self.visit_repo.get_existing_visit_ids(rest) if rest else set()
+
+        items, seen = [], set()
+        for index, visit_id in enumerate(visit_ids):
+            if visit_id in ended and visit_id not in seen:
+                item_status = "ended"
+            elif visit_id in ended or visit_id in existing:
+                item_status = "already_ended"
+            else:
+                item_status = "not_found"
+
+            seen.add(visit_id)
+            items.append(
+                VisitBatchItemModel(index=index, id=visit_id, status=item_status)
+            )
+
+        for visit_id in ended:
+            occupancy_index.close(visit_id)
+
+        if ended:
+            change_feed.publish("visits.ended", {"ids": sorted(ended)})
+
+        return items
+
+    @staticmethod
+    def get_active_visits() -> ActiveVisitsResponse:
+        """Возвращает незавершённые посещения из индекса заполненности.
+
+        Returns
+        -------
+        ActiveVisitsResponse
+            Незавершённые посещения в порядке их начала.
+
+        Notes
+        -----
+        - Запросы к базе данных не выполняются.
+        """
+        return ActiveVisitsResponse(
+            visits=[
+                ActiveVisitModel(
+                    id=visit.id,
+                    client_id=visit.client_id,
+                    box=visit.box,
+                    visit_start=visit.visit_start,
+                )
+                for visit in occupancy_index.active()
+            ]
+        )
+
+    @staticmethod
+    def get_free_boxes() -> FreeBoxesResponse:
+        """Возвращает свободные ящики из индекса заполненности.
+
+        Returns
+        -------
+        FreeBoxesResponse
+            Номера свободных ящиков, общее количество ящиков и количество занятых.
+
+        Notes
+        -----
+        - Запросы к базе данных не выполняются.
+        """
+        return FreeBoxesResponse(
+            boxes=occupancy_index.free_boxes(),
+            total=occupancy_index.box_count,
+            occupied=occupancy_index.occupied_count,
+        )
+
+    async def get_client_visits(
+        self,
+        client_id: UUID,
+        since: datetime | None,
+        until: datetime | None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> VisitsResponse:
+        """Возвращает страницу истории посещений клиента.
+
+        Parameters
+        ----------
+        client_id : UUID
+            Уникальный идентификатор клиента.
+        since : datetime | None
+            Нижняя граница времени начала посещения (включительно).
+        until : datetime | None
+            Верхняя граница времени начала посещения (не включительно).
+        limit : int
+            Размер страницы.
+        cursor : str | None
+            Курсор, полученный вместе с предыдущей страницей.
+
+        Returns
+        -------
+        VisitsResponse
+            Посещения от новых к старым и курсор следующей страницы.
+
+        Raises
+        ------
+        HTTPException
+            - 400 Bad Request: если курсор повреждён.
+            - 404 Not Found: если клиент не найден.
+
+        Notes
+        -----
+        - Существование клиента проверяется отдельным запросом только для пустой первой страницы.
+        """
+        after = None
+        if cursor is not None:
+            try:
+                visit_start, visit_id = decode_cursor(cursor, 2)
+                after = (datetime.fromisoformat(visit_start), UUID(visit_id))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Некорректный курсор.",
+                )
+
+        visits = await self.visit_repo.get_client_visits(
+            client_id, since=since, until=until, limit=limit + 1, after=after
+        )
+
+        if not visits and after is None:
+            if not await self.visit_repo.get_existing_client_ids({client_id}):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Клиент с таким uuid не найден.",
+                )
+
+        next_cursor = None
+        if len(visits) > limit:
+            visits = visits[:limit]
+            next_cursor = encode_cursor(
+                visits[-1].visit_start.isoformat(), visits[-1].id
+            )
+
+        return VisitsResponse(
+            visits=[
+                VisitModel(
+                    id=visit.id,
+                    box=visit.box,
+                    visit_start=visit.visit_start,
+                    visit_end=visit.visit_end,
+                )
+                for visit in visits
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def rebuild_occupancy(self):
+        """Перестраивает индекс заполненности по данным базы данных.
+
+        Вызывается при запуске приложения. Незавершённые посещения выбираются
+        по частичному индексу `visit_open_idx`.
+        """
+        visits = await self.visit_repo.get_open_visits()
+
+        occupancy_index.rebuild(self._to_open_visit(visit) for visit in visits)
+
+    async def rebuild_ticket_validity(self):
+        """Заполняет кэш сроков действия абонементов по сводке по клиентам.
+
+        Вызывается при запуске приложения, чтобы допуск клиентов в зал
+        не требовал запросов к базе данных.
+        """
+        expiries = await self.client_summary_repo.get_season_ticket_expiries()
+
+        ticket_validity_map.warm(expiries.items())
+
+    async def maintain_partitions(self, months_ahead: int):
+        """Создаёт секции таблицы посещений на ближайшие месяцы.
+
+        Вызывается при запуске приложения и периодически `VisitPartitionScheduler`,
+        чтобы новые посещения попадали в помесячные секции, а не в секцию по умолчанию.
+
+        Parameters
+        ----------
+        months_ahead : int
+            Количество будущих месяцев, для которых создаются секции.
+        """
+        await self.visit_repo.ensure_partitions(months_ahead)
+        await self.visit_repo.commit()
+
+    async def _check_season_tickets(
+        self, client_ids: Iterable[UUID]
+    ) -> Dict[UUID, Tuple[str, str]]:
+        """Проверяет, есть ли у клиентов действующие абонементы.
+
+        Сначала сроки действия берутся из кэша `ticket_validity_map`. Клиенты,
+        которых нет в кэше или которым кэш отказывает в допуске, перепроверяются
+        одним SELECT по сводке по клиентам, и кэш обновляется результатом.
+
+        Parameters
+        ----------
+        client_ids : Iterable[UUID]
+            UUID клиентов.
+
+        Returns
+        -------
+        rejections : Dict[UUID, Tuple[str, str]]
+            Статус и причина отказа по UUID не допущенных клиентов.
+            Пусто, если настройка `VISITS_REQUIRE_SEASON_TICKET` выключена.
+        """
+        if not settings.VISITS_REQUIRE_SEASON_TICKET:
+            return {}
+
+        now = datetime.now(timezone.utc)
+
+        expiries, unknown = ticket_validity_map.lookup(client_ids)
+        stale = unknown | {
+            client_id
+            for client_id, expires_at in expiries.items()
+            if expires_at is None or expires_at <= now
+        }
+
+        if stale:
+            fresh = await self.client_summary_repo.get_season_ticket_expiries(stale)
+
+            for client_id in stale - fresh.keys():
+                ticket_validity_map.invalidate(client_id)
+                expiries.pop(client_id, None)
+
+            ticket_validity_map.update(fresh)
+            expiries.update(ticket_validity_map.lookup(fresh)[0])
+
+        rejections = {
+            client_id: ("not_found", f"Клиент с id={client_id} не найден!")
+            for client_id in stale - expiries.keys()
+        }
+        for client_id, expires_at in expiries.items():
+            if expires_at is None:
+                rejections[client_id] = (
+                    "no_season_ticket",
+                    f"У клиента с id={client_id} нет абонемента!",
+                )
+            elif expires_at <= now:
+                rejections[client_id] = (
+                    "season_ticket_expired",
+                    f"Абонемент клиента с id={client_id} истёк "
+                    f"{expires_at.astimezone(timezone.utc):%d.%m.%Y %H:%M} UTC!",
+                )
+
+        return rejections
+
+    @staticmethod
+    def _to_open_visit(visit: Visit) -> OpenVisit:
+        """Преобразует запись посещения в элемент индекса заполненности.
+
+        Parameters
+        ----------
+        visit : Visit
+            Запись посещения.
+
+        Returns
+        -------
+        OpenVisit
+            Элемент индекса заполненности.
+        """
+        return OpenVisit(
+            id=visit.id,
+            client_id=visit.client_id,
+            box=visit.box,
+            visit_start=visit.visit_start,
+        )
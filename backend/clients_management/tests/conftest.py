@@ -1,22 +1,69 @@
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
-from app.api.dependencies.session import get_session
+from app.api.dependencies.session import get_session, get_session_maker
+from app.core.change_feed import change_feed
 from app.core.config import Settings, get_settings
+from app.core.idempotency import idempotency_store
+from app.core.metrics import request_metrics
+from app.core.query_budget import query_budget_guard
+from app.core.response_cache import response_cache
+from app.core.search import client_search_index
+from app.core.token_cache import access_token_cache
 from app.main import clients_management
-from tests.override import override_get_session, override_initialize
+from app.services.occupancy import occupancy_index
+from app.services.ticket_validity import ticket_validity_map
+from tests.override import (
+    override_get_session,
+    override_get_session_maker,
+    override_initialize,
+    test_engine,
+)
 
 settings: Settings = get_settings()
 
+query_budget_guard.mode = "raise"
+
 
 @pytest_asyncio.fixture
 async def async_client():
     await override_initialize()
+    access_token_cache.clear()
+    occupancy_index.clear()
+    idempotency_store.clear()
+    await response_cache.clear()
+    client_search_index.clear()
+    ticket_validity_map.clear()
+    change_feed.clear()
+    request_metrics.clear()
+    query_budget_guard.clear()
 
     clients_management.dependency_overrides[get_session] = override_get_session
+    clients_management.dependency_overrides[get_session_maker] = (
+        override_get_session_maker
+    )
 
     async with AsyncClient(
         transport=ASGITransport(app=clients_management),
         base_url=f"http://127.0.0.1:8000/{settings.CURRENT_API_URL}",
     ) as client:
         yield client
+
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def auth_headers(async_client):
+    await async_client.post(
+        "/auth/sign_up",
+        json={
+            "username": "desk_user",
+            "email": "desk@example.com",
+            "password": "DeskPass",
+        },
+    )
+    sign_in = await async_client.post(
+        "/auth/sign_in", data={"username": "desk_user", "password": "DeskPass"}
+    )
+
+    return {"Authorization": f"Bearer {sign_in.json()['access_token']}"}
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from app.core.config import Settings, get_settings
+from app.core.metrics import request_metrics
 
 settings: Settings = get_settings()
 
@@ -9,6 +10,7 @@ test_engine: AsyncEngine = create_async_engine(
     echo=False,
     pool_pre_ping=True,
 )
+request_metrics.instrument(test_engine)
 
 from .initialize import override_initialize
-from .session import override_get_session
+from .session import override_get_session, override_get_session_maker
@@ -20,3 +20,16 @@ async def override_get_session() -> AsyncSession:
     """
     async with TestAsyncSessionMaker() as test_session:
         yield test_session
+
+
+async def override_get_session_maker() -> async_sessionmaker:
+    """Возвращает фабрику асинхронных сессий тестовой базы данных.
+
+    Используется для переопределения подобной общей зависимости для изоляции тестов.
+
+    Returns
+    -------
+    session_maker : async_sessionmaker
+        Фабрика асинхронных сессий тестовой базы данных.
+    """
+    return TestAsyncSessionMaker
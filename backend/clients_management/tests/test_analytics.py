@@ -0,0 +1,211 @@
+import os
+import random
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import insert
+
+from app.database.tables.entities import Transaction, Visit
+from app.repositories import AnalyticsRepository
+from app.services import AnalyticsRollupScheduler, AnalyticsService
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import create_client
+
+BENCHMARK_VISITS = int(os.environ.get("ANALYTICS_BENCHMARK_VISITS", 100_000))
+
+
+async def insert_rows(entity, rows):
+    async with TestAsyncSessionMaker() as session:
+        for offset in range(0, len(rows), 10_000):
+            await session.execute(insert(entity), rows[offset : offset + 10_000])
+        await session.commit()
+
+
+def visit_rows(client_id: UUID, starts_and_boxes):
+    return [
+        {"id": uuid4(), "client_id": client_id, "visit_start": start, "box": box}
+        for start, box in starts_and_boxes
+    ]
+
+
+def transaction_rows(client_id: UUID, timestamps_and_amounts):
+    return [
+        {"id": uuid4(), "client_id": client_id, "timestamp": moment, "amount": amount}
+        for moment, amount in timestamps_and_amounts
+    ]
+
+
+async def get_report(async_client, auth_headers, path: str, **params):
+    response = await async_client.get(
+        f"/analytics/{path}", params=params, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_rollups_are_incremental(async_client, auth_headers):
+    client_id = UUID(await create_client(async_client, auth_headers, "Аналитик", 0))
+    scheduler = AnalyticsRollupScheduler(interval=0, lag=timedelta(0))
+
+    # понедельник 2 июня и вторник 3 июня 2025 года
+    monday = datetime(2025, 6, 2, tzinfo=timezone.utc)
+    await insert_rows(
+        Visit,
+        visit_rows(
+            client_id,
+            [
+                (monday + timedelta(hours=9, minutes=5), 1),
+                (monday + timedelta(hours=9, minutes=55), 1),
+                (monday + timedelta(hours=18), 2),
+                (monday + timedelta(days=1, hours=7), 1),
+            ],
+        ),
+    )
+    await insert_rows(
+        Transaction,
+        transaction_rows(
+            client_id,
+            [
+                (monday + timedelta(hours=10), Decimal("1500.00")),
+                (monday + timedelta(hours=23, minutes=59), Decimal("-200.50")),
+                (monday + timedelta(days=1, hours=1), Decimal("300.00")),
+            ],
+        ),
+    )
+
+    assert await scheduler.run_once(TestAsyncSessionMaker) == (3, 2)
+
+    attendance = await get_report(
+        async_client, auth_headers, "attendance", start="2025-06-01", end="2025-06-04"
+    )
+    assert [item["visits"] for item in attendance["items"]] == [0, 3, 1, 0]
+    assert attendance["rolled_up_until"] is not None
+
+    revenue = await get_report(
+        async_client,
+        auth_headers,
+        "revenue",
+        start="2025-06-01",
+        end="2025-06-04",
+        period="week",
+    )
+    assert [item["period_start"] for item in revenue["items"]] == [
+        "2025-05-26",
+        "2025-06-02",
+    ]
+    assert [Decimal(item["revenue"]) for item in revenue["items"]] == [0, 1599.5]
+    assert [item["transactions"] for item in revenue["items"]] == [0, 3]
+
+    heatmap = await get_report(
+        async_client, auth_headers, "heatmap", start="2025-06-02", end="2025-06-08"
+    )
+    assert [item["box"] for item in heatmap["boxes"]] == [1, 2]
+    assert heatmap["boxes"][0]["visits"][0][9] == 2
+    assert heatmap["boxes"][0]["visits"][1][7] == 1
+    assert heatmap["boxes"][1]["visits"][0][18] == 1
+    assert sum(map(sum, heatmap["boxes"][0]["visits"])) == 3
+
+    # следующий запуск учитывает только записи после границы
+    now = datetime.now(timezone.utc)
+    await insert_rows(Visit, visit_rows(client_id, [(now, 3)]))
+    await insert_rows(Transaction, transaction_rows(client_id, [(now, Decimal(50))]))
+
+    assert await scheduler.run_once(TestAsyncSessionMaker) == (1, 1)
+    assert await scheduler.run_once(TestAsyncSessionMaker) == (0, 0)
+
+    today = now.date().isoformat()
+    attendance = await get_report(
+        async_client, auth_headers, "attendance", start=today, end=today
+    )
+    revenue = await get_report(
+        async_client, auth_headers, "revenue", start=today, end=today, period="month"
+    )
+    assert attendance["items"][0]["visits"] == 1
+    assert Decimal(revenue["items"][0]["revenue"]) == 50
+    assert revenue["items"][0]["period_start"] == now.date().replace(day=1).isoformat()
+
+    # граница, которую уже сдвинул другой процесс, повторно не занимается
+    async with TestAsyncSessionMaker() as session:
+        analytics_repo = AnalyticsRepository(session)
+
+        assert not await analytics_repo.claim_watermark(None, now)
+        assert not await analytics_repo.claim_watermark(monday, now)
+
+
+@pytest.mark.asyncio
+async def test_analytics_range_validation(async_client, auth_headers):
+    for start, end in (("2025-06-02", "2025-06-01"), ("2024-01-01", "2025-06-01")):
+        response = await async_client.get(
+            "/analytics/attendance",
+            params={"start": start, "end": end},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+    response = await async_client.get(
+        "/analytics/revenue",
+        params={"start": "2025-06-01", "end": "2025-06-02", "period": "year"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_rollup_read_benchmark(async_client, auth_headers):
+    """Сравнивает время отчёта о посещаемости по агрегатам и по исходной таблице.
+
+    Заменяет отдельный бенчмарк: по умолчанию генерируется 100 000 посещений
+    за год, для замера на миллионе посещений задайте
+    ``ANALYTICS_BENCHMARK_VISITS=1000000``.
+    """
+    client_id = UUID(await create_client(async_client, auth_headers, "Аналитик", 0))
+    first_day = date(2025, 1, 1)
+    since = datetime.combine(first_day, datetime.min.time(), tzinfo=timezone.utc)
+    until = since + timedelta(days=365)
+
+    generator = random.Random(7)
+    await insert_rows(
+        Visit,
+        visit_rows(
+            client_id,
+            (
+                (
+                    since + timedelta(seconds=generator.randrange(365 * 86400)),
+                    generator.randint(1, 100),
+                )
+                for _ in range(BENCHMARK_VISITS)
+            ),
+        ),
+    )
+
+    async with TestAsyncSessionMaker() as session:
+        analytics_service = AnalyticsService(AnalyticsRepository(session))
+        await analytics_service.roll_up(until)
+
+        started = time.perf_counter()
+        raw = Counter()
+        for hour, _, visits in await analytics_service.analytics_repo.aggregate_visits(
+            since, until
+        ):
+            raw[hour.date()] += visits
+        raw_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        report = await analytics_service.get_attendance(
+            "day", first_day, first_day + timedelta(days=364)
+        )
+        rollup_elapsed = time.perf_counter() - started
+
+    assert {item.period_start: item.visits for item in report.items if item.visits} == (
+        dict(raw)
+    )
+    assert sum(item.visits for item in report.items) == BENCHMARK_VISITS
+    assert (
+        rollup_elapsed * 5 < raw_elapsed
+    ), f"rollup {rollup_elapsed * 1000:.1f} ms vs raw {raw_elapsed * 1000:.1f} ms"
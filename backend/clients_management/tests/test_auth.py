@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 
 
@@ -122,3 +125,84 @@ async def test_refresh_token_invalid(async_client):
     )
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_access_token_cache_hits_and_rotation(async_client, auth_headers):
+    await async_client.get("/clients/all", headers=auth_headers)
+    await async_client.get("/clients/all", headers=auth_headers)
+
+    stats = (await async_client.get("/metrics/token_cache")).json()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["size"] == 1
+
+    sign_in = await async_client.post(
+        "/auth/sign_in", data={"username": "desk_user", "password": "DeskPass"}
+    )
+    assert sign_in.status_code == 200
+
+    stats = (await async_client.get("/metrics/token_cache")).json()
+    assert stats["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sign_in_rehashes_outdated_hash(async_client):
+    from sqlalchemy import select
+
+    from app.core.security import pwd_context
+    from app.database.tables.entities import User
+    from tests.override.session import TestAsyncSessionMaker
+
+    await async_client.post(
+        "/auth/sign_up",
+        json={"username": "rehash_user", "password": "RehashPass"},
+    )
+
+    async with TestAsyncSessionMaker() as session:
+        user = await session.scalar(select(User).where(User.username == "rehash_user"))
+        user.password = pwd_context.hash("RehashPass", rounds=4)
+        await session.commit()
+
+    response = await async_client.post(
+        "/auth/sign_in", data={"username": "rehash_user", "password": "RehashPass"}
+    )
+    assert response.status_code == 200
+
+    async with TestAsyncSessionMaker() as session:
+        password = await session.scalar(
+            select(User.password).where(User.username == "rehash_user")
+        )
+    assert not pwd_context.needs_update(password)
+    assert pwd_context.verify("RehashPass", password)
+
+
+@pytest.mark.asyncio
+async def test_unrelated_latency_during_login_storm(async_client):
+    await async_client.post(
+        "/auth/sign_up",
+        json={"username": "storm_user", "password": "StormPass"},
+    )
+
+    async def sign_in():
+        return await async_client.post(
+            "/auth/sign_in", data={"username": "storm_user", "password": "StormPass"}
+        )
+
+    async def probe(latencies):
+        # Задержка считается от момента, когда запрос должен был начаться,
+        # поэтому блокировка цикла событий попадает в измерение.
+        for _ in range(40):
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            await async_client.get("/")
+            latencies.append(time.perf_counter() - started - 0.01)
+
+    latencies = []
+    *responses, _ = await asyncio.gather(
+        *(sign_in() for _ in range(16)), probe(latencies)
+    )
+
+    assert all(response.status_code == 200 for response in responses)
+    p99 = sorted(latencies)[int(len(latencies) * 0.99) - 1]
+    assert p99 < 0.15
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.dependencies.tokens import validate_events_access
+from app.core.change_feed import ChangeFeed, change_feed
+from app.repositories import UserRepository
+from app.services import AuthService
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import add_season_ticket, create_client
+from tests.test_visits import start_visit
+
+
+async def read_frames(stream, count: int):
+    frames = []
+    for _ in range(count):
+        frame = await asyncio.wait_for(anext(stream), 1)
+        fields = dict(
+            line.split(": ", 1) for line in frame.strip().split("\n") if ": " in line
+        )
+        frames.append((fields.get("id"), fields.get("event"), fields.get("data")))
+
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_service_writes_publish_events(async_client, auth_headers):
+    stream = change_feed.subscribe(None).stream(keepalive=60)
+
+    client_id = await create_client(async_client, auth_headers, "Иванов", 0)
+    await add_season_ticket(async_client, auth_headers, client_id, 30)
+    visit_id = await start_visit(async_client, auth_headers, client_id, 7)
+    response = await async_client.put(f"/visits/end/{visit_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    frames = await read_frames(stream, 4)
+    assert [event for _, event, _ in frames] == [
+        "client.created",
+        "season_ticket.created",
+        "visit.started",
+        "visit.ended",
+    ]
+    assert [event_id for event_id, _, _ in frames] == [
+        f"{change_feed.epoch}-{seq}" for seq in range(1, 5)
+    ]
+
+    started = json.loads(frames[2][2])
+    assert (started["id"], started["client_id"], started["box"]) == (
+        visit_id,
+        client_id,
+        7,
+    )
+
+    # переподключение с последним полученным событием продолжает ленту
+    resumed = change_feed.subscribe(frames[1][0]).stream(keepalive=60)
+    assert [event for _, event, _ in await read_frames(resumed, 2)] == [
+        "visit.started",
+        "visit.ended",
+    ]
+
+    reset = change_feed.subscribe("00000000-1").stream(keepalive=60)
+    assert [event for _, event, _ in await read_frames(reset, 1)] == ["reset"]
+
+    response = await async_client.get("/events/")
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_disconnected_and_resumes():
+    feed = ChangeFeed(history_size=3, queue_size=2)
+
+    idle = feed.subscribe(None).stream(keepalive=0.01)
+    assert await asyncio.wait_for(anext(idle), 1) == ": keepalive\n\n"
+    await idle.aclose()
+
+    slow = feed.subscribe(None)
+    for index in range(3):
+        feed.publish("client.updated", {"index": index})
+
+    # очередь переполнилась: поток завершается, а запись не блокируется
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(anext(slow.stream(keepalive=60)), 1)
+    assert feed.overflows == 1
+
+    resumed = feed.subscribe(f"{feed.epoch}-0").stream(keepalive=60)
+    assert [json.loads(data) for _, _, data in await read_frames(resumed, 3)] == [
+        {"index": 0},
+        {"index": 1},
+        {"index": 2},
+    ]
+
+    # события старше истории уже недоступны
+    feed.publish("client.updated", {"index": 3})
+    stale = feed.subscribe(f"{feed.epoch}-0").stream(keepalive=60)
+    assert [event for _, event, _ in await read_frames(stale, 1)] == ["reset"]
+
+
+@pytest.mark.asyncio
+async def test_events_token_authorizes_only_the_feed(async_client, auth_headers):
+    response = await async_client.post("/events/token", headers=auth_headers)
+    assert response.status_code == 200
+    token = response.json()["token"]
+
+    # токен из URL не заменяет токен доступа
+    response = await async_client.get(
+        "/clients/all", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 401
+
+    async with TestAsyncSessionMaker() as session:
+        auth_service = AuthService(UserRepository(session))
+
+        user = await validate_events_access(None, auth_service, token)
+        assert user.username == "desk_user"
+
+        access_token = auth_headers["Authorization"].removeprefix("Bearer ")
+        for bad_token in (access_token, "not-a-token", None):
+            with pytest.raises(HTTPException) as error:
+                await validate_events_access(None, auth_service, bad_token)
+            assert error.value.status_code == 401
@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from tests.test_client_summary import inconsistent_clients
+from tests.test_clients import create_client
+
+
+async def add_record(async_client, auth_headers, path: str, payload: dict) -> str:
+    response = await async_client.post(f"/{path}/", json=payload, headers=auth_headers)
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+async def list_records(async_client, auth_headers, client_id: str, path: str, limit):
+    pages, cursor = [], None
+    while True:
+        response = await async_client.get(
+            f"/clients/{client_id}/{path}",
+            params={"limit": limit, **({"cursor": cursor} if cursor else {})},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()[path]])
+
+        if (cursor := response.json()["next_cursor"]) is None:
+            return pages
+
+
+async def get_counts(async_client, auth_headers) -> dict:
+    response = await async_client.get("/clients/all", headers=auth_headers)
+    assert response.status_code == 200
+
+    return {
+        client["id"]: (
+            client["is_violator"],
+            client["violation_count"],
+            client["complaint_count"],
+        )
+        for client in response.json()["clients"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_violations_maintain_summary(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Нарушитель", 0)
+    other_id = await create_client(async_client, auth_headers, "Законник", 1)
+
+    now = datetime.now(timezone.utc)
+    violation_ids = [
+        await add_record(
+            async_client,
+            auth_headers,
+            "violations",
+            {
+                "client_id": client_id,
+                "detail": f"нарушение {index}",
+                "claimed_at": str(now - timedelta(days=index)),
+            },
+        )
+        for index in range(3)
+    ]
+
+    pages = await list_records(
+        async_client, auth_headers, client_id, "violations", limit=2
+    )
+    assert pages == [violation_ids[:2], violation_ids[2:]]
+    assert await list_records(
+        async_client, auth_headers, other_id, "violations", limit=2
+    ) == [[]]
+
+    assert await get_counts(async_client, auth_headers) == {
+        client_id: (True, 3, 0),
+        other_id: (False, 0, 0),
+    }
+
+    response = await async_client.put(
+        f"/violations/{violation_ids[0]}",
+        json={"detail": "опоздание", "claimed_at": str(now - timedelta(days=10))},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get(
+        f"/violations/{violation_ids[0]}", headers=auth_headers
+    )
+    assert response.json()["violation"]["detail"] == "опоздание"
+    assert await list_records(
+        async_client, auth_headers, client_id, "violations", limit=5
+    ) == [violation_ids[1:] + violation_ids[:1]]
+
+    for violation_id in violation_ids:
+        response = await async_client.delete(
+            f"/violations/{violation_id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+    assert (await get_counts(async_client, auth_headers))[client_id] == (False, 0, 0)
+    assert await inconsistent_clients() == []
+
+    for method in ("get", "delete"):
+        response = await getattr(async_client, method)(
+            f"/violations/{violation_ids[0]}", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    response = await async_client.get(
+        f"/clients/{uuid4()}/violations", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    response = await async_client.get(
+        f"/clients/{client_id}/violations",
+        params={"cursor": "broken"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_comments_and_complaints_belong_to_author(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Обсуждаемый", 0)
+
+    await async_client.post(
+        "/auth/sign_up",
+        json={
+            "username": "other_user",
+            "email": "other@example.com",
+            "password": "OtherPass",
+        },
+    )
+    sign_in = await async_client.post(
+        "/auth/sign_in", data={"username": "other_user", "password": "OtherPass"}
+    )
+    other_headers = {"Authorization": f"Bearer {sign_in.json()['access_token']}"}
+
+    for path, field in (("comments", "comment"), ("complaints", "complaint")):
+        record_ids = [
+            await add_record(
+                async_client,
+                auth_headers,
+                path,
+                {"client_id": client_id, field: f"запись {index}"},
+            )
+            for index in range(3)
+        ]
+
+        pages = await list_records(async_client, auth_headers, client_id, path, 2)
+        assert [len(page) for page in pages] == [2, 1]
+        assert sorted(sum(pages, [])) == sorted(record_ids)
+
+        # изменять и удалять запись может только её автор
+        response = await async_client.put(
+            f"/{path}/{record_ids[0]}", json={field: "чужая"}, headers=other_headers
+        )
+        assert response.status_code == 403
+        response = await async_client.delete(
+            f"/{path}/{record_ids[0]}", headers=other_headers
+        )
+        assert response.status_code == 403
+
+        response = await async_client.put(
+            f"/{path}/{record_ids[0]}", json={field: "своя"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        response = await async_client.get(
+            f"/{path}/{record_ids[0]}", headers=other_headers
+        )
+        assert response.json()[field][field] == "своя"
+
+        response = await async_client.delete(
+            f"/{path}/{record_ids[1]}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        response = await async_client.put(
+            f"/{path}/{record_ids[1]}", json={field: "снова"}, headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    assert (await get_counts(async_client, auth_headers))[client_id] == (False, 0, 2)
+    assert await inconsistent_clients() == []
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy import update
+
+from app.database.tables.entities import ClientSummary, Violation
+from app.repositories import ClientSummaryRepository
+from app.services import ClientSummaryService
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import add_season_ticket, count_statements, create_client
+from tests.test_visits import start_visit
+
+
+async def inconsistent_clients() -> list[UUID]:
+    async with TestAsyncSessionMaker() as session:
+        return await ClientSummaryService(ClientSummaryRepository(session)).check()
+
+
+@pytest.mark.asyncio
+async def test_summary_follows_writes(async_client, auth_headers):
+    client_ids = [
+        await create_client(async_client, auth_headers, f"Сводкин{index}", index)
+        for index in range(3)
+    ]
+    ticket_id = await add_season_ticket(async_client, auth_headers, client_ids[0], 30)
+    await add_season_ticket(async_client, auth_headers, client_ids[0], 10)
+    other_id = await add_season_ticket(async_client, auth_headers, client_ids[1], 20)
+    await add_season_ticket(async_client, auth_headers, client_ids[2], 1)
+
+    visit_id = await start_visit(async_client, auth_headers, client_ids[0], 1)
+    await start_visit(async_client, auth_headers, client_ids[1], 2)
+    response = await async_client.post(
+        "/visits/start/batch",
+        json=[{"client_id": client_ids[2], "box": 3}],
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    assert await inconsistent_clients() == []
+
+    # у второго клиента остаётся только истёкший абонемент
+    response = await async_client.delete(
+        f"/season_tickets/{other_id}", headers=auth_headers
+    )
+    assert response.status_code == 200
+    await add_season_ticket(async_client, auth_headers, client_ids[1], -1)
+
+    # перенос абонемента другому клиенту пересчитывает сводку обоих
+    response = await async_client.put(
+        f"/season_tickets/{ticket_id}",
+        json={
+            "client_id": client_ids[2],
+            "type": "перенесённый",
+            "expires_at": str(datetime.now(timezone.utc) + timedelta(days=5)),
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    response = await async_client.delete(f"/visits/{visit_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    assert await inconsistent_clients() == []
+
+    response = await async_client.get("/clients/all", headers=auth_headers)
+    clients = {client["id"]: client for client in response.json()["clients"]}
+
+    assert clients[client_ids[0]]["season_ticket_type"] == "на 10 дней"
+    assert clients[client_ids[0]]["last_visit"] is None
+    assert clients[client_ids[1]]["season_ticket_type"] is None
+    assert clients[client_ids[2]]["season_ticket_type"] == "перенесённый"
+
+    response = await async_client.delete(
+        f"/season_tickets/{ticket_id}", headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    assert await inconsistent_clients() == []
+
+
+@pytest.mark.asyncio
+async def test_summary_violations_hook(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Нарушитель", 0)
+
+    async with TestAsyncSessionMaker() as session:
+        session.add(Violation(client_id=UUID(client_id), detail="опоздание"))
+        await session.flush()
+
+        repo = ClientSummaryRepository(session)
+        await repo.change_violation_count(UUID(client_id), 1)
+        await repo.commit()
+
+    assert await inconsistent_clients() == []
+
+    response = await async_client.get("/clients/all", headers=auth_headers)
+    assert response.json()["clients"][0]["is_violator"] is True
+
+
+@pytest.mark.asyncio
+async def test_summary_check_and_rebuild(async_client, auth_headers):
+    client_ids = [
+        await create_client(async_client, auth_headers, f"Сводкин{index}", index)
+        for index in range(3)
+    ]
+    await add_season_ticket(async_client, auth_headers, client_ids[0], 30)
+    await add_season_ticket(async_client, auth_headers, client_ids[1], 30)
+    await start_visit(async_client, auth_headers, client_ids[1], 1)
+
+    async with TestAsyncSessionMaker() as session:
+        await session.execute(
+            update(ClientSummary)
+            .where(ClientSummary.client_id == UUID(client_ids[1]))
+            .values(violation_count=5, last_visit=None)
+        )
+        await session.commit()
+
+    assert await inconsistent_clients() == [UUID(client_ids[1])]
+
+    async with TestAsyncSessionMaker() as session:
+        count = await ClientSummaryService(ClientSummaryRepository(session)).rebuild()
+
+    assert count == 3
+    assert await inconsistent_clients() == []
+
+
+@pytest.mark.asyncio
+async def test_client_listing_reads_summary(async_client, auth_headers):
+    await create_client(async_client, auth_headers, "Сводкин", 0)
+
+    with count_statements() as statements:
+        response = await async_client.get("/clients/all", headers=auth_headers)
+
+    assert response.status_code == 200
+    (statement,) = statements
+    assert "client_summary" in statement
+    for table in ("season_ticket", "violation", "visit"):
+        assert f"FROM {table}" not in statement
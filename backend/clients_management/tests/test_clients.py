@@ -0,0 +1,545 @@
+import csv
+import io
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.api.routes.v1 import clients as clients_routes
+from app.core.config import Settings, get_settings
+from app.core.search import ClientSearchIndex, SearchEntry, SearchQuery
+from tests.override import test_engine
+
+settings: Settings = get_settings()
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(
+        test_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+    )
+    try:
+        yield statements
+    finally:
+        event.remove(
+            test_engine.sync_engine, "before_cursor_execute", before_cursor_execute
+        )
+
+
+async def create_client(async_client, auth_headers, surname: str, index: int) -> str:
+    response = await async_client.post(
+        "/clients/",
+        json={
+            "name": "Пётр",
+            "surname": surname,
+            "patronymic": "Олегович",
+            "sex": True,
+            "phone": f"+7 999 138-{index // 100:02d}-{index % 100:02d}",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+async def add_season_ticket(async_client, auth_headers, client_id: str, days: int):
+    response = await async_client.post(
+        "/season_tickets/",
+        json={
+            "client_id": client_id,
+            "type": f"на {days} дней",
+            "expires_at": str(datetime.now(timezone.utc) + timedelta(days=days)),
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+async def populate(async_client, auth_headers, count: int, offset: int = 0):
+    for index in range(offset, offset + count):
+        client_id = await create_client(
+            async_client, auth_headers, f"Семёнов{index:04d}", index
+        )
+
+        response = await async_client.post(
+            "/season_tickets/",
+            json={
+                "client_id": client_id,
+                "type": "семейный",
+                "expires_at": str(datetime.now(timezone.utc) + timedelta(days=30)),
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+        response = await async_client.post(
+            "/visits/start",
+            json={"client_id": client_id, "box": index},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_all_clients_compact_projection(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Иванов", 1)
+    for ticket_type, delta in (("просроченный", -1), ("семейный", 30)):
+        response = await async_client.post(
+            "/season_tickets/",
+            json={
+                "client_id": client_id,
+                "type": ticket_type,
+                "expires_at": str(datetime.now(timezone.utc) + timedelta(days=delta)),
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+    response = await async_client.post(
+        "/visits/start",
+        json={"client_id": client_id, "box": 7},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    response = await async_client.get("/clients/all", headers=auth_headers)
+
+    assert response.status_code == 200
+    (client,) = response.json()["clients"]
+    assert client["season_ticket_type"] == "семейный"
+    assert client["is_violator"] is False
+    assert client["last_visit"] == str(datetime.now(timezone.utc).date())
+
+
+@pytest.mark.asyncio
+async def test_all_clients_query_count_is_constant(async_client, auth_headers):
+    query_counts = []
+    populated = 0
+
+    for size in (1, 5, 20, 50):
+        await populate(async_client, auth_headers, size - populated, offset=populated)
+        populated = size
+
+        with count_statements() as statements:
+            response = await async_client.get("/clients/all", headers=auth_headers)
+        assert len(response.json()["clients"]) == size
+
+        query_counts.append(len(statements))
+
+    assert len(set(query_counts)) == 1
+
+
+@pytest.mark.asyncio
+async def test_all_clients_keyset_pagination(async_client, auth_headers):
+    for index, surname in enumerate(
+        ["Петров", "Иванов", "Иванов", "Сидоров", "Андреев"]
+    ):
+        await create_client(async_client, auth_headers, surname, index)
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = await async_client.get(
+            "/clients/all", params=params, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        pages.append(response.json()["clients"])
+        if (cursor := response.json()["next_cursor"]) is None:
+            break
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    clients = [client for page in pages for client in page]
+    assert [client["surname"] for client in clients] == [
+        "Андреев",
+        "Иванов",
+        "Иванов",
+        "Петров",
+        "Сидоров",
+    ]
+    assert len({client["id"] for client in clients}) == 5
+
+
+@pytest.mark.asyncio
+async def test_all_clients_malformed_cursor(async_client, auth_headers):
+    response = await async_client.get(
+        "/clients/all", params={"cursor": "not-a-cursor"}, headers=auth_headers
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stream_clients_ndjson(async_client, auth_headers):
+    for index, surname in enumerate(["Петров", "Андреев", "Иванов"]):
+        await create_client(async_client, auth_headers, surname, index)
+
+    response = await async_client.get("/clients/stream", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["surname"] for line in lines] == ["Андреев", "Иванов", "Петров"]
+
+
+async def create_group(async_client, auth_headers, group_type: str) -> str:
+    response = await async_client.post(
+        "/groups/", json={"type": group_type}, headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+async def add_to_group(async_client, auth_headers, group_id, client_ids):
+    for client_id in client_ids:
+        response = await async_client.post(
+            f"/groups/{group_id}/members",
+            json={"client_id": str(client_id), "role": "участник"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_client_by_id_query_count_ignores_group_size(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Иванов", 0)
+    group_id = await create_group(async_client, auth_headers, "семья")
+    await add_to_group(async_client, auth_headers, group_id, [client_id])
+
+    query_counts = []
+    for size in (1, 10, 40):
+        others = [
+            UUID(await create_client(async_client, auth_headers, "Петров", index))
+            for index in range(
+                len(query_counts) * 100, len(query_counts) * 100 + size - 1
+            )
+        ]
+        await add_to_group(async_client, auth_headers, group_id, others)
+
+        with count_statements() as statements:
+            response = await async_client.get(
+                f"/clients/{client_id}", headers=auth_headers
+            )
+        assert response.status_code == 200
+
+        query_counts.append(len(statements))
+
+    assert response.json()["client"]["groups"][0]["quantity"] == 1 + 0 + 9 + 39
+    assert len(set(query_counts)) == 1
+
+
+def client_csv(count: int, offset: int = 0) -> str:
+    lines = ["name,surname,patronymic,sex,email,phone"]
+    lines += [
+        f"Пётр,Импортов{index:05d},Олегович,true,,+7 999 2{index // 10000:02d}-"
+        f"{index // 100 % 100:02d}-{index % 100:02d}"
+        for index in range(offset, offset + count)
+    ]
+
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.asyncio
+async def test_import_clients_csv_reports_rows(async_client, auth_headers):
+    body = client_csv(3) + "Ирина,Ошибкина,Павловна,false,,not-a-phone\nБез,Колонок\n"
+
+    response = await async_client.post(
+        "/clients/bulk",
+        content=body.encode("utf-8"),
+        headers={**auth_headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 3
+    assert response.json()["failed"] == 2
+    assert [error["row"] for error in response.json()["errors"]] == [4, 5]
+    assert response.json()["errors"][0]["detail"].startswith("phone:")
+
+    response = await async_client.get("/clients/all", headers=auth_headers)
+    assert len(response.json()["clients"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_import_clients_ndjson(async_client, auth_headers):
+    rows = [
+        {
+            "name": "Анна",
+            "surname": "Потокова",
+            "patronymic": "Игоревна",
+            "sex": False,
+            "phone": "+7 999 300-00-01",
+        },
+        "{not json",
+    ]
+    body = "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+
+    response = await async_client.post(
+        "/clients/bulk",
+        content=body.encode("utf-8"),
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.json()["imported"] == 1
+    assert response.json()["errors"] == [{"row": 2, "detail": "Malformed JSON."}]
+
+
+@pytest.mark.asyncio
+async def test_import_clients_unsupported_media_type(async_client, auth_headers):
+    response = await async_client.post("/clients/bulk", json=[], headers=auth_headers)
+
+    assert response.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_import_clients_reports_duplicates(async_client, auth_headers):
+    async with test_engine.begin() as connection:
+        await connection.exec_driver_sql(
+            "CREATE UNIQUE INDEX client_phone_test_uk ON client (phone)"
+        )
+
+    body = client_csv(3) + client_csv(1, offset=1).split("\n", 1)[1]
+
+    response = await async_client.post(
+        "/clients/bulk",
+        content=body.encode("utf-8"),
+        headers={**auth_headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.json()["imported"] == 3
+    assert response.json()["errors"] == [
+        {"row": 4, "detail": 'User with phone="tel:+7-999-200-00-01" already exists!'}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_clients_statements_per_chunk(async_client, auth_headers):
+    """Проверяет, что импорт выполняет постоянное число SQL-запросов на порцию.
+
+    Заменяет сравнение скоростей: количество запросов на HTTP-запрос берётся
+    из показателя ``http_request_db_statements`` и не зависит от машины.
+    """
+    chunk_size = settings.CLIENTS_IMPORT_CHUNK_SIZE
+    route = 'method="POST",route="/api/v1/clients/bulk"'
+
+    # первый импорт кэширует пользователя, последующие не загружают его из базы
+    offset, totals = 0, [0.0]
+    for rows in (1, chunk_size, 4 * chunk_size):
+        response = await async_client.post(
+            "/clients/bulk",
+            content=client_csv(rows, offset).encode("utf-8"),
+            headers={**auth_headers, "Content-Type": "text/csv"},
+        )
+        assert response.json()["imported"] == rows
+        offset += rows
+
+        response = await async_client.get("/metrics/")
+        samples = dict(
+            line.rsplit(" ", 1)
+            for line in response.text.splitlines()
+            if line and not line.startswith("#")
+        )
+        totals.append(float(samples[f"http_request_db_statements_sum{{{route}}}"]))
+
+    one_chunk, four_chunks = totals[2] - totals[1], totals[3] - totals[2]
+
+    assert one_chunk <= 5
+    assert four_chunks == 4 * one_chunk
+
+
+@pytest.mark.asyncio
+async def test_export_clients_csv(async_client, auth_headers):
+    await populate(async_client, auth_headers, 3)
+
+    response = await async_client.get("/clients/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert [row["surname"] for row in rows] == [
+        f"Семёнов{index:04d}" for index in range(3)
+    ]
+    assert all(row["season_ticket_type"] == "семейный" for row in rows)
+    assert all(row["violation_count"] == "0" for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_export_clients_columnar_chunks(async_client, auth_headers, monkeypatch):
+    monkeypatch.setattr(clients_routes.settings, "CLIENTS_STREAM_CHUNK_SIZE", 2)
+    await populate(async_client, auth_headers, 5)
+
+    response = await async_client.get(
+        "/clients/export", params={"format": "columnar"}, headers=auth_headers
+    )
+    header, *chunks = [json.loads(line) for line in response.text.splitlines()]
+
+    assert header["columns"][:3] == ["id", "name", "surname"]
+    assert [len(chunk["id"]) for chunk in chunks] == [2, 2, 1]
+    assert sum((chunk["surname"] for chunk in chunks), []) == [
+        f"Семёнов{index:04d}" for index in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_client_is_single_update(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Старов", 0)
+    body = {
+        "name": "Пётр",
+        "surname": "Новов",
+        "patronymic": "Олегович",
+        "sex": True,
+        "phone": "+7 999 138-00-00",
+    }
+
+    with count_statements() as statements:
+        response = await async_client.put(
+            f"/clients/{client_id}", json=body, headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+
+    response = await async_client.get(f"/clients/{client_id}", headers=auth_headers)
+    assert response.json()["client"]["surname"] == "Новов"
+
+    response = await async_client.put(
+        f"/clients/{uuid4()}", json=body, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_season_ticket_is_single_update(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Абонентов", 0)
+    body = {
+        "client_id": client_id,
+        "type": "семейный",
+        "expires_at": str(datetime.now(timezone.utc) + timedelta(days=30)),
+    }
+    response = await async_client.post(
+        "/season_tickets/", json=body, headers=auth_headers
+    )
+    season_ticket_id = response.json()["id"]
+
+    with count_statements() as statements:
+        response = await async_client.put(
+            f"/season_tickets/{season_ticket_id}",
+            json={**body, "type": "студенческий"},
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    # абонемент обновляется без предварительного SELECT, второй UPDATE — сводка клиента
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "UPDATE"]
+    assert statements[1].split()[1] == "client_summary"
+
+    response = await async_client.put(
+        f"/season_tickets/{uuid4()}", json=body, headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+async def search(async_client, auth_headers, query: str, limit: int = 20) -> list[str]:
+    response = await async_client.get(
+        "/clients/search", params={"q": query, "limit": limit}, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    return [client["surname"] for client in response.json()["clients"]]
+
+
+@pytest.mark.asyncio
+async def test_search_clients_ranking(async_client, auth_headers):
+    client_ids = {
+        surname: await create_client(async_client, auth_headers, surname, index)
+        for index, surname in enumerate(("Сидоров", "Петров", "Ивановский", "Иванов"))
+    }
+
+    assert await search(async_client, auth_headers, "ИВАН") == ["Иванов", "Ивановский"]
+    assert await search(async_client, auth_headers, "ров") == ["Петров", "Сидоров"]
+    # совпадение по началу имени ранжируется ниже совпадения по началу фамилии
+    assert await search(async_client, auth_headers, "пётр", limit=2) == [
+        "Иванов",
+        "Ивановский",
+    ]
+    # последние цифры номера телефона
+    assert await search(async_client, auth_headers, "00-02") == ["Ивановский"]
+    assert await search(async_client, auth_headers, "100%") == []
+
+    # после построения индекса поиск выполняет один запрос за найденными клиентами
+    with count_statements() as statements:
+        assert await search(async_client, auth_headers, "иванов") == [
+            "Иванов",
+            "Ивановский",
+        ]
+    assert len(statements) == 1
+
+    await create_client(async_client, auth_headers, "Иванченко", 4)
+    response = await async_client.put(
+        f"/clients/{client_ids['Петров']}",
+        json={
+            "name": "Анна",
+            "surname": "Иванова",
+            "patronymic": "Олеговна",
+            "sex": False,
+            "phone": "+7 999 138-00-01",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    response = await async_client.delete(
+        f"/clients/{client_ids['Сидоров']}", headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    assert await search(async_client, auth_headers, "иван") == [
+        "Иванов",
+        "Иванова",
+        "Ивановский",
+        "Иванченко",
+    ]
+    assert await search(async_client, auth_headers, "ров") == []
+
+
+def test_search_index_scans_only_trigram_candidates():
+    """Проверяет, что поиск по индексу проверяет лишь кандидатов по триграммам.
+
+    Вместо замера времени проверяется количество просмотренных клиентов:
+    оно не должно зависеть от размера индекса.
+    """
+    index = ClientSearchIndex()
+    index.rebuild(
+        SearchEntry.create(
+            uuid4(),
+            f"Фамилия{number:06d}",
+            "Имя",
+            "Отчество",
+            f"user{number}@example.com",
+            f"+7 999 {number:07d}",
+        )
+        for number in range(100_000)
+    )
+
+    for query, expected in (
+        ("фамилия012345", 1),
+        ("4567", 20),
+        ("user99999@", 1),
+    ):
+        parsed = SearchQuery.parse(query)
+        scanned = len(set(index._candidates(parsed)))
+
+        assert len(index.search(parsed, 20)) == expected
+        assert scanned <= 100, f"{query!r}: scanned {scanned} clients"
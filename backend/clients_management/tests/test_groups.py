@@ -0,0 +1,138 @@
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database.tables.entities import Group
+from app.database.tables.junctions import Relationship
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import add_to_group, create_client, create_group
+
+
+async def get_quantity(async_client, auth_headers, group_id: str) -> int:
+    response = await async_client.get(f"/groups/{group_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    return response.json()["group"]["quantity"]
+
+
+async def counted_and_actual(group_id: str) -> tuple[int, int]:
+    group_id = UUID(group_id)
+
+    async with TestAsyncSessionMaker() as session:
+        counted = await session.scalar(
+            select(Group.member_count).where(Group.id == group_id)
+        )
+        actual = await session.scalar(
+            select(func.count()).where(Relationship.group_id == group_id)
+        )
+
+    return counted, actual
+
+
+@pytest.mark.asyncio
+async def test_group_membership_maintains_count(async_client, auth_headers):
+    group_id = await create_group(async_client, auth_headers, "семья")
+    other_group_id = await create_group(async_client, auth_headers, "команда")
+    client_ids = [
+        await create_client(async_client, auth_headers, surname, index)
+        for index, surname in enumerate(("Петров", "Андреев", "Иванов"))
+    ]
+
+    assert await get_quantity(async_client, auth_headers, group_id) == 0
+
+    await add_to_group(async_client, auth_headers, group_id, client_ids)
+    await add_to_group(async_client, auth_headers, other_group_id, client_ids[:1])
+    assert await get_quantity(async_client, auth_headers, group_id) == 3
+
+    # повторное добавление и несуществующая группа не меняют количество
+    response = await async_client.post(
+        f"/groups/{group_id}/members",
+        json={"client_id": client_ids[0], "role": "родитель"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 409
+    response = await async_client.post(
+        f"/groups/{uuid4()}/members",
+        json={"client_id": client_ids[0], "role": "родитель"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+    assert await counted_and_actual(group_id) == (3, 3)
+
+    pages, cursor = [], None
+    while True:
+        response = await async_client.get(
+            f"/groups/{group_id}/members",
+            params={"limit": 2, **({"cursor": cursor} if cursor else {})},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        pages.append(
+            [(item["surname"], item["role"]) for item in response.json()["members"]]
+        )
+
+        if (cursor := response.json()["next_cursor"]) is None:
+            break
+
+    assert pages == [
+        [("Андреев", "участник"), ("Иванов", "участник")],
+        [("Петров", "участник")],
+    ]
+
+    response = await async_client.delete(
+        f"/groups/{group_id}/members/{client_ids[1]}", headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await async_client.delete(
+        f"/groups/{group_id}/members/{client_ids[1]}", headers=auth_headers
+    )
+    assert response.status_code == 404
+    assert await get_quantity(async_client, auth_headers, group_id) == 2
+
+    # удаление клиента исключает его из всех групп
+    response = await async_client.delete(
+        f"/clients/{client_ids[0]}", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert await counted_and_actual(group_id) == (1, 1)
+    assert await counted_and_actual(other_group_id) == (0, 0)
+
+    response = await async_client.get(f"/clients/{client_ids[2]}", headers=auth_headers)
+    assert response.json()["client"]["groups"] == [
+        {"id": group_id, "type": "семья", "quantity": 1}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_group_crud(async_client, auth_headers):
+    group_id = await create_group(async_client, auth_headers, "семья")
+
+    response = await async_client.put(
+        f"/groups/{group_id}", json={"type": "клуб"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get(f"/groups/{group_id}", headers=auth_headers)
+    assert response.json()["group"] == {"id": group_id, "type": "клуб", "quantity": 0}
+
+    response = await async_client.get(
+        f"/groups/{group_id}/members", headers=auth_headers
+    )
+    assert response.json()["members"] == []
+
+    response = await async_client.delete(f"/groups/{group_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    for method, path in (
+        ("get", f"/groups/{group_id}"),
+        ("delete", f"/groups/{group_id}"),
+        ("get", f"/groups/{group_id}/members"),
+    ):
+        response = await getattr(async_client, method)(path, headers=auth_headers)
+        assert response.status_code == 404
+
+    response = await async_client.put(
+        f"/groups/{group_id}", json={"type": "клуб"}, headers=auth_headers
+    )
+    assert response.status_code == 404
@@ -0,0 +1,153 @@
+import re
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Select, delete, select
+from sqlalchemy.dialects import sqlite
+
+from app.database.tables.entities import (
+    Client,
+    ClientSummary,
+    SeasonTicket,
+    Transaction,
+    Violation,
+    Visit,
+)
+from app.database.tables.junctions import Comment, Complaint, Relationship
+from app.repositories import ClientRepository
+from tests.override import test_engine
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+async def query_plan(statement: Select) -> list[str]:
+    compiled = statement.compile(dialect=sqlite.dialect())
+    parameters = tuple(None for _ in compiled.positiontup)
+
+    async with test_engine.connect() as connection:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", parameters
+        )
+
+        return [row[-1] for row in result.all()]
+
+
+def assert_no_full_scan(plan: list[str]):
+    scans = [detail for detail in plan if FULL_SCAN.match(detail)]
+    sorts = [detail for detail in plan if "TEMP B-TREE" in detail]
+
+    assert not scans, f"Sequential scan in plan: {plan}"
+    assert not sorts, f"Sort without index in plan: {plan}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "statement",
+    [
+        pytest.param(
+            select(Visit)
+            .where(Visit.client_id == uuid4())
+            .order_by(Visit.visit_start.desc()),
+            id="client_visits",
+        ),
+        pytest.param(
+            select(SeasonTicket)
+            .where(SeasonTicket.client_id == uuid4())
+            .order_by(SeasonTicket.expires_at.desc()),
+            id="client_season_tickets",
+        ),
+        pytest.param(
+            select(Violation).where(Violation.client_id == uuid4()),
+            id="client_violations",
+        ),
+        pytest.param(
+            select(Violation)
+            .where(Violation.client_id == uuid4())
+            .order_by(Violation.claimed_at.desc(), Violation.id.desc()),
+            id="client_violation_history",
+        ),
+        pytest.param(
+            select(ClientSummary).where(ClientSummary.season_ticket_id == uuid4()),
+            id="summary_season_ticket",
+        ),
+        pytest.param(
+            select(SeasonTicket)
+            .where(
+                SeasonTicket.expired_at.is_(None),
+                SeasonTicket.expires_at <= datetime(2025, 1, 1),
+            )
+            .order_by(SeasonTicket.expires_at),
+            id="pending_season_ticket_expiry",
+        ),
+        pytest.param(
+            select(Transaction)
+            .where(Transaction.client_id == uuid4())
+            .order_by(Transaction.timestamp),
+            id="client_transactions",
+        ),
+        pytest.param(
+            select(Transaction)
+            .where(Transaction.client_id == uuid4())
+            .order_by(Transaction.timestamp.desc(), Transaction.id.desc()),
+            id="client_transaction_history",
+        ),
+        pytest.param(
+            select(Relationship).where(Relationship.client_id == uuid4()),
+            id="client_relationships",
+        ),
+        pytest.param(
+            select(Relationship).where(Relationship.group_id == uuid4()),
+            id="group_relationships",
+        ),
+        pytest.param(
+            select(Comment).where(Comment.client_id == uuid4()), id="client_comments"
+        ),
+        pytest.param(
+            select(Comment).where(Comment.user_id == uuid4()), id="user_comments"
+        ),
+        pytest.param(
+            select(Complaint).where(Complaint.client_id == uuid4()),
+            id="client_complaints",
+        ),
+        pytest.param(
+            select(Complaint).where(Complaint.user_id == uuid4()),
+            id="user_complaints",
+        ),
+        pytest.param(
+            select(Comment)
+            .where(Comment.client_id == uuid4())
+            .order_by(Comment.created_at.desc(), Comment.id.desc()),
+            id="client_comment_history",
+        ),
+        pytest.param(
+            select(Complaint)
+            .where(Complaint.client_id == uuid4())
+            .order_by(Complaint.created_at.desc(), Complaint.id.desc()),
+            id="client_complaint_history",
+        ),
+        pytest.param(
+            delete(Visit).where(Visit.client_id == uuid4()), id="cascade_visits"
+        ),
+        pytest.param(
+            select(Visit).where(Visit.visit_end.is_(None)).order_by(Visit.box),
+            id="open_visits",
+        ),
+        pytest.param(
+            select(Visit)
+            .where(Visit.client_id == uuid4(), Visit.visit_start >= datetime.now())
+            .order_by(Visit.visit_start.desc(), Visit.id.desc()),
+            id="client_visit_history",
+        ),
+    ],
+)
+async def test_hot_query_uses_index(async_client, statement):
+    assert_no_full_scan(await query_plan(statement))
+
+
+@pytest.mark.asyncio
+async def test_client_listing_uses_indexes(async_client):
+    plan = await query_plan(ClientRepository._compact_clients_statement())
+
+    assert any("client_surname_id_idx" in detail for detail in plan), plan
+    assert_no_full_scan(plan)
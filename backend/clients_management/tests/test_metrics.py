@@ -0,0 +1,93 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import Settings, get_settings
+from app.core.metrics import Histogram
+from app.database.pool import InstrumentedAsyncQueuePool
+from tests.test_clients import create_client
+
+settings: Settings = get_settings()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_endpoint(async_client):
+    response = await async_client.get("/metrics/pool")
+
+    assert response.status_code == 200
+    assert response.json()["size"] == settings.DATABASE_POOL_SIZE
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_counts_waits_and_overflow():
+    engine = create_async_engine(
+        settings.TEST_DATABASE_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=5,
+    )
+
+    async def hold(seconds: float):
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            await asyncio.sleep(seconds)
+
+    try:
+        await asyncio.gather(hold(0.2), hold(0.2), hold(0.0))
+        snapshot = engine.pool.snapshot()
+    finally:
+        await engine.dispose()
+
+    assert snapshot["checkouts"] == 3
+    assert snapshot["overflow_checkouts"] >= 1
+    assert snapshot["waits"] >= 1
+    assert snapshot["wait_time_max"] > 0.1
+    assert snapshot["checked_out"] == 0
+
+
+@pytest.mark.asyncio
+async def test_prometheus_metrics_per_route(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Иванов", 0)
+    response = await async_client.get(f"/clients/{client_id}", headers=auth_headers)
+    assert response.status_code == 200
+    response = await async_client.get(f"/clients/{uuid4()}", headers=auth_headers)
+    assert response.status_code == 404
+
+    response = await async_client.get("/metrics/")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    samples = dict(
+        line.rsplit(" ", 1)
+        for line in response.text.splitlines()
+        if line and not line.startswith("#")
+    )
+    route = 'method="GET",route="/api/v1/clients/{client_id}"'
+
+    # серии помечены шаблоном пути, а не конкретным идентификатором
+    assert samples[f'http_requests_total{{{route},status="200"}}'] == "1"
+    assert samples[f'http_requests_total{{{route},status="404"}}'] == "1"
+    assert samples[f'http_request_duration_seconds_bucket{{{route},le="+Inf"}}'] == "2"
+    assert float(samples[f"http_request_db_statements_sum{{{route}}}"]) >= 2
+    assert samples["http_requests_in_flight"] == "1"
+    assert int(samples["db_statements_total"]) > 0
+    assert samples["db_pool_size"] == str(settings.DATABASE_POOL_SIZE)
+    assert not any(str(client_id) in sample for sample in samples)
+
+
+def test_histogram_render_is_cumulative():
+    histogram = Histogram("latency", "Задержка.", (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe((("route", '/a"b'),), value)
+
+    assert histogram.render()[2:] == [
+        'latency_bucket{route="/a\\"b",le="0.1"} 2',
+        'latency_bucket{route="/a\\"b",le="1.0"} 3',
+        'latency_bucket{route="/a\\"b",le="+Inf"} 4',
+        'latency_sum{route="/a\\"b"} 3.65',
+        'latency_count{route="/a\\"b"} 4',
+    ]
@@ -0,0 +1,75 @@
+import logging
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+
+from app.api.routes.v1.clients import all_clients
+from app.core.metrics import RequestStats, request_metrics, statement_shape
+from app.core.query_budget import (
+    QUERY_BUDGET_ATTRIBUTE,
+    QueryBudget,
+    QueryBudgetExceeded,
+    query_budget_guard,
+)
+from app.database.tables.entities import Client
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import create_client
+
+
+@pytest.mark.asyncio
+async def test_route_over_budget_fails(async_client, auth_headers, monkeypatch):
+    for index in range(3):
+        await create_client(async_client, auth_headers, f"Иванов{index}", index)
+
+    response = await async_client.get("/clients/all", headers=auth_headers)
+    assert response.status_code == 200
+
+    monkeypatch.setattr(all_clients, QUERY_BUDGET_ATTRIBUTE, QueryBudget(0))
+
+    with pytest.raises(QueryBudgetExceeded, match="budget is 0"):
+        await async_client.get("/clients/all?limit=2", headers=auth_headers)
+
+    assert query_budget_guard.violations == 1
+
+
+@pytest.mark.asyncio
+async def test_repeated_statement_shape_is_reported(
+    async_client, auth_headers, monkeypatch, caplog
+):
+    client_ids = [
+        UUID(await create_client(async_client, auth_headers, "Петров", index))
+        for index in range(query_budget_guard.repeat_threshold)
+    ]
+    monkeypatch.setattr(query_budget_guard, "mode", "warn")
+
+    stats = RequestStats(shapes={})
+    token = request_metrics.current.set(stats)
+    try:
+        # ленивая загрузка в цикле: по запросу на каждого клиента
+        async with TestAsyncSessionMaker() as session:
+            for client_id in client_ids:
+                await session.scalar(select(Client).where(Client.id == client_id))
+    finally:
+        request_metrics.current.reset(token)
+
+    route = SimpleNamespace(path="/loop", endpoint=lambda: None)
+    with caplog.at_level(logging.WARNING, logger="app.core.query_budget"):
+        query_budget_guard.check("GET", route, stats)
+
+    assert f"N+1: {len(client_ids)} x SELECT" in caplog.text
+
+    # повторы разрешены для маршрутов пакетной записи
+    setattr(route.endpoint, QUERY_BUDGET_ATTRIBUTE, QueryBudget(allow_repeats=True))
+    query_budget_guard.check("GET", route, stats)
+    assert query_budget_guard.violations == 1
+
+
+def test_statement_shape_ignores_parameter_count():
+    assert statement_shape("SELECT * FROM t WHERE id IN ($1, $2) AND a = $3") == (
+        statement_shape("SELECT *\n  FROM t WHERE id IN ($1) AND a = $2")
+    )
+    assert statement_shape("INSERT INTO t (a, b) VALUES (?, ?), (?, ?)") == (
+        "INSERT INTO t (a, b) VALUES (?)"
+    )
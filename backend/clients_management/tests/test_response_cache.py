@@ -0,0 +1,106 @@
+import pytest
+
+from app.core.response_cache import response_cache
+from tests.test_clients import (
+    add_season_ticket,
+    add_to_group,
+    count_statements,
+    create_client,
+    create_group,
+)
+from tests.test_visits import start_visit
+
+
+async def get_cached(async_client, auth_headers, path: str, etag: str | None = None):
+    headers = {**auth_headers, **({"If-None-Match": etag} if etag else {})}
+
+    return await async_client.get(path, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_client_by_id_revalidates_with_etag(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Иванов", 0)
+    path = f"/clients/{client_id}"
+
+    first = await get_cached(async_client, auth_headers, path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    with count_statements() as statements:
+        second = await get_cached(async_client, auth_headers, path)
+        not_modified = await get_cached(async_client, auth_headers, path, etag)
+
+    assert statements == []
+    assert second.content == first.content
+    assert second.headers["etag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert response_cache.stats() == {"hits": 2, "misses": 1, "not_modified": 1}
+
+    # каждая пишущая операция делает сохранённый ответ недействительным
+    group_id = await create_group(async_client, auth_headers, "семья")
+    await add_to_group(async_client, auth_headers, group_id, [client_id])
+
+    response = await get_cached(async_client, auth_headers, path, etag)
+    assert response.status_code == 200
+    assert response.json()["client"]["groups"][0]["quantity"] == 1
+    etag = response.headers["etag"]
+
+    other_id = await create_client(async_client, auth_headers, "Петров", 1)
+    await add_to_group(async_client, auth_headers, group_id, [other_id])
+
+    response = await get_cached(async_client, auth_headers, path, etag)
+    assert response.json()["client"]["groups"][0]["quantity"] == 2
+    etag = response.headers["etag"]
+
+    await add_season_ticket(async_client, auth_headers, client_id, 30)
+
+    response = await get_cached(async_client, auth_headers, path, etag)
+    assert len(response.json()["client"]["season_tickets"]) == 1
+
+    response = await async_client.delete(path, headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await get_cached(async_client, auth_headers, path)
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_clients_list_invalidated_by_writes(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Иванов", 0)
+
+    response = await get_cached(async_client, auth_headers, "/clients/all")
+    etag = response.headers["etag"]
+    assert response.json()["clients"][0]["season_ticket_type"] is None
+
+    response = await get_cached(async_client, auth_headers, "/clients/all", etag)
+    assert response.status_code == 304
+
+    # другие параметры запроса хранятся отдельно
+    response = await get_cached(
+        async_client, auth_headers, "/clients/all?limit=1", etag
+    )
+    assert response.status_code == 304
+    assert response_cache.stats()["misses"] == 2
+
+    await add_season_ticket(async_client, auth_headers, client_id, 30)
+
+    response = await get_cached(async_client, auth_headers, "/clients/all", etag)
+    assert response.status_code == 200
+    assert response.json()["clients"][0]["season_ticket_type"] == "на 30 дней"
+    etag = response.headers["etag"]
+
+    await start_visit(async_client, auth_headers, client_id, 1)
+
+    response = await get_cached(async_client, auth_headers, "/clients/all", etag)
+    assert response.status_code == 200
+    assert response.json()["clients"][0]["last_visit"] is not None
+    etag = response.headers["etag"]
+
+    await create_client(async_client, auth_headers, "Петров", 1)
+
+    response = await get_cached(async_client, auth_headers, "/clients/all", etag)
+    assert [client["surname"] for client in response.json()["clients"]] == [
+        "Иванов",
+        "Петров",
+    ]
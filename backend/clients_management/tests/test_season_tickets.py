@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.database.tables.entities import SeasonTicket
+from app.services import SeasonTicketExpiryScheduler
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_client_summary import add_season_ticket
+from tests.test_clients import create_client
+
+
+@pytest.mark.asyncio
+async def test_expiring_season_tickets(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Абонентов", 0)
+    for days in (10, 3, -1, 1):
+        await add_season_ticket(async_client, auth_headers, client_id, days)
+
+    response = await async_client.get(
+        "/season_tickets/expiring", params={"within": "P7D"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert [ticket["type"] for ticket in response.json()["season_tickets"]] == [
+        "на 1 дней",
+        "на 3 дней",
+    ]
+    assert response.json()["season_tickets"][0]["client_id"] == client_id
+
+    response = await async_client.get(
+        "/season_tickets/expiring",
+        params={"within": "P14D", "limit": 1},
+        headers=auth_headers,
+    )
+    assert [ticket["type"] for ticket in response.json()["season_tickets"]] == [
+        "на 1 дней"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_current_season_ticket(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Абонентов", 0)
+    await add_season_ticket(async_client, auth_headers, client_id, -5)
+
+    response = await async_client.get(
+        f"/season_tickets/current/{client_id}", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    await add_season_ticket(async_client, auth_headers, client_id, 30)
+    await add_season_ticket(async_client, auth_headers, client_id, 3)
+
+    response = await async_client.get(
+        f"/season_tickets/current/{client_id}", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["season_ticket"]["type"] == "на 30 дней"
+
+    response = await async_client.get(
+        f"/season_tickets/current/{uuid4()}", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_expiry_scheduler_marks_in_batches(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Абонентов", 0)
+    expired_ids = {
+        await add_season_ticket(async_client, auth_headers, client_id, -days)
+        for days in (1, 2, 3)
+    }
+    await add_season_ticket(async_client, auth_headers, client_id, 30)
+
+    batches = []
+    scheduler = SeasonTicketExpiryScheduler(interval=60.0, batch_size=2)
+    scheduler.subscribe(batches.append)
+
+    assert await scheduler.run_once(TestAsyncSessionMaker) == 3
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert {str(ticket.id) for batch in batches for ticket in batch} == expired_ids
+
+    # повторная проверка не оповещает о тех же абонементах
+    assert await scheduler.run_once(TestAsyncSessionMaker) == 0
+    assert len(batches) == 2
+
+    # продление снимает отметку об истечении
+    ticket_id = sorted(expired_ids)[0]
+    response = await async_client.put(
+        f"/season_tickets/{ticket_id}",
+        json={
+            "client_id": client_id,
+            "type": "продлённый",
+            "expires_at": str(datetime.now(timezone.utc) + timedelta(days=2)),
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    async with TestAsyncSessionMaker() as session:
+        expired_at = await session.scalars(
+            select(SeasonTicket.id).where(SeasonTicket.expired_at.is_not(None))
+        )
+        assert set(expired_at.all()) == set(map(UUID, expired_ids - {ticket_id}))
+
+    response = await async_client.get("/season_tickets/expiring", headers=auth_headers)
+    assert [ticket["type"] for ticket in response.json()["season_tickets"]] == [
+        "продлённый"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_expiry_scheduler_runs_in_background(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Абонентов", 0)
+    await add_season_ticket(async_client, auth_headers, client_id, -1)
+
+    batches = []
+    scheduler = SeasonTicketExpiryScheduler(interval=0.01, batch_size=10)
+    scheduler.subscribe(batches.append)
+
+    scheduler.start(TestAsyncSessionMaker)
+    try:
+        for _ in range(100):
+            if batches:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await scheduler.stop()
+
+    assert [len(batch) for batch in batches] == [1]
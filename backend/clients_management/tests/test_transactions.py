@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import update
+
+from app.database.tables.entities import ClientBalance, Transaction
+from app.services import BalanceSnapshotScheduler
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import count_statements, create_client
+
+
+async def add_transaction(async_client, auth_headers, client_id: str, amount: str):
+    response = await async_client.post(
+        "/transactions/",
+        json={"client_id": client_id, "amount": amount},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+async def get_balance(async_client, auth_headers, client_id: str) -> Decimal:
+    response = await async_client.get(
+        f"/clients/{client_id}/balance", headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    return Decimal(response.json()["balance"])
+
+
+@pytest.mark.asyncio
+async def test_transactions_and_balance(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Плательщик", 0)
+
+    assert await get_balance(async_client, auth_headers, client_id) == 0
+
+    transaction_ids = [
+        await add_transaction(async_client, auth_headers, client_id, amount)
+        for amount in ("1500.00", "-250.50", "0.10", "0.20")
+    ]
+
+    assert await get_balance(async_client, auth_headers, client_id) == Decimal(
+        "1249.80"
+    )
+
+    pages, cursor = [], None
+    while True:
+        response = await async_client.get(
+            f"/clients/{client_id}/transactions",
+            params={"limit": 3, **({"cursor": cursor} if cursor else {})},
+            headers=auth_headers,
+        )
+        pages.append([item["id"] for item in response.json()["transactions"]])
+
+        if (cursor := response.json()["next_cursor"]) is None:
+            break
+
+    assert sorted(sum(pages, [])) == sorted(transaction_ids)
+    assert [len(page) for page in pages] == [3, 1]
+
+    response = await async_client.post(
+        "/transactions/",
+        json={"client_id": client_id, "amount": "0.001"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+    for path in ("balance", "transactions"):
+        response = await async_client.get(
+            f"/clients/{uuid4()}/{path}", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_transactions(async_client, auth_headers):
+    client_ids = [
+        await create_client(async_client, auth_headers, f"Плательщик{index}", index)
+        for index in range(2)
+    ]
+    body = [
+        {"client_id": client_ids[0], "amount": "100.00"},
+        {"client_id": client_ids[1], "amount": "-40.00"},
+        {"client_id": str(uuid4()), "amount": "1.00"},
+        {"client_id": client_ids[0], "amount": "-0.25"},
+    ]
+
+    with count_statements() as statements:
+        response = await async_client.post(
+            "/transactions/batch", json=body, headers=auth_headers
+        )
+
+    assert [item["status"] for item in response.json()["items"]] == [
+        "created",
+        "created",
+        "not_found",
+        "created",
+    ]
+    assert sum(s.startswith('INSERT INTO "transaction"') for s in statements) == 1
+    assert sum(s.startswith("INSERT INTO client_balance") for s in statements) == 1
+
+    assert await get_balance(async_client, auth_headers, client_ids[0]) == Decimal(
+        "99.75"
+    )
+    assert await get_balance(async_client, auth_headers, client_ids[1]) == Decimal(
+        "-40.00"
+    )
+
+
+@pytest.mark.asyncio
+async def test_balance_read_ignores_history(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Плательщик", 0)
+    response = await async_client.post(
+        "/transactions/batch",
+        json=[{"client_id": client_id, "amount": "1.00"}] * 200,
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    with count_statements() as statements:
+        balance = await get_balance(async_client, auth_headers, client_id)
+
+    assert balance == 200
+    (statement,) = statements
+    assert "FROM client_balance" in statement
+    assert '"transaction"' not in statement
+
+
+@pytest.mark.asyncio
+async def test_snapshot_and_compaction(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Плательщик", 0)
+    old_ids = [
+        await add_transaction(async_client, auth_headers, client_id, amount)
+        for amount in ("300.00", "-100.00")
+    ]
+    new_id = await add_transaction(async_client, auth_headers, client_id, "50.00")
+
+    async with TestAsyncSessionMaker() as session:
+        await session.execute(
+            update(Transaction)
+            .where(Transaction.id.in_([UUID(id) for id in old_ids]))
+            .values(timestamp=datetime.now(timezone.utc) - timedelta(days=60))
+        )
+        await session.commit()
+
+    scheduler = BalanceSnapshotScheduler(
+        interval=0, snapshot_age=timedelta(hours=1), retention=timedelta(days=30)
+    )
+
+    assert await scheduler.run_once(TestAsyncSessionMaker) == (1, 2)
+
+    async with TestAsyncSessionMaker() as session:
+        snapshot = await session.get(ClientBalance, UUID(client_id))
+        assert snapshot.snapshot_balance == 200
+
+    response = await async_client.get(
+        f"/clients/{client_id}/transactions", headers=auth_headers
+    )
+    assert [item["id"] for item in response.json()["transactions"]] == [new_id]
+
+    response = await async_client.get(
+        f"/clients/{client_id}/balance", headers=auth_headers
+    )
+    assert Decimal(response.json()["balance"]) == 250
+    assert response.json()["snapshot_at"] is not None
+
+    # повторный снимок не учитывает уже перенесённые транзакции дважды
+    await add_transaction(async_client, auth_headers, client_id, "-25.00")
+
+    assert await scheduler.run_once(TestAsyncSessionMaker) == (1, 0)
+    assert await get_balance(async_client, auth_headers, client_id) == 225
@@ -0,0 +1,367 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.api.routes.v1 import visits as visits_routes
+from app.database.tables.entities import SeasonTicket, Visit
+from app.repositories import ClientSummaryRepository, VisitRepository
+from app.services import VisitService
+from app.services.occupancy import occupancy_index
+from app.services.ticket_validity import ticket_validity_map
+from app.services.visit_partitions import VisitPartitionScheduler
+from tests.override.session import TestAsyncSessionMaker
+from tests.test_clients import add_season_ticket, count_statements, create_client
+
+
+def count_prefixed(statements, prefix: str) -> int:
+    return sum(statement.startswith(prefix) for statement in statements)
+
+
+async def create_member(async_client, auth_headers, surname: str, index: int) -> str:
+    client_id = await create_client(async_client, auth_headers, surname, index)
+    await add_season_ticket(async_client, auth_headers, client_id, 30)
+
+    return client_id
+
+
+async def start_visit(async_client, auth_headers, client_id: str, box: int) -> str:
+    response = await async_client.post(
+        "/visits/start", json={"client_id": client_id, "box": box}, headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    return response.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_occupancy_follows_visits(async_client, auth_headers):
+    client_ids = [
+        await create_member(async_client, auth_headers, f"Посетитель{index}", index)
+        for index in range(3)
+    ]
+    visit_ids = [
+        await start_visit(async_client, auth_headers, client_id, box)
+        for box, client_id in enumerate(client_ids, start=1)
+    ]
+
+    with count_statements() as statements:
+        active = await async_client.get("/visits/active", headers=auth_headers)
+        free = await async_client.get("/visits/boxes/free", headers=auth_headers)
+
+    assert statements == []
+    assert [visit["id"] for visit in active.json()["visits"]] == visit_ids
+    assert free.json()["occupied"] == 3
+    assert free.json()["boxes"][:2] == [4, 5]
+    assert len(free.json()["boxes"]) == occupancy_index.box_count - 3
+
+    response = await async_client.put(
+        f"/visits/end/{visit_ids[0]}", headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await async_client.delete(
+        f"/visits/{visit_ids[1]}", headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    active = await async_client.get("/visits/active", headers=auth_headers)
+    free = await async_client.get("/visits/boxes/free", headers=auth_headers)
+
+    assert [visit["id"] for visit in active.json()["visits"]] == visit_ids[2:]
+    assert free.json()["boxes"][:3] == [1, 2, 4]
+    assert free.json()["occupied"] == 1
+
+
+@pytest.mark.asyncio
+async def test_occupancy_rebuilds_from_database(async_client, auth_headers):
+    client_id = await create_member(async_client, auth_headers, "Посетитель", 0)
+    open_id = await start_visit(async_client, auth_headers, client_id, 7)
+    closed_id = await start_visit(async_client, auth_headers, client_id, 8)
+    await async_client.put(f"/visits/end/{closed_id}", headers=auth_headers)
+
+    occupancy_index.clear()
+
+    async with TestAsyncSessionMaker() as session:
+        await VisitService(
+            VisitRepository(session), ClientSummaryRepository(session)
+        ).rebuild_occupancy()
+
+    active = await async_client.get("/visits/active", headers=auth_headers)
+
+    assert [visit["id"] for visit in active.json()["visits"]] == [open_id]
+    assert 7 not in occupancy_index.free_boxes()
+    assert 8 in occupancy_index.free_boxes()
+
+
+@pytest.mark.asyncio
+async def test_end_unknown_visit(async_client, auth_headers):
+    response = await async_client.put(f"/visits/end/{uuid4()}", headers=auth_headers)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_start_and_end(async_client, auth_headers):
+    client_ids = [
+        await create_member(async_client, auth_headers, f"Турникет{index}", index)
+        for index in range(3)
+    ]
+    body = [
+        {"client_id": client_id, "box": box} for box, client_id in enumerate(client_ids)
+    ]
+    body.append({"client_id": str(uuid4()), "box": 99})
+
+    with count_statements() as statements:
+        response = await async_client.post(
+            "/visits/start/batch", json=body, headers=auth_headers
+        )
+
+    items = response.json()["items"]
+
+    assert [item["status"] for item in items] == ["started"] * 3 + ["not_found"]
+    assert count_prefixed(statements, "INSERT INTO visit") == 1
+    assert occupancy_index.occupied_count == 3
+
+    await async_client.put(f"/visits/end/{items[0]['id']}", headers=auth_headers)
+
+    unknown = str(uuid4())
+    visit_ids = [item["id"] for item in items[:3]] + [items[1]["id"], unknown]
+
+    with count_statements() as statements:
+        response = await async_client.post(
+            "/visits/end/batch", json=visit_ids, headers=auth_headers
+        )
+
+    assert [item["status"] for item in response.json()["items"]] == [
+        "already_ended",
+        "ended",
+        "ended",
+        "already_ended",
+        "not_found",
+    ]
+    assert count_prefixed(statements, "UPDATE visit") == 1
+    assert occupancy_index.occupied_count == 0
+
+
+@pytest.mark.asyncio
+async def test_micro_batching_coalesces_check_ins(
+    async_client, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(visits_routes.settings, "VISITS_MICRO_BATCHING", True)
+    client_ids = [
+        await create_member(async_client, auth_headers, f"Пачка{index}", index)
+        for index in range(10)
+    ]
+
+    with count_statements() as statements:
+        responses = await asyncio.gather(
+            *(
+                async_client.post(
+                    "/visits/start",
+                    json={"client_id": client_id, "box": box},
+                    headers=auth_headers,
+                )
+                for box, client_id in enumerate(client_ids, start=1)
+            ),
+            async_client.post(
+                "/visits/start",
+                json={"client_id": str(uuid4()), "box": 50},
+                headers=auth_headers,
+            ),
+        )
+
+    assert [response.status_code for response in responses] == [201] * 10 + [404]
+    assert count_prefixed(statements, "INSERT INTO visit") == 1
+    assert occupancy_index.occupied_count == 10
+
+
+@pytest.mark.asyncio
+async def test_visit_requires_season_ticket(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Безбилетный", 0)
+    expired_id = await create_client(async_client, auth_headers, "Просроченный", 1)
+    await add_season_ticket(async_client, auth_headers, expired_id, -1)
+
+    response = await async_client.post(
+        "/visits/start", json={"client_id": client_id, "box": 1}, headers=auth_headers
+    )
+    assert response.status_code == 403
+    assert "нет абонемента" in response.json()["detail"]
+
+    response = await async_client.post(
+        "/visits/start", json={"client_id": expired_id, "box": 2}, headers=auth_headers
+    )
+    assert response.status_code == 403
+    assert "истёк" in response.json()["detail"]
+
+    response = await async_client.post(
+        "/visits/start/batch",
+        json=[
+            {"client_id": client_id, "box": 1},
+            {"client_id": expired_id, "box": 2},
+            {"client_id": str(uuid4()), "box": 3},
+        ],
+        headers=auth_headers,
+    )
+    assert [item["status"] for item in response.json()["items"]] == [
+        "no_season_ticket",
+        "season_ticket_expired",
+        "not_found",
+    ]
+    assert occupancy_index.occupied_count == 0
+
+    # абонемент, добавленный в обход кэша (другим воркером), виден сразу
+    async with TestAsyncSessionMaker() as session:
+        session.add(
+            SeasonTicket(
+                client_id=UUID(client_id),
+                type="годовой",
+                expires_at=datetime.now(timezone.utc) + timedelta(days=365),
+            )
+        )
+        await session.flush()
+        await ClientSummaryRepository(session).refresh_season_tickets([UUID(client_id)])
+        await session.commit()
+
+    await start_visit(async_client, auth_headers, client_id, 1)
+
+
+@pytest.mark.asyncio
+async def test_admission_uses_warm_cache(async_client, auth_headers):
+    client_id = await create_member(async_client, auth_headers, "Постоянный", 0)
+
+    ticket_validity_map.clear()
+
+    async with TestAsyncSessionMaker() as session:
+        await VisitService(
+            VisitRepository(session), ClientSummaryRepository(session)
+        ).rebuild_ticket_validity()
+
+    with count_statements() as statements:
+        await start_visit(async_client, auth_headers, client_id, 1)
+
+    assert [statement.split()[0] for statement in statements] == ["INSERT", "UPDATE"]
+
+
+@pytest.mark.asyncio
+async def test_end_visit_is_single_update(async_client, auth_headers):
+    client_id = await create_member(async_client, auth_headers, "Закрывающий", 0)
+    visit_id = await start_visit(async_client, auth_headers, client_id, 3)
+
+    with count_statements() as statements:
+        response = await async_client.put(
+            f"/visits/end/{visit_id}", headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+
+    response = await async_client.put(f"/visits/end/{visit_id}", headers=auth_headers)
+
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_end_visit_idempotency_key(async_client, auth_headers):
+    client_id = await create_member(async_client, auth_headers, "Повторяющий", 0)
+    visit_id = await start_visit(async_client, auth_headers, client_id, 4)
+    headers = {**auth_headers, "Idempotency-Key": str(uuid4())}
+
+    first = await async_client.put(f"/visits/end/{visit_id}", headers=headers)
+    retry = await async_client.put(f"/visits/end/{visit_id}", headers=headers)
+    other = await async_client.put(
+        f"/visits/end/{visit_id}",
+        headers={**auth_headers, "Idempotency-Key": str(uuid4())},
+    )
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert other.status_code == 409
+
+
+async def add_history(client_id: str, starts: list) -> list:
+    visits = [
+        Visit(client_id=UUID(client_id), box=1, visit_start=start, visit_end=start)
+        for start in starts
+    ]
+
+    async with TestAsyncSessionMaker() as session:
+        session.add_all(visits)
+        await session.commit()
+
+    return [str(visit.id) for visit in visits]
+
+
+@pytest.mark.asyncio
+async def test_client_visit_history(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Историков", 0)
+    starts = [
+        datetime(2025, month, 10, 18, tzinfo=timezone.utc) for month in range(1, 7)
+    ]
+    visit_ids = await add_history(client_id, starts)
+
+    pages, cursor = [], None
+    while True:
+        response = await async_client.get(
+            f"/clients/{client_id}/visits",
+            params={"limit": 2, **({"cursor": cursor} if cursor else {})},
+            headers=auth_headers,
+        )
+        pages.append([visit["id"] for visit in response.json()["visits"]])
+
+        if (cursor := response.json()["next_cursor"]) is None:
+            break
+
+    assert pages == [visit_ids[5:3:-1], visit_ids[3:1:-1], visit_ids[1::-1]]
+
+    response = await async_client.get(
+        f"/clients/{client_id}/visits",
+        params={"from": "2025-02-01T00:00:00Z", "to": "2025-04-01T00:00:00Z"},
+        headers=auth_headers,
+    )
+
+    assert [visit["id"] for visit in response.json()["visits"]] == [
+        visit_ids[2],
+        visit_ids[1],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_visit_history_unknown_client(async_client, auth_headers):
+    response = await async_client.get(
+        f"/clients/{uuid4()}/visits", headers=auth_headers
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_client_does_not_load_visits(async_client, auth_headers):
+    client_id = await create_client(async_client, auth_headers, "Удаляемов", 0)
+    await add_history(client_id, [datetime(2025, 1, 1, tzinfo=timezone.utc)] * 3)
+
+    response = await async_client.delete(f"/clients/{client_id}", headers=auth_headers)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_partition_scheduler_runs_periodically(async_client, monkeypatch):
+    calls = []
+
+    async def maintain_partitions(self, months_ahead: int):
+        calls.append(months_ahead)
+
+    monkeypatch.setattr(VisitService, "maintain_partitions", maintain_partitions)
+
+    scheduler = VisitPartitionScheduler(interval=0.01, months_ahead=2)
+    scheduler.start(TestAsyncSessionMaker)
+    try:
+        for _ in range(100):
+            if len(calls) >= 2:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await scheduler.stop()
+
+    assert calls[:2] == [2, 2]
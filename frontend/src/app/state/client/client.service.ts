@@ -1,6 +1,6 @@
 import { HttpClient } from '@angular/common/http';
 import { Injectable } from '@angular/core';
-import { catchError, EMPTY, Observable, of, switchMap, tap, throwError } from 'rxjs';
+import { catchError, EMPTY, expand, Observable, of, reduce, switchMap, tap, throwError } from 'rxjs';
 import { Client, ClientCreate } from './client.model';
 import { ApiResMessageModel } from '../../models/api-response.model';
 import { SeasonTicketsService } from '../season-tickets/season-tickets.service';
@@ -11,6 +11,7 @@ export interface ReturnedClients {
     id?: string;
     clients?: Client[];
     client?: Client;
+    next_cursor?: string | null;
 }
 
 @Injectable({ providedIn: 'root' })
@@ -18,16 +19,23 @@ export class ClientService {
     constructor(private http: HttpClient, private seasonTicketsService: SeasonTicketsService) {}
 
     getClients(): Observable<ReturnedClients> {
-        return this.http.get<ReturnedClients>('clients/all').pipe(
-            tap((clients: ReturnedClients) => {
-                return clients;
-            }),
+        return this.getClientsPage().pipe(
+            expand((page: ReturnedClients) => (page.next_cursor ? this.getClientsPage(page.next_cursor) : EMPTY)),
+            reduce((acc: ReturnedClients, page: ReturnedClients) => ({
+                ...page,
+                clients: [...(acc.clients ?? []), ...(page.clients ?? [])],
+            })),
             catchError((err: Error) => {
                 return throwError(() => err);
             }),
         );
     }
 
+    private getClientsPage(cursor?: string | null): Observable<ReturnedClients> {
+        const params: Record<string, string> = cursor ? { cursor } : {};
+        return this.http.get<ReturnedClients>('clients/all', { params });
+    }
+
     getClient(id: string): Observable<ReturnedClients> {
         return this.http.get<ReturnedClients>(`clients/${id}`).pipe(
             tap((client: ReturnedClients) => {